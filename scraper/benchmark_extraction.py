@@ -0,0 +1,183 @@
+"""
+BENCHMARK EKSTRAKCIJE
+=====================
+Primerja ElementHandle ekstrakcijo (EXTRACTION_MODE="element") z BULK
+(EXTRACTION_MODE="bulk") in SNAPSHOT ekstrakcijo (EXTRACTION_MODE="snapshot",
+page.content() + lxml) na ISTI naloženi strani.
+
+Z --streaming primerja celo kategorijo: "scroll do konca + ekstrakcija"
+proti STREAMING ekstrakciji med scrollom (peak JS heap, DOM vozlišča, čas).
+
+UPORABA:
+    python benchmark_extraction.py --store tus
+    python benchmark_extraction.py --store mercator --scrolls 40
+    python benchmark_extraction.py --store spar --url https://www.spar.si/online/pijace/c/F05
+    python benchmark_extraction.py --store tus --streaming
+"""
+
+import time
+import argparse
+from datetime import datetime
+from playwright.sync_api import sync_playwright
+
+from stores.spar import SparScraper
+from stores.mercator import MercatorScraper
+from stores.tus import TusScraper
+
+SCRAPERS = {
+    "spar": (SparScraper, "https://www.spar.si/online/sadje-in-zelenjava/c/F01"),
+    "mercator": (MercatorScraper, MercatorScraper.CATEGORY_URLS[0][1]),
+    "tus": (TusScraper, TusScraper.CATEGORY_URLS[0][1]),
+}
+
+COMPARED_FIELDS = ["ime", "redna_cena", "akcijska_cena", "slika", "enota"]
+
+
+def run_mode(scraper_cls, page, mode: str) -> tuple[list[dict], float]:
+    """Scrapaj trenutno stran v danem načinu - vrne (izdelki, sekunde)"""
+    scraper = scraper_cls(page, extraction_mode=mode)
+    start = time.perf_counter()
+    products = scraper.scrape_current_page("Benchmark")
+    return products, time.perf_counter() - start
+
+
+def new_page(browser):
+    """Svež context + page (da se meritve spomina ne mešajo)"""
+    context = browser.new_context(
+        viewport={"width": 1920, "height": 1080},
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        locale="sl-SI",
+    )
+    context.set_default_timeout(60000)
+    return context, context.new_page()
+
+
+def run_category(scraper_cls, browser, url: str, streaming: bool, max_scrolls: int) -> dict:
+    """Scrapaj celo kategorijo in vrni meritve"""
+    context, page = new_page(browser)
+    try:
+        scraper = scraper_cls(page, extraction_mode="bulk", streaming=streaming)
+        scraper.MEASURE_BROWSER_MEMORY = True
+        scraper.current_category = "Benchmark"
+        scraper.begin_category()
+
+        start = time.perf_counter()
+        scraper.safe_goto(url, timeout=60000)
+        scraper.scroll_and_load_all(max_scrolls=max_scrolls)
+        products = scraper.scrape_page_products("Benchmark")
+        m = scraper.metrics
+
+        return {
+            "products": len(products),
+            "seconds": time.perf_counter() - start,
+            "extract": m.extract_time,
+            "heap": m.peak_js_heap_mb,
+            "nodes": m.peak_dom_nodes,
+        }
+    finally:
+        context.close()
+
+
+def compare_streaming(args, scraper_cls, url: str):
+    """Celotna kategorija: klasično vs streaming"""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(
+            headless=not args.headful,
+            args=["--disable-blink-features=AutomationControlled"]
+        )
+        try:
+            results = {
+                "klasično": run_category(scraper_cls, browser, url, False, args.max_scrolls),
+                "streaming": run_category(scraper_cls, browser, url, True, args.max_scrolls),
+            }
+        finally:
+            browser.close()
+
+    print("\n" + "=" * 60)
+    print("REZULTATI (cela kategorija)")
+    print("=" * 60)
+    print(f"  {'način':<10} {'izdelki':>8} {'čas':>9} {'ekstr.':>8} {'heap MB':>8} {'DOM':>8}")
+    for name, r in results.items():
+        print(f"  {name:<10} {r['products']:>8} {r['seconds']:>8.1f}s {r['extract']:>7.2f}s "
+              f"{r['heap']:>8.1f} {r['nodes']:>8}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark element vs bulk vs snapshot ekstrakcije")
+    parser.add_argument("--store", "-s", choices=list(SCRAPERS.keys()), default="tus")
+    parser.add_argument("--url", help="URL kategorije (default: prva kategorija)")
+    parser.add_argument("--scrolls", type=int, default=20, help="Koliko scrollov pred meritvijo")
+    parser.add_argument("--headful", action="store_true", help="Prikaži browser")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Primerjaj celo kategorijo: klasično vs streaming (tus, mercator)")
+    parser.add_argument("--max-scrolls", type=int, default=300, help="Max scroll korakov za --streaming")
+    args = parser.parse_args()
+
+    scraper_cls, default_url = SCRAPERS[args.store]
+    url = args.url or default_url
+
+    if args.streaming:
+        if args.store == "spar":
+            parser.error("--streaming podpira samo tus in mercator (SPAR ima paginacijo)")
+        compare_streaming(args, scraper_cls, url)
+        return
+
+    print("=" * 60)
+    print(f"BENCHMARK EKSTRAKCIJE: {scraper_cls.STORE_NAME}")
+    print(f"Čas: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"URL: {url}")
+    print("=" * 60)
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(
+            headless=not args.headful,
+            args=["--disable-blink-features=AutomationControlled"]
+        )
+        context = browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            locale="sl-SI",
+        )
+        context.set_default_timeout(60000)
+        page = context.new_page()
+
+        try:
+            loader = scraper_cls(page)
+            loader.safe_goto(url, timeout=60000)
+            for _ in range(args.scrolls):
+                loader.safe_scroll("down")
+
+            element_products, element_time = run_mode(scraper_cls, page, "element")
+            bulk_products, bulk_time = run_mode(scraper_cls, page, "bulk")
+            snapshot_products, snapshot_time = run_mode(scraper_cls, page, "snapshot")
+        finally:
+            browser.close()
+
+    # Primerjava rezultatov
+    element_by_name = {p["ime"]: p for p in element_products}
+
+    def mismatches(products: list[dict]) -> int:
+        count = 0
+        for product in products:
+            other = element_by_name.get(product["ime"])
+            if not other or any(other.get(f) != product.get(f) for f in COMPARED_FIELDS):
+                count += 1
+        return count
+
+    print("\n" + "=" * 60)
+    print("REZULTATI")
+    print("=" * 60)
+    print(f"  element: {len(element_products):>6} izdelkov v {element_time:8.2f}s")
+    print(f"  bulk:    {len(bulk_products):>6} izdelkov v {bulk_time:8.2f}s")
+    print(f"  snapshot:{len(snapshot_products):>6} izdelkov v {snapshot_time:8.2f}s")
+    if bulk_time > 0:
+        print(f"  Pohitritev (bulk): {element_time / bulk_time:.1f}x")
+    if snapshot_time > 0:
+        print(f"  Pohitritev (snapshot): {element_time / snapshot_time:.1f}x")
+    print(f"  Razlik v poljih: bulk {mismatches(bulk_products)}, snapshot {mismatches(snapshot_products)}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
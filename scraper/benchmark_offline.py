@@ -0,0 +1,157 @@
+"""
+OFFLINE BENCHMARK (HAR replay)
+==============================
+Cela trgovina end-to-end na ISTIH posnetih odgovorih (stores/har.py) -
+vsaka optimizacija scraperja se primerja na enakem vhodu, brez živih strežnikov.
+
+1. Posnemi (enkrat, živo):
+    python benchmark_offline.py --store tus --record
+2. Primerjaj (offline, poljubnokrat):
+    python benchmark_offline.py --store tus
+    python benchmark_offline.py --store all --latency 80 --runs 3
+    python benchmark_offline.py --store spar --extraction snapshot
+
+Poročilo: čas, izdelki, izdelki/s, protokolni (CDP) klici, peak JS heap,
+peak RSS (Python proces + največji browser proces). Rezultati tudi v
+metrics/benchmark_{ts}.json.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from orchestrator import STORE_RUNNERS
+from stores import har
+from stores.profiling import count_all_protocol_calls
+
+try:
+    import resource  # Unix
+except ImportError:
+    resource = None
+
+
+def peak_rss_mb() -> tuple:
+    """(Python proces, največji končan otrok = browser) v MB; None na Windows"""
+    if resource is None:
+        return None, None
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024  # macOS: bajti, Linux: KB
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return round(own, 1), round(children, 1)
+
+
+def run_store(store: str, args) -> dict:
+    """En end-to-end run trgovine v tem procesu (svoj BrowserPool -> HAR se zapiše ob close)"""
+    from stores.browser_pool import BrowserPool
+
+    module_name, class_name, method_name = STORE_RUNNERS[store]
+    scraper_cls = getattr(importlib.import_module(module_name), class_name)
+    calls = count_all_protocol_calls()
+
+    start = time.perf_counter()
+    with BrowserPool(headless=not args.headful, timeout=60000) as pool:
+        lease = pool.acquire(scraper_cls)
+        try:
+            scraper = scraper_cls(
+                lease.page,
+                extraction_mode=args.extraction,
+                workers=args.workers,
+                streaming=args.streaming,
+            )
+            scraper.MEASURE_BROWSER_MEMORY = True
+            products = getattr(scraper, method_name)()
+        finally:
+            pool.release(lease)
+        pool_stats = pool.stats()
+    seconds = time.perf_counter() - start
+
+    rss, browser_rss = peak_rss_mb()
+    m = scraper.metrics
+    return {
+        "store": store,
+        "products": len(products),
+        "seconds": round(seconds, 2),
+        "products_per_second": round(len(products) / seconds, 1) if seconds else 0.0,
+        "protocol_calls": sum(calls.values()) if calls is not None else None,
+        "protocol_calls_by_method": dict(sorted((calls or {}).items(), key=lambda kv: -kv[1])[:15]),
+        "peak_js_heap_mb": m.peak_js_heap_mb,
+        "peak_dom_nodes": m.peak_dom_nodes,
+        "peak_rss_mb": rss,
+        "peak_browser_rss_mb": browser_rss,
+        "scroll_time": round(m.scroll_time, 2),
+        "extract_time": round(m.extract_time, 2),
+        "errors": m.errors,
+        "har_files": pool_stats.get("har_files", 0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark trgovin (HAR record/replay)")
+    parser.add_argument("--store", "-s", choices=list(STORE_RUNNERS.keys()) + ["all"], default="tus")
+    parser.add_argument("--record", action="store_true", help="Živ run + snemanje HAR (namesto replaya)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Umetna zakasnitev na request ob replayu (ms)")
+    parser.add_argument("--run", default=None, help="Posnetek za replay (har/{trgovina}/{run}, default: zadnji)")
+    parser.add_argument("--runs", type=int, default=1, help="Ponovitve na trgovino (replay)")
+    parser.add_argument("--extraction", choices=["element", "bulk", "snapshot"], default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--streaming", action="store_true", default=None)
+    parser.add_argument("--headful", action="store_true", help="Prikaži browser")
+    args = parser.parse_args()
+
+    # Env: BrowserPool (stores/har.py) + brez delta reuse-a (vsak run enako dela)
+    os.environ["PRHRAN_HAR"] = har.RECORD if args.record else har.REPLAY
+    os.environ["PRHRAN_HAR_LATENCY_MS"] = str(args.latency)
+    os.environ["PRHRAN_DELTA"] = "0"
+    os.environ.setdefault("PRHRAN_LOG_LEVEL", "WARNING")
+    if args.run:
+        os.environ["PRHRAN_HAR_RUN"] = args.run
+
+    stores = list(STORE_RUNNERS.keys()) if args.store == "all" else [args.store]
+    runs = 1 if args.record else max(1, args.runs)
+
+    print("=" * 60)
+    print(f"OFFLINE BENCHMARK ({'record' if args.record else 'replay'})")
+    print(f"Čas: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if not args.record:
+        print(f"Latenca: {args.latency:.0f} ms/request")
+    print("=" * 60)
+
+    results = []
+    for store in stores:
+        if not args.record and not har.replay_files(store):
+            print(f"  {store}: ni posnetka v {har.har_dir() / store} (najprej --record)")
+            continue
+        for number in range(runs):
+            result = run_store(store, args)
+            result["run"] = number + 1
+            results.append(result)
+            print(f"  {store:<9} #{number + 1}: {result['products']:>6} izdelkov v {result['seconds']:>7.1f}s "
+                  f"({result['products_per_second']:>6.1f}/s), CDP {result['protocol_calls'] or '-':>7}, "
+                  f"heap {result['peak_js_heap_mb']:.0f} MB, RSS {result['peak_rss_mb'] or '-'} MB")
+
+    if not results:
+        return
+
+    out = Path(__file__).parent / "metrics" / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    out.parent.mkdir(exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({
+            "mode": "record" if args.record else "replay",
+            "latency_ms": args.latency,
+            "extraction": args.extraction,
+            "workers": args.workers,
+            "streaming": args.streaming,
+            "results": results,
+        }, f, ensure_ascii=False, indent=1)
+    print("=" * 60)
+    print(f"Rezultati: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+BENCHMARK PARSERJA CEN (kaskada vs tokenizer)
+=============================================
+1. Zlati korpus (stores/prices_golden.jsonl): vsak tile mora dati pričakovane cene
+   (redna, akcijska, cena na enoto, prihranek, bulk) - exit 1 ob neujemanju
+2. Čas na tile: stara kaskada regexov (kopija spodaj) vs stores/prices.parse_price_pair
+   (kar kličejo scraperji) na korpusu + sintetičnih tile-ih (mock_store.Catalogue, tekst kot na strani)
+   - parse_price_pair mora dati isti par kot parse_price_text (korpus in sintetični tile-i)
+
+UPORABA:
+    python benchmark_prices.py                   # korpus + 30k sintetičnih tile-ov
+    python benchmark_prices.py --tiles 100000
+    python benchmark_prices.py --check           # samo korpus (brez merjenja)
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from mock_store import Catalogue, TUS_CATEGORIES, money
+from stores.prices import STORE_PRICE_RULES, parse_amount, parse_price_pair, parse_price_text
+
+GOLDEN_PATH = Path(__file__).parent / "stores" / "prices_golden.jsonl"
+STORES = ["spar", "mercator", "tus"]
+
+
+# ==================== STARA KASKADA (pred stores/prices.py) ====================
+
+def valid(value: float) -> bool:
+    return 0.01 < value < 9999
+
+
+def legacy_spar(text: str, has_discount: bool):
+    regular_price = None
+    sale_price = None
+    prej_match = re.search(r"prej\s+([\d]+)[,.](\d{2})\s*€?", text, re.I)
+    if prej_match:
+        regular_price = float(f"{prej_match.group(1)}.{prej_match.group(2)}")
+    clean = re.sub(r"prej\s+\d+[,.]\d{2}\s*€?", " ", text, flags=re.I)
+    clean = re.sub(r"prihran[ie]k\s+\d+[,.]\d{2}\s*€?", " ", clean, flags=re.I)
+    clean = re.sub(r"PC\d+\s*:?\s*\d+[,.]\d{2}\s*€?", " ", clean, flags=re.I)
+    clean = re.sub(r"\d+[,.]\d{2}\s*€?\s*/\s*\d*\s*(kg|kos|kom|l|ml|g|m)\b", " ", clean, flags=re.I)
+    clean = re.sub(r"(kg|kos|kom|l)\s+za\s+\d+[,.]\d{2}\s*€?", " ", clean, flags=re.I)
+    clean = re.sub(r"za\s+\d+[,.]\d{2}\s*€?\s*/?k?g", " ", clean, flags=re.I)
+    clean = re.sub(r"\d+[,.]\d*\s*k?g\b", " ", clean, flags=re.I)
+    clean = re.sub(r"\d+\s*g\b", " ", clean, flags=re.I)
+    clean = re.sub(r"\d+[,.]\d*\s*m?l\b", " ", clean, flags=re.I)
+    prices = []
+    for m in re.finditer(r"(\d+)[,.](\d{2})\s*€?", clean):
+        val = float(f"{m.group(1)}.{m.group(2)}")
+        if valid(val) and val not in prices:
+            prices.append(val)
+    if regular_price and prices:
+        sale_price = min(prices)
+        if sale_price >= regular_price:
+            sale_price = None
+    elif len(prices) == 1:
+        regular_price = prices[0]
+    elif len(prices) >= 2:
+        if has_discount:
+            regular_price, sale_price = max(prices), min(prices)
+            if sale_price == regular_price:
+                sale_price = None
+        else:
+            regular_price = min(prices)
+    return regular_price, sale_price
+
+
+def legacy_mercator(text: str, has_discount: bool = False):
+    prices = []
+    for match in re.finditer(r"(\d+)[,.](\d{2})\s*€", text):
+        value = float(f"{match.group(1)}.{match.group(2)}")
+        after_text = text[match.end():match.end() + 30]
+        if re.match(r"^\s*/\s*\d*\s*(kg|kos|kom|kpl|pak|ml|cl|dl|mm|cm|m|g|l)\b", after_text, re.I):
+            continue
+        if valid(value) and value not in prices:
+            prices.append(value)
+    if not prices:
+        return None, None
+    if len(prices) == 1:
+        return prices[0], None
+    first, second = prices[0], prices[1]
+    return max(first, second), min(first, second)
+
+
+def legacy_tus(text: str, has_discount: bool):
+    clean = re.sub(r"\d+[,.]\d{2}\s*€?\s*/\s*(kg|kos|kom|l|ml|g)\b", " ", text, flags=re.I)
+    prices = []
+    for m in re.finditer(r"(\d+)[,.](\d{2})\s*€?", clean):
+        val = float(f"{m.group(1)}.{m.group(2)}")
+        if valid(val) and val not in prices:
+            prices.append(val)
+    if not prices:
+        return None, None
+    if len(prices) == 1:
+        return prices[0], None
+    if has_discount:
+        high, low = max(prices), min(prices)
+        return high, (low if low != high else None)
+    return min(prices), None
+
+
+LEGACY = {"spar": legacy_spar, "mercator": legacy_mercator, "tus": legacy_tus}
+
+
+# ==================== KORPUS ====================
+
+def load_golden() -> list:
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def check_golden(rows: list) -> int:
+    """Preveri korpus - vrne število neujemanj"""
+    failures = 0
+    legacy_diff = 0
+    for row in rows:
+        expected = row["expected"]
+        if row["store"] == "amount":
+            actual = {"value": parse_amount(row["text"])}
+        else:
+            parsed = parse_price_text(row["text"], STORE_PRICE_RULES[row["store"]], row["discount"])
+            actual = {key: getattr(parsed, key) for key in expected}
+            if parse_price_pair(row["text"], STORE_PRICE_RULES[row["store"]], row["discount"]) != parsed.pair:
+                actual["pair"] = "parse_price_pair drugače"
+
+            legacy = LEGACY.get(row["store"])
+            if legacy and legacy(row["text"], row["discount"]) != (expected["regular"], expected["sale"]):
+                legacy_diff += 1
+                if not row.get("note"):
+                    print(f"  ! {row['id']}: stara kaskada drugače, a brez note")
+
+        if actual != expected:
+            failures += 1
+            print(f"  ✗ {row['id']}: {actual} != {expected}")
+
+    print(f"Korpus: {len(rows) - failures}/{len(rows)} OK, "
+          f"namerno drugače kot stara kaskada: {legacy_diff}")
+    return failures
+
+
+# ==================== SINTETIČNI TILE-I ====================
+
+def synthetic_tiles(total: int, seed: int) -> list:
+    """(trgovina, tekst, has_discount) - tekst tile-a kot inner_text() na strani"""
+    per_store = total // len(STORES)
+    catalogue = Catalogue(per_store, seed=seed, unavailable=0)
+    per_category = catalogue.per_category(len(TUS_CATEGORIES))
+    tiles = []
+    for store in STORES:
+        for index in range(per_store):
+            category_index = min(index // per_category, len(TUS_CATEGORIES) - 1)
+            item = catalogue.item(store, category_index, TUS_CATEGORIES[category_index],
+                                  index - category_index * per_category, len(TUS_CATEGORIES))
+            unit = f"{money(item['unit_price'])}/ 1{item['unit']}"
+            if item["regular"]:
+                if store == "spar":
+                    saving = money(round(item["regular"] - item["price"], 2))
+                    text = (f"Akcija\n{item['name']}\nPrej {money(item['regular'])}\n{money(item['price'])}\n"
+                            f"Prihranek {saving}\n{unit}")
+                else:
+                    text = f"-20 %\n{item['name']}\n{money(item['regular'])}\n{money(item['price'])}\n{unit}"
+            else:
+                text = f"{item['name']}\n{money(item['price'])}\n{unit}"
+            tiles.append((store, text, bool(item["regular"])))
+    return tiles
+
+
+def time_parser(tiles: list, parse) -> float:
+    start = time.perf_counter()
+    for store, text, discount in tiles:
+        parse(store, text, discount)
+    return time.perf_counter() - start
+
+
+def parse_legacy(store: str, text: str, discount: bool):
+    return LEGACY[store](text, discount)
+
+
+def parse_new(store: str, text: str, discount: bool):
+    return parse_price_pair(text, STORE_PRICE_RULES[store], discount)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zlati korpus + benchmark parserja cen")
+    parser.add_argument("--tiles", type=int, default=30000, help="Sintetičnih tile-ov (3 trgovine)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--check", action="store_true", help="Samo preveri korpus")
+    args = parser.parse_args()
+
+    rows = load_golden()
+
+    print("=" * 60)
+    print(f"ZLATI KORPUS ({GOLDEN_PATH.name}, {len(rows)} primerov)")
+    print("=" * 60)
+    failures = check_golden(rows)
+    if failures or args.check:
+        sys.exit(1 if failures else 0)
+
+    corpus = [(row["store"], row["text"], row["discount"]) for row in rows if row["store"] in LEGACY]
+    synthetic = synthetic_tiles(args.tiles, args.seed)
+
+    print("=" * 60)
+    print(f"BENCHMARK PARSERJA CEN ({len(synthetic)} sintetičnih + {len(corpus)} korpus tile-ov)")
+    print("=" * 60)
+
+    mismatches = sum(1 for store, text, discount in synthetic
+                     if parse_legacy(store, text, discount) != parse_new(store, text, discount))
+    print(f"  Sintetični tile-i: stara kaskada drugače v {mismatches} primerih (Tuš '€/ 1kg')")
+    pair_diff = sum(1 for store, text, discount in synthetic
+                    if parse_new(store, text, discount) != parse_price_text(text, STORE_PRICE_RULES[store], discount).pair)
+    if pair_diff:
+        print(f"  ✗ parse_price_pair != parse_price_text.pair v {pair_diff} primerih")
+        sys.exit(1)
+
+    results = {}
+    for label, parse in (("kaskada", parse_legacy), ("tokenizer", parse_new)):
+        repeat = max(1, 20000 // max(1, len(corpus)))
+        corpus_seconds = time_parser(corpus * repeat, parse)
+        per_store = {store: time_parser([tile for tile in synthetic if tile[0] == store], parse)
+                     for store in STORES}
+        results[label] = seconds = sum(per_store.values())
+        stores = ", ".join(f"{store} {per_store[store] / (len(synthetic) / len(STORES)) * 1e6:.1f}"
+                           for store in STORES)
+        print(f"  {label:<10} {seconds / len(synthetic) * 1e6:>5.1f} µs/tile ({stores}), "
+              f"korpus {corpus_seconds / (len(corpus) * repeat) * 1e6:.1f} µs/tile")
+
+    print("=" * 60)
+    print(f"Hitrost: {results['kaskada'] / max(results['tokenizer'], 1e-9):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
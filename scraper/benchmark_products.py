@@ -0,0 +1,135 @@
+"""
+BENCHMARK ZAPISOV IZDELKOV (dict vs Product)
+============================================
+Spomin in čas poti scraper -> dedupe -> matcher na sintetičnem katalogu
+(mock_store.Catalogue, brez browserja):
+
+- dict:    prost dict na izdelek + seen set stringov "trgovina|ime|cena"
+- product: stores/product.Product (__slots__) + seen set 64-bit intov
+
+UPORABA:
+    python benchmark_products.py                    # 30k izdelkov (3 trgovine x 10k)
+    python benchmark_products.py --products 60000
+    python benchmark_products.py --matcher 3000     # + ProductMatcher na prvih N
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from mock_store import Catalogue, TUS_CATEGORIES
+from stores.product import Product, fingerprint64, fingerprint_key
+
+STORES = ["Spar", "Mercator", "Tuš"]
+
+
+def catalogue_rows(total: int, seed: int) -> list:
+    """Surovi izdelki kataloga (isti za oba načina)"""
+    per_store = total // len(STORES)
+    catalogue = Catalogue(per_store, seed=seed, unavailable=0)
+    per_category = catalogue.per_category(len(TUS_CATEGORIES))
+    rows = []
+    for store in STORES:
+        for index in range(per_store):
+            category_index = min(index // per_category, len(TUS_CATEGORIES) - 1)
+            item = catalogue.item(store.lower(), category_index, TUS_CATEGORIES[category_index],
+                                  index - category_index * per_category, len(TUS_CATEGORIES))
+            rows.append((store, item))
+    return rows
+
+
+def build(rows: list, compact: bool) -> tuple:
+    """Sestavi + deduplikacija (kot build_product + add_product) - vrne (izdelki, seen)"""
+    record = Product if compact else dict
+    products = []
+    seen = set()
+    for store, item in rows:
+        product = record(
+            ime=item["name"],
+            redna_cena=item["regular"] or item["price"],
+            akcijska_cena=item["price"] if item["regular"] else None,
+            kategorija=item["category"],
+            enota=item["unit"],
+            trgovina=store,
+            slika=f"https://example.com/img/{item['id']}.jpg",
+            url=f"https://example.com/{store.lower()}/{item['id']}",
+        )
+        key = fingerprint_key(product)
+        fp = fingerprint64(key) if compact else key
+        if fp in seen:
+            continue
+        seen.add(fp)
+        product["_quality_score"] = 100
+        products.append(product)
+    return products, seen
+
+
+def measure(rows: list, compact: bool, matcher_count: int) -> dict:
+    # Čas brez tracemalloc (ta upočasni vsako alokacijo), spomin v ločenem prehodu
+    start = time.perf_counter()
+    build(rows, compact)
+    build_seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    products, seen = build(rows, compact)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "products": len(products),
+        "build_seconds": build_seconds,
+        "retained_mb": retained / (1024 * 1024),
+        "peak_mb": peak / (1024 * 1024),
+        "bytes_per_product": retained / max(1, len(products)),
+    }
+
+    if matcher_count:
+        from matcher import ProductMatcher
+
+        subset = products[:matcher_count]
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        ProductMatcher().process_all(subset)
+        result["matcher_seconds"] = time.perf_counter() - start
+        result["matcher_mb"] = (tracemalloc.get_traced_memory()[0] - before) / (1024 * 1024)
+        tracemalloc.stop()
+
+    del products, seen
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark zapisov izdelkov: dict vs Product (__slots__)")
+    parser.add_argument("--products", type=int, default=30000, help="Izdelkov skupaj (razdeljeno na 3 trgovine)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--matcher", type=int, default=0, help="ProductMatcher na prvih N izdelkih (0 = brez)")
+    args = parser.parse_args()
+
+    rows = catalogue_rows(args.products, args.seed)
+
+    print("=" * 60)
+    print(f"BENCHMARK ZAPISOV IZDELKOV ({len(rows)} izdelkov)")
+    print("=" * 60)
+
+    results = {}
+    for label, compact in (("dict", False), ("product", True)):
+        results[label] = result = measure(rows, compact, args.matcher)
+        line = (f"  {label:<8} {result['products']:>6} izdelkov: {result['retained_mb']:>6.1f} MB "
+                f"({result['bytes_per_product']:>4.0f} B/izdelek), peak {result['peak_mb']:.1f} MB, "
+                f"build+dedupe {result['build_seconds']:.2f}s")
+        if args.matcher:
+            line += f", matcher {result['matcher_seconds']:.2f}s (+{result['matcher_mb']:.1f} MB)"
+        print(line)
+
+    old, new = results["dict"], results["product"]
+    print("=" * 60)
+    print(f"Spomin: {old['retained_mb'] / max(new['retained_mb'], 1e-9):.2f}x manj, "
+          f"čas: {old['build_seconds'] / max(new['build_seconds'], 1e-9):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
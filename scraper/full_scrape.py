@@ -11,13 +11,9 @@ Trgovine:
 Po scrapanju avtomatsko uploada v Google Sheets.
 """
 
-import time
 from datetime import datetime
-from playwright.sync_api import sync_playwright
 
-from stores.spar import SparScraper
-from stores.mercator import MercatorScraper
-from stores.tus import TusScraper
+from orchestrator import StoreOrchestrator
 from google_sheets import GoogleSheetsManager
 
 
@@ -35,63 +31,23 @@ def full_scrape():
         "tus": []
     }
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=False,  # Headful da vidiš kaj se dogaja
-            args=["--disable-blink-features=AutomationControlled"]
-        )
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            locale="sl-SI",
-        )
-        context.set_default_timeout(60000)
-        page = context.new_page()
-
-        # ==================== SPAR ====================
-        print("\n" + "=" * 70)
-        print("[1/3] SCRAPING: SPAR")
-        print("=" * 70)
-
-        try:
-            spar = SparScraper(page)
-            spar_products = spar.scrape_all()
-            all_products["spar"] = spar_products
-            print(f"\n[SPAR] KONČANO: {len(spar_products)} izdelkov")
-        except Exception as e:
-            print(f"[SPAR] NAPAKA: {e}")
-
-        time.sleep(3)
-
-        # ==================== MERCATOR ====================
-        print("\n" + "=" * 70)
-        print("[2/3] SCRAPING: MERCATOR")
-        print("=" * 70)
-
-        try:
-            mercator = MercatorScraper(page)
-            mercator_products = mercator.scrape_all_simple()  # Uporabi /brskaj
-            all_products["mercator"] = mercator_products
-            print(f"\n[MERCATOR] KONČANO: {len(mercator_products)} izdelkov")
-        except Exception as e:
-            print(f"[MERCATOR] NAPAKA: {e}")
-
-        time.sleep(3)
-
-        # ==================== TUŠ ====================
-        print("\n" + "=" * 70)
-        print("[3/3] SCRAPING: TUŠ")
-        print("=" * 70)
-
-        try:
-            tus = TusScraper(page)
-            tus_products = tus.scrape_all()
-            all_products["tus"] = tus_products
-            print(f"\n[TUŠ] KONČANO: {len(tus_products)} izdelkov")
-        except Exception as e:
-            print(f"[TUŠ] NAPAKA: {e}")
-
-        browser.close()
+    # ==================== SPAR + MERCATOR + TUŠ (vzporedno) ====================
+    # Vsaka trgovina v svojem procesu - čas = najpočasnejša trgovina, ne vsota.
+    # Če en proces pade, rezultati ostalih (in delni rezultati padlega) ostanejo.
+    def on_store_done(store: str, products: list, status: dict):
+        if status["status"] == "ok":
+            print(f"\n[{store.upper()}] KONČANO: {len(products)} izdelkov")
+        else:
+            print(f"[{store.upper()}] NAPAKA: {status.get('error') or status['status']} "
+                  f"(ohranjenih {len(products)} izdelkov)")
+
+    results = StoreOrchestrator(
+        list(all_products.keys()),
+        headless=False,  # Headful da vidiš kaj se dogaja
+        timeout=60000,
+        on_store_done=on_store_done,
+    ).run()
+    all_products.update(results)
 
     # ==================== GOOGLE SHEETS UPLOAD ====================
     print("\n" + "=" * 70)
@@ -21,7 +21,8 @@ from difflib import SequenceMatcher
 # Dodaj parent dir v path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from playwright.sync_api import sync_playwright
+from stores.browser_pool import pooled_page
+from stores.product import to_dicts
 
 # ============================================
 # KONFIGURACIJA
@@ -164,61 +165,62 @@ def scrape_store(store_name: str) -> list:
     """Scrape vse izdelke iz ene trgovine."""
     log(f"Začenjam scraping: {store_name.upper()}")
 
-    with sync_playwright() as p:
-        # Headless mode za CI/CD (GitHub Actions), headed za lokalno
-        is_ci = os.getenv("CI", "false").lower() == "true" or os.getenv("GITHUB_ACTIONS", "false").lower() == "true"
-        browser = p.chromium.launch(headless=is_ci)
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            locale="sl-SI",
-        )
-        context.set_default_timeout(60000)
-        page = context.new_page()
+    # Headless mode za CI/CD (GitHub Actions), headed za lokalno
+    is_ci = os.getenv("CI", "false").lower() == "true" or os.getenv("GITHUB_ACTIONS", "false").lower() == "true"
+
+    if store_name == "spar":
+        from stores.spar import SparScraper as scraper_cls
+        method = "scrape_all"
+    elif store_name == "mercator":
+        from stores.mercator import MercatorScraper as scraper_cls
+        method = "scrape_all_simple"
+    elif store_name == "tus":
+        from stores.tus import TusScraper as scraper_cls
+        method = "scrape_all"
+    else:
+        return []
+
+    # En topel browser za vse trgovine (pool tega procesa), svež context za vsako
+    try:
+        with pooled_page(scraper_cls, headless=is_ci, timeout=60000) as page:
+            products = getattr(scraper_cls(page), method)()
 
-        try:
-            if store_name == "spar":
-                from stores.spar import SparScraper
-                scraper = SparScraper(page)
-                products = scraper.scrape_all()
-
-            elif store_name == "mercator":
-                from stores.mercator import MercatorScraper
-                scraper = MercatorScraper(page)
-                products = scraper.scrape_all_simple()
-
-            elif store_name == "tus":
-                from stores.tus import TusScraper
-                scraper = TusScraper(page)
-                products = scraper.scrape_all()
-            else:
-                products = []
+        log(f"{store_name.upper()}: {len(products)} izdelkov", "SUCCESS")
+        return products
 
-            log(f"{store_name.upper()}: {len(products)} izdelkov", "SUCCESS")
-            return products
+    except Exception as e:
+        log(f"{store_name.upper()}: NAPAKA - {e}", "ERROR")
+        return []
 
-        except Exception as e:
-            log(f"{store_name.upper()}: NAPAKA - {e}", "ERROR")
-            return []
-        finally:
-            browser.close()
 
+def save_store_products(store: str, products: list):
+    """Shrani vmesne rezultate trgovine"""
+    output_file = OUTPUT_DIR / f"{store}_products.json"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(to_dicts(products), f, ensure_ascii=False, indent=2)
+    log(f"Shranjeno: {output_file}")
 
-def scrape_all_stores() -> dict:
-    """Scrape vse trgovine."""
-    all_products = {}
 
-    for store in STORES:
-        products = scrape_store(store)
-        all_products[store] = products
+def scrape_all_stores() -> dict:
+    """Scrape vse trgovine - vzporedno, vsaka v svojem procesu."""
+    from orchestrator import StoreOrchestrator
 
-        # Shrani vmesne rezultate
-        output_file = OUTPUT_DIR / f"{store}_products.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
-        log(f"Shranjeno: {output_file}")
+    is_ci = os.getenv("CI", "false").lower() == "true" or os.getenv("GITHUB_ACTIONS", "false").lower() == "true"
 
-    return all_products
+    def on_store_done(store: str, products: list, status: dict):
+        if status["status"] == "ok":
+            log(f"{store.upper()}: {len(products)} izdelkov", "SUCCESS")
+        else:
+            log(f"{store.upper()}: NAPAKA - {status.get('error') or status['status']}", "ERROR")
+        # Shrani takoj ko trgovina konča (tudi delne rezultate padle trgovine)
+        save_store_products(store, products)
+
+    return StoreOrchestrator(
+        STORES,
+        headless=is_ci,
+        timeout=60000,
+        on_store_done=on_store_done,
+    ).run()
 
 
 # ============================================
@@ -6,32 +6,29 @@ Preskoči Google Sheets in uploada direktno iz lokalnih progress datotek.
 
 import os
 import sys
-import json
 import requests
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from stores.progress import find_progress_files, iter_progress_records, progress_store
+
 def log(msg):
     timestamp = datetime.now().strftime("%H:%M:%S")
     print(f"[{timestamp}] {msg}")
 
 
 def find_latest_progress_files(progress_dir: Path) -> dict:
-    """Najdi najnovejše progress datoteke za vsako trgovino."""
+    """Najdi najnovejše progress datoteke za vsako trgovino (.jsonl, .jsonl.gz, .json)."""
     latest = {}
 
-    for file in progress_dir.glob("*.json"):
-        parts = file.stem.split("_")
-        if len(parts) < 2:
-            continue
-
-        store = parts[0].lower()
+    for file in find_progress_files(progress_dir):
+        store = progress_store(file)
         if store not in ["spar", "mercator", "tus"]:
             continue
 
-        # Preveri če je novejša
-        if store not in latest or file.stat().st_mtime > latest[store].stat().st_mtime:
-            latest[store] = file
+        # find_progress_files vrne najnovejše zadnje
+        latest[store] = file
 
     return latest
 
@@ -39,16 +36,7 @@ def find_latest_progress_files(progress_dir: Path) -> dict:
 def read_progress_file(file_path: Path) -> list:
     """Preberi izdelke iz progress datoteke."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Lahko ima products ali samo seznam
-        if isinstance(data, dict):
-            products = data.get("products", [])
-        else:
-            products = data
-
-        return products
+        return list(iter_progress_records(file_path))
     except Exception as e:
         log(f"  Napaka pri branju {file_path}: {e}")
         return []
@@ -15,6 +15,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from google_sheets import GoogleSheetsManager
+from stores.prices import parse_amount
 
 def log(msg):
     timestamp = datetime.now().strftime("%H:%M:%S")
@@ -65,23 +66,13 @@ def read_sheet_products(gs, store: str) -> list:
         if not ime:
             continue
 
-        # Cena - odstrani € in zamenjaj , z .
+        # Cena - "1,29 €", "1.234,56", "2" (stores/prices.parse_amount)
         cena_raw = row[col_map.get('cena', 1)] if col_map.get('cena') is not None and len(row) > col_map.get('cena', 1) else ""
-        cena = None
-        if cena_raw:
-            try:
-                cena = float(cena_raw.replace('€', '').replace(',', '.').strip())
-            except:
-                pass
+        cena = parse_amount(cena_raw) if cena_raw else None
 
         # Akcijska cena
         akcijska_raw = row[col_map.get('akcijska', 3)] if col_map.get('akcijska') is not None and len(row) > col_map.get('akcijska', 3) else ""
-        akcijska = None
-        if akcijska_raw:
-            try:
-                akcijska = float(akcijska_raw.replace('€', '').replace(',', '.').strip())
-            except:
-                pass
+        akcijska = parse_amount(akcijska_raw) if akcijska_raw else None
 
         # Slika
         slika = row[col_map.get('slika', 2)] if col_map.get('slika') is not None and len(row) > col_map.get('slika', 2) else ""
@@ -0,0 +1,654 @@
+"""
+MOCK TRGOVINE (sintetični strežnik za load teste)
+=================================================
+Lokalna spletna stran ki posnema markup in obnašanje vseh treh trgovin -
+brez živih strežnikov, s poljubno velikim katalogom (50k+ izdelkov na trgovino).
+
+- Tuš:      /tus/kategorije/{ime}   itemCardWrapper tile-i, infinite scroll (JSON API po 48)
+- Mercator: /mercator/brskaj        .box.item.product tile-i, data-analytics-object,
+                                    infinite scroll prek getProducts, popup "Izbira načina prevzema"
+- SPAR:     /spar/online/.../c/F01  ant-design paginacija (?page=N), "Prej" / "Prihranek" cene,
+                                    18+ potrditev (pijače), drawer za prevzem
+
+Vbrizgane napake: latenca (+ jitter), počasne strani, 429 (Retry-After), popupi.
+Katalog je determinističen (--seed) - isti vhod za vsako primerjavo.
+
+UPORABA:
+    python mock_store.py --products 50000 --latency 40 --error-rate 0.02
+    python scraper.py --store tus --mock http://127.0.0.1:8765 --no-upload
+
+    # ali ročno za posamezno trgovino (tudi v orchestrator procesih):
+    PRHRAN_BASE_URL_TUS=http://127.0.0.1:8765/tus python scraper.py --store tus
+
+Statistika strežnika (requesti, 429, počasne strani): GET /__stats
+"""
+
+import json
+import math
+import random
+import threading
+import time
+import zlib
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+# ==================== KATALOG ====================
+
+TUS_CATEGORIES = [
+    "Sadje in zelenjava", "Meso, delikatesa in ribe", "Hlajeni in mlečni izdelki",
+    "Kruh in pekovski izdelki", "Zamrznjeno", "Shramba", "Alkoholne pijače",
+    "Brezalkoholne pijače", "Sladko in slano", "Osebna nega", "Dom",
+    "Dojenčki in otroci", "Male živali", "Mednarodna hrana",
+]
+
+SPAR_CATEGORIES = [
+    ("sadje-in-zelenjava", "Sadje in zelenjava"), ("mlecni-izdelki-in-jajca", "Mlečni izdelki in jajca"),
+    ("meso-ribe-in-delikatesne-jedi", "Meso, ribe in delikatesne jedi"), ("vse-za-zajtrk", "Vse za zajtrk"),
+    ("pijace", "Pijače"), ("kruh-pecivo-in-slascice", "Kruh, pecivo in slaščice"), ("shramba", "Shramba"),
+    ("bio-in-zdrava-prehrana", "Bio in zdrava prehrana"), ("zamrznjeni-izdelki", "Zamrznjeni izdelki"),
+    ("prigrizki-in-sladkarije", "Prigrizki in sladkarije"), ("vse-za-otroka", "Vse za otroka"),
+    ("hrana-za-zivali", "Hrana za živali"), ("osebna-nega-in-zdravje", "Osebna nega in zdravje"),
+    ("dom-in-prosti-cas", "Dom in prosti čas"),
+]
+SPAR_AGE_GATE = {"F05"}  # 18+ potrditev (alkohol)
+
+MERCATOR_CATEGORIES = [
+    ("14535810", "Sadje in zelenjava"), ("14535405", "Mlečni izdelki"), ("14535446", "Meso in ribe"),
+    ("14535463", "Kruh in pecivo"), ("14535481", "Delikatesa"), ("14535512", "Zamrznjeni izdelki"),
+    ("14535548", "Shramba"), ("14535588", "Zajtrk"), ("14535612", "Pijače"),
+    ("14535661", "Testenine in riž"), ("14535681", "Konzerve"), ("14535711", "Čokolada in sladkarije"),
+    ("14535736", "Slani prigrizki"), ("14535768", "Hrana za živali"), ("14535837", "Otroci"),
+    ("14535864", "Higiena in lepota"), ("14535906", "Čistila"), ("14535984", "Dom in kuhinja"),
+    ("16873196", "Bio izdelki"),
+]
+
+BRANDS = [
+    "Alpsko", "Ljubljanske", "Pomurske", "Zvijezda", "Podravka", "Argeta", "Kras", "Perutnina Ptuj",
+    "Žito", "Droga", "Barcaffe", "Radenska", "Fructal", "Gorenjka", "Kraš", "Mercator", "Spar", "Tuš",
+    "Natureta", "Eta", "Panvita", "Celjske", "Vital", "Ilirija", "Frutek", "Šumi", "Dana", "Union",
+    "Laško", "Zlato polje", "Bio Planet", "Sveže",
+]
+NOUNS = [
+    "Mleko", "Jogurt", "Sir", "Skuta", "Maslo", "Kruh", "Žemlja", "Testenine", "Riž", "Moka",
+    "Kava", "Čaj", "Sok", "Voda", "Pivo", "Vino", "Čokolada", "Piškoti", "Čips", "Kosmiči",
+    "Pašteta", "Salama", "Šunka", "Piščanec", "Tuna", "Fižol", "Paradižnik", "Kumarice", "Olje", "Kis",
+    "Med", "Marmelada", "Sladoled", "Pica", "Juha", "Omaka", "Šampon", "Gel za tuširanje", "Zobna pasta",
+    "Detergent", "Mehčalec", "Papirnate brisače", "Toaletni papir", "Plenice", "Hrana za pse",
+    "Hrana za mačke", "Bonboni", "Oreščki",
+]
+VARIANTS = [
+    "klasik", "light", "polnozrnat", "bio", "z lešniki", "s čokolado", "jagoda", "vanilija",
+    "borovnica", "limona", "mediteran", "domač", "extra", "original", "brez laktoze", "pikanten",
+    "nežen", "družinsko pakiranje", "mini", "premium", "sveži", "tradicionalni", "z zelišči", "naravni",
+]
+SIZES = [
+    ("100 g", 0.1, "kg"), ("150 g", 0.15, "kg"), ("250 g", 0.25, "kg"), ("400 g", 0.4, "kg"),
+    ("500 g", 0.5, "kg"), ("1 kg", 1.0, "kg"), ("200 ml", 0.2, "l"), ("330 ml", 0.33, "l"),
+    ("500 ml", 0.5, "l"), ("0,75 l", 0.75, "l"), ("1 l", 1.0, "l"), ("1,5 l", 1.5, "l"),
+    ("2 l", 2.0, "l"), ("4 kos", 4.0, "kos"), ("10 kos", 10.0, "kos"), ("6 x 0,5 l", 3.0, "l"),
+]
+
+
+class Catalogue:
+    """Determinističen katalog: izdelek = f(seed, trgovina, kategorija, indeks), brez shranjevanja"""
+
+    def __init__(self, products: int, seed: int = 1, sale_rate: float = 0.25, unavailable: int = 3):
+        self.products = products
+        self.seed = seed
+        self.sale_rate = sale_rate
+        self.unavailable = unavailable
+
+    def per_category(self, categories: int) -> int:
+        return max(1, self.products // max(1, categories))
+
+    def item(self, store: str, category_index: int, category_name: str, index: int, categories: int) -> dict:
+        """Izdelek (imena so unikatna znotraj trgovine - dedupe jih ne odstrani)"""
+        number = category_index * self.per_category(categories) + index
+        rng = random.Random(zlib.crc32(f"{self.seed}:{store}:{number}".encode()))
+
+        n = number
+        brand = BRANDS[n % len(BRANDS)]
+        n //= len(BRANDS)
+        noun = NOUNS[n % len(NOUNS)]
+        n //= len(NOUNS)
+        variant = VARIANTS[n % len(VARIANTS)]
+        n //= len(VARIANTS)
+        size, amount, unit = SIZES[n % len(SIZES)]
+        n //= len(SIZES)
+        name = f"{noun} {brand} {variant} {size}" + (f" {n + 1}. serija" if n else "")
+
+        price = round(rng.uniform(0.39, 39.99), 2)
+        sale = None
+        if rng.random() < self.sale_rate:
+            sale = round(price * rng.uniform(0.55, 0.9), 2)
+            if sale >= price or sale < 0.2:
+                sale = None
+
+        item = {
+            "id": f"{store[:1]}{number:07d}",
+            "name": name,
+            "price": sale or price,
+            "regular": price if sale else None,
+            "unit_price": round((sale or price) / amount, 2),
+            "unit": unit,
+            "category": category_name,
+            "available": True,
+        }
+        if index >= self.per_category(categories) - self.unavailable:
+            item["available"] = False  # SPAR: "ni na voljo" na koncu kategorije
+        return item
+
+
+def money(value: float) -> str:
+    return f"{value:.2f}".replace(".", ",") + " €"
+
+
+# ==================== STREŽNIK ====================
+
+class MockSettings:
+    """Nastavitve + števci (deljeno med handler threadi)"""
+
+    def __init__(self, args):
+        self.catalogue = Catalogue(args.products, args.seed, args.sale_rate, args.unavailable)
+        self.latency = args.latency / 1000.0
+        self.jitter = args.jitter / 1000.0
+        self.slow_rate = args.slow_rate
+        self.slow = args.slow_ms / 1000.0
+        self.error_rate = args.error_rate
+        self.popups = not args.no_popups
+        self.page_size = args.page_size
+        self.batch = args.batch
+        self.verbose = args.verbose
+        self.rng = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "pages": 0, "api": 0, "images": 0, "throttled": 0, "slow": 0, "not_found": 0}
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def chance(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self.lock:
+            return self.rng.random() < rate
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "PrHranMock/1.0"
+    settings: MockSettings = None
+
+    def log_message(self, format, *args):
+        if self.settings.verbose:
+            super().log_message(format, *args)
+
+    # ==================== ODGOVORI ====================
+
+    def send_body(self, body: str, content_type: str = "text/html; charset=utf-8", status: int = 200,
+                  headers: dict = None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_json(self, payload):
+        self.send_body(json.dumps(payload, ensure_ascii=False), "application/json; charset=utf-8")
+
+    def inject_failures(self) -> bool:
+        """Latenca, počasne strani, 429 - True če je odgovor že poslan"""
+        s = self.settings
+        delay = s.latency + (random.uniform(0, s.jitter) if s.jitter else 0.0)
+        if s.chance(s.slow_rate):
+            s.count("slow")
+            delay += s.slow
+        if delay:
+            time.sleep(delay)
+        if s.chance(s.error_rate):
+            s.count("throttled")
+            self.send_body("Too Many Requests", "text/plain", 429, {"Retry-After": "1"})
+            return True
+        return False
+
+    # ==================== ROUTING ====================
+
+    def do_GET(self):
+        s = self.settings
+        s.count("requests")
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        segments = [unquote(seg) for seg in parts.path.split("/") if seg]
+
+        try:
+            if segments[:1] == ["img"]:
+                s.count("images")
+                return self.send_body(image_svg(segments[-1]), "image/svg+xml",
+                                      headers={"Cache-Control": "max-age=86400"})
+            if segments[:1] == ["__stats"]:
+                with s.lock:
+                    return self.send_json(dict(s.stats))
+            if not segments or segments[0] not in ("spar", "mercator", "tus"):
+                return self.not_found()
+
+            if self.inject_failures():
+                return
+            store, rest = segments[0], segments[1:]
+            route = getattr(self, f"route_{store}")
+            return route(rest, query)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def not_found(self):
+        self.settings.count("not_found")
+        self.send_body("<h1>404</h1>", status=404)
+
+    def origin(self) -> str:
+        return f"http://{self.headers.get('Host', 'localhost')}"
+
+    # ---------- TUŠ ----------
+
+    def route_tus(self, rest, query):
+        c = self.settings.catalogue
+        if rest[:2] == ["api", "items"]:
+            self.settings.count("api")
+            name = query.get("category", [""])[0]
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", [str(self.settings.batch)])[0])
+            return self.send_json(tus_items(c, self.origin(), name, offset, limit))
+
+        if rest[:1] == ["kategorije"] and len(rest) >= 2:
+            self.settings.count("pages")
+            name = rest[1]
+            first = tus_items(c, self.origin(), name, 0, self.settings.batch)
+            return self.send_body(tus_page(name, first, self.settings))
+
+        if not rest or rest == ["kategorije"]:
+            self.settings.count("pages")
+            links = "".join(f'<li><a href="/tus/kategorije/{quote(n)}">{n}</a></li>' for n in TUS_CATEGORIES)
+            return self.send_body(shell("Hitri nakup", f"<ul class=\"categories\">{links}</ul>", self.settings))
+        return self.not_found()
+
+    # ---------- MERCATOR ----------
+
+    def route_mercator(self, rest, query):
+        c = self.settings.catalogue
+        if rest[:3] == ["products", "browseProducts", "getProducts"]:
+            self.settings.count("api")
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", [str(self.settings.batch)])[0])
+            category = query.get("categories", [""])[0]
+            return self.send_json(mercator_items(c, self.origin(), category, offset, limit))
+
+        if not rest or rest == ["brskaj"]:
+            self.settings.count("pages")
+            return self.send_body(mercator_page(self.settings))
+        return self.not_found()
+
+    # ---------- SPAR ----------
+
+    def route_spar(self, rest, query):
+        c = self.settings.catalogue
+        if rest == ["online"] or not rest:
+            self.settings.count("pages")
+            links = "".join(
+                f'<li><a href="/spar/online/{slug}/c/F{i + 1:02d}">{name}</a></li>'
+                for i, (slug, name) in enumerate(SPAR_CATEGORIES)
+            )
+            return self.send_body(shell("SPAR online", f"<ul class=\"categories\">{links}</ul>", self.settings))
+
+        if len(rest) == 4 and rest[0] == "online" and rest[2] == "c":
+            self.settings.count("pages")
+            code = rest[3]
+            page = max(1, int(query.get("page", ["1"])[0] or 1))
+            return self.send_body(spar_page(c, self.origin(), code, page, self.settings))
+        return self.not_found()
+
+
+# ==================== TUŠ ====================
+
+def tus_items(c: Catalogue, origin: str, name: str, offset: int, limit: int) -> dict:
+    index = TUS_CATEGORIES.index(name) if name in TUS_CATEGORIES else 14 + zlib.crc32(name.encode()) % 100
+    total = c.per_category(len(TUS_CATEGORIES))
+    items = []
+    for i in range(max(0, offset), min(total, offset + limit)):
+        item = c.item("tus", index, name, i, len(TUS_CATEGORIES))
+        items.append({
+            "id": item["id"],
+            "name": item["name"],
+            "price": item["price"],
+            "regularPrice": item["regular"],
+            "image": f"{origin}/img/tus/{item['id']}.svg",
+        })
+    return {"items": items, "offset": offset, "total": total}
+
+
+TUS_JS = """
+const grid = document.querySelector('.itemsGrid');
+const state = {offset: INITIAL.items.length, total: INITIAL.total, loading: false};
+const tile = (it) => {
+  const prices = it.regularPrice
+    ? `<span class="dashed-price_x1">${money(it.regularPrice)}</span><span class="green-price_x2">${money(it.price)}</span>`
+    : `<span class="price_x3">${money(it.price)}</span>`;
+  return `<a class="itemCardWrapper_q8k" href="/tus/izdelki/${it.id}">
+    <img class="itemCardThumbnail_h2" alt="${esc(it.name)}" src="${it.image}">
+    <div class="itemProductTitle_z9">${esc(it.name)}</div><div class="itemPrices_p1">${prices}</div></a>`;
+};
+const render = (items) => grid.insertAdjacentHTML('beforeend', items.map(tile).join(''));
+render(INITIAL.items);
+async function more() {
+  if (state.loading || state.offset >= state.total) return;
+  state.loading = true;
+  try {
+    const r = await fetch(`/tus/api/items?category=${encodeURIComponent(CATEGORY)}&offset=${state.offset}&limit=${BATCH}`);
+    if (r.status === 429) { await new Promise((ok) => setTimeout(ok, 1000)); return; }
+    const data = await r.json();
+    render(data.items);
+    state.offset += data.items.length;
+  } catch (e) {
+  } finally {
+    state.loading = false;
+  }
+  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 1500) more();
+}
+window.addEventListener('scroll', () => {
+  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 1500) more();
+});
+"""
+
+
+def tus_page(name: str, first: dict, settings: MockSettings) -> str:
+    body = (
+        f'<h1>{name}</h1><div class="productCount_a1">{first["total"]} izdelkov</div>'
+        '<div class="itemsGrid grid"></div>'
+    )
+    script = (
+        f"const CATEGORY = {js(name)}; const BATCH = {settings.batch}; const INITIAL = {js(first)};"
+        + TUS_JS
+    )
+    return shell(f"{name} | Hitri nakup", body, settings, script)
+
+
+# ==================== MERCATOR ====================
+
+def mercator_items(c: Catalogue, origin: str, category: str, offset: int, limit: int) -> dict:
+    ids = [cid for cid, _ in MERCATOR_CATEGORIES]
+    per = c.per_category(len(ids))
+    if category in ids:
+        index = ids.index(category)
+        slots = [(index, i) for i in range(offset, min(per, offset + limit))]
+        total = per
+    else:
+        # /brskaj brez filtra: vse kategorije zaporedoma
+        total = per * len(ids)
+        slots = [divmod(n, per) for n in range(offset, min(total, offset + limit))]
+
+    products = []
+    for index, i in slots:
+        item = c.item("mercator", index, MERCATOR_CATEGORIES[index][1], i, len(ids))
+        products.append({"data": {
+            "id": item["id"],
+            "name": item["name"],
+            "current_price": item["price"],
+            "normal_price": item["regular"],
+            "unit_price": item["unit_price"],
+            "unit": item["unit"],
+            "category": item["category"],
+            "mainImageSrc": f"{origin}/img/mercator/{item['id']}.svg",
+        }})
+    return {"products": products, "offset": offset, "total": total}
+
+
+MERCATOR_JS = """
+const grid = document.querySelector('.products-grid');
+const state = {offset: 0, total: Infinity, loading: false, category: '', generation: 0};
+const tile = (p) => {
+  const d = p.data;
+  const analytics = {item_name: d.name, item_category: d.category};
+  if (!d.normal_price) analytics.price = d.current_price;
+  const prices = d.normal_price
+    ? `<div class="lib-product-normal-price">${money(d.normal_price)}</div><div class="lib-product-price">${money(d.current_price)}</div>`
+    : `<div class="lib-product-price">${money(d.current_price)}</div>`;
+  return `<div class="box item product" data-item-id="${d.id}" data-analytics-object="${esc(JSON.stringify(analytics))}">
+    <div class="product-image"><img src="${d.mainImageSrc}" alt="${esc(d.name)}"></div>
+    <a class="lib-product-url" href="/mercator/izdelek/${d.id}" title="${esc(d.name)}"><span class="lib-product-name">${esc(d.name)}</span></a>
+    <div class="product-price-holder">${prices}<div class="lib-product-price-per-unit-main">${money(d.unit_price)}/ 1${d.unit}</div></div></div>`;
+};
+async function more() {
+  if (state.loading || state.offset >= state.total) return;
+  state.loading = true;
+  const generation = state.generation;
+  try {
+    const r = await fetch(`/mercator/products/browseProducts/getProducts?offset=${state.offset}&limit=${BATCH}&categories=${state.category}`);
+    if (r.status === 429) { await new Promise((ok) => setTimeout(ok, 1000)); return; }
+    const data = await r.json();
+    if (generation !== state.generation) return;
+    grid.insertAdjacentHTML('beforeend', data.products.map(tile).join(''));
+    state.offset += data.products.length;
+    state.total = data.total;
+  } catch (e) {
+  } finally {
+    state.loading = false;
+  }
+  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 1500) more();
+}
+function load() {
+  const match = location.hash.match(/categories=(\\d+)/);
+  state.category = match ? match[1] : '';
+  state.offset = 0; state.total = Infinity; state.generation += 1; state.loading = false;
+  grid.innerHTML = '';
+  window.scrollTo(0, 0);
+  more();
+}
+window.addEventListener('hashchange', load);
+window.addEventListener('scroll', () => {
+  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 1500) more();
+});
+load();
+"""
+
+MERCATOR_POPUP = """
+<div class="ReactModal__Overlay Modal-overlay mock-popup" data-cookie="mock_delivery" role="dialog" style="display:none">
+  <div class="Modal-content"><h2>Izbira načina prevzema izdelkov</h2>
+  <p>Dostava na dom ali prevzem v trgovini?</p>
+  <button class="close" aria-label="close">&times;</button></div>
+</div>
+"""
+
+
+def mercator_page(settings: MockSettings) -> str:
+    body = '<h1>Brskaj</h1><div class="products-grid grid"></div>'
+    extra = MERCATOR_POPUP if settings.popups else ""
+    return shell("Mercator online", body + extra, settings, f"const BATCH = {settings.batch};" + MERCATOR_JS)
+
+
+# ==================== SPAR ====================
+
+def spar_page(c: Catalogue, origin: str, code: str, page: int, settings: MockSettings) -> str:
+    try:
+        index = int(code.lstrip("F")) - 1
+    except ValueError:
+        index = 0
+    index = min(max(index, 0), len(SPAR_CATEGORIES) - 1)
+    name = SPAR_CATEGORIES[index][1]
+
+    total = c.per_category(len(SPAR_CATEGORIES))
+    pages = max(1, math.ceil(total / settings.page_size))
+    start = (page - 1) * settings.page_size
+    tiles = []
+    for i in range(start, min(total, start + settings.page_size)):
+        item = c.item("spar", index, name, i, len(SPAR_CATEGORIES))
+        tiles.append(spar_tile(item, origin))
+
+    numbers = sorted({1, pages} | {n for n in range(page - 2, page + 3) if 1 <= n <= pages})
+    pagination = "".join(
+        f'<li class="ant-pagination-item ant-pagination-item-{n}'
+        f'{" ant-pagination-item-active" if n == page else ""}"><a href="?page={n}">{n}</a></li>'
+        for n in numbers
+    )
+    body = (
+        f'<h1>{name}</h1><div class="result-count">{total} izdelkov</div>'
+        f'<div class="product-list grid">{"".join(tiles)}</div>'
+        f'<ul class="ant-pagination">{pagination}</ul>'
+    )
+    extra = ""
+    if settings.popups:
+        extra += SPAR_DRAWER
+        if code in SPAR_AGE_GATE:
+            extra += SPAR_AGE_GATE_MODAL
+    return shell(f"{name} | SPAR online", body + extra, settings)
+
+
+def spar_tile(item: dict, origin: str) -> str:
+    name = escape(item["name"])
+    if item["regular"]:
+        saving = round(item["regular"] - item["price"], 2)
+        prices = (
+            f'<div class="product-price__badge">Akcija</div>'
+            f'<div class="product-price__old">Prej {money(item["regular"])}</div>'
+            f'<div class="product-price__current">{money(item["price"])}</div>'
+            f'<div class="product-price__saving">Prihranek {money(saving)}</div>'
+        )
+    else:
+        prices = f'<div class="product-price__current">{money(item["price"])}</div>'
+    availability = "" if item["available"] else '<div class="product-tile__unavailable">Ni na voljo</div>'
+    return (
+        f'<div class="product-tile" data-testid="product-tile" data-product-id="{item["id"]}">'
+        f'<img class="product-tile__image" src="{origin}/img/spar/{item["id"]}.svg" alt="{name}">'
+        f'<a class="lib-analytics-product-link" data-ga-label="{name}" title="{name}" '
+        f'href="/spar/online/p/{item["id"]}">{name}</a>'
+        f'<div class="product-price">{prices}'
+        f'<div class="product-price__unit">{money(item["unit_price"])}/{item["unit"]}</div></div>'
+        f'{availability}</div>'
+    )
+
+
+SPAR_DRAWER = """
+<div class="ant-drawer ant-drawer-right ant-drawer-open mock-popup" data-cookie="mock_delivery" style="display:none">
+  <div class="ant-drawer-content"><div class="ant-drawer-header">Izberite način prevzema
+  <button class="ant-drawer-close" aria-label="Close"><span class="anticon anticon-close">&times;</span></button></div></div>
+</div>
+"""
+
+SPAR_AGE_GATE_MODAL = """
+<div class="ant-modal-wrap mock-popup" data-cookie="mock_age" role="dialog" style="display:none">
+  <div class="ant-modal"><p>Ali ste starejši od 18 let?</p>
+  <button class="ant-btn">Ne</button><button class="ant-btn ant-btn-primary" data-accept="1">Da, potrjujem</button></div>
+</div>
+"""
+
+
+# ==================== SKUPNO ====================
+
+COOKIE_BANNER = """
+<div id="CybotCookiebotDialog" class="cookie-banner mock-popup" data-cookie="mock_consent" style="display:none">
+  <p>Ta stran uporablja piškotke.</p>
+  <button id="CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll">Dovoli vse</button>
+</div>
+"""
+
+COMMON_JS = """
+const esc = (s) => String(s).replace(/&/g, '&amp;').replace(/"/g, '&quot;').replace(/</g, '&lt;');
+const money = (v) => v.toFixed(2).replace('.', ',') + ' €';
+// Popupi: prikažejo se z zamikom (kot v živo), zaprtje zapomni piškotek
+setTimeout(() => {
+  for (const el of document.querySelectorAll('.mock-popup')) {
+    if (document.cookie.includes(el.dataset.cookie + '=1')) { el.remove(); continue; }
+    el.style.display = 'block';
+    for (const button of el.querySelectorAll('button')) {
+      button.addEventListener('click', () => {
+        if (button.dataset.accept !== undefined || !el.querySelector('[data-accept]')) {
+          document.cookie = el.dataset.cookie + '=1; path=/; max-age=31536000';
+        }
+        el.remove();
+      });
+    }
+  }
+}, POPUP_DELAY);
+"""
+
+CSS = """
+body { font-family: sans-serif; margin: 0; padding: 16px; }
+.grid { display: grid; grid-template-columns: repeat(6, 1fr); gap: 12px; }
+.grid > * { display: block; min-height: 280px; border: 1px solid #ddd; padding: 8px; }
+.grid img { width: 100%; height: 160px; }
+.mock-popup { position: fixed; z-index: 1000; background: #fff; border: 2px solid #333; padding: 16px; }
+.cookie-banner { bottom: 0; left: 0; right: 0; }
+.Modal-overlay, .ant-modal-wrap { top: 20%; left: 30%; right: 30%; }
+.ant-drawer { top: 0; right: 0; bottom: 0; width: 360px; }
+.ant-pagination li { display: inline-block; margin: 4px; }
+"""
+
+
+def shell(title: str, body: str, settings: MockSettings, script: str = "") -> str:
+    popups = COOKIE_BANNER if settings.popups else ""
+    return (
+        f'<!doctype html><html lang="sl"><head><meta charset="utf-8"><title>{escape(title)}</title>'
+        f"<style>{CSS}</style></head><body>{body}{popups}"
+        f"<script>const POPUP_DELAY = 400;{COMMON_JS}{script}</script></body></html>"
+    )
+
+
+def image_svg(name: str) -> str:
+    hue = zlib.crc32(name.encode()) % 360
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="160" height="160">'
+        f'<rect width="160" height="160" fill="hsl({hue},60%,70%)"/></svg>'
+    )
+
+
+def escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace('"', "&quot;").replace("<", "&lt;")
+
+
+def js(value) -> str:
+    """JSON za <script> (brez zaključka script taga)"""
+    return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sintetični strežnik trgovin (Tuš, Mercator, SPAR) za load teste")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--products", type=int, default=50000, help="Izdelkov na trgovino (razdeljeno po kategorijah)")
+    parser.add_argument("--seed", type=int, default=1, help="Seme kataloga (isti seed = isti izdelki)")
+    parser.add_argument("--sale-rate", type=float, default=0.25, help="Delež izdelkov v akciji")
+    parser.add_argument("--unavailable", type=int, default=3, help="'Ni na voljo' izdelkov na koncu kategorije")
+    parser.add_argument("--page-size", type=int, default=48, help="SPAR: izdelkov na stran")
+    parser.add_argument("--batch", type=int, default=48, help="Tuš/Mercator: izdelkov na infinite scroll request")
+    parser.add_argument("--latency", type=float, default=0.0, help="Zakasnitev strani/API odgovorov (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Naključni dodatek k latenci (0..ms)")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Delež počasnih odgovorov")
+    parser.add_argument("--slow-ms", type=float, default=5000.0, help="Dodatna zakasnitev počasnega odgovora (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Delež 429 odgovorov (Retry-After: 1)")
+    parser.add_argument("--no-popups", action="store_true", help="Brez piškotkov / prevzema / 18+ popupov")
+    parser.add_argument("--verbose", action="store_true", help="Izpiši vsak request")
+    args = parser.parse_args()
+
+    MockHandler.settings = MockSettings(args)
+    server = ThreadingHTTPServer((args.host, args.port), MockHandler)
+    server.daemon_threads = True
+    origin = f"http://{args.host}:{args.port}"
+
+    print("=" * 60)
+    print(f"MOCK TRGOVINE: {origin}  ({args.products} izdelkov na trgovino, seed {args.seed})")
+    print(f"  Tuš:      {origin}/tus/kategorije")
+    print(f"  Mercator: {origin}/mercator/brskaj")
+    print(f"  SPAR:     {origin}/spar/online")
+    print(f"  Scraper:  python scraper.py --mock {origin} --no-upload")
+    print("=" * 60)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Statistika: {MockHandler.settings.stats}")
+
+
+if __name__ == "__main__":
+    main()
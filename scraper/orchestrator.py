@@ -0,0 +1,269 @@
+"""
+PR'HRAN STORE ORCHESTRATOR
+==========================
+Vse 3 trgovine HKRATI - vsaka v svojem procesu s svojim browserjem.
+
+- SPAR, Mercator, Tuš so neodvisni hosti -> čas = najpočasnejša trgovina
+- Izdelki se sproti (v batchih) pošiljajo v glavni proces prek Queue
+- Izolacija napak: če Tuš proces pade, SPAR in Mercator rezultati ostanejo
+
+UPORABA:
+    from orchestrator import StoreOrchestrator
+
+    orch = StoreOrchestrator(["spar", "mercator", "tus"], headless=True)
+    results = orch.run()          # {"spar": [...], "mercator": [...], "tus": [...]}
+    print(orch.status)            # {"tus": {"status": "crashed", ...}, ...}
+"""
+
+import time
+import queue
+import importlib
+import traceback
+import multiprocessing
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# Trgovina -> (modul, razred, metoda za vse izdelke)
+STORE_RUNNERS = {
+    "spar": ("stores.spar", "SparScraper", "scrape_all"),
+    "mercator": ("stores.mercator", "MercatorScraper", "scrape_all_simple"),
+    "tus": ("stores.tus", "TusScraper", "scrape_all"),
+}
+
+STREAM_BATCH_SIZE = 100  # Izdelkov na sporočilo
+STREAM_FLUSH_SECONDS = 5.0  # Pošlji batch tudi če ni poln
+
+
+def log(message: str, level: str = "INFO"):
+    """Structured logging (Windows-safe)"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    symbol = {
+        "ERROR": "[X]",
+        "WARNING": "[!]",
+        "SUCCESS": "[OK]",
+    }.get(level, "")
+
+    log_line = f"[{timestamp}] [ORCH] {symbol} {message}" if symbol else f"[{timestamp}] [ORCH] {message}"
+    try:
+        print(log_line, flush=True)
+    except UnicodeEncodeError:
+        print(log_line.encode('ascii', 'replace').decode('ascii'), flush=True)
+
+
+# ==================== CHILD PROCESS ====================
+
+def run_store_process(store: str, options: dict, out_queue):
+    """
+    Entry point procesa za eno trgovino.
+    Sporočila v out_queue: ("products", store, [..]), ("done", store, info), ("error", store, info)
+    """
+    # Import tukaj - spawn proces začne s čistim interpreterjem
+    from stores.browser_pool import BrowserPool
+
+    start = time.time()
+    buffer = []
+    last_flush = time.time()
+    sent = 0
+
+    def flush():
+        nonlocal buffer, last_flush, sent
+        if buffer:
+            out_queue.put(("products", store, buffer))
+            sent += len(buffer)
+            buffer = []
+        last_flush = time.time()
+
+    def on_product(product: dict):
+        buffer.append(product)
+        if len(buffer) >= STREAM_BATCH_SIZE or time.time() - last_flush >= STREAM_FLUSH_SECONDS:
+            flush()
+
+    try:
+        module_name, class_name, method_name = STORE_RUNNERS[store]
+        scraper_cls = getattr(importlib.import_module(module_name), class_name)
+
+        # Launch ali connect na PRHRAN_BROWSER_WS (topel browser med runi)
+        with BrowserPool(headless=options.get("headless", True), timeout=options.get("timeout", 60000)) as pool:
+            # Shranjena seja (piškotki, izbira prevzema) iz prejšnjega runa
+            lease = pool.acquire(scraper_cls)
+            try:
+                page = lease.page
+
+                scraper = scraper_cls(
+                    page,
+                    headless=options.get("headless", True),
+                    **options.get("scraper_kwargs", {}),
+                )
+                scraper.product_callback = on_product
+
+                # Resume: obnovi izdelke končanih kategorij iz journala in jih pošlji naprej
+                if options.get("resume") and scraper.load_checkpoint():
+                    for product in scraper.products:
+                        on_product(product)
+
+                products = getattr(scraper, method_name)()
+                flush()
+
+                out_queue.put(("done", store, {
+                    "products": len(products),
+                    "streamed": sent,
+                    "seconds": round(time.time() - start, 1),
+                    "metrics": scraper.metrics.to_dict(),
+                    "browser_pool": pool.stats(),
+                }))
+            finally:
+                pool.release(lease)
+
+    except Exception as e:
+        # Pošlji kar imamo, potem napako
+        try:
+            flush()
+        except Exception:
+            pass
+        out_queue.put(("error", store, {
+            "error": str(e),
+            "traceback": traceback.format_exc(),
+            "streamed": sent,
+            "seconds": round(time.time() - start, 1),
+        }))
+
+
+# ==================== PARENT ====================
+
+class StoreOrchestrator:
+    """Zažene trgovine v ločenih procesih in zbira izdelke sproti"""
+
+    def __init__(
+        self,
+        stores: List[str] = None,
+        headless: bool = True,
+        timeout: int = 60000,
+        resume: bool = False,
+        scraper_kwargs: dict = None,
+        on_products: Optional[Callable[[str, List[dict]], None]] = None,
+        on_store_done: Optional[Callable[[str, List[dict], dict], None]] = None,
+    ):
+        self.stores = stores or list(STORE_RUNNERS.keys())
+        self.options = {
+            "headless": headless,
+            "timeout": timeout,
+            "resume": resume,
+            "scraper_kwargs": {k: v for k, v in (scraper_kwargs or {}).items() if v is not None},
+        }
+        self.on_products = on_products
+        self.on_store_done = on_store_done
+
+        self.results: Dict[str, List[dict]] = {store: [] for store in self.stores}
+        self.status: Dict[str, dict] = {}
+
+    def run(self) -> Dict[str, List[dict]]:
+        """Zaženi vse trgovine in počakaj da končajo (ali padejo)"""
+        for store in self.stores:
+            if store not in STORE_RUNNERS:
+                raise ValueError(f"Neznana trgovina: {store}")
+
+        # spawn: čist proces brez podedovanega Playwright stanja (deluje tudi na Windows)
+        ctx = multiprocessing.get_context("spawn")
+        out_queue = ctx.Queue()
+        processes = {}
+
+        log(f"Zaganjam {len(self.stores)} procese: {', '.join(s.upper() for s in self.stores)}")
+        for store in self.stores:
+            process = ctx.Process(
+                target=run_store_process,
+                args=(store, self.options, out_queue),
+                name=f"scraper-{store}",
+                daemon=False,
+            )
+            process.start()
+            processes[store] = process
+
+        pending = set(self.stores)
+        while pending:
+            try:
+                kind, store, payload = out_queue.get(timeout=1.0)
+            except queue.Empty:
+                self._check_crashed(processes, pending, out_queue)
+                continue
+
+            if kind == "products":
+                self.results[store].extend(payload)
+                if self.on_products:
+                    self._safe_callback(self.on_products, store, payload)
+            elif kind in ("done", "error"):
+                self._finish_store(store, kind, payload)
+                pending.discard(store)
+
+        for process in processes.values():
+            process.join(timeout=30)
+
+        self.log_summary()
+        return self.results
+
+    def _check_crashed(self, processes: dict, pending: set, out_queue):
+        """Proces ki je umrl brez 'done'/'error' sporočila (segfault, OOM kill ...)"""
+        for store in list(pending):
+            process = processes[store]
+            if process.is_alive():
+                continue
+
+            # Morda je sporočilo še v vrsti - poberi ga preden razglasimo crash
+            try:
+                while True:
+                    kind, msg_store, payload = out_queue.get(timeout=0.5)
+                    if kind == "products":
+                        self.results[msg_store].extend(payload)
+                        if self.on_products:
+                            self._safe_callback(self.on_products, msg_store, payload)
+                    else:
+                        self._finish_store(msg_store, kind, payload)
+                        pending.discard(msg_store)
+            except queue.Empty:
+                pass
+
+            if store in pending:
+                self._finish_store(store, "crashed", {"exitcode": process.exitcode})
+                pending.discard(store)
+
+    def _finish_store(self, store: str, kind: str, info: dict):
+        """Zabeleži konec trgovine"""
+        products = self.results[store]
+        status = {"status": "ok" if kind == "done" else kind, "received": len(products)}
+        status.update({k: v for k, v in info.items() if k != "traceback"})
+        self.status[store] = status
+
+        if kind == "done":
+            log(f"{store.upper()}: {len(products)} izdelkov ({info.get('seconds')}s)", "SUCCESS")
+        elif kind == "error":
+            log(f"{store.upper()}: NAPAKA - {info.get('error')} (ohranjenih {len(products)} izdelkov)", "ERROR")
+            if info.get("traceback"):
+                print(info["traceback"], flush=True)
+        else:
+            log(f"{store.upper()}: proces padel (exitcode={info.get('exitcode')}, "
+                f"ohranjenih {len(products)} izdelkov)", "ERROR")
+
+        if self.on_store_done:
+            self._safe_callback(self.on_store_done, store, products, status)
+
+    def _safe_callback(self, callback: Callable, *args):
+        """Napaka v callbacku ne sme ustaviti orchestratorja"""
+        try:
+            callback(*args)
+        except Exception as e:
+            log(f"Callback napaka: {e}", "WARNING")
+
+    def log_summary(self):
+        """Povzetek po trgovinah"""
+        log("=" * 50)
+        for store in self.stores:
+            info = self.status.get(store, {})
+            log(f"  {store.upper():<10} {info.get('status', '?'):<8} {len(self.results[store]):>6} izdelkov")
+            failed = (info.get("metrics") or {}).get("failed_categories")
+            if failed:
+                log(f"  {'':<10} neuspele kategorije: {', '.join(failed)}", "ERROR")
+        log("=" * 50)
+
+
+def scrape_stores_parallel(stores: List[str] = None, headless: bool = True, **kwargs) -> Dict[str, List[dict]]:
+    """Bližnjica: vse trgovine vzporedno, vrne {trgovina: izdelki}"""
+    return StoreOrchestrator(stores, headless=headless, **kwargs).run()
@@ -6,7 +6,7 @@ Testiraj vsak scraper z malo izdelki za hitro preverjanje.
 
 import time
 from datetime import datetime
-from playwright.sync_api import sync_playwright
+from stores.browser_pool import pooled_page, close_browser_pool
 
 def test_spar():
     """Test SPAR - samo prva kategorija"""
@@ -16,37 +16,25 @@ def test_spar():
     print("[SPAR] HITER TEST")
     print("=" * 60)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            locale="sl-SI",
-        )
-        context.set_default_timeout(60000)
-        page = context.new_page()
+    # Topel browser iz poola (en launch za vse tri teste)
+    with pooled_page(SparScraper, headless=False, timeout=60000) as page:
+        scraper = SparScraper(page)
+        # Samo 1 kategorija za hiter test
+        scraper.MAIN_CATEGORIES = scraper.MAIN_CATEGORIES[:1]
+        products = scraper.scrape_all()
 
-        try:
-            scraper = SparScraper(page)
-            # Samo 1 kategorija za hiter test
-            scraper.MAIN_CATEGORIES = scraper.MAIN_CATEGORIES[:1]
-            products = scraper.scrape_all()
+        print(f"\n[SPAR] {len(products)} izdelkov")
+        if products:
+            p = products[0]
+            print(f"  Ime: {p.get('ime', 'N/A')[:50]}")
+            print(f"  Cena: {p.get('redna_cena', 'N/A')}")
+            print(f"  Slika: {p.get('slika', 'NI!')[:60]}...")
 
-            print(f"\n[SPAR] {len(products)} izdelkov")
-            if products:
-                p = products[0]
-                print(f"  Ime: {p.get('ime', 'N/A')[:50]}")
-                print(f"  Cena: {p.get('redna_cena', 'N/A')}")
-                print(f"  Slika: {p.get('slika', 'NI!')[:60]}...")
+            # Koliko ima slik
+            with_images = sum(1 for x in products if x.get('slika'))
+            print(f"  S slikami: {with_images}/{len(products)}")
 
-                # Koliko ima slik
-                with_images = sum(1 for x in products if x.get('slika'))
-                print(f"  S slikami: {with_images}/{len(products)}")
-
-            return products
-
-        finally:
-            browser.close()
+        return products
 
 
 def test_mercator():
@@ -57,42 +45,30 @@ def test_mercator():
     print("[MERCATOR] HITER TEST")
     print("=" * 60)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            locale="sl-SI",
-        )
-        context.set_default_timeout(60000)
-        page = context.new_page()
-
-        try:
-            scraper = MercatorScraper(page)
-            # Modificiraj da naredi samo 10 scrollov za test
-            original_scroll = scraper.scroll_and_load_all
-
-            def limited_scroll(max_scrolls=10):
-                return original_scroll(max_scrolls=10)
+    # Topel browser iz poola (en launch za vse tri teste)
+    with pooled_page(MercatorScraper, headless=False, timeout=60000) as page:
+        scraper = MercatorScraper(page)
+        # Modificiraj da naredi samo 10 scrollov za test
+        original_scroll = scraper.scroll_and_load_all
 
-            scraper.scroll_and_load_all = limited_scroll
-            products = scraper.scrape_all_simple()
+        def limited_scroll(max_scrolls=10):
+            return original_scroll(max_scrolls=10)
 
-            print(f"\n[MERCATOR] {len(products)} izdelkov")
-            if products:
-                p = products[0]
-                print(f"  Ime: {p.get('ime', 'N/A')[:50]}")
-                print(f"  Cena: {p.get('redna_cena', 'N/A')}")
-                print(f"  Slika: {p.get('slika', 'NI!')[:60] if p.get('slika') else 'NI!'}...")
+        scraper.scroll_and_load_all = limited_scroll
+        products = scraper.scrape_all_simple()
 
-                # Koliko ima slik
-                with_images = sum(1 for x in products if x.get('slika'))
-                print(f"  S slikami: {with_images}/{len(products)}")
+        print(f"\n[MERCATOR] {len(products)} izdelkov")
+        if products:
+            p = products[0]
+            print(f"  Ime: {p.get('ime', 'N/A')[:50]}")
+            print(f"  Cena: {p.get('redna_cena', 'N/A')}")
+            print(f"  Slika: {p.get('slika', 'NI!')[:60] if p.get('slika') else 'NI!'}...")
 
-            return products
+            # Koliko ima slik
+            with_images = sum(1 for x in products if x.get('slika'))
+            print(f"  S slikami: {with_images}/{len(products)}")
 
-        finally:
-            browser.close()
+        return products
 
 
 def test_tus():
@@ -103,37 +79,25 @@ def test_tus():
     print("[TUŠ] HITER TEST")
     print("=" * 60)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            locale="sl-SI",
-        )
-        context.set_default_timeout(60000)
-        page = context.new_page()
+    # Topel browser iz poola (en launch za vse tri teste)
+    with pooled_page(TusScraper, headless=False, timeout=60000) as page:
+        scraper = TusScraper(page)
+        # Samo 1 podkategorija za test
+        scraper.SUBCATEGORIES = scraper.SUBCATEGORIES[:1]
+        products = scraper.scrape_all()
 
-        try:
-            scraper = TusScraper(page)
-            # Samo 1 podkategorija za test
-            scraper.SUBCATEGORIES = scraper.SUBCATEGORIES[:1]
-            products = scraper.scrape_all()
+        print(f"\n[TUŠ] {len(products)} izdelkov")
+        if products:
+            p = products[0]
+            print(f"  Ime: {p.get('ime', 'N/A')[:50]}")
+            print(f"  Cena: {p.get('redna_cena', 'N/A')}")
+            print(f"  Slika: {p.get('slika', 'NI!')[:60] if p.get('slika') else 'NI!'}...")
 
-            print(f"\n[TUŠ] {len(products)} izdelkov")
-            if products:
-                p = products[0]
-                print(f"  Ime: {p.get('ime', 'N/A')[:50]}")
-                print(f"  Cena: {p.get('redna_cena', 'N/A')}")
-                print(f"  Slika: {p.get('slika', 'NI!')[:60] if p.get('slika') else 'NI!'}...")
+            # Koliko ima slik
+            with_images = sum(1 for x in products if x.get('slika'))
+            print(f"  S slikami: {with_images}/{len(products)}")
 
-                # Koliko ima slik
-                with_images = sum(1 for x in products if x.get('slika'))
-                print(f"  S slikami: {with_images}/{len(products)}")
-
-            return products
-
-        finally:
-            browser.close()
+        return products
 
 
 if __name__ == "__main__":
@@ -167,6 +131,8 @@ if __name__ == "__main__":
         print(f"[TUŠ] NAPAKA: {e}")
         results["tus"] = []
 
+    close_browser_pool()
+
     # Povzetek
     print("\n" + "=" * 70)
     print("POVZETEK")
@@ -4,31 +4,28 @@ HITER TEST GOOGLE SHEETS UPLOAD
 Testira upload v Google Sheets z obstoječimi podatki.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
+from itertools import islice
 from google_sheets import GoogleSheetsManager
+from stores.progress import find_progress_files, iter_progress_records
 
 def load_sample_products(store: str, count: int = 10):
     """Naloži vzorčne izdelke iz progress datotek"""
     progress_dir = Path(__file__).parent / "progress"
 
-    # Najdi najnovejšo datoteko za trgovino
-    files = list(progress_dir.glob(f"{store.lower()}_*.json"))
+    # Najdi najnovejšo datoteko za trgovino (najnovejša zadnja)
+    files = find_progress_files(progress_dir, store)
     if not files:
         print(f"[!] Ni progress datotek za {store}")
         return []
 
-    # Sortiraj po datumu (najnovejša prva)
-    files.sort(reverse=True)
-    latest = files[0]
+    latest = files[-1]
 
     print(f"[{store}] Berem iz: {latest.name}")
 
-    with open(latest, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    products = data.get('products', [])[:count]
+    # Leno branje - samo prvih `count` izdelkov
+    products = list(islice(iter_progress_records(latest), count))
     print(f"[{store}] Naloženih {len(products)} izdelkov")
 
     return products
@@ -0,0 +1,80 @@
+"""
+REPARSE SNAPSHOTOV (brez browserja)
+===================================
+Arhivirane strani (ARCHIVE_SNAPSHOTS = True -> snapshots/{trgovina}/*.html.gz)
+znova razčleni z isto parse_tile() logiko kot živ scrape - npr. po popravku
+pravil za cene, brez ponovnega obiska trgovine.
+
+Izdelki gredo v progress/{trgovina}_{ts}.jsonl kot pri navadnem runu
+(import_progress_to_convex.py jih uvozi).
+
+UPORABA:
+    python reparse_snapshots.py --store tus
+    python reparse_snapshots.py --store spar snapshots/spar/pijace_*.html.gz
+    python reparse_snapshots.py --store mercator --workers 4
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from stores import snapshot as snapshots
+from stores.spar import SparScraper
+from stores.mercator import MercatorScraper
+from stores.tus import TusScraper
+
+SCRAPERS = {
+    "spar": SparScraper,
+    "mercator": MercatorScraper,
+    "tus": TusScraper,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ponovno razčleni arhivirane snapshote strani")
+    parser.add_argument("--store", "-s", choices=list(SCRAPERS.keys()), required=True)
+    parser.add_argument("files", nargs="*", help="Snapshoti (default: snapshots/{trgovina}/*.html.gz)")
+    parser.add_argument("--workers", type=int, default=0, help="Procesi za velike strani (0 = auto)")
+    args = parser.parse_args()
+
+    if not snapshots.available():
+        print("Potrebna sta lxml in cssselect (pip install -r requirements.txt)")
+        sys.exit(1)
+
+    scraper_cls = SCRAPERS[args.store]
+    scraper = scraper_cls(None, extraction_mode="snapshot")
+    scraper.SNAPSHOT_WORKERS = args.workers
+
+    files = [Path(f) for f in args.files] or sorted(scraper.snapshots_dir.glob("*.html*"))
+    if not files:
+        print(f"Ni snapshotov v {scraper.snapshots_dir}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    for path in files:
+        page_start = time.perf_counter()
+        try:
+            snapshot = snapshots.PageSnapshot.load(path)
+        except Exception as e:
+            print(f"  {path.name}: napaka pri branju ({e})")
+            continue
+        scraper.current_category = snapshot.category
+        products = scraper.parse_snapshot(snapshot)
+        print(f"  {path.name}: {len(products):>5} izdelkov ({snapshot.category or '-'}) "
+              f"v {time.perf_counter() - page_start:.2f}s")
+
+    scraper.close_progress()
+    snapshots.shutdown_parse_pool()
+    scraper.flush_log()
+
+    print("=" * 60)
+    print(f"{scraper.STORE_NAME}: {len(scraper.products)} izdelkov iz {len(files)} snapshotov "
+          f"v {time.perf_counter() - start:.1f}s")
+    if scraper.progress_writer:
+        print(f"Progress: {scraper.progress_writer.path}")
+
+
+if __name__ == "__main__":
+    main()
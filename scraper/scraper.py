@@ -19,14 +19,13 @@ UPORABA:
     python scraper.py --no-upload        # Brez pošiljanja v Convex
     python scraper.py --headful          # Prikaži browser
 """
-import json
+import os
 import time
 import sys
 import traceback
 import requests
 from datetime import datetime
 from pathlib import Path
-from playwright.sync_api import sync_playwright
 
 # Google Sheets upload
 from google_sheets import upload_to_sheets, GoogleSheetsManager
@@ -37,16 +36,27 @@ from config import CONVEX_URL, INGEST_TOKEN
 from stores.spar import SparScraper
 from stores.mercator import MercatorScraper
 from stores.tus import TusScraper
+from stores.progress import progress_path, write_products
+from stores.product import to_dicts
+from stores.browser_pool import get_browser_pool, pooled_page, close_browser_pool
 
 # Product matcher
 from matcher import ProductMatcher
+from orchestrator import StoreOrchestrator
 
 
 class PrHranScraper:
     """BULLETPROOF glavni orchestrator za vse scraperje"""
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, extraction_mode: str = None, capture_api: bool = None,
+                 workers: int = None, parallel: bool = True, streaming: bool = None, resume: bool = False):
         self.headless = headless
+        self.parallel = parallel
+        self.extraction_mode = extraction_mode
+        self.capture_api = capture_api
+        self.workers = workers
+        self.streaming = streaming
+        self.resume = resume
         self.all_products = []
         self.stats = {
             "spar": 0,
@@ -82,6 +92,11 @@ class PrHranScraper:
             safe_line = log_line.encode('ascii', 'replace').decode('ascii')
             print(safe_line, flush=True)
 
+    def record_failed_categories(self, store: str, failed: list):
+        """Neuspele kategorije trgovine (tudi po ponovitvi) v povzetek napak"""
+        if failed:
+            self.stats["errors"].append({"store": store, "error": f"neuspele kategorije: {', '.join(failed)}"})
+
     def scrape_spar(self, page) -> list[dict]:
         """Scrapaj SPAR z BULLETPROOF scraperjem"""
         self.log("=" * 60)
@@ -89,9 +104,12 @@ class PrHranScraper:
         self.log("=" * 60)
 
         try:
-            scraper = SparScraper(page)
+            scraper = SparScraper(page, extraction_mode=self.extraction_mode, capture_api=self.capture_api)
+            if self.resume:
+                scraper.load_checkpoint()
             products = scraper.scrape_all()
             self.stats["spar"] = len(products)
+            self.record_failed_categories("spar", scraper.metrics.failed_categories)
             self.log(f"SPAR KONČANO: {len(products)} izdelkov", "SUCCESS")
             return products
         except Exception as e:
@@ -107,10 +125,18 @@ class PrHranScraper:
         self.log("=" * 60)
 
         try:
-            scraper = MercatorScraper(page)
+            scraper = MercatorScraper(
+                page,
+                extraction_mode=self.extraction_mode,
+                capture_api=self.capture_api,
+                streaming=self.streaming,
+            )
             # Uporabi /brskaj URL z infinite scroll (vsi izdelki na eni strani)
+            if self.resume:
+                scraper.load_checkpoint()
             products = scraper.scrape_all_simple()
             self.stats["mercator"] = len(products)
+            self.record_failed_categories("mercator", scraper.metrics.failed_categories)
             self.log(f"MERCATOR KONČANO: {len(products)} izdelkov", "SUCCESS")
             return products
         except Exception as e:
@@ -126,9 +152,19 @@ class PrHranScraper:
         self.log("=" * 60)
 
         try:
-            scraper = TusScraper(page)
+            scraper = TusScraper(
+                page,
+                headless=self.headless,
+                extraction_mode=self.extraction_mode,
+                capture_api=self.capture_api,
+                workers=self.workers,
+                streaming=self.streaming,
+            )
+            if self.resume:
+                scraper.load_checkpoint()
             products = scraper.scrape_all()
             self.stats["tus"] = len(products)
+            self.record_failed_categories("tus", scraper.metrics.failed_categories)
             self.log(f"TUŠ KONČANO: {len(products)} izdelkov", "SUCCESS")
             return products
         except Exception as e:
@@ -147,64 +183,10 @@ class PrHranScraper:
         self.log(f"Čas: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         self.log("=" * 60)
 
-        with sync_playwright() as p:
-            # Zaženi browser z optimiziranimi nastavitvami
-            browser = p.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-accelerated-2d-canvas",
-                    "--no-first-run",
-                    "--no-zygote",
-                    "--disable-gpu",
-                    "--disable-blink-features=AutomationControlled",
-                ]
-            )
-
-            # Context z realističnimi nastavitvami
-            context = browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                locale="sl-SI",
-                timezone_id="Europe/Ljubljana",
-                geolocation={"latitude": 46.0569, "longitude": 14.5058},  # Ljubljana
-                permissions=["geolocation"],
-            )
-
-            # Nastavi timeout
-            context.set_default_timeout(30000)
-
-            page = context.new_page()
-
-            # Scrapaj vsako trgovino posebej
-            try:
-                spar_products = self.scrape_spar(page)
-                self.all_products.extend(spar_products)
-                self.save_progress("spar", spar_products)
-            except Exception as e:
-                self.log(f"KRITIČNA NAPAKA pri SPAR: {e}", "ERROR")
-
-            time.sleep(2)
-
-            try:
-                mercator_products = self.scrape_mercator(page)
-                self.all_products.extend(mercator_products)
-                self.save_progress("mercator", mercator_products)
-            except Exception as e:
-                self.log(f"KRITIČNA NAPAKA pri MERCATOR: {e}", "ERROR")
-
-            time.sleep(2)
-
-            try:
-                tus_products = self.scrape_tus(page)
-                self.all_products.extend(tus_products)
-                self.save_progress("tus", tus_products)
-            except Exception as e:
-                self.log(f"KRITIČNA NAPAKA pri TUŠ: {e}", "ERROR")
-
-            browser.close()
+        if self.parallel:
+            self.scrape_stores_parallel()
+        else:
+            self.scrape_stores_sequential()
 
         self.stats["end_time"] = datetime.now()
         self.stats["total"] = len(self.all_products)
@@ -245,6 +227,72 @@ class PrHranScraper:
 
         return self.all_products
 
+    def scrape_stores_parallel(self):
+        """Vse 3 trgovine hkrati - vsaka v svojem procesu (glej orchestrator.py)"""
+        def on_store_done(store: str, products: list[dict], status: dict):
+            self.stats[store] = len(products)
+            if status["status"] != "ok":
+                self.stats["errors"].append({"store": store, "error": status.get("error") or status["status"]})
+            self.record_failed_categories(store, (status.get("metrics") or {}).get("failed_categories"))
+            # Shrani tudi delne rezultate padle trgovine
+            self.save_progress(store, products)
+
+        orchestrator = StoreOrchestrator(
+            ["spar", "mercator", "tus"],
+            headless=self.headless,
+            timeout=30000,
+            resume=self.resume,
+            scraper_kwargs={
+                "extraction_mode": self.extraction_mode,
+                "capture_api": self.capture_api,
+                "workers": self.workers,
+                "streaming": self.streaming,
+            },
+            on_products=lambda store, batch: self.all_products.extend(batch),
+            on_store_done=on_store_done,
+        )
+        orchestrator.run()
+
+    def scrape_stores_sequential(self):
+        """Trgovine ena za drugo v enem toplem browserju (--sequential)"""
+        # Context z realističnimi nastavitvami (+ shranjena seja trgovine iz BrowserPool)
+        context_extra = {
+            "geolocation": {"latitude": 46.0569, "longitude": 14.5058},  # Ljubljana
+            "permissions": ["geolocation"],
+        }
+        pool = get_browser_pool(self.headless)
+
+        # Scrapaj vsako trgovino posebej
+        try:
+            with pooled_page(SparScraper, self.headless, **context_extra) as page:
+                spar_products = self.scrape_spar(page)
+            self.all_products.extend(spar_products)
+            self.save_progress("spar", spar_products)
+        except Exception as e:
+            self.log(f"KRITIČNA NAPAKA pri SPAR: {e}", "ERROR")
+
+        time.sleep(2)
+
+        try:
+            with pooled_page(MercatorScraper, self.headless, **context_extra) as page:
+                mercator_products = self.scrape_mercator(page)
+            self.all_products.extend(mercator_products)
+            self.save_progress("mercator", mercator_products)
+        except Exception as e:
+            self.log(f"KRITIČNA NAPAKA pri MERCATOR: {e}", "ERROR")
+
+        time.sleep(2)
+
+        try:
+            with pooled_page(TusScraper, self.headless, **context_extra) as page:
+                tus_products = self.scrape_tus(page)
+            self.all_products.extend(tus_products)
+            self.save_progress("tus", tus_products)
+        except Exception as e:
+            self.log(f"KRITIČNA NAPAKA pri TUŠ: {e}", "ERROR")
+
+        self.log(f"Browser pool: {pool.stats()}")
+
     def run_matching(self) -> list[dict]:
         """
         BULLETPROOF MATCHING
@@ -284,26 +332,10 @@ class PrHranScraper:
         self.stats["start_time"] = datetime.now()
         self.all_products = []
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-blink-features=AutomationControlled",
-                ]
-            )
-
-            context = browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                locale="sl-SI",
-            )
-            context.set_default_timeout(30000)
-            page = context.new_page()
-
-            store_lower = store.lower()
+        store_lower = store.lower()
+        scraper_cls = {"spar": SparScraper, "mercator": MercatorScraper}.get(store_lower, TusScraper)
 
+        with pooled_page(scraper_cls, self.headless) as page:
             if store_lower == "spar":
                 self.all_products = self.scrape_spar(page)
             elif store_lower == "mercator":
@@ -313,26 +345,18 @@ class PrHranScraper:
             else:
                 self.log(f"Neznana trgovina: {store}", "ERROR")
 
-            browser.close()
-
         self.stats["end_time"] = datetime.now()
         self.stats["total"] = len(self.all_products)
 
         return self.all_products
 
     def save_progress(self, store_name: str, products: list[dict]):
-        """Shrani napredek za posamezno trgovino"""
+        """Shrani napredek za posamezno trgovino (kompaktni JSONL, glej stores/progress.py)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = self.progress_dir / f"{store_name}_{timestamp}.json"
+        filename = progress_path(self.progress_dir, store_name, timestamp=timestamp)
 
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump({
-                    "store": store_name,
-                    "timestamp": timestamp,
-                    "count": len(products),
-                    "products": products
-                }, f, ensure_ascii=False, indent=2)
+            write_products(filename, products, header={"store": store_name, "timestamp": timestamp})
             self.log(f"Progress shranjen: {filename}")
         except Exception as e:
             self.log(f"Napaka pri shranjevanju progress: {e}", "WARNING")
@@ -359,7 +383,7 @@ class PrHranScraper:
 
         # Pripravi payload
         payload = {
-            "items": products,
+            "items": to_dicts(products),
             "clearFirst": False,
         }
 
@@ -422,13 +446,12 @@ class PrHranScraper:
         return success
 
     def save_to_file(self, filename: str = None) -> str:
-        """Shrani izdelke v JSON datoteko"""
+        """Shrani izdelke v JSONL datoteko (en izdelek na vrstico, .gz = stisnjeno)"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"scraped_products_{timestamp}.json"
+            filename = f"scraped_products_{timestamp}.jsonl"
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(self.all_products, f, ensure_ascii=False, indent=2)
+        write_products(Path(filename), self.all_products, header={"count": len(self.all_products)})
 
         self.log(f"Shranjeno v {filename}", "SUCCESS")
         return filename
@@ -454,7 +477,7 @@ class PrHranScraper:
         if self.stats.get("errors"):
             print(f"\n  NAPAKE: {len(self.stats['errors'])}")
             for err in self.stats["errors"]:
-                print(f"    - {err['store']}: {err['error'][:50]}")
+                print(f"    - {err['store']}: {err['error'][:100]}")
 
         if self.stats["start_time"] and self.stats["end_time"]:
             duration = self.stats["end_time"] - self.stats["start_time"]
@@ -484,6 +507,81 @@ def main():
         action="store_true",
         help="Prikaži browser (za debugging)",
     )
+    parser.add_argument(
+        "--extraction",
+        choices=["element", "bulk", "snapshot"],
+        default=None,
+        help="Način ekstrakcije tile-ov (default: nastavitev trgovine)",
+    )
+    parser.add_argument(
+        "--capture-api",
+        action="store_true",
+        default=None,
+        help="Beri izdelke iz API odgovorov trgovine (DOM ostane fallback)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Vzporedni category workerji na trgovino (default: nastavitev trgovine, omejeno s politeness capom)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        default=None,
+        help="Beri izdelke med scrollom in prazni obdelane tile (Tuš, Mercator)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Nadaljuj zadnji checkpoint (izdelki končanih kategorij iz journala)",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Vklopi delta scraping (nespremenjene kategorije iz prejšnjega runa, stores/delta.py)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Izklopi delta scraping (vse kategorije scrollaj, tudi nespremenjene)",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        metavar="SPEC",
+        help="Profiling kategorij: all / delež (0.2) / Kat1,Kat2 -> profiling/{trgovina}_{ts}/ (trace, cProfile, CDP klici)",
+    )
+    parser.add_argument(
+        "--har",
+        choices=["record", "replay"],
+        default=None,
+        help="Snemaj (record) ali predvajaj (replay, offline) HAR trgovin v har/{trgovina}/ (stores/har.py)",
+    )
+    parser.add_argument(
+        "--har-latency",
+        type=float,
+        default=None,
+        metavar="MS",
+        help="Umetna zakasnitev na request ob --har replay (ms)",
+    )
+    parser.add_argument(
+        "--mock",
+        default=None,
+        metavar="URL",
+        help="Scrapaj mock trgovine (mock_store.py, npr. http://127.0.0.1:8765) namesto živih - brez uploada",
+    )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Trgovine ena za drugo namesto vzporednih procesov",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default=None,
+        help="Najnižji nivo log zapisov (default: DEBUG, ali PRHRAN_LOG_LEVEL)",
+    )
     parser.add_argument(
         "--batch-size",
         type=int,
@@ -493,18 +591,48 @@ def main():
 
     args = parser.parse_args()
 
+    if args.log_level:
+        # Env gre tudi v procese trgovin (orchestrator spawn)
+        os.environ["PRHRAN_LOG_LEVEL"] = args.log_level
+    if args.delta:
+        os.environ["PRHRAN_DELTA"] = "1"
+    if args.full:
+        os.environ["PRHRAN_DELTA"] = "0"
+    if args.profile:
+        os.environ["PRHRAN_PROFILE"] = args.profile
+    if args.har:
+        os.environ["PRHRAN_HAR"] = args.har
+    if args.har_latency is not None:
+        os.environ["PRHRAN_HAR_LATENCY_MS"] = str(args.har_latency)
+    if args.mock:
+        # PRHRAN_BASE_URL_{TRGOVINA} velja tudi v procesih trgovin; sintetičnih izdelkov ne uploadamo
+        for store in ("spar", "mercator", "tus"):
+            os.environ[f"PRHRAN_BASE_URL_{store.upper()}"] = f"{args.mock.rstrip('/')}/{store}"
+        args.no_upload = True
+
     print("=" * 60)
     print("PrHran BULLETPROOF Avtomatski Scraper")
     print(f"Čas: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
 
-    scraper = PrHranScraper(headless=not args.headful)
+    scraper = PrHranScraper(
+        headless=not args.headful,
+        extraction_mode=args.extraction,
+        capture_api=args.capture_api,
+        workers=args.workers,
+        parallel=not args.sequential,
+        streaming=args.streaming,
+        resume=args.resume,
+    )
 
     # Scrapaj
-    if args.store == "all":
-        scraper.scrape_all()
-    else:
-        scraper.scrape_single_store(args.store)
+    try:
+        if args.store == "all":
+            scraper.scrape_all()
+        else:
+            scraper.scrape_single_store(args.store)
+    finally:
+        close_browser_pool()
 
     # Statistika
     scraper.print_stats()
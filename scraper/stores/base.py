@@ -21,24 +21,173 @@ import time
 import random
 import json
 import hashlib
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable, Any, List, Dict, Tuple
-from dataclasses import dataclass, field, asdict
+from urllib.parse import urlsplit
+from dataclasses import dataclass, field, asdict, replace
 from playwright.sync_api import Page, ElementHandle, TimeoutError as PlaywrightTimeout, Response
 
+from .capture import ResponseCapture, find_product_items, first_value, is_last_page, to_price
+from .workers import CategoryWorkerPool
+from .browser_pool import CONTEXT_OPTIONS
+from .journal import ProductJournal
+from .progress import ProgressWriter, progress_path
+from .logger import get_logger
+from .popups import COOKIE_POPUP_RULES, PopupGuard
+from .session import load_storage_state, persistent_cookie_names, save_storage_state
+from .ratelimit import RateController, get_rate_controller, host_key
+from .breaker import CircuitBreaker, RetryBudget, get_breaker, url_pattern
+from .delta import FINGERPRINT_JS, DeltaCache, delta_enabled, delta_max_age_hours, fingerprint
+from .selector_stats import RACE_SELECTORS_JS, SelectorStats, get_selector_stats
+from .timing import PhaseTimings, prometheus_dir
+from .profiling import ProfileRun, parse_profile_spec
+from . import snapshot as snapshots
+from .delta import category_slug
+from .product import Product, fingerprint64, fingerprint_key
+from .validation import ProductQuality, ProductValidator
+from .prices import PriceRules
+
 
 class ScraperError(Exception):
     """Custom scraper exception"""
     pass
 
 
+# BULK ekstrakcija - en page.eval_on_selector_all za VSE tile na strani.
+# Vrne surove podatke (teksti, atributi, class flagi, slike), Python logika
+# za cene ostane v posameznih scraperjih (parse_tile).
+BULK_EXTRACT_JS = """
+(els, spec) => els.map((el) => {
+    const first = (sel) => { try { return el.querySelector(sel); } catch (e) { return null; } };
+    const all = (sel) => { try { return Array.from(el.querySelectorAll(sel)); } catch (e) { return []; } };
+    const describe = (node) => node ? {
+        tag: node.tagName,
+        text: node.innerText || "",
+        title: node.getAttribute("title"),
+        alt: node.getAttribute("alt"),
+        cls: node.getAttribute("class") || "",
+    } : null;
+    const image = (node) => {
+        if (!node) return null;
+        const attrs = {};
+        for (const a of (spec.image_attrs || [])) attrs[a] = node.getAttribute(a);
+        return attrs;
+    };
+    const attrs = {};
+    for (const a of (spec.attrs || [])) attrs[a] = el.getAttribute(a);
+    const flags = {};
+    for (const s of (spec.flags || [])) flags[s] = !!first(s);
+    const groups = {};
+    for (const [key, sels] of Object.entries(spec.groups || {})) groups[key] = sels.map((s) => describe(first(s)));
+    const lists = {};
+    for (const [key, sels] of Object.entries(spec.lists || {})) lists[key] = sels.map((s) => all(s).map(describe));
+    return {
+        text: el.innerText || "",
+        attrs: attrs,
+        names: (spec.names || []).map((s) => describe(first(s))),
+        images: (spec.images || []).map((s) => image(first(s))),
+        flags: flags,
+        groups: groups,
+        lists: lists,
+    };
+})
+"""
+
+
+# STREAMING ekstrakcija - BULK_EXTRACT_JS samo za še neobdelane tile, ki jih
+# v ISTEM klicu označi (EXTRACTED_ATTR) in po želji izprazni (DOM + heap ostaneta ravna).
+# Izpraznjen tile obdrži višino, da se layout/scroll pozicija ne premakne.
+STREAM_EXTRACT_JS = """
+(els, [spec, attr, prune]) => {
+    const extract = """ + BULK_EXTRACT_JS + """;
+    const out = extract(els, spec);
+    for (const el of els) {
+        el.setAttribute(attr, "1");
+        if (prune) {
+            const height = el.offsetHeight;
+            if (height) el.style.minHeight = height + "px";
+            el.replaceChildren();
+        }
+    }
+    return out;
+}
+"""
+
+
+# SCROLL ENGINE - signali iz strani (MutationObserver za nove tile + product-list requesti).
+# Idempotentno: ponoven klic samo posodobi selector/vzorce.
+SCROLL_OBSERVER_JS = """
+([tileSelector, patterns]) => {
+    if (!window.__prhranScroll) {
+        const state = {added: 0, inflight: 0, lastChange: Date.now(), selector: tileSelector, patterns: []};
+        window.__prhranScroll = state;
+        const touch = () => { state.lastChange = Date.now(); };
+        const tracked = (url) => !state.patterns.length || state.patterns.some((p) => p.test(String(url)));
+
+        new MutationObserver((records) => {
+            let added = 0;
+            for (const r of records) {
+                for (const n of r.addedNodes) {
+                    if (n.nodeType !== 1) continue;
+                    try {
+                        added += n.matches(state.selector) ? 1 : n.querySelectorAll(state.selector).length;
+                    } catch (e) {}
+                }
+            }
+            if (added) { state.added += added; touch(); }
+        }).observe(document.body, {childList: true, subtree: true});
+
+        const open = XMLHttpRequest.prototype.open;
+        const send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.open = function (method, url) {
+            this.__prhranUrl = url;
+            return open.apply(this, arguments);
+        };
+        XMLHttpRequest.prototype.send = function () {
+            if (tracked(this.__prhranUrl)) {
+                state.inflight += 1; touch();
+                this.addEventListener("loadend", () => { state.inflight -= 1; touch(); });
+            }
+            return send.apply(this, arguments);
+        };
+
+        const fetchOrig = window.fetch;
+        if (fetchOrig) {
+            window.fetch = function (input) {
+                const url = (input && input.url) || input;
+                if (!tracked(url)) return fetchOrig.apply(this, arguments);
+                state.inflight += 1; touch();
+                return fetchOrig.apply(this, arguments).finally(() => { state.inflight -= 1; touch(); });
+            };
+        }
+    }
+    const state = window.__prhranScroll;
+    state.selector = tileSelector;
+    state.patterns = patterns.map((p) => { try { return new RegExp(p, "i"); } catch (e) { return null; } }).filter(Boolean);
+    return true;
+}
+"""
+
+SCROLL_SIGNALS_JS = """
+() => {
+    const s = window.__prhranScroll;
+    if (!s) return null;
+    return {added: s.added, inflight: s.inflight, quiet: Date.now() - s.lastChange,
+            height: document.body.scrollHeight};
+}
+"""
+
+
 @dataclass
 class ScrapingMetrics:
     """Metrike scrapanja za analizo"""
     start_time: datetime = None
     end_time: datetime = None
     pages_scraped: int = 0
+    pages_failed: int = 0  # Strani ki se niso naložile niti ob ponovitvi (SPAR paginacija)
+    failed_categories: List[str] = field(default_factory=list)  # Neuspele tudi po ponovitvi
     products_found: int = 0
     products_valid: int = 0
     products_invalid: int = 0
@@ -49,54 +198,54 @@ class ScrapingMetrics:
     avg_page_load_time: float = 0.0
     avg_products_per_page: float = 0.0
     blocked_requests: int = 0
+    api_responses: int = 0
+    api_products: int = 0
+    scroll_time: float = 0.0
+    category_scroll_times: Dict[str, float] = field(default_factory=dict)
+    extract_time: float = 0.0
+    category_extract_times: Dict[str, float] = field(default_factory=dict)
+    peak_js_heap_mb: float = 0.0
+    peak_dom_nodes: int = 0
+    popups_dismissed: Dict[str, int] = field(default_factory=dict)
+    request_rate: float = 0.0  # Trenutna hitrost AIMD controllerja (zahtev/s)
+    rate_wait_time: float = 0.0  # Skupni čas čakanja na žetone
+    rate_backoffs: int = 0
+    retry_time: float = 0.0  # Čas izgubljen z neuspelimi poskusi + čakanjem
+    circuit_opens: int = 0
+    circuit_fast_fails: int = 0
+    circuit_state: Dict[str, str] = field(default_factory=dict)
+    retry_budget_left: int = 0
+    delta_reused_categories: int = 0  # Nespremenjene kategorije (izdelki iz prejšnjega runa)
+    delta_reused_products: int = 0
+    delta_time_saved: float = 0.0  # Ocenjen prihranek (trajanje polnega scrapa prejšnjega runa)
+    selector_drift: Dict[str, str] = field(default_factory=dict)  # polje -> nov zmagovalec
+    selector_self_heals: int = 0  # Noben znan selektor ni deloval (fallback vzorci)
+    rejections: Dict[str, int] = field(default_factory=dict)  # Razlog zavrnitve -> število
 
     def to_dict(self) -> dict:
         return asdict(self)
 
 
-@dataclass
-class ProductQuality:
-    """Ocena kvalitete podatkov izdelka"""
-    has_name: bool = False
-    has_price: bool = False
-    has_image: bool = False
-    has_category: bool = False
-    has_unit: bool = False
-    name_length_ok: bool = False
-    price_reasonable: bool = False
-    image_url_valid: bool = False
-
-    @property
-    def score(self) -> int:
-        """Vrni score 0-100"""
-        checks = [
-            self.has_name * 20,
-            self.has_price * 25,
-            self.has_image * 20,
-            self.has_category * 10,
-            self.has_unit * 10,
-            self.name_length_ok * 5,
-            self.price_reasonable * 5,
-            self.image_url_valid * 5,
-        ]
-        return sum(checks)
-
-    @property
-    def is_acceptable(self) -> bool:
-        """Ali je kvaliteta sprejemljiva (min 50)"""
-        return self.score >= 50
-
-
 class BulletproofScraper:
     """ULTIMATE Base class za vse scraperje"""
 
     STORE_NAME = "Unknown"
     BASE_URL = ""
+    # PRHRAN_BASE_URL_{TRGOVINA} (npr. PRHRAN_BASE_URL_TUS=http://127.0.0.1:8765/tus) preusmeri
+    # BASE_URL in vse *_URL / CATEGORY_URLS trgovine - mock_store.py, staging
 
     # ==================== RETRY CONFIG ====================
     MAX_RETRIES = 5  # Povečano iz 3
     RETRY_DELAYS = [1, 2, 4, 8, 16]  # Exponential backoff
 
+    # ==================== CIRCUIT BREAKER CONFIG ====================
+    # stores/breaker.py - trgovina / URL vzorec, skupno vsem workerjem
+    CIRCUIT_BREAKER_ENABLED = True
+    CIRCUIT_STORE_THRESHOLD = 8  # zaporednih napak navigacije na trgovino
+    CIRCUIT_PATTERN_THRESHOLD = 3  # zaporednih napak na URL vzorec
+    CIRCUIT_RESET_SECONDS = 60.0  # open -> half_open (probe)
+    RETRY_BUDGET = 60  # retry-jev na run (vsi workerji skupaj)
+
     # ==================== TIMING CONFIG ====================
     MIN_DELAY = 0.3
     MAX_DELAY = 1.5
@@ -108,12 +257,66 @@ class BulletproofScraper:
     SLOW_RESPONSE_THRESHOLD = 3.0  # sekund
     FAST_RESPONSE_THRESHOLD = 0.5
 
+    # ==================== RATE CONTROL CONFIG ====================
+    # AIMD token bucket na host (stores/ratelimit.py) - skupen vsem workerjem trgovine
+    RATE_CONTROL_ENABLED = True
+    RATE_INITIAL = 1.0  # zahtev/s
+    RATE_MIN = 0.2
+    RATE_MAX = 5.0
+    RATE_INCREASE = 0.1  # + na uspešno sekundo
+    RATE_DECREASE = 0.5  # * ob 429/5xx/počasnem odzivu
+    RATE_BURST = 2.0  # žetonov
+    RATE_FEEDBACK_TYPES = ("document", "xhr", "fetch")
+
     # ==================== VALIDATION CONFIG ====================
     MIN_PRICE = 0.01
     MAX_PRICE = 9999
     MIN_NAME_LENGTH = 2
     MAX_NAME_LENGTH = 500
     MIN_QUALITY_SCORE = 45  # Minimalna kvaliteta za sprejem
+    PRICE_RULES = PriceRules()  # Izbira redne/akcijske iz teksta tile-a (stores/prices.py)
+
+    # ==================== SCROLL ENGINE CONFIG ====================
+    SCROLL_QUIET_WINDOW = 1.0  # sekund brez novih tile-ov/requestov = korak končan
+    SCROLL_STEP_TIMEOUT = 15.0  # max čakanja na en korak (npr. visi analytics request)
+    SCROLL_POLL_INTERVAL = 0.1
+    SCROLL_IDLE_STEPS = 3  # zaporedni koraki brez rasti = konec seznama
+    SCROLL_TILE_SELECTORS: List[str] = []  # prazno = PRODUCT_SELECTORS[:3]
+    LOAD_MORE_SELECTORS = [
+        'button[class*="load-more"]',
+        'button[class*="LoadMore"]',
+        'button[class*="loadMore"]',
+        'button[class*="show-more"]',
+        'button[class*="ShowMore"]',
+        '[class*="loadMore"] button',
+        'button:has-text("Naloži več")',
+        'button:has-text("Prikaži več")',
+        'button:has-text("Več izdelkov")',
+        'a:has-text("Več izdelkov")',
+        'a:has-text("Naloži več")',
+        'a[class*="load-more"]',
+    ]
+
+    # ==================== EXTRACTION CONFIG ====================
+    # "element" = ElementHandle za vsak tile (veliko CDP round-tripov)
+    # "bulk" = en page.eval_on_selector_all za vso stran (BULK_EXTRACT_JS)
+    # "snapshot" = en page.content(), tile-e razčleni lxml (stores/snapshot.py), brez CDP na tile
+    EXTRACTION_MODE = "element"
+    PRODUCT_SELECTORS: List[str] = []
+    NAME_SELECTORS: List[str] = []
+    IMAGE_SELECTORS: List[str] = []
+    IMAGE_ATTRS = ["data-src", "data-lazy-src", "src"]
+
+    # STREAMING: izdelki se berejo med scrollom (parse_tile), obdelani tile se izpraznijo
+    STREAMING_EXTRACTION = False
+    PRUNE_EXTRACTED = True
+    EXTRACTED_ATTR = "data-prhran-done"
+    MEASURE_BROWSER_MEMORY = False  # CDP Performance.getMetrics na vsak scroll korak
+
+    # SNAPSHOT: velike strani se razčlenijo v več procesih (ProcessPoolExecutor)
+    SNAPSHOT_WORKERS = 0  # 0 = auto (CPU - 1, max 4), 1 = brez poola
+    SNAPSHOT_PARALLEL_MIN_TILES = 400  # manj tile-ov -> v tem procesu (pool se ne splača)
+    ARCHIVE_SNAPSHOTS = False  # snapshots/{trgovina}/{kategorija}_{ts}.html.gz (reparse_snapshots.py)
 
     # ==================== NETWORK CONFIG ====================
     BLOCK_RESOURCES = False  # IZKLOPLJENO za debugging
@@ -126,17 +329,87 @@ class BulletproofScraper:
         "ads", "advertising", "banner",
     ]
 
+    # ==================== NETWORK CAPTURE CONFIG ====================
+    # Opt-in: beri izdelke iz product-list API odgovorov namesto iz DOM-a
+    CAPTURE_API_RESPONSES = False
+    API_URL_PATTERNS: List[str] = []
+    # Poti do polj v API izdelku (s piko za gnezdena polja)
+    API_FIELDS: Dict[str, List[str]] = {
+        "name": ["name", "title", "item_name", "productName", "ime"],
+        "price": ["price", "currentPrice", "current_price", "finalPrice", "salePrice", "cena"],
+        "regular_price": ["regularPrice", "regular_price", "normalPrice", "normal_price", "oldPrice", "old_price"],
+        "image": ["image", "imageUrl", "image_url", "img", "thumbnail", "mainImage"],
+        "category": ["category", "categoryName", "category_name", "item_category"],
+    }
+
+    # ==================== WORKERS CONFIG ====================
+    # Vzporedne kategorije (stores/workers.py) - vsak worker ima svoj browser
+    CATEGORY_WORKERS = 1
+    MAX_CATEGORY_WORKERS = 4  # Politeness: več hkratnih sej na trgovino ne
+    WORKER_START_STAGGER = 2.0  # sekund med zagonom workerjev
+    CATEGORY_RETRIES = 1  # Neuspela kategorija še enkrat (workerji: nazaj v vrsto, serijsko: na koncu)
+
     # ==================== PROGRESS CONFIG ====================
-    SAVE_PROGRESS_EVERY = 25  # Bolj pogosto shranjevanje
+    SAVE_PROGRESS_EVERY = 25  # Izdelkov v bufferju pred zapisom progress datoteke
+    SAVE_PROGRESS_SECONDS = 10.0  # ... ali po toliko sekundah
+    PROGRESS_COMPRESS = False  # progress/*.jsonl.gz
     CHECKPOINT_ENABLED = True
+    JOURNAL_FLUSH_EVERY = 50  # Izdelkov v bufferju pred zapisom journala
+    JOURNAL_FLUSH_SECONDS = 5.0
+
+    # ==================== POPUP CONFIG ====================
+    # Auto-dismiss skripta v browserju (stores/popups.py) namesto pollanja
+    AUTO_DISMISS_POPUPS = True
+    POPUP_RULES: List[dict] = COOKIE_POPUP_RULES
+
+    # ==================== SESSION CONFIG ====================
+    # sessions/{trgovina}.json - consent/prevzem rešen enkrat, naslednji runi ga naložijo
+    PERSIST_STORAGE_STATE = True
+    STORAGE_STATE_MAX_AGE_HOURS = 168.0  # 7 dni
+
+    # ==================== DELTA CONFIG ====================
+    # Fingerprint prve strani kategorije (stores/delta.py) - nespremenjena = izdelki prejšnjega runa
+    DELTA_SCRAPING = False  # Opt-in: PRHRAN_DELTA=1 (ali --delta), PRHRAN_DELTA=0 (ali --full) izklopi
+    DELTA_FINGERPRINT_TILES = 24  # tile-ov prve strani v fingerprintu
+    DELTA_MAX_AGE_HOURS = 120.0  # PRHRAN_DELTA_MAX_AGE_HOURS; > razmik med runi (CI pon/čet = do 96h)
+
+    # ==================== SELECTOR LEARNING CONFIG ====================
+    # selectors/{trgovina}.json - zadnji zmagovalec najprej, ostali v enem round-tripu
+    LEARN_SELECTORS = True
+
+    # ==================== TIMING CONFIG (EXPORT) ====================
+    # Histogrami faz (stores/timing.py) -> metrics/{trgovina}_{ts}.json + prhran_{trgovina}.prom
+    EXPORT_TIMINGS = True
+    TIMINGS_LIVE_SECONDS = 30.0  # sprotni izvoz ob checkpointu (0 = samo na koncu)
+
+    # ==================== PROFILING CONFIG ====================
+    # Opt-in (stores/profiling.py): "all" / "0.2" (delež) / "Kat1,Kat2"; PRHRAN_PROFILE preglasi
+    PROFILING = ""
+    PROFILE_TRACE = True  # Playwright trace zip
+    PROFILE_CPROFILE = True  # cProfile .prof
+    PROFILE_CALLS = True  # protokolni (CDP) klici po metodi
 
     # ==================== SCREENSHOT CONFIG ====================
     SCREENSHOT_ON_ERROR = True
     MAX_SCREENSHOTS = 50  # Max screenshots per run
 
-    def __init__(self, page: Page, headless: bool = True):
+    def __init__(self, page: Page, headless: bool = True, extraction_mode: str = None,
+                 capture_api: bool = None, workers: int = None, streaming: bool = None):
         self.page = page
         self.headless = headless
+        if extraction_mode:
+            self.EXTRACTION_MODE = extraction_mode
+        if capture_api is not None:
+            self.CAPTURE_API_RESPONSES = capture_api
+        if workers:
+            self.CATEGORY_WORKERS = workers
+        if streaming is not None:
+            self.STREAMING_EXTRACTION = streaming
+        if self.base_url_override():
+            self.apply_base_url(self.base_url_override())
+        self.worker_id = 0  # 0 = koordinator / serijski scraper
+        # Klic za vsak sprejet izdelek (npr. streaming v orchestrator proces)
+        self.product_callback: Optional[Callable[[dict], None]] = None
         self.products = []
         self.seen = set()
         self.errors = []
@@ -148,6 +421,7 @@ class BulletproofScraper:
         self.screenshots_dir = self.base_dir / "screenshots"
         self.logs_dir = self.base_dir / "logs"
         self.checkpoints_dir = self.base_dir / "checkpoints"
+        self.metrics_dir = self.base_dir / "metrics"
 
         # Create directories
         for d in [self.progress_dir, self.screenshots_dir, self.logs_dir, self.checkpoints_dir]:
@@ -156,6 +430,9 @@ class BulletproofScraper:
         # State
         self.start_time = None
         self.current_category = ""
+        self.journal_category = None  # Ključ kategorije za journal (= save_checkpoint(name)), ne prikazno ime
+        self.phase = ""  # navigate / popup / scroll / extract ... (za log zapise)
+        self.run_started = None
         self.last_response_time = 1.0
         self.screenshot_count = 0
         self.page_load_times = []
@@ -163,14 +440,102 @@ class BulletproofScraper:
         # Checkpoint
         self.checkpoint_file = None
         self.completed_categories = set()
+        self.journal: Optional[ProductJournal] = None
+
+        # Progress (en file na run)
+        self.progress_writer: Optional[ProgressWriter] = None
 
         # Log file
         self.log_file = None
 
+        # Network capture
+        self.capture: Optional[ResponseCapture] = None
+        self.api_category_products = []
+        self.api_done = False
+
+        # Streaming ekstrakcija
+        self.stream_selector = None
+        self.stream_products = []
+        self.page_ended = False  # tile_ends_page() je ustavil zadnjo ekstrakcijo (konec kategorije)
+        self._cdp = None  # CDP seja za meritve spomina (False = ni podprto)
+
+        # Snapshot ekstrakcija (trenutni page.content() med razčlenjevanjem)
+        self.snapshot: Optional[snapshots.PageSnapshot] = None
+        self.snapshots_dir = self.base_dir / "snapshots" / self.data_key()
+
+        # Popup guard (namesti se ob prvi navigaciji)
+        self.popup_guard: Optional[PopupGuard] = None
+
+        # Shranjena seja (None = še ni preverjeno)
+        self._session_restored: Optional[bool] = None
+        self.session_saved = False
+
+        # Delta scraping (fingerprint kategorije v teku + reuse-ane kategorije)
+        self.DELTA_SCRAPING = delta_enabled(self.DELTA_SCRAPING)
+        self.delta = DeltaCache(self.base_dir / "delta" / self.data_key(),
+                                delta_max_age_hours(self.DELTA_MAX_AGE_HOURS))
+        self.category_fingerprint: Optional[str] = None
+        self.category_started = time.time()
+        self.delta_reused = set()
+
+        # Pravila validacije (meje trgovine) - en izdelek ali batch
+        self.validator = ProductValidator.for_scraper(self)
+        self.price_rules = replace(self.PRICE_RULES, min_price=self.MIN_PRICE, max_price=self.MAX_PRICE)
+
+        # Histogrami faz (navigate, popup, scroll, extract, validate, dedupe, persist)
+        self.timings = PhaseTimings(self.STORE_NAME)
+        self.timings_exported = 0.0
+        self.timings_stamp = None
+
+        # Profiling (None = izklopljeno, brez vsakega overheada)
+        self.profiler: Optional[ProfileRun] = None
+
+        # Naučeno zaporedje selektorjev (skupno za trgovino v procesu)
+        self.selector_stats: Optional[SelectorStats] = None
+        if self.LEARN_SELECTORS:
+            self.selector_stats = get_selector_stats(
+                self.data_key(), self.base_dir / "selectors" / f"{self.data_key()}.json"
+            )
+
+        # Retry budget za ta run (workerji dobijo koordinatorjevega)
+        self.retry_budget = RetryBudget(self.RETRY_BUDGET)
+        self.metrics.retry_budget_left = self.RETRY_BUDGET
+
+        # AIMD rate controller (skupen za host)
+        self.rate: Optional[RateController] = None
+        if self.RATE_CONTROL_ENABLED and self.BASE_URL:
+            self.rate = get_rate_controller(
+                self.BASE_URL,
+                rate=self.RATE_INITIAL,
+                min_rate=self.RATE_MIN,
+                max_rate=self.RATE_MAX,
+                increase=self.RATE_INCREASE,
+                decrease=self.RATE_DECREASE,
+                burst=self.RATE_BURST,
+                slow_seconds=self.SLOW_RESPONSE_THRESHOLD,
+            )
+            self.attach_rate_feedback()
+
         # Setup network optimization
         if self.BLOCK_RESOURCES:
             self._setup_network_optimization()
 
+    def attach_page(self, page: Page):
+        """Nov page (recikliran context iz BrowserPool) - na novo vežemo page handlerje"""
+        if self.capture:
+            self.capture.detach()
+            self.capture = None
+        self.page = page
+        self.popup_guard = None
+        self._cdp = None
+        self._session_restored = None
+        if self.rate:
+            self.attach_rate_feedback()
+        if self.BLOCK_RESOURCES:
+            self._setup_network_optimization()
+        if self.CAPTURE_API_RESPONSES:
+            self.enable_response_capture()
+
     # ==================== NETWORK OPTIMIZATION ====================
 
     def _setup_network_optimization(self):
@@ -202,37 +567,29 @@ class BulletproofScraper:
 
     # ==================== LOGGING ====================
 
-    def log(self, message: str, level: str = "INFO"):
-        """Structured logging z file output (Windows-safe)"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        prefix = f"[{timestamp}] [{self.STORE_NAME}]"
-
-        # Windows-safe symbols instead of emoji
-        symbol = {
-            "ERROR": "[X]",
-            "WARNING": "[!]",
-            "SUCCESS": "[OK]",
-            "DEBUG": "[?]",
-            "PROGRESS": "[#]",
-        }.get(level, "")
+    def log(self, message: str, level: str = "INFO", phase: str = None):
+        """
+        Structured logging - zapis gre v vrsto, izpiše ga background thread
+        (konzola + logs/*.jsonl). Nikoli ne blokira na disku ali konzoli.
+        """
+        logger = get_logger()
+        if not logger.enabled(level):
+            return
 
-        log_line = f"{prefix} {symbol} {message}" if symbol else f"{prefix} {message}"
-
-        # Console output (safe for Windows)
-        try:
-            print(log_line, flush=True)
-        except UnicodeEncodeError:
-            # Fallback: remove problematic characters
-            safe_line = log_line.encode('ascii', 'replace').decode('ascii')
-            print(safe_line, flush=True)
-
-        # File output
-        if self.log_file:
-            try:
-                with open(self.log_file, "a", encoding="utf-8") as f:
-                    f.write(log_line + "\n")
-            except:
-                pass
+        now = time.time()
+        logger.emit({
+            "ts": now,
+            "level": level,
+            "store": f"{self.STORE_NAME}#{self.worker_id}" if self.worker_id else self.STORE_NAME,
+            "category": self.current_category,
+            "phase": phase or self.phase,
+            "elapsed": round(now - self.run_started, 3) if self.run_started else None,
+            "msg": message,
+        }, self.log_file)
+
+    def flush_log(self):
+        """Počakaj da so vsi log zapisi izpisani"""
+        get_logger().flush()
 
     def log_stats(self):
         """Izpiši podrobno statistiko"""
@@ -241,15 +598,47 @@ class BulletproofScraper:
         self.log("=" * 60)
         self.log(f"STATISTIKA {self.STORE_NAME}", "PROGRESS")
         self.log("-" * 60)
-        self.log(f"  Strani:           {m.pages_scraped}")
+        self.log(f"  Strani:           {m.pages_scraped}" + (f" (neuspelih: {m.pages_failed})" if m.pages_failed else ""))
         self.log(f"  Najdenih:         {m.products_found}")
         self.log(f"  Veljavnih:        {m.products_valid}")
         self.log(f"  Neveljavnih:      {m.products_invalid}")
+        if m.rejections:
+            reasons = ", ".join(f"{reason}={count}" for reason, count in
+                                sorted(m.rejections.items(), key=lambda kv: -kv[1]))
+            self.log(f"  Zavrnitve:        {reasons}")
         self.log(f"  Duplikatov:       {m.duplicates}")
         self.log(f"  Ponovitev:        {m.retries}")
         self.log(f"  Napak:            {m.errors}")
+        if m.failed_categories:
+            self.log(f"  Neuspele kat.:    {', '.join(m.failed_categories)}", "ERROR")
         self.log(f"  Screenshotov:     {m.screenshots_taken}")
         self.log(f"  Blokiranih req:   {m.blocked_requests}")
+        if m.category_scroll_times:
+            self.log(f"  Scroll čas:       {m.scroll_time}s ({len(m.category_scroll_times)} kategorij)")
+        if m.category_extract_times:
+            self.log(f"  Ekstrakcija:      {m.extract_time}s")
+        if m.peak_js_heap_mb:
+            self.log(f"  Peak JS heap:     {m.peak_js_heap_mb} MB ({m.peak_dom_nodes} DOM vozlišč)")
+        if self.rate:
+            m.request_rate = round(self.rate.rate, 2)
+            self.log(f"  Hitrost (AIMD):   {m.request_rate}/s (backoffov: {m.rate_backoffs}, čakanja: {m.rate_wait_time}s)")
+        if m.retries:
+            self.log(f"  Čas retry-jev:    {m.retry_time}s (budget ostane: {m.retry_budget_left}/{self.RETRY_BUDGET})")
+        if m.circuit_opens or m.circuit_fast_fails:
+            opened = ", ".join(name for name, state in m.circuit_state.items() if state != "closed") or "-"
+            self.log(f"  Circuit breaker:  {m.circuit_opens}x odprt, {m.circuit_fast_fails} fast-fail (odprti: {opened})")
+        if m.selector_drift or m.selector_self_heals:
+            drift = ", ".join(f"{name}={selector}" for name, selector in m.selector_drift.items()) or "-"
+            self.log(f"  Selektorji:       spremenjeni: {drift}, self-healing: {m.selector_self_heals}x", "WARNING")
+        if m.delta_reused_categories:
+            self.log(f"  Delta (reuse):    {m.delta_reused_categories} kategorij, {m.delta_reused_products} izdelkov, "
+                     f"prihranjeno ~{m.delta_time_saved}s")
+        if m.popups_dismissed:
+            popups = ", ".join(f"{name}={count}" for name, count in m.popups_dismissed.items())
+            self.log(f"  Zaprti popup-i:   {popups}")
+        if self.capture:
+            self.log(f"  API odgovorov:    {m.api_responses}")
+            self.log(f"  API izdelkov:     {m.api_products}")
 
         if m.pages_scraped > 0:
             m.avg_products_per_page = m.products_valid / m.pages_scraped
@@ -263,8 +652,82 @@ class BulletproofScraper:
             duration = m.end_time - m.start_time
             self.log(f"  Trajanje:         {duration}")
 
+        phases = self.timings.phase_totals()
+        if phases:
+            self.log("  Faze (sum / n / max):")
+            for phase, h in phases.items():
+                self.log(f"    {phase:<10} {h['sum']:>9.1f}s / {h['count']:>6} / {h['max']:.2f}s")
+
         self.log("=" * 60)
 
+    # ==================== PHASE TIMINGS ====================
+
+    def timed(self, phase: str):
+        """with self.timed("scroll"): ... -> histogram (trgovina, kategorija, faza)"""
+        return self.timings.timer(phase, self.current_category)
+
+    def export_timings(self, final: bool = False) -> Optional[Path]:
+        """
+        JSON (metrics/{trgovina}_{ts}.json) + Prometheus textfile (prhran_{trgovina}.prom).
+        Brez final: samo vsakih TIMINGS_LIVE_SECONDS (sprotno ob checkpointih).
+        """
+        if not self.EXPORT_TIMINGS or self.worker_id:
+            return None
+        now = time.time()
+        if not final and (not self.TIMINGS_LIVE_SECONDS or now - self.timings_exported < self.TIMINGS_LIVE_SECONDS):
+            return None
+        self.timings_exported = now
+
+        if not self.timings_stamp:
+            self.timings_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        json_path = self.metrics_dir / f"{self.store_key()}_{self.timings_stamp}.json"
+        prom_path = prometheus_dir(self.metrics_dir) / f"prhran_{self.store_key()}.prom"
+        try:
+            self.timings.export(json_path, prom_path, {"final": final, "metrics": self.metrics.to_dict()})
+        except Exception as e:
+            self.log(f"Timings export error: {e}", "WARNING")
+            return None
+        if final:
+            self.log(f"Timings: {json_path.name}, {prom_path}", "DEBUG")
+        return json_path
+
+    # ==================== PROFILING ====================
+
+    def open_profiler(self, timestamp: str = None):
+        """Profiling direktorij za run (samo če je PROFILING / PRHRAN_PROFILE nastavljen)"""
+        spec = parse_profile_spec(os.getenv("PRHRAN_PROFILE", self.PROFILING))
+        if not spec or self.profiler or self.worker_id:
+            return
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        directory = self.base_dir / "profiling" / f"{self.store_key()}_{timestamp}"
+        self.profiler = ProfileRun(
+            directory,
+            spec,
+            trace=self.PROFILE_TRACE,
+            cprofile=self.PROFILE_CPROFILE,
+            count_calls=self.PROFILE_CALLS,
+            log=self.log,
+        )
+        self.log(f"Profiling vklopljen: {directory}", "WARNING")
+
+    def profiled(self, category: str):
+        """with self.profiled(kategorija): ... - trace + cProfile + klici (nullcontext če izklopljeno)"""
+        if self.profiler is None or not self.profiler.wants(category):
+            return nullcontext()
+        return self._profile_category(category)
+
+    @contextmanager
+    def _profile_category(self, category: str):
+        session = self.profiler.start(category, self.page)
+        status = "error"
+        try:
+            yield session
+            status = "ok"
+        finally:
+            entry = self.profiler.stop(session, status)
+            self.log(f"Profil {category}: {entry['seconds']}s, {entry['protocol_calls']} protokolnih klicev "
+                     f"({entry['trace'] or '-'}, {entry['profile'] or '-'})", "DEBUG")
+
     # ==================== SCREENSHOTS ====================
 
     def take_screenshot(self, name: str = None, on_error: bool = False) -> Optional[str]:
@@ -311,20 +774,40 @@ class BulletproofScraper:
             return False
 
     def wait_for_products(self, selectors: List[str], timeout: int = 15000) -> Optional[str]:
-        """Počakaj da se pojavijo izdelki - vrne prvi selector ki dela"""
-        for selector in selectors:
-            try:
-                self.page.wait_for_selector(selector, timeout=timeout // len(selectors), state="visible")
-                # Preveri da je vsaj 1 element
-                elements = self.page.query_selector_all(selector)
-                if elements and len(elements) > 0:
+        """
+        Počakaj da se pojavijo izdelki - vrne selector ki dela.
+        En wait na združen selektor (cel timeout), potem en round-trip za zmagovalca.
+        Čas šteje v fazo "navigate" (čakanje na stran).
+        """
+        with self.timed("navigate"):
+            return self._wait_for_products(selectors, timeout)
+
+    def _wait_for_products(self, selectors: List[str], timeout: int) -> Optional[str]:
+        if not selectors:
+            return None
+        ranked = self.rank_selectors("tile", selectors)
+        try:
+            self.page.wait_for_selector(", ".join(ranked), timeout=timeout, state="visible")
+        except PlaywrightTimeout:
+            return None
+        except Exception:
+            # Združen selektor ni veljaven (npr. Playwright-only sintaksa) - po vrsti
+            for selector in ranked:
+                try:
+                    self.page.wait_for_selector(selector, timeout=timeout // len(ranked), state="visible")
+                    self.record_selector("tile", selector, ranked)
                     return selector
-            except:
-                continue
-        return None
+                except:
+                    continue
+            return None
+        return self.race_selectors("tile", ranked)
 
     def adaptive_delay(self):
         """Prilagodi zakasnitev glede na hitrost odziva"""
+        if self.rate:
+            self.throttle()
+            return
+
         if not self.ADAPTIVE_DELAY_ENABLED:
             self.random_delay()
             return
@@ -347,6 +830,75 @@ class BulletproofScraper:
             max_delay = self.MAX_DELAY
         time.sleep(random.uniform(min_delay, max_delay))
 
+    # ==================== RATE CONTROL ====================
+
+    def throttle(self) -> float:
+        """Vzemi žeton AIMD controllerja (namesto fiksnega sleep) - vrne čas čakanja"""
+        if not self.rate:
+            self.random_delay()
+            return 0.0
+        waited = self.rate.acquire()
+        self.metrics.rate_wait_time = round(self.metrics.rate_wait_time + waited, 2)
+        self.metrics.request_rate = round(self.rate.rate, 2)
+        return waited
+
+    def attach_rate_feedback(self):
+        """page.on("response") -> statusi odzivov trgovine v controller"""
+        if self.page is None:
+            return
+        self._rate_host = host_key(self.BASE_URL)
+        try:
+            self.page.on("response", self._on_rate_response)
+        except Exception:
+            pass
+
+    def _on_rate_response(self, response):
+        """Handler - samo lokalni podatki (brez sync klicev)"""
+        try:
+            if response.request.resource_type not in self.RATE_FEEDBACK_TYPES:
+                return
+            if self._rate_host not in response.url:
+                return
+            status = response.status
+            if status == 429 or status >= 500:
+                self.rate_backoff(f"HTTP {status}")
+            elif status < 400:
+                self.rate.on_success()
+        except Exception:
+            pass
+
+    def rate_backoff(self, reason: str):
+        """Multiplikativno zmanjšaj hitrost (429/5xx, napaka, health check)"""
+        if self.rate:
+            self.rate.on_backoff(reason)
+            self.metrics.rate_backoffs += 1
+            self.metrics.request_rate = round(self.rate.rate, 2)
+
+    # ==================== CIRCUIT BREAKER ====================
+
+    def circuit_breakers(self, url: str = None) -> List[CircuitBreaker]:
+        """Breaker trgovine (+ URL vzorca če je podan)"""
+        if not self.CIRCUIT_BREAKER_ENABLED:
+            return []
+        store = self.store_key()
+        breakers = [get_breaker(
+            store,
+            failure_threshold=self.CIRCUIT_STORE_THRESHOLD,
+            reset_timeout=self.CIRCUIT_RESET_SECONDS,
+        )]
+        if url:
+            breakers.append(get_breaker(
+                f"{store}:{url_pattern(url)}",
+                failure_threshold=self.CIRCUIT_PATTERN_THRESHOLD,
+                reset_timeout=self.CIRCUIT_RESET_SECONDS,
+            ))
+        return breakers
+
+    def record_circuit_state(self, breakers: List[CircuitBreaker]):
+        """Stanje breakerjev v metrike"""
+        for breaker in breakers:
+            self.metrics.circuit_state[breaker.name] = breaker.state
+
     # ==================== RETRY LOGIC ====================
 
     def retry_on_failure(
@@ -355,38 +907,87 @@ class BulletproofScraper:
         *args,
         max_retries: int = None,
         screenshot_on_fail: bool = True,
+        circuit: str = None,
         **kwargs
     ) -> Any:
         """
         ULTIMATE retry z exponential backoff, jitter, in screenshots.
+        circuit: URL za circuit breaker (trgovina + URL vzorec) - odprt breaker = takojšen neuspeh.
+        Retry-ji so omejeni tudi z RETRY_BUDGET na run.
         """
         if max_retries is None:
             max_retries = self.MAX_RETRIES
 
+        breakers = self.circuit_breakers(circuit) if circuit else []
+        # Short-circuit: ob prvem zaprtem breakerju vrni probe ki so jih half_open breakerji že dali
+        # (sicer probe nikoli ni zabeležen in breaker ostane half_open za vedno)
+        allowed = []
+        for breaker in breakers:
+            if not breaker.allow():
+                for claimed in allowed:
+                    claimed.release()
+                self.metrics.circuit_fast_fails += 1
+                self.log(f"Circuit odprt ({breaker.name}) - preskakujem {func.__name__}", "WARNING")
+                self.record_circuit_state(breakers)
+                return None
+            allowed.append(breaker)
+
         last_error = None
 
         for attempt in range(max_retries + 1):
+            start = time.time()
             try:
-                start = time.time()
                 result = func(*args, **kwargs)
                 self.last_response_time = time.time() - start
+                for breaker in breakers:
+                    breaker.record_success()
+                if attempt:
+                    self.record_circuit_state(breakers)
                 return result
 
             except Exception as e:
                 last_error = e
                 self.metrics.retries += 1
+                self.metrics.retry_time = round(self.metrics.retry_time + time.time() - start, 1)
+
+                opened = [b.name for b in breakers if b.record_failure()]
+                if opened:
+                    self.metrics.circuit_opens += len(opened)
+                open_now = [b.name for b in breakers if b.is_open]
+                if open_now:
+                    self.record_circuit_state(breakers)
 
+                give_up = ""
                 if attempt < max_retries:
+                    if open_now:
+                        give_up = f"circuit odprt ({', '.join(open_now)})"
+                    elif not self.retry_budget.spend():
+                        give_up = "retry budget porabljen"
+                    self.metrics.retry_budget_left = self.retry_budget.remaining
+
+                if attempt < max_retries and not give_up:
+                    self.log(f"Poskus {attempt + 1}/{max_retries + 1} ni uspel: {str(e)[:100]}", "WARNING")
+
+                    if self.rate:
+                        # Backoff prek controllerja: nižja hitrost + prazen bucket
+                        self.rate_backoff(f"napaka: {str(e)[:60]}")
+                        waited = self.throttle()
+                        self.metrics.retry_time = round(self.metrics.retry_time + waited, 1)
+                        self.log(f"Čakal {waited:.1f}s (hitrost {self.rate.rate:.2f}/s)", "WARNING")
+                        continue
+
                     delay = self.RETRY_DELAYS[min(attempt, len(self.RETRY_DELAYS) - 1)]
                     # Dodaj jitter (±20%)
                     jitter = delay * random.uniform(-0.2, 0.2)
                     delay += jitter
 
-                    self.log(f"Poskus {attempt + 1}/{max_retries + 1} ni uspel: {str(e)[:100]}", "WARNING")
                     self.log(f"Čakam {delay:.1f}s...", "WARNING")
 
                     time.sleep(delay)
+                    self.metrics.retry_time = round(self.metrics.retry_time + delay, 1)
                 else:
+                    if give_up:
+                        self.log(f"Ne ponavljam več: {give_up}", "WARNING")
                     self.log(f"Vsi poskusi spodleteli: {str(e)[:200]}", "ERROR")
                     self.metrics.errors += 1
 
@@ -400,6 +1001,7 @@ class BulletproofScraper:
                         "timestamp": datetime.now().isoformat(),
                         "url": self.page.url,
                     })
+                    return None
 
         return None
 
@@ -444,6 +1046,8 @@ class BulletproofScraper:
         failed = [k for k, v in checks.items() if not v]
         if failed:
             self.log(f"Health check issues: {failed}", "WARNING")
+            if not checks["no_blocked"] or not checks["no_captcha"]:
+                self.rate_backoff("health check")
             self.take_screenshot("health_check_fail", on_error=True)
 
         return checks
@@ -455,19 +1059,21 @@ class BulletproofScraper:
 
     # ==================== SELF-HEALING SELECTORS ====================
 
-    def find_elements_smart(self, selectors: List[str], min_count: int = 1) -> Tuple[List[ElementHandle], str]:
+    def find_elements_smart(self, selectors: List[str], min_count: int = 1,
+                            field: str = "tile") -> Tuple[List[ElementHandle], str]:
         """
         SELF-HEALING: Poskusi več selektorjev in vrni prvi ki dela.
         Če noben ne dela, poskusi najti podobne elemente.
         """
-        # 1. Poskusi vse selektorje
-        for selector in selectors:
+        # 1. Naučen zmagovalec + ostali v enem round-tripu
+        selector = self.race_selectors(field, selectors, min_count)
+        if selector:
             try:
                 elements = self.page.query_selector_all(selector)
                 if elements and len(elements) >= min_count:
                     return elements, selector
             except:
-                continue
+                pass
 
         # 2. Poskusi najti po atributih
         fallback_patterns = [
@@ -494,6 +1100,7 @@ class BulletproofScraper:
 
                 if len(valid) >= min_count:
                     self.log(f"Self-healing: uporabil fallback {pattern}", "WARNING")
+                    self.metrics.selector_self_heals += 1
                     return valid, pattern
             except:
                 continue
@@ -501,16 +1108,18 @@ class BulletproofScraper:
         self.log("Self-healing: ni našel elementov", "ERROR")
         return [], ""
 
-    def extract_text_smart(self, element: ElementHandle, selectors: List[str]) -> str:
+    def extract_text_smart(self, element: ElementHandle, selectors: List[str], field: str = "name") -> str:
         """SELF-HEALING ekstrakcija teksta"""
-        # 1. Poskusi vse selektorje
-        for selector in selectors:
+        # 1. Poskusi selektorje (naučen zmagovalec najprej)
+        ranked = self.rank_selectors(field, selectors)
+        for selector in ranked:
             try:
                 el = element.query_selector(selector)
                 if el:
                     text = el.get_attribute("title") or el.inner_text()
                     text = re.sub(r"\s+", " ", text).strip()
                     if len(text) > 2:
+                        self.record_selector(field, selector, ranked)
                         return text
             except:
                 continue
@@ -531,16 +1140,433 @@ class BulletproofScraper:
 
         return ""
 
+    # ==================== SELECTOR LEARNING ====================
+
+    def rank_selectors(self, field: str, selectors: List[str]) -> List[str]:
+        """Selektorji polja: zadnji zmagovalec (tudi iz prejšnjih runov) najprej"""
+        if not self.selector_stats or not selectors:
+            return list(selectors)
+        return self.selector_stats.rank(field, selectors)
+
+    def record_selector(self, field: str, selector: str, candidates: List[str] = None):
+        """Zmagal je selector - opozori če zgodovinski zmagovalec ne deluje več"""
+        stats = self.selector_stats
+        if not stats:
+            return
+        previous = stats.record_win(field, selector)
+        if not previous:
+            return
+        stats.record_miss(field, previous)
+
+        baseline = stats.baseline.get(field)
+        if baseline and baseline != selector and field not in self.metrics.selector_drift:
+            if candidates is None or baseline in candidates:
+                self.metrics.selector_drift[field] = selector
+                self.log(f"Selektor za '{field}' se je spremenil: '{baseline}' ne deluje več, "
+                         f"zdaj '{selector}' - preveri stran", "WARNING")
+
+    def race_selectors(self, field: str, selectors: List[str], min_count: int = 1) -> Optional[str]:
+        """
+        Prvi selektor (zmagovalec najprej) z vsaj min_count elementi na strani.
+        En evaluate za vse CSS selektorje; Playwright-only sintaksa po vrsti.
+        """
+        ranked = self.rank_selectors(field, selectors)
+        if not ranked:
+            return None
+        try:
+            result = self.page.evaluate(RACE_SELECTORS_JS, [ranked, min_count]) or {}
+        except Exception:
+            result = {"index": -1, "invalid": list(range(len(ranked)))}
+
+        index = result.get("index", -1)
+        if index < 0:
+            for i in result.get("invalid", []):
+                try:
+                    if len(self.page.query_selector_all(ranked[i])) >= min_count:
+                        index = i
+                        break
+                except:
+                    continue
+        if index < 0:
+            return None
+
+        self.record_selector(field, ranked[index], ranked)
+        return ranked[index]
+
+    def save_selector_stats(self):
+        """Shrani naučeno zaporedje selektorjev (selectors/{trgovina}.json)"""
+        if not self.selector_stats:
+            return
+        try:
+            self.selector_stats.save()
+        except Exception as e:
+            self.log(f"Selector stats save error: {e}", "WARNING")
+
+    # ==================== BULK EXTRACTION ====================
+
+    def get_bulk_spec(self) -> dict:
+        """Kaj naj BULK_EXTRACT_JS prebere iz vsakega tile-a (override v podrazredu)"""
+        return {
+            "names": self.rank_selectors("name", self.NAME_SELECTORS),
+            "images": self.rank_selectors("image", self.IMAGE_SELECTORS),
+            "image_attrs": self.IMAGE_ATTRS,
+        }
+
+    def extract_tiles_bulk(self, selector: str) -> List[dict]:
+        """
+        BULK: en CDP klic za vse tile na strani.
+        SNAPSHOT: iz page.content() (lxml), brez klicev v browser.
+        Vrne seznam surovih dict-ov (text, attrs, names, images, flags, groups, lists).
+        """
+        if self.snapshot is not None:
+            try:
+                return self.snapshot.extract(
+                    selector, self.get_bulk_spec(),
+                    workers=self.SNAPSHOT_WORKERS or snapshots.default_workers(),
+                    parallel_min=self.SNAPSHOT_PARALLEL_MIN_TILES,
+                )
+            except Exception as e:
+                self.log(f"Snapshot ekstrakcija ni uspela ({selector}): {e}", "WARNING")
+                return []
+        try:
+            return self.page.eval_on_selector_all(selector, BULK_EXTRACT_JS, self.get_bulk_spec()) or []
+        except Exception as e:
+            self.log(f"Bulk ekstrakcija ni uspela ({selector}): {e}", "WARNING")
+            return []
+
+    def tile_ends_page(self, raw: dict) -> bool:
+        """Ali tile pomeni konec uporabnih izdelkov na strani (override v podrazredu)"""
+        return False
+
+    def scrape_current_page_bulk(self, category: str = "") -> list[dict]:
+        """Scrapaj vse izdelke na trenutni strani z BULK (ali SNAPSHOT) ekstrakcijo"""
+        if self.EXTRACTION_MODE == "snapshot":
+            snapshot = self.take_snapshot(category)
+            if snapshot is not None:
+                return self.parse_snapshot(snapshot, category)
+        return self._scrape_tiles_bulk(category, self.page.url)
+
+    def take_snapshot(self, category: str = "") -> Optional[snapshots.PageSnapshot]:
+        """En page.content() po scrollu - None = fallback na BULK (ni lxml / napaka)"""
+        if not snapshots.available():
+            self.log("Snapshot način potrebuje lxml + cssselect - uporabljam bulk", "WARNING")
+            self.EXTRACTION_MODE = "bulk"
+            return None
+        try:
+            category = category or self.current_category
+            snapshot = snapshots.PageSnapshot(self.page.content(), self.page.url, category)
+        except Exception as e:
+            self.log(f"Snapshot strani ni uspel: {e} - uporabljam bulk", "WARNING")
+            return None
+
+        if self.ARCHIVE_SNAPSHOTS:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")  # Spar: več strani na sekundo
+            name = f"{category_slug(category or 'stran')}_{stamp}.html.gz"
+            try:
+                snapshot.archive(self.snapshots_dir / name)
+            except Exception as e:
+                self.log(f"Arhiv snapshota ni shranjen: {e}", "WARNING")
+        return snapshot
+
+    def parse_snapshot(self, snapshot, category: str = "", url: str = None) -> list[dict]:
+        """
+        Izdelki iz snapshota strani (PageSnapshot ali HTML) - ista parse_tile() pravila
+        kot bulk. Deluje brez browserja (reparse_snapshots.py).
+        """
+        if isinstance(snapshot, str):
+            snapshot = snapshots.PageSnapshot(snapshot, url or "")
+        self.snapshot = snapshot
+        try:
+            return self._scrape_tiles_bulk(category or snapshot.category, url or snapshot.url)
+        finally:
+            self.snapshot = None
+
+    def _scrape_tiles_bulk(self, category: str, url: str) -> list[dict]:
+        """Surovi tile-i (bulk ali snapshot) -> parse_tile -> add_product"""
+        products = []
+
+        ranked = self.rank_selectors("tile", self.PRODUCT_SELECTORS)
+        for selector in ranked:
+            tiles = self.extract_tiles_bulk(selector)
+            if len(tiles) < 3:
+                continue
+            self.record_selector("tile", selector, ranked)
+
+            mode = "snapshot" if self.snapshot is not None else "bulk"
+            self.log(f"Najdenih {len(tiles)} elementov s selektorjem: {selector} ({mode})")
+
+            page_ended = False
+            parsed = []
+            for raw in tiles:
+                if self.tile_ends_page(raw):
+                    page_ended = self.page_ended = True
+                    break
+                try:
+                    product = self.parse_tile(raw, category, url)
+                    if product:
+                        parsed.append(product)
+                except Exception:
+                    continue
+            products = self.add_products(parsed)
+
+            if page_ended or products:
+                break
+
+        return products
+
+    def begin_category(self):
+        """Začetek kategorije: počisti API capture in streaming stanje"""
+        self.phase = ""
+        self.reset_capture()
+        self.category_fingerprint = None
+        self.category_started = time.time()
+        self.stream_selector = None
+        self.stream_products = []
+
+    def pick_stream_selector(self) -> Optional[str]:
+        """Prvi PRODUCT_SELECTOR z vsaj 3 tile-i (vključno z že obdelanimi)"""
+        return self.race_selectors("tile", self.PRODUCT_SELECTORS, 3)
+
+    def extract_new_tiles(self, category: str = "") -> list[dict]:
+        """
+        STREAMING: preberi samo še neobdelane tile, jih označi/izprazni
+        in jih takoj pošlji v add_product. Vrne NOVE izdelke.
+        """
+        start = time.time()
+        if not self.stream_selector:
+            self.stream_selector = self.pick_stream_selector()
+            if not self.stream_selector:
+                return []
+
+        selector = f"{self.stream_selector}:not([{self.EXTRACTED_ATTR}])"
+        try:
+            tiles = self.page.eval_on_selector_all(
+                selector, STREAM_EXTRACT_JS,
+                [self.get_bulk_spec(), self.EXTRACTED_ATTR, self.PRUNE_EXTRACTED],
+            ) or []
+        except Exception as e:
+            self.log(f"Streaming ekstrakcija ni uspela ({selector}): {e}", "WARNING")
+            tiles = []
+
+        parsed = []
+        url = self.page.url
+        for raw in tiles:
+            if self.tile_ends_page(raw):
+                self.page_ended = True
+                break
+            try:
+                product = self.parse_tile(raw, category, url)
+                if product:
+                    parsed.append(product)
+            except Exception:
+                continue
+        products = self.add_products(parsed)
+
+        self.stream_products.extend(products)
+        self.record_extract_time(time.time() - start)
+        return products
+
+    def stream_step(self, step: int):
+        """on_step za scroll engine: sproti poberi nove tile"""
+        new = self.extract_new_tiles(self.current_category)
+        if new and step % 10 == 0:
+            self.log(f"Streaming: {len(self.stream_products)} izdelkov v kategoriji")
+
+    def parse_tile(self, raw: dict, category: str = "", url: str = "") -> Optional[dict]:
+        """Override v podrazredu! Pretvori surov BULK tile v izdelek."""
+        raise NotImplementedError("Override parse_tile() in subclass")
+
+    # ==================== NETWORK CAPTURE ====================
+
+    def enable_response_capture(self):
+        """Vklopi prestrezanje product-list API odgovorov (page.on("response"))"""
+        if self.capture or not self.API_URL_PATTERNS:
+            return
+        self.capture = ResponseCapture(self.page, self.API_URL_PATTERNS, self.log)
+        self.capture.attach()
+        self.log(f"API capture vklopljen ({len(self.API_URL_PATTERNS)} vzorcev)", "DEBUG")
+
+    def reset_capture(self):
+        """Nova kategorija/stran - zavrzi stare odgovore"""
+        self.api_category_products = []
+        self.api_done = False
+        if self.capture:
+            self.capture.clear()
+
+    def api_exhausted(self) -> bool:
+        """Ali je API povedal da je bila zadnja stran postrežena (lahko nehamo scrollat)"""
+        return bool(self.capture) and self.api_done
+
+    def api_says_done(self, category: str = "") -> bool:
+        """Za scroll zanke: obdelaj nove odgovore in vrni True ko API pove da ni več strani"""
+        if not self.capture:
+            return False
+        self.collect_api_products(category or self.current_category)
+        return self.api_done
+
+    def parse_api_item(self, item: dict, category: str = "") -> Optional[Product]:
+        """API izdelek -> product dict (override v podrazredu za posebne formate)"""
+        name = first_value(item, self.API_FIELDS["name"])
+        if not isinstance(name, str):
+            return None
+        name = re.sub(r"\s+", " ", name).strip()
+
+        current = to_price(first_value(item, self.API_FIELDS["price"]))
+        old = to_price(first_value(item, self.API_FIELDS["regular_price"]))
+
+        if old and current and current < old:
+            regular_price, sale_price = old, current
+        else:
+            regular_price, sale_price = current or old, None
+
+        image = first_value(item, self.API_FIELDS["image"])
+        if isinstance(image, dict):
+            image = first_value(image, ["url", "src", "href"])
+        if isinstance(image, list):
+            image = image[0] if image and isinstance(image[0], str) else None
+        image = self.resolve_image_src({"src": image}) if isinstance(image, str) else ""
+
+        api_category = first_value(item, self.API_FIELDS["category"])
+        if not isinstance(api_category, str):
+            api_category = ""
+
+        return Product(
+            ime=name,
+            redna_cena=regular_price,
+            akcijska_cena=sale_price,
+            kategorija=api_category or category or self.current_category,
+            enota=self.extract_unit(name),
+            trgovina=self.STORE_NAME,
+            slika=image if image else None,
+            url=self.page.url,
+        )
+
+    def collect_api_products(self, category: str = "") -> list[dict]:
+        """Obdelaj prestrežene API odgovore - vrne NOVE izdelke"""
+        if not self.capture:
+            return []
+
+        products = []
+        for url, payload in self.capture.drain():
+            self.metrics.api_responses += 1
+            items = find_product_items(payload, self.API_FIELDS["name"], self.API_FIELDS["price"])
+
+            parsed = []
+            for item in items:
+                product = self.parse_api_item(item, category)
+                if product:
+                    parsed.append(product)
+            products.extend(self.add_products(parsed))
+
+            if is_last_page(payload, len(items)):
+                self.api_done = True
+
+        if products:
+            self.metrics.api_products += len(products)
+            self.api_category_products.extend(products)
+        return products
+
+    def count_tiles(self) -> int:
+        """Koliko product tile-ov je v DOM-u (en CDP klic na selektor, zmagovalec najprej)"""
+        for selector in self.rank_selectors("tile", self.PRODUCT_SELECTORS):
+            try:
+                count = self.page.eval_on_selector_all(selector, "els => els.length")
+                if count >= 3:
+                    return count
+            except:
+                continue
+        return 0
+
+    def scrape_page_products(self, category: str = "") -> list[dict]:
+        """
+        Izdelki trenutne strani: API capture če je kaj ujel, sicer DOM (fallback).
+        Če je v DOM-u več tile-ov kot API izdelkov (npr. prva stran je server-rendered),
+        scrapamo še DOM - duplikate odstrani add_product.
+        STREAMING: večina je že pobrana med scrollom, tu samo še preostanek.
+        """
+        self.phase = "extract"
+        if self.STREAMING_EXTRACTION:
+            if self.capture:
+                self.collect_api_products(category)
+            self.extract_new_tiles(category)
+            products = list(self.api_category_products) + list(self.stream_products)
+            self.log(f"Streaming: {len(products)} izdelkov (API: {len(self.api_category_products)})")
+            return products
+
+        start = time.time()
+        products = self._scrape_page_products(category)
+        self.record_extract_time(time.time() - start)
+        return products
+
+    def _scrape_page_products(self, category: str = "") -> list[dict]:
+        """Ne-streaming pot za scrape_page_products"""
+        if self.capture:
+            self.collect_api_products(category)
+            api_count = len(self.api_category_products)
+
+            if api_count:
+                tiles = self.count_tiles()
+                if tiles <= api_count:
+                    self.log(f"API: {api_count} izdelkov (DOM preskočen)")
+                    return list(self.api_category_products)
+                self.log(f"API: {api_count} izdelkov, DOM: {tiles} tile-ov - dopolnjujem iz DOM", "WARNING")
+                return list(self.api_category_products) + self.scrape_current_page(category)
+
+            self.log("API capture ni ujel izdelkov - DOM fallback", "WARNING")
+
+        return self.scrape_current_page(category)
+
+    # ==================== EXTRACTION HELPERS ====================
+
+    def clean_name(self, name: str) -> str:
+        """Normaliziraj presledke in odstrani ceno iz imena"""
+        name = re.sub(r"\s+", " ", name or "").strip()
+        return re.sub(r"\d+[,.]\d{2}\s*€.*", "", name).strip()
+
+    def resolve_image_src(self, attrs: Optional[dict]) -> str:
+        """Izberi URL slike iz atributov (IMAGE_ATTRS vrstni red) - vrne "" če ni veljaven"""
+        if not attrs:
+            return ""
+
+        src = ""
+        for attr in self.IMAGE_ATTRS:
+            src = attrs.get(attr) or ""
+            if src:
+                break
+
+        if not src or src.startswith("data:"):
+            return ""
+        if src.startswith("//"):
+            src = f"https:{src}"
+        elif src.startswith("/"):
+            src = f"{self.BASE_URL}{src}"
+
+        return src if self.is_valid_image_url(src) else ""
+
+    def extract_unit(self, name: str) -> str:
+        """Enota iz imena (500g, 1l, 10kos ...)"""
+        unit_match = re.search(r"(\d+(?:[.,]\d+)?)\s*(kg|g|l|ml|cl|dl|kos|kom)\b", name, re.I)
+        if unit_match:
+            return f"{unit_match.group(1)}{unit_match.group(2).lower()}"
+        return ""
+
     # ==================== NAVIGATION ====================
 
     def safe_goto(self, url: str, wait_until: str = "domcontentloaded", timeout: int = 30000) -> bool:
         """ULTIMATE varno nalaganje strani"""
+        self.install_popup_guard()
+        self.phase = "navigate"
+
         def _goto():
+            if self.rate:
+                self.throttle()
             start = time.time()
             response = self.page.goto(url, wait_until=wait_until, timeout=timeout)
             load_time = time.time() - start
             self.page_load_times.append(load_time)
             self.last_response_time = load_time
+            if self.rate and load_time > self.SLOW_RESPONSE_THRESHOLD:
+                self.rate_backoff(f"počasno nalaganje {load_time:.1f}s")
 
             # Preveri response
             if response and response.status >= 400:
@@ -548,16 +1574,19 @@ class BulletproofScraper:
 
             return True
 
-        result = self.retry_on_failure(_goto)
+        with self.timed("navigate"):
+            result = self.retry_on_failure(_goto, circuit=url)
 
         if result:
-            self.adaptive_delay()
+            if not self.rate:
+                self.adaptive_delay()
 
-            # NAJPREJ sprejmi piskotke (cookie popup blokira vse!)
-            self.accept_cookies()
+            with self.timed("popup"):
+                # NAJPREJ sprejmi piskotke (cookie popup blokira vse!)
+                self.accept_cookies()
 
-            # Nato zapri druge popupe
-            self.close_popups()
+                # Nato zapri druge popupe
+                self.close_popups()
 
             # Health check SELE PO sprejetju piskotkov
             # Ne obravnavamo kot napako ce ni "healthy" - nadaljujemo
@@ -594,10 +1623,177 @@ class BulletproofScraper:
         except Exception as e:
             self.log(f"Scroll error: {e}", "WARNING")
 
+    # ==================== SCROLL ENGINE ====================
+
+    def install_scroll_observer(self) -> bool:
+        """Vstavi MutationObserver + števec product-list requestov (idempotentno)"""
+        selectors = self.SCROLL_TILE_SELECTORS or self.PRODUCT_SELECTORS[:3]
+        try:
+            return bool(self.page.evaluate(
+                SCROLL_OBSERVER_JS, [", ".join(selectors) or "*", self.API_URL_PATTERNS]
+            ))
+        except Exception as e:
+            self.log(f"Scroll observer napaka: {e}", "WARNING")
+            return False
+
+    def scroll_signals(self) -> Optional[dict]:
+        """{added, inflight, quiet (ms), height} ali None če observer ni nameščen"""
+        try:
+            return self.page.evaluate(SCROLL_SIGNALS_JS)
+        except:
+            return None
+
+    def wait_for_scroll_settle(self, timeout: float = None) -> Optional[dict]:
+        """
+        Čakaj dokler ni nobenega product-list requesta v teku IN ni novih tile-ov
+        SCROLL_QUIET_WINDOW sekund (merjeno od začetka koraka ali zadnje spremembe).
+        """
+        step_start = time.time()
+        deadline = step_start + (timeout or self.SCROLL_STEP_TIMEOUT)
+        quiet_needed = self.SCROLL_QUIET_WINDOW * 1000
+        signals = None
+
+        while time.time() < deadline:
+            time.sleep(self.SCROLL_POLL_INTERVAL)
+            signals = self.scroll_signals()
+            if signals is None:
+                break
+            quiet = min(signals["quiet"], (time.time() - step_start) * 1000)
+            if signals["inflight"] <= 0 and quiet >= quiet_needed:
+                break
+
+        return signals
+
+    def click_load_more(self) -> bool:
+        """Klikni viden "Naloži več" gumb (če obstaja)"""
+        for selector in self.LOAD_MORE_SELECTORS:
+            try:
+                btn = self.page.query_selector(selector)
+                if btn and btn.is_visible():
+                    btn.click()
+                    return True
+            except:
+                continue
+        return False
+
+    def scroll_until_settled(self, max_scrolls: int = 300, scrolls_per_step: int = 1,
+                             on_step: Callable[[int], Any] = None) -> int:
+        """
+        SKUPNI scroll engine: scroll -> čakaj na signale -> "Naloži več" -> ponovi.
+        Konča ko SCROLL_IDLE_STEPS korakov zapored ni novih tile-ov in višina stoji,
+        ali ko API capture pove da je bila zadnja stran. Vrne število korakov.
+        """
+        self.phase = "scroll"
+        start = time.time()
+        self.install_scroll_observer()
+
+        signals = self.scroll_signals() or {"added": 0, "height": 0}
+        last_added, last_height = signals["added"], signals["height"]
+        idle = 0
+        steps = 0
+
+        while steps < max_scrolls and idle < self.SCROLL_IDLE_STEPS:
+            # Scroll korak sproži nalaganje -> žeton controllerja
+            if self.rate:
+                self.throttle()
+            for _ in range(scrolls_per_step):
+                try:
+                    self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                except Exception as e:
+                    self.log(f"Scroll error: {e}", "WARNING")
+            steps += 1
+
+            signals = self.wait_for_scroll_settle()
+
+            if self.click_load_more():
+                idle = 0
+                signals = self.wait_for_scroll_settle()
+
+            if on_step:
+                on_step(steps)
+            elif self.STREAMING_EXTRACTION:
+                self.stream_step(steps)
+
+            if self.MEASURE_BROWSER_MEMORY:
+                self.sample_browser_memory()
+
+            # API capture: zadnja stran že postrežena -> nehaj scrollat
+            if self.api_says_done():
+                self.log("API: zadnja stran naložena - konec scrolla", "SUCCESS")
+                break
+
+            if signals is None:
+                # Observer izgubljen (navigacija?) - namesti znova
+                self.install_scroll_observer()
+                signals = self.scroll_signals() or {"added": last_added, "height": last_height}
+
+            if signals["added"] > last_added or signals["height"] != last_height:
+                idle = 0
+            else:
+                idle += 1
+            last_added, last_height = signals["added"], signals["height"]
+
+            if steps % 20 == 0:
+                self.log(f"Scroll {steps}: +{last_added} tile-ov, idle={idle}")
+
+        if self.MEASURE_BROWSER_MEMORY:
+            self.sample_browser_memory()
+
+        elapsed = round(time.time() - start, 1)
+        self.record_scroll_time(elapsed)
+        self.log(f"Scroll končan po {steps} korakih v {elapsed}s (+{last_added} tile-ov)")
+        return steps
+
+    def record_extract_time(self, seconds: float):
+        """Čas ekstrakcije po kategoriji v metrikah"""
+        category = self.current_category or "?"
+        times = self.metrics.category_extract_times
+        times[category] = round(times.get(category, 0.0) + seconds, 2)
+        self.metrics.extract_time = round(self.metrics.extract_time + seconds, 2)
+        self.timings.observe("extract", seconds, category)
+
+    def sample_browser_memory(self) -> Optional[dict]:
+        """JS heap + DOM vozlišča strani (CDP Performance.getMetrics, samo Chromium)"""
+        if self._cdp is False:
+            return None
+        try:
+            if self._cdp is None:
+                self._cdp = self.page.context.new_cdp_session(self.page)
+                self._cdp.send("Performance.enable")
+            result = self._cdp.send("Performance.getMetrics")
+        except Exception as e:
+            self.log(f"Meritev spomina ni podprta: {e}", "DEBUG")
+            self._cdp = False
+            return None
+
+        values = {m["name"]: m["value"] for m in result.get("metrics", [])}
+        sample = {
+            "js_heap_mb": round(values.get("JSHeapUsedSize", 0) / (1024 * 1024), 1),
+            "dom_nodes": int(values.get("Nodes", 0)),
+        }
+        self.metrics.peak_js_heap_mb = max(self.metrics.peak_js_heap_mb, sample["js_heap_mb"])
+        self.metrics.peak_dom_nodes = max(self.metrics.peak_dom_nodes, sample["dom_nodes"])
+        return sample
+
+    def record_scroll_time(self, seconds: float):
+        """Čas scrollanja po kategoriji v metrikah"""
+        category = self.current_category or "?"
+        times = self.metrics.category_scroll_times
+        times[category] = round(times.get(category, 0.0) + seconds, 1)
+        self.metrics.scroll_time = round(self.metrics.scroll_time + seconds, 1)
+        self.timings.observe("scroll", seconds, category)
+
     # ==================== ANTI-DETECTION ====================
 
     def accept_cookies(self) -> bool:
         """ULTIMATE sprejem piškotkov - 30+ selektorjev"""
+        if self.session_restored():
+            return True
+
+        if self.popups_auto_dismissed():
+            # Cookie bar klikne popup guard takoj ko se pojavi
+            self.popup_guard.sweep()
+            return self.metrics.popups_dismissed.get("cookies", 0) > 0
 
         # Počakaj da se popup pojavi
         time.sleep(1.5)
@@ -699,8 +1895,99 @@ class BulletproofScraper:
 
     def close_popups(self):
         """ULTIMATE SMART zapiranje popup-ov - skenira in zapre VSE"""
+        self.phase = "popup"
+        if self.popups_auto_dismissed():
+            self.popup_guard.sweep()
+            return
+        if self.session_restored():
+            return
         self._smart_close_all_popups()
 
+    # ==================== POPUP GUARD ====================
+
+    def install_popup_guard(self) -> bool:
+        """Namesti auto-dismiss skripto (enkrat na page, velja za vse navigacije)"""
+        if not self.AUTO_DISMISS_POPUPS or self.page is None:
+            return False
+        if self.popup_guard is None:
+            self.popup_guard = PopupGuard(self.page, self.POPUP_RULES, self._on_popup_dismissed, self.log)
+            if self.popup_guard.install():
+                self.log(f"Popup guard nameščen ({len(self.POPUP_RULES)} pravil)", "DEBUG")
+        return self.popup_guard.installed
+
+    def popups_auto_dismissed(self) -> bool:
+        """Ali popup-e zapira skripta v browserju (brez pollanja)"""
+        return bool(self.popup_guard and self.popup_guard.installed)
+
+    def _on_popup_dismissed(self, name: str):
+        """Binding callback - samo števec (brez Playwright klicev)"""
+        dismissed = self.metrics.popups_dismissed
+        dismissed[name] = dismissed.get(name, 0) + 1
+
+    def popups_handled(self) -> bool:
+        """Ni treba čakati na popup-e (guard jih zapira ali pa je seja obnovljena)"""
+        return self.popups_auto_dismissed() or self.session_restored()
+
+    # ==================== SESSION (STORAGE STATE) ====================
+
+    @classmethod
+    def storage_state_path(cls) -> Path:
+        """sessions/{trgovina}.json"""
+        return Path(__file__).parent.parent / "sessions" / f"{cls.data_key()}.json"
+
+    @classmethod
+    def load_session(cls) -> Optional[dict]:
+        """Shranjena seja trgovine (None če je ni ali je zastarela)"""
+        if not cls.PERSIST_STORAGE_STATE:
+            return None
+        return load_storage_state(cls.storage_state_path(), cls.STORAGE_STATE_MAX_AGE_HOURS)
+
+    @classmethod
+    def context_options(cls) -> dict:
+        """Opcije za browser.new_context() - s shranjeno sejo če obstaja"""
+        options = dict(CONTEXT_OPTIONS)
+        state = cls.load_session()
+        if state:
+            options["storage_state"] = state
+        return options
+
+    def session_restored(self) -> bool:
+        """
+        Poceni preverjanje (en klic, brez DOM-a): ali context vsebuje trajne
+        piškotke shranjene seje. Če ne, gre scraper skozi interaktivni flow.
+        """
+        if self._session_restored is None:
+            self._session_restored = False
+            state = self.load_session()
+            if state and self.page is not None:
+                try:
+                    saved = persistent_cookie_names(state)
+                    current = {c["name"] for c in self.page.context.cookies()}
+                    self._session_restored = bool(saved) and saved <= current
+                except:
+                    pass
+            if self._session_restored:
+                self.log("Seja obnovljena (piškotki/prevzem iz sessions/)", "DEBUG")
+        return self._session_restored
+
+    def save_session(self, final: bool = False):
+        """
+        Shrani storage_state po uspešnem consent/izbiri prevzema (enkrat na run).
+        final=True (konec runa) prepiše zgodnji zapis - guard morda klikne consent šele kasneje.
+        """
+        if not self.PERSIST_STORAGE_STATE or self.session_restored():
+            return
+        if self.session_saved and not final:
+            return
+        try:
+            state = self.page.context.storage_state()
+            if state.get("cookies"):
+                save_storage_state(self.storage_state_path(), state)
+                self.session_saved = True
+                self.log(f"Seja shranjena: {self.storage_state_path().name}", "DEBUG")
+        except Exception as e:
+            self.log(f"Seje ni bilo mogoče shraniti: {e}", "WARNING")
+
     def _smart_close_all_popups(self, max_attempts: int = 5):
         """
         PAMETEN POPUP CLOSER - skenira stran za popup-e in jih zapre.
@@ -836,151 +2123,42 @@ class BulletproofScraper:
 
     def assess_quality(self, product: dict) -> ProductQuality:
         """Oceni kvaliteto podatkov izdelka"""
-        q = ProductQuality()
-
-        name = product.get("ime", "")
-        regular_price = product.get("redna_cena")
-        sale_price = product.get("akcijska_cena")
-        image = product.get("slika", "")
-        category = product.get("kategorija", "")
-        unit = product.get("enota", "")
-
-        # Has name
-        q.has_name = bool(name and len(name) > 1)
-
-        # Has price
-        q.has_price = bool(regular_price or sale_price)
-
-        # Has image
-        q.has_image = bool(image and image.startswith("http"))
-
-        # Has category
-        q.has_category = bool(category and len(category) > 2)
-
-        # Has unit
-        q.has_unit = bool(unit)
-
-        # Name length OK
-        q.name_length_ok = self.MIN_NAME_LENGTH < len(name) < self.MAX_NAME_LENGTH if name else False
-
-        # Price reasonable
-        price = regular_price or sale_price or 0
-        q.price_reasonable = self.MIN_PRICE < price < self.MAX_PRICE if price else False
-
-        # Image URL valid
-        if image:
-            bad_patterns = ["placeholder", "no-image", "noimage", "default", "loading", "blank", "1x1"]
-            q.image_url_valid = not any(p in image.lower() for p in bad_patterns)
-
-        return q
+        return self.validator.quality(product)
 
     # ==================== VALIDATION ====================
 
     def is_valid_name(self, name: str) -> bool:
         """Preveri ali je ime veljavno"""
-        if not name:
-            return False
-        if len(name) < self.MIN_NAME_LENGTH or len(name) > self.MAX_NAME_LENGTH:
-            return False
-
-        # Bad patterns
-        bad_patterns = [
-            r"^(menu|nav|header|footer|košarica|cart|prijava|login|iskanje|search)$",
-            r"^(kategorij[ea]|razvrsti|filter|išči|išci|sortir)$",
-            r"^(vstavi|dodaj|izbriši|uredi|zapri|odpri)$",
-            r"^(nalagam|čakaj|loading)\.{0,3}$",
-            r"^\d+$",
-            r"^€\s*\d",
-            r"^[A-Z]{5,}$",  # Samo uppercase kratice
-        ]
-        name_lower = name.lower()
-        for pattern in bad_patterns:
-            if re.match(pattern, name_lower, re.I):
-                return False
-
-        return True
+        return self.validator.is_valid_name(name)
 
     def is_valid_price(self, price: float) -> bool:
         """Preveri ali je cena veljavna"""
-        if price is None:
-            return False
-        if not isinstance(price, (int, float)):
-            return False
-        return self.MIN_PRICE < price < self.MAX_PRICE
+        return self.validator.is_valid_price(price)
 
     def is_valid_image_url(self, url: str) -> bool:
         """Preveri ali je URL slike veljaven"""
-        if not url or not url.startswith("http"):
-            return False
-
-        bad_patterns = [
-            "placeholder", "no-image", "noimage", "default", "loading",
-            "spinner", "blank", "empty", "1x1", "pixel", "spacer",
-            "transparent", "grey", "gray",
-        ]
-        url_lower = url.lower()
-        return not any(p in url_lower for p in bad_patterns)
+        return self.validator.is_valid_image_url(url)
 
     def validate_product(self, product: dict) -> Tuple[bool, str, ProductQuality]:
         """
         ULTIMATE validacija izdelka.
         Vrne (is_valid, reason, quality_score)
         """
-        quality = self.assess_quality(product)
-
-        # Must have name
-        if not quality.has_name:
-            self.metrics.products_invalid += 1
-            return False, "no_name", quality
-
-        # Must have price
-        if not quality.has_price:
-            self.metrics.products_invalid += 1
-            return False, "no_price", quality
-
-        # Validate name
-        if not self.is_valid_name(product.get("ime", "")):
-            self.metrics.products_invalid += 1
-            return False, "invalid_name", quality
-
-        # Validate prices
-        regular = product.get("redna_cena")
-        sale = product.get("akcijska_cena")
-
-        if regular and not self.is_valid_price(regular):
-            self.metrics.products_invalid += 1
-            return False, "invalid_regular_price", quality
-
-        if sale and not self.is_valid_price(sale):
-            self.metrics.products_invalid += 1
-            return False, "invalid_sale_price", quality
-
-        # Sale price should be lower
-        if regular and sale and sale >= regular:
-            # Auto-fix: swap them
-            product["redna_cena"], product["akcijska_cena"] = sale, regular
-
-        # Quality threshold
-        if quality.score < self.MIN_QUALITY_SCORE:
-            self.metrics.products_invalid += 1
-            return False, f"low_quality_{quality.score}", quality
+        is_valid, reason, quality = self.validator.validate(product)
+        if not is_valid:
+            self.record_rejection(reason)
+        return is_valid, reason, quality
 
-        return True, "ok", quality
+    def record_rejection(self, reason: str, count: int = 1):
+        """Neveljaven izdelek: števec + statistika po razlogu"""
+        self.metrics.products_invalid += count
+        self.metrics.rejections[reason] = self.metrics.rejections.get(reason, 0) + count
 
     # ==================== DEDUPLICATION ====================
 
-    def get_product_fingerprint(self, product: dict) -> str:
-        """Unikaten fingerprint za izdelek"""
-        name = product.get("ime", "").lower().strip()
-        price = product.get("redna_cena") or product.get("akcijska_cena") or 0
-
-        # Normalize name for fingerprint
-        name = re.sub(r"[^a-zčšž0-9]", "", name)
-
-        # Include store to avoid cross-store dedup at this level
-        store = product.get("trgovina", "").lower()
-
-        return f"{store}|{name}|{price:.2f}"
+    def get_product_fingerprint(self, product: dict) -> int:
+        """Unikaten fingerprint za izdelek (64-bit hash - seen set drži inte, ne stringov)"""
+        return fingerprint64(fingerprint_key(product))
 
     def is_duplicate(self, product: dict) -> bool:
         """Preveri ali je duplikat"""
@@ -993,26 +2171,64 @@ class BulletproofScraper:
 
     # ==================== CHECKPOINTS ====================
 
+    def open_journal(self):
+        """Odpri append-only journal izdelkov (ob resume nadaljuje obstoječega)"""
+        if not self.CHECKPOINT_ENABLED or self.journal:
+            return
+
+        if not self.checkpoint_file:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.checkpoint_file = self.checkpoints_dir / f"{self.STORE_NAME.lower()}_{timestamp}.json"
+
+        journal_path = self.checkpoint_file.with_suffix(".journal.jsonl")
+        self.journal = ProductJournal(journal_path, self.JOURNAL_FLUSH_EVERY, self.JOURNAL_FLUSH_SECONDS)
+        self.log(f"Journal: {journal_path.name}", "DEBUG")
+
+    def journal_product(self, product: dict, category: str = None):
+        """Zapiši sprejet izdelek v journal"""
+        if self.journal:
+            try:
+                if category is None:
+                    category = self.journal_category if self.journal_category is not None else self.current_category
+                self.journal.append_product(product, category)
+            except Exception as e:
+                self.log(f"Journal write error: {e}", "WARNING")
+
     def save_checkpoint(self, category: str = None):
-        """Shrani checkpoint za resume"""
+        """Shrani checkpoint za resume (in flushaj journal) + sprotni izvoz histogramov"""
         if not self.CHECKPOINT_ENABLED:
             return
+        with self.timed("persist"):
+            self._save_checkpoint(category)
+        self.export_timings()
+
+    def _save_checkpoint(self, category: str = None):
 
         if category:
             self.completed_categories.add(category)
 
+        if not self.checkpoint_file:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.checkpoint_file = self.checkpoints_dir / f"{self.STORE_NAME.lower()}_{timestamp}.json"
+
+        try:
+            if self.journal:
+                if category:
+                    self.journal.mark_category(category)
+                else:
+                    self.journal.flush()
+        except Exception as e:
+            self.log(f"Journal flush error: {e}", "WARNING")
+
         checkpoint = {
             "store": self.STORE_NAME,
             "timestamp": datetime.now().isoformat(),
             "completed_categories": list(self.completed_categories),
             "products_count": len(self.products),
+            "journal": self.journal.path.name if self.journal else None,
             "metrics": self.metrics.to_dict(),
         }
 
-        if not self.checkpoint_file:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.checkpoint_file = self.checkpoints_dir / f"{self.STORE_NAME.lower()}_{timestamp}.json"
-
         try:
             with open(self.checkpoint_file, "w", encoding="utf-8") as f:
                 json.dump(checkpoint, f, ensure_ascii=False, indent=2, default=str)
@@ -1020,7 +2236,11 @@ class BulletproofScraper:
             self.log(f"Checkpoint save error: {e}", "WARNING")
 
     def load_checkpoint(self, checkpoint_file: str = None) -> bool:
-        """Naloži checkpoint za resume"""
+        """
+        Naloži checkpoint za resume.
+        Iz journala obnovi products, seen in metrike končanih kategorij;
+        kategorija ki je bila v teku se ponovi od začetka.
+        """
         if checkpoint_file:
             path = Path(checkpoint_file)
         else:
@@ -1035,42 +2255,371 @@ class BulletproofScraper:
                 checkpoint = json.load(f)
 
             self.completed_categories = set(checkpoint.get("completed_categories", []))
-            self.log(f"Loaded checkpoint: {len(self.completed_categories)} kategorij že končanih", "SUCCESS")
+            self.checkpoint_file = path
+
+            # Metrike (števci) iz checkpointa
+            for key, value in (checkpoint.get("metrics") or {}).items():
+                if key in ("start_time", "end_time"):
+                    continue
+                if hasattr(self.metrics, key):
+                    setattr(self.metrics, key, value)
+
+            # Izdelki iz journala
+            journal_path = path.with_suffix(".journal.jsonl")
+            if journal_path.exists():
+                products, completed, dropped = ProductJournal.replay(journal_path)
+                self.completed_categories |= completed
+
+                self.products = []
+                self.seen = set()
+                for product in products:
+                    product = Product.from_dict(product)
+                    fp = self.get_product_fingerprint(product)
+                    if fp in self.seen:
+                        continue
+                    self.seen.add(fp)
+                    self.products.append(product)
+                self.metrics.products_valid = len(self.products)
+
+                for category, count in dropped.items():
+                    self.log(f"Kategorija v teku '{category}': {count} izdelkov zavrženih - ponovim", "WARNING")
+
+                # Nadaljuj isti journal
+                self.journal = ProductJournal(journal_path, self.JOURNAL_FLUSH_EVERY, self.JOURNAL_FLUSH_SECONDS)
+
+            self.log(f"Loaded checkpoint: {len(self.completed_categories)} kategorij že končanih, "
+                     f"{len(self.products)} izdelkov obnovljenih", "SUCCESS")
             return True
         except Exception as e:
             self.log(f"Checkpoint load error: {e}", "WARNING")
             return False
 
     def should_skip_category(self, category: str) -> bool:
-        """Ali naj preskočimo kategorijo (že končana)"""
-        return category in self.completed_categories
+        """Ali naj preskočimo kategorijo (že končana ali že prevzeta iz delta zapisa)"""
+        return category in self.completed_categories or category in self.delta_reused
+
+    # ==================== DELTA SCRAPING ====================
+
+    def category_tail_sample(self) -> Optional[List[str]]:
+        """
+        Vzorec konca kategorije za fingerprint (zadnja stran / zadnji tile-i), [] = kategorija
+        ima samo prvo stran. None = ni poceni vzorca -> delta se za kategorijo ne uporabi
+        (infinite scroll: konec je dosegljiv šele po celem scrollu). SparScraper: zadnja stran.
+        """
+        return None
+
+    def compute_category_fingerprint(self) -> Optional[str]:
+        """
+        Poceni fingerprint: prvih N tile-ov prve strani (en evaluate), značka s številom
+        izdelkov, že ujeti API izdelki in vzorec konca kategorije. None = ni s čim primerjati.
+        """
+        tail = self.category_tail_sample()
+        if tail is None:
+            self.log(f"Delta: {self.current_category} brez vzorca konca - poln scrape", "DEBUG")
+            return None
+
+        selectors = list(self.SCROLL_TILE_SELECTORS or []) + list(self.PRODUCT_SELECTORS)
+        try:
+            first_page = self.page.evaluate(FINGERPRINT_JS, [selectors, self.DELTA_FINGERPRINT_TILES]) or {}
+        except Exception as e:
+            self.log(f"Delta fingerprint napaka: {e}", "DEBUG")
+            return None
+
+        api = []
+        if self.capture:
+            self.collect_api_products(self.current_category)
+            api = [f"{p.get('ime')}|{p.get('redna_cena')}|{p.get('akcijska_cena')}"
+                   for p in self.api_category_products[:self.DELTA_FINGERPRINT_TILES]]
+
+        return fingerprint(first_page.get("tiles") or [], first_page.get("count") or "", api, tail)
+
+    def reuse_unchanged_category(self, category: str) -> Optional[list[dict]]:
+        """
+        Klic PO prvi strani kategorije, PRED scrollom. Samo za prave kategorije - ne za
+        psevdo-kategorijo celega kataloga (npr. Mercator /brskaj).
+        Fingerprint = prejšnji run -> izdelki prejšnjega runa (vrne jih), sicer None (poln scrape).
+        """
+        if not self.DELTA_SCRAPING:
+            return None
+
+        tile_selectors = self.SCROLL_TILE_SELECTORS or self.PRODUCT_SELECTORS[:3]
+        if tile_selectors:
+            self.wait_for_products(tile_selectors, timeout=10000)
+        self.category_fingerprint = self.compute_category_fingerprint()
+        entry = self.delta.lookup(category, self.category_fingerprint)
+        if not entry:
+            return None
+
+        # API izdelki prve strani so že sveži - ostalo iz zapisa (duplikate odstrani add_product)
+        products = list(self.api_category_products)
+        products.extend(self.add_products([Product.from_dict(product) for product in entry["products"]]))
+
+        saved = max(0.0, entry.get("seconds", 0.0) - (time.time() - self.category_started))
+        self.delta_reused.add(category)
+        self.metrics.delta_reused_categories += 1
+        self.metrics.delta_reused_products += len(products)
+        self.metrics.delta_time_saved = round(self.metrics.delta_time_saved + saved, 1)
+        self.log(f"{category}: nespremenjena (delta) - {len(products)} izdelkov iz prejšnjega runa, "
+                 f"prihranjeno ~{saved:.0f}s", "SUCCESS")
+        return products
+
+    def remember_category(self, category: str, products: list[dict]):
+        """Po polnem scrapu kategorije: shrani fingerprint + izdelke za naslednji run"""
+        if not self.DELTA_SCRAPING or not self.category_fingerprint or not products:
+            return
+        if category in self.delta_reused:
+            return  # Zapis je že aktualen
+        try:
+            self.delta.store(category, self.category_fingerprint, products, time.time() - self.category_started)
+        except Exception as e:
+            self.log(f"Delta zapis napaka: {e}", "WARNING")
 
     # ==================== PROGRESS ====================
 
+    @classmethod
+    def store_key(cls) -> str:
+        """ASCII ključ trgovine za imena datotek (Tuš -> tus)"""
+        return cls.STORE_NAME.lower().replace("š", "s").replace("č", "c").replace("ž", "z")
+
+    @classmethod
+    def base_url_override(cls) -> str:
+        """PRHRAN_BASE_URL_{TRGOVINA} ali prazno"""
+        return os.getenv(f"PRHRAN_BASE_URL_{cls.store_key().upper()}", "").strip().rstrip("/")
+
+    @classmethod
+    def data_key(cls) -> str:
+        """Ključ za lokalne podatke trgovine (seja, delta, selektorji) - mock/staging ločeno od živih"""
+        override = cls.base_url_override()
+        if not override:
+            return cls.store_key()
+        host = re.sub(r"[^a-z0-9]+", "_", urlsplit(override).netloc.lower()).strip("_")
+        return f"{cls.store_key()}_{host}"
+
+    def apply_base_url(self, base_url: str):
+        """Preusmeri BASE_URL, vse *_URL atribute in CATEGORY_URLS (seznam (ime, URL)) na base_url"""
+        original = type(self).BASE_URL.rstrip("/")
+
+        def rebase(url: str) -> str:
+            if original and url.startswith(original):
+                return base_url + url[len(original):]
+            return url
+
+        for name in dir(type(self)):
+            value = getattr(type(self), name, None)
+            if name.isupper() and name.endswith("_URL") and isinstance(value, str):
+                setattr(self, name, rebase(value))
+
+        categories = getattr(type(self), "CATEGORY_URLS", None)
+        if isinstance(categories, list):
+            # SPAR ima dict poti (relativno na BASE_URL) - ostane kot je
+            self.CATEGORY_URLS = [(name, rebase(url)) for name, url in categories]
+
+    def open_progress(self):
+        """Odpri progress writer za ta run (en file: progress/{store}_{ts}.jsonl[.gz])"""
+        if self.progress_writer or self.worker_id:
+            return
+        path = progress_path(self.progress_dir, self.store_key(), self.PROGRESS_COMPRESS)
+        try:
+            self.progress_writer = ProgressWriter(
+                path,
+                header={"store": self.STORE_NAME, "timestamp": datetime.now().isoformat()},
+                flush_every=self.SAVE_PROGRESS_EVERY,
+                flush_seconds=self.SAVE_PROGRESS_SECONDS,
+            )
+            self.log(f"Progress: {path.name}", "DEBUG")
+        except Exception as e:
+            self.log(f"Progress open error: {e}", "WARNING")
+
     def save_progress(self):
-        """Shrani trenutni napredek"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = self.progress_dir / f"{self.STORE_NAME.lower()}_{timestamp}.json"
+        """Zapiši buffer progress datoteke na disk"""
+        if not self.progress_writer:
+            return
+        try:
+            self.progress_writer.flush()
+        except Exception as e:
+            self.log(f"Progress save error: {e}", "WARNING")
 
-        progress = {
-            "store": self.STORE_NAME,
-            "timestamp": timestamp,
-            "products_count": len(self.products),
-            "metrics": self.metrics.to_dict(),
-            "products": self.products[-100:],  # Zadnjih 100 za debugging
-        }
+    def record_progress(self, product: dict):
+        """Dodaj izdelek v progress (writer sam omeji pogostost zapisov)"""
+        if self.worker_id:
+            return  # Worker - progress shranjuje koordinator
+        if not self.progress_writer:
+            self.open_progress()
+        if self.progress_writer:
+            try:
+                self.progress_writer.write(product)
+            except Exception as e:
+                self.log(f"Progress write error: {e}", "WARNING")
 
+    def close_progress(self):
+        """Zaključi progress datoteko (footer s številom in metrikami)"""
+        if not self.progress_writer:
+            return
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(progress, f, ensure_ascii=False, indent=2, default=str)
-            self.log(f"Progress saved: {filename.name}", "DEBUG")
+            self.progress_writer.close({"metrics": self.metrics.to_dict()})
+            self.log(f"Progress saved: {self.progress_writer.path.name}", "DEBUG")
         except Exception as e:
-            self.log(f"Progress save error: {e}", "WARNING")
+            self.log(f"Progress close error: {e}", "WARNING")
+
+    def emit_product(self, product: dict):
+        """Posreduj sprejet izdelek product_callback-u (če je nastavljen)"""
+        if not self.product_callback:
+            return
+        try:
+            self.product_callback(product)
+        except Exception as e:
+            self.log(f"product_callback napaka: {e}", "WARNING")
+
+    # ==================== CATEGORY WORKERS ====================
+
+    def worker_count(self, categories: int) -> int:
+        """Število workerjev: nastavitev trgovine, omejena s politeness capom"""
+        return max(1, min(self.CATEGORY_WORKERS, self.MAX_CATEGORY_WORKERS, categories))
+
+    def spawn_worker(self, page: Page, worker_id: int) -> "BulletproofScraper":
+        """Nov scraper iste trgovine za worker thread (svoj page, svoje stanje)"""
+        worker = type(self)(
+            page,
+            headless=self.headless,
+            extraction_mode=self.EXTRACTION_MODE,
+            capture_api=self.CAPTURE_API_RESPONSES,
+            streaming=self.STREAMING_EXTRACTION,
+        )
+        worker.MEASURE_BROWSER_MEMORY = self.MEASURE_BROWSER_MEMORY
+        worker.AUTO_DISMISS_POPUPS = self.AUTO_DISMISS_POPUPS
+        worker.DELTA_SCRAPING = self.DELTA_SCRAPING
+        worker.SNAPSHOT_WORKERS = self.SNAPSHOT_WORKERS
+        worker.ARCHIVE_SNAPSHOTS = self.ARCHIVE_SNAPSHOTS
+        worker.retry_budget = self.retry_budget  # En budget za celoten run trgovine
+        worker.profiler = self.profiler  # Skupen profiling direktorij + index
+        worker.worker_id = worker_id
+        worker.log_file = self.log_file
+        worker.run_started = self.run_started
+        worker.CHECKPOINT_ENABLED = False
+        worker.metrics.start_time = datetime.now()
+        if worker.CAPTURE_API_RESPONSES:
+            worker.enable_response_capture()
+        return worker
+
+    def merge_products(self, products: list[dict], category: str = None) -> int:
+        """Združi izdelke workerja (deduplikacija čez vse workerje) - vrne št. novih"""
+        added = 0
+        for product in products:
+            if self.is_duplicate(product):
+                continue
+            self.products.append(product)
+            self.metrics.products_valid += 1
+            added += 1
+            with self.timed("persist"):
+                self.journal_product(product, category or "")
+                self.emit_product(product)
+                self.record_progress(product)
+
+        if category:
+            self.save_checkpoint(category)
+        return added
+
+    def merge_worker_metrics(self, worker: "BulletproofScraper"):
+        """Prištej metrike workerja (products_valid šteje merge_products)"""
+        m, w = self.metrics, worker.metrics
+        m.pages_scraped += w.pages_scraped
+        m.pages_failed += w.pages_failed
+        m.products_found += w.products_found
+        m.products_invalid += w.products_invalid
+        m.duplicates += w.duplicates
+        m.retries += w.retries
+        m.errors += w.errors
+        m.screenshots_taken += w.screenshots_taken
+        m.blocked_requests += w.blocked_requests
+        m.api_responses += w.api_responses
+        m.api_products += w.api_products
+        m.scroll_time = round(m.scroll_time + w.scroll_time, 1)
+        m.extract_time = round(m.extract_time + w.extract_time, 2)
+        m.peak_js_heap_mb = max(m.peak_js_heap_mb, w.peak_js_heap_mb)
+        m.peak_dom_nodes = max(m.peak_dom_nodes, w.peak_dom_nodes)
+        m.rate_wait_time = round(m.rate_wait_time + w.rate_wait_time, 2)
+        m.rate_backoffs += w.rate_backoffs
+        m.retry_time = round(m.retry_time + w.retry_time, 1)
+        m.circuit_opens += w.circuit_opens
+        m.circuit_fast_fails += w.circuit_fast_fails
+        m.circuit_state.update(w.circuit_state)
+        m.delta_reused_categories += w.delta_reused_categories
+        m.selector_self_heals += w.selector_self_heals
+        for name, selector in w.selector_drift.items():
+            m.selector_drift.setdefault(name, selector)
+        m.delta_reused_products += w.delta_reused_products
+        m.delta_time_saved = round(m.delta_time_saved + w.delta_time_saved, 1)
+        self.delta_reused |= worker.delta_reused
+        m.retry_budget_left = self.retry_budget.remaining
+        if self.rate:
+            m.request_rate = round(self.rate.rate, 2)
+        for name, count in w.popups_dismissed.items():
+            m.popups_dismissed[name] = m.popups_dismissed.get(name, 0) + count
+        for reason, count in w.rejections.items():
+            m.rejections[reason] = m.rejections.get(reason, 0) + count
+        for category, seconds in w.category_extract_times.items():
+            m.category_extract_times[category] = round(m.category_extract_times.get(category, 0.0) + seconds, 2)
+        for category, seconds in w.category_scroll_times.items():
+            m.category_scroll_times[category] = round(m.category_scroll_times.get(category, 0.0) + seconds, 1)
+        self.page_load_times.extend(worker.page_load_times)
+        self.timings.merge(worker.timings)
+
+    def scrape_category_task(self, category_name: str, url: str) -> list[dict]:
+        """Ena kategorija od začetka do konca (override v podrazredu za workerje)"""
+        raise NotImplementedError("Override scrape_category_task() in subclass")
+
+    def run_category_task(self, category_name: str, url: str) -> list[dict]:
+        """scrape_category_task (+ profiling če je kategorija izbrana)"""
+        # Journal pod istim ključem kot save_checkpoint(category_name) - current_category je
+        # lahko prikazno ime trgovine (SPAR: "Sadje In Zelenjava"), replay bi izdelke zavrgel
+        previous, self.journal_category = self.journal_category, category_name
+        try:
+            with self.profiled(category_name):
+                return self.scrape_category_task(category_name, url)
+        finally:
+            self.journal_category = previous
+
+    def scrape_categories(self, categories: List[Tuple[str, str]]) -> list[dict]:
+        """
+        Scrapaj seznam (ime, url) kategorij - serijsko ali z več workerji.
+        Že končane kategorije (checkpoint) preskoči.
+        """
+        todo = [(name, url) for name, url in categories if not self.should_skip_category(name)]
+        if len(todo) < len(categories):
+            self.log(f"Preskočenih {len(categories) - len(todo)} že končanih kategorij")
+
+        workers = self.worker_count(len(todo))
+        if workers > 1:
+            return CategoryWorkerPool(self, todo, workers).run()
 
-    def maybe_save_progress(self):
-        """Shrani progress če je dovolj novih izdelkov"""
-        if len(self.products) % self.SAVE_PROGRESS_EVERY == 0:
-            self.save_progress()
+        failed = self.scrape_categories_serial(todo)
+        if failed:
+            self.metrics.failed_categories.extend(failed)
+            self.log(f"Neuspele kategorije: {', '.join(failed)}", "ERROR")
+        return self.products
+
+    def scrape_categories_serial(self, categories: List[Tuple[str, str]]) -> List[str]:
+        """Kategorije ena za drugo, neuspele na koncu še CATEGORY_RETRIES-krat - vrne dokončno neuspele"""
+        pending = list(categories)
+        for attempt in range(self.CATEGORY_RETRIES + 1):
+            if attempt:
+                self.log(f"Ponavljam neuspele kategorije: {', '.join(name for name, _ in pending)}", "WARNING")
+            failed = []
+            for i, (name, url) in enumerate(pending):
+                self.log(f"\n[{i+1}/{len(pending)}] {name}")
+                try:
+                    products = self.run_category_task(name, url)
+                    self.remember_category(name, products)
+                    self.save_checkpoint(name)
+                except Exception as e:
+                    self.log(f"Napaka pri {name}: {e}", "ERROR")
+                    self.metrics.errors += 1
+                    failed.append((name, url))
+                self.throttle()
+            pending = failed
+            if not pending:
+                break
+        return [name for name, _ in pending]
 
     # ==================== MAIN METHODS ====================
 
@@ -1079,23 +2628,51 @@ class BulletproofScraper:
         self.metrics.products_found += 1
 
         # Validacija
-        is_valid, reason, quality = self.validate_product(product)
+        with self.timed("validate"):
+            is_valid, reason, quality = self.validate_product(product)
         if not is_valid:
             return False
 
+        return self.accept_product(product, quality.score)
+
+    def add_products(self, products: list[dict]) -> list[dict]:
+        """
+        Batch različica add_product (bulk / snapshot / streaming / API):
+        ena validacija za cel seznam, potem deduplikacija v istem vrstnem redu.
+        Vrne sprejete (nove) izdelke.
+        """
+        if not products:
+            return []
+        self.metrics.products_found += len(products)
+
+        with self.timed("validate"):
+            result = self.validator.validate_batch(products)
+        for reason, count in result.reasons.items():
+            self.record_rejection(reason, count)
+
+        return [product for product, score in zip(result.accepted, result.scores)
+                if self.accept_product(product, score)]
+
+    def accept_product(self, product: dict, score: int) -> bool:
+        """Veljaven izdelek: deduplikacija, quality score, shrani (journal, callback, progress)"""
         # Deduplikacija
-        if self.is_duplicate(product):
+        with self.timed("dedupe"):
+            duplicate = self.is_duplicate(product)
+        if duplicate:
             return False
 
         # Add quality score to product
-        product["_quality_score"] = quality.score
+        product["_quality_score"] = score
 
         # Dodaj
         self.products.append(product)
         self.metrics.products_valid += 1
+        with self.timed("persist"):
+            self.journal_product(product)
+            self.emit_product(product)
 
-        # Progress
-        self.maybe_save_progress()
+            # Progress
+            self.record_progress(product)
 
         return True
 
@@ -1103,24 +2680,43 @@ class BulletproofScraper:
         """Začni scraping"""
         self.metrics.start_time = datetime.now()
 
-        # Setup log file
+        self.run_started = time.time()
+
+        # Setup log file (JSONL - en strukturiran zapis na vrstico)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.log_file = self.logs_dir / f"{self.STORE_NAME.lower()}_{timestamp}.log"
+        self.log_file = self.logs_dir / f"{self.STORE_NAME.lower()}_{timestamp}.jsonl"
 
         self.log("=" * 60)
         self.log(f"ZAČENJAM SCRAPING: {self.STORE_NAME}")
         self.log(f"Čas: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         self.log("=" * 60)
 
+        if self.CAPTURE_API_RESPONSES:
+            self.enable_response_capture()
+
+        self.open_journal()
+        self.open_profiler(timestamp)
+
     def finish(self):
         """Zaključi scraping"""
         self.metrics.end_time = datetime.now()
 
-        self.save_progress()
+        if self.capture:
+            self.capture.detach()
+
+        self.close_progress()
         self.save_checkpoint()
+        if self.journal:
+            self.journal.close()
         self.log_stats()
+        self.export_timings(final=True)
+
+        self.save_session(final=True)
+        self.save_selector_stats()
+        snapshots.shutdown_parse_pool()
 
         self.log(f"KONČANO: {self.metrics.products_valid} izdelkov", "SUCCESS")
+        self.flush_log()
 
     def scrape_all(self) -> list[dict]:
         """Override v podrazredu!"""
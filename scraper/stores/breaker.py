@@ -0,0 +1,138 @@
+"""
+CIRCUIT BREAKER + RETRY BUDGET
+==============================
+Ko trgovina pade ali nas blokira, ne zapravljamo minut za retry kategorijo za kategorijo.
+
+- CircuitBreaker na trgovino IN na URL vzorec (host/prvi segment poti)
+  closed -> (N zaporednih napak) -> open -> (po RESET sekundah) -> half_open (probe)
+  half_open: uspeh -> closed, napaka -> spet open
+- Ko je odprt, klic takoj vrne neuspeh (fast-fail) - brez čakanja
+- RetryBudget: največ N retry-jev na run (skupaj za vse workerje trgovine)
+"""
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe breaker (deli se med workerji)"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0,
+                 half_open_probes: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+
+        self.lock = threading.Lock()
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+        self.opens = 0
+        self.fast_fails = 0
+
+    def allow(self) -> bool:
+        """Ali sme klic naprej (open -> half_open po reset_timeout)"""
+        with self.lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.fast_fails += 1
+                    return False
+                self.state = HALF_OPEN
+                self.probes = 0
+            # HALF_OPEN: samo omejeno število probe klicev
+            if self.probes < self.half_open_probes:
+                self.probes += 1
+                return True
+            self.fast_fails += 1
+            return False
+
+    def release(self):
+        """Vrni probe iz allow() ki ni bil porabljen (klic je blokiral drug breaker)"""
+        with self.lock:
+            if self.state == HALF_OPEN and self.probes > 0:
+                self.probes -= 1
+
+    def record_success(self):
+        with self.lock:
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.probes = 0
+
+    def record_failure(self) -> bool:
+        """Zabeleži napako - vrne True samo če je TA napaka odprla breaker (closed/half_open -> open)"""
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or (
+                self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.opens += 1
+                return True
+            return False
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == OPEN
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "opens": self.opens,
+                "fast_fails": self.fast_fails,
+            }
+
+
+class RetryBudget:
+    """Največ N retry-jev na run"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.used = 0
+        self.lock = threading.Lock()
+
+    def spend(self) -> bool:
+        """Porabi en retry - False če je budget porabljen"""
+        with self.lock:
+            if self.used >= self.total:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.total - self.used)
+
+
+def url_pattern(url: str) -> str:
+    """https://mercatoronline.si/brskaj/sadje?x=1 -> mercatoronline.si/brskaj"""
+    parsed = urlparse(url)
+    segments = [s for s in parsed.path.split("/") if s]
+    first = segments[0] if segments else ""
+    return f"{parsed.netloc.lower()}/{first}"
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str, **settings) -> CircuitBreaker:
+    """Skupni breaker za ime (trgovina ali trgovina + URL vzorec)"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, **settings)
+            _breakers[name] = breaker
+        return breaker
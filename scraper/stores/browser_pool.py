@@ -0,0 +1,291 @@
+"""
+BROWSER POOL
+============
+En topel Chromium na proces (thread) namesto launch() za vsako trgovino/test.
+
+- launch() enkrat, ali connect() na dolgo živeč strežnik:
+      python -m playwright run-server --port 3000
+      PRHRAN_BROWSER_WS=ws://localhost:3000/ python scraper.py
+- acquire() vrne lease (context + svež page) z sl-SI locale, viewport, UA
+  in shranjeno sejo trgovine (scraper_cls.context_options())
+- release() vrne context v idle (za isto trgovino), page se zapre
+- maybe_recycle() po kategoriji: nov context po N uporabah ali nad mejo spomina
+- stats(): launches, contexti (novi / ponovno uporabljeni / reciklirani), čas zagona
+- PRHRAN_HAR=record/replay: contexti snemajo ali predvajajo HAR (stores/har.py)
+
+Playwright sync objektov ni dovoljeno deliti med threadi -> get_browser_pool()
+vrne pool TEGA threada (category workerji imajo vsak svojega).
+"""
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from playwright.sync_api import sync_playwright
+
+from . import har
+
+
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+]
+
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "locale": "sl-SI",
+    "timezone_id": "Europe/Ljubljana",
+}
+
+
+class ContextLease:
+    """Izposojen context + page"""
+
+    def __init__(self, key: str, context, page):
+        self.key = key
+        self.context = context
+        self.page = page
+        self.uses = 0
+        self.created = time.time()
+
+
+class BrowserPool:
+    """Topel browser + reciklirani contexti"""
+
+    RECYCLE_AFTER_USES = 25  # kategorij na context
+    RECYCLE_MEMORY_MB = 1024.0  # JS heap strani (CDP) nad katerim context zamenjamo
+    DEFAULT_TIMEOUT = 30000
+
+    def __init__(self, headless: bool = True, ws_endpoint: str = None, timeout: int = None):
+        self.headless = headless
+        self.ws_endpoint = ws_endpoint if ws_endpoint is not None else os.getenv("PRHRAN_BROWSER_WS", "")
+        self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self.playwright = None
+        self.browser = None
+        self.idle: Dict[str, List[ContextLease]] = {}
+        self.in_use = 0
+        self.counters = {
+            "launches": 0,
+            "connects": 0,
+            "launch_seconds": 0.0,
+            "contexts_created": 0,
+            "contexts_reused": 0,
+            "contexts_recycled": 0,
+            "leases": 0,
+            "har_files": 0,
+        }
+
+    # ==================== BROWSER ====================
+
+    def start(self) -> "BrowserPool":
+        """Zaženi (ali poveži) browser če še ne teče"""
+        if self.browser and self.browser.is_connected():
+            return self
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+
+        start = time.time()
+        if self.ws_endpoint:
+            self.browser = self.playwright.chromium.connect(self.ws_endpoint)
+            self.counters["connects"] += 1
+        else:
+            self.browser = self.playwright.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
+            self.counters["launches"] += 1
+        self.counters["launch_seconds"] = round(self.counters["launch_seconds"] + time.time() - start, 2)
+        self.idle = {}
+        return self
+
+    def close(self):
+        """Zapri vse contexte, browser in Playwright"""
+        for leases in self.idle.values():
+            for lease in leases:
+                self._close_context(lease)
+        self.idle = {}
+        try:
+            if self.browser:
+                self.browser.close()
+        except Exception:
+            pass
+        try:
+            if self.playwright:
+                self.playwright.stop()
+        except Exception:
+            pass
+        self.browser = None
+        self.playwright = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ==================== CONTEXTS ====================
+
+    def acquire(self, scraper_cls=None, timeout: int = None, **overrides) -> ContextLease:
+        """
+        Context za trgovino (idle ali nov) + svež page.
+        overrides: dodatne new_context opcije (npr. geolocation) - takšen context se ne deli.
+        """
+        self.start()
+        key = scraper_cls.store_key() if scraper_cls else "default"
+
+        lease = None
+        if not overrides:
+            while self.idle.get(key):
+                candidate = self.idle[key].pop()
+                if self._healthy(candidate):
+                    lease = candidate
+                    self.counters["contexts_reused"] += 1
+                    break
+                self._close_context(candidate)
+
+        if lease is None:
+            lease = ContextLease(key, self._new_context(scraper_cls, timeout, overrides), None)
+            if overrides:
+                lease.key = f"{key}:custom"
+
+        lease.page = lease.context.new_page()
+        self.in_use += 1
+        self.counters["leases"] += 1
+        return lease
+
+    def release(self, lease: ContextLease):
+        """Vrni context v pool (page zapre); prestar/prevelik context zapre"""
+        self.in_use = max(0, self.in_use - 1)
+        try:
+            if lease.page:
+                lease.page.close()
+        except Exception:
+            pass
+        lease.page = None
+
+        if lease.key.endswith(":custom") or not self._healthy(lease):
+            self._close_context(lease)
+            return
+        self.idle.setdefault(lease.key, []).append(lease)
+
+    def maybe_recycle(self, lease: ContextLease, scraper_cls=None) -> bool:
+        """
+        Po vsaki kategoriji: uses += 1; ob preseženi meji nov context + page.
+        Vrne True če je page zamenjan (scraper mora dobiti nov page).
+        """
+        lease.uses += 1
+        memory = self.page_memory_mb(lease.page)
+        if lease.uses < self.RECYCLE_AFTER_USES and memory < self.RECYCLE_MEMORY_MB:
+            return False
+
+        self._close_context(lease)
+        lease.context = self._new_context(scraper_cls, None, {})
+        lease.page = lease.context.new_page()
+        lease.uses = 0
+        lease.created = time.time()
+        self.counters["contexts_recycled"] += 1
+        return True
+
+    def _new_context(self, scraper_cls, timeout: Optional[int], overrides: dict):
+        options = scraper_cls.context_options() if scraper_cls else dict(CONTEXT_OPTIONS)
+        store = scraper_cls.store_key() if scraper_cls else "default"
+        options.update(har.context_options(store))
+        options.update(overrides)
+        context = self.browser.new_context(**options)
+        context.set_default_timeout(timeout or self.timeout)
+        self.counters["har_files"] = max(self.counters["har_files"], har.attach_replay(context, store))
+        self.counters["contexts_created"] += 1
+        return context
+
+    def _healthy(self, lease: ContextLease) -> bool:
+        return lease.uses < self.RECYCLE_AFTER_USES and bool(self.browser and self.browser.is_connected())
+
+    def _close_context(self, lease: ContextLease):
+        try:
+            lease.context.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def page_memory_mb(page) -> float:
+        """JS heap strani v MB (CDP, samo Chromium; 0 če ni podprto)"""
+        if page is None:
+            return 0.0
+        try:
+            cdp = page.context.new_cdp_session(page)
+            try:
+                cdp.send("Performance.enable")
+                result = cdp.send("Performance.getMetrics")
+            finally:
+                cdp.detach()
+        except Exception:
+            return 0.0
+        values = {m["name"]: m["value"] for m in result.get("metrics", [])}
+        return round(values.get("JSHeapUsedSize", 0) / (1024 * 1024), 1)
+
+    # ==================== STATS ====================
+
+    def stats(self) -> dict:
+        """Statistika poola"""
+        stats = dict(self.counters)
+        stats.update({
+            "mode": "connect" if self.ws_endpoint else "launch",
+            "har": har.har_mode() or "off",
+            "connected": bool(self.browser and self.browser.is_connected()),
+            "in_use": self.in_use,
+            "idle": sum(len(leases) for leases in self.idle.values()),
+        })
+        return stats
+
+
+class PooledPage:
+    """with pooled_page(SparScraper) as page: ... (context se vrne v pool)"""
+
+    def __init__(self, pool: BrowserPool, scraper_cls=None, timeout: int = None, **overrides):
+        self.pool = pool
+        self.scraper_cls = scraper_cls
+        self.timeout = timeout
+        self.overrides = overrides
+        self.lease: Optional[ContextLease] = None
+
+    def __enter__(self):
+        self.lease = self.pool.acquire(self.scraper_cls, self.timeout, **self.overrides)
+        return self.lease.page
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.lease:
+            self.pool.release(self.lease)
+
+
+_local = threading.local()
+
+
+def get_browser_pool(headless: bool = True) -> BrowserPool:
+    """
+    Pool tega threada (ustvari ga ob prvem klicu).
+    Drug headless kot obstoječi pool: prost pool se zapre in ustvari znova, med izposojo -> ValueError.
+    """
+    pool = getattr(_local, "pool", None)
+    if pool is not None and pool.headless != headless and not pool.ws_endpoint:
+        if pool.in_use:
+            raise ValueError(f"Browser pool tega threada je headless={pool.headless} in v uporabi "
+                             f"({pool.in_use} contextov) - ne morem preklopiti na headless={headless}")
+        pool.close()
+        pool = None
+    if pool is None:
+        pool = BrowserPool(headless=headless)
+        _local.pool = pool
+    return pool
+
+
+def pooled_page(scraper_cls=None, headless: bool = True, timeout: int = None, **overrides) -> PooledPage:
+    """Bližnjica: page iz poola tega threada"""
+    return PooledPage(get_browser_pool(headless), scraper_cls, timeout, **overrides)
+
+
+def close_browser_pool():
+    """Zapri pool tega threada (konec programa)"""
+    pool = getattr(_local, "pool", None)
+    if pool is not None:
+        pool.close()
+        _local.pool = None
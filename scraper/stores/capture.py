@@ -0,0 +1,174 @@
+"""
+NETWORK CAPTURE
+===============
+Prestreže product-list API odgovore trgovin (XHR/fetch), ki jih sproži
+scrollanje, in iz JSON-a naredi izdelke - brez branja DOM-a.
+
+- page.on("response") samo shrani Response (brez sync klicev v handlerju)
+- drain() pozneje prebere JSON iz glavnega flowa
+- find_product_items() poišče seznam izdelkov kjerkoli v payloadu
+- is_last_page() prepozna ko API pove da je bila zadnja stran
+"""
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class ResponseCapture:
+    """Zbira API odgovore ki ustrezajo vzorcem URL-jev"""
+
+    CAPTURED_RESOURCE_TYPES = ("xhr", "fetch")
+
+    def __init__(self, page, url_patterns: List[str], log: Callable = None):
+        self.page = page
+        self.patterns = [re.compile(p, re.I) for p in url_patterns]
+        self.log = log or (lambda message, level="INFO": None)
+        self.pending = []
+        self.responses_matched = 0
+        self.payloads_parsed = 0
+        self.attached = False
+
+    def attach(self):
+        """Poveži handler na page"""
+        if not self.attached:
+            self.page.on("response", self._on_response)
+            self.attached = True
+
+    def detach(self):
+        """Odklopi handler"""
+        if self.attached:
+            try:
+                self.page.remove_listener("response", self._on_response)
+            except Exception:
+                pass
+            self.attached = False
+
+    def matches(self, url: str) -> bool:
+        """Ali URL ustreza kateremu od product-list vzorcev"""
+        return any(p.search(url) for p in self.patterns)
+
+    def _on_response(self, response):
+        """Handler - samo shrani, JSON preberemo v drain()"""
+        try:
+            if response.request.resource_type not in self.CAPTURED_RESOURCE_TYPES:
+                return
+            if not self.matches(response.url):
+                return
+            self.pending.append(response)
+            self.responses_matched += 1
+        except Exception:
+            pass
+
+    def clear(self):
+        """Zavrzi neobdelane odgovore (npr. ob menjavi kategorije)"""
+        self.pending = []
+
+    def drain(self) -> List[Tuple[str, Any]]:
+        """Preberi JSON vseh čakajočih odgovorov - vrne [(url, payload)]"""
+        payloads = []
+        while self.pending:
+            response = self.pending.pop(0)
+            try:
+                if not response.ok:
+                    continue
+                payloads.append((response.url, response.json()))
+                self.payloads_parsed += 1
+            except Exception as e:
+                self.log(f"API odgovor ni JSON ({response.url[:80]}): {e}", "DEBUG")
+        return payloads
+
+
+# ==================== JSON HELPERS ====================
+
+def get_path(item: Any, path: str) -> Any:
+    """Vrednost po poti z pikami (npr. "data.name", "masterValues.title")"""
+    value = item
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+        if value is None:
+            return None
+    return value
+
+
+def first_value(item: dict, paths: List[str]) -> Any:
+    """Prva ne-prazna vrednost med potmi"""
+    for path in paths:
+        value = get_path(item, path)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def to_price(value: Any) -> Optional[float]:
+    """API cena -> float ("1,29", "1.29 €", 1.29, {"value": 1.29})"""
+    if isinstance(value, dict):
+        value = first_value(value, ["value", "amount", "price", "gross"])
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.search(r"(\d+)(?:[,.](\d{1,2}))?", str(value))
+    if not match:
+        return None
+    return float(f"{match.group(1)}.{match.group(2) or '0'}")
+
+
+def find_product_items(payload: Any, name_paths: List[str], price_paths: List[str]) -> List[dict]:
+    """
+    Poišči največji seznam dict-ov ki imajo ime IN ceno.
+    Deluje ne glede na to kje v payloadu je seznam (data.items, hits, products ...).
+    """
+    best: List[dict] = []
+    stack = [payload]
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            dicts = [x for x in node if isinstance(x, dict)]
+            if dicts:
+                sample = dicts[:5]
+                if any(first_value(x, name_paths) and first_value(x, price_paths) is not None for x in sample):
+                    if len(dicts) > len(best):
+                        best = dicts
+                    continue
+            stack.extend(node)
+
+    return best
+
+
+LAST_PAGE_FLAGS = ["last", "isLast", "is_last", "isLastPage"]
+HAS_MORE_FLAGS = ["hasMore", "has_more", "hasNextPage", "has_next", "more"]
+
+
+def is_last_page(payload: Any, item_count: int) -> bool:
+    """Ali API odgovor pove da je bila zadnja stran"""
+    if item_count == 0:
+        return True
+    if not isinstance(payload, dict):
+        return False
+
+    # Poišči metapodatke na prvem ali drugem nivoju (payload, payload.data, payload.paging ...)
+    scopes: List[Dict] = [payload] + [v for v in payload.values() if isinstance(v, dict)]
+
+    for scope in scopes:
+        for key in LAST_PAGE_FLAGS:
+            if isinstance(scope.get(key), bool):
+                return scope[key]
+        for key in HAS_MORE_FLAGS:
+            if isinstance(scope.get(key), bool):
+                return not scope[key]
+
+        page = first_value(scope, ["page", "currentPage", "current_page", "pageNumber"])
+        pages = first_value(scope, ["totalPages", "total_pages", "pageCount", "lastPage"])
+        if isinstance(page, int) and isinstance(pages, int) and pages > 0:
+            return page >= pages
+
+        offset = first_value(scope, ["offset", "from", "start"])
+        total = first_value(scope, ["total", "totalCount", "total_count", "totalHits", "totalResults"])
+        if isinstance(offset, int) and isinstance(total, int):
+            return offset + item_count >= total
+
+    return False
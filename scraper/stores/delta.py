@@ -0,0 +1,140 @@
+"""
+DELTA SCRAPING (opt-in: PRHRAN_DELTA=1 / --delta)
+=================================================
+Nespremenjene kategorije se ne scrollajo znova.
+
+- Po prvi strani kategorije izračunamo POCENI fingerprint (en evaluate):
+  prvih N tile-ov (ime + cena), značka s številom izdelkov ("1234 izdelkov"),
+  prvi API odgovor (če ga capture ujame) in VZOREC KONCA kategorije (zadnja stran)
+- Brez vzorca konca (infinite scroll, ena psevdo-kategorija za cel katalog) se delta
+  ne uporabi - sprememba cene za prvo stranjo bi sicer ostala neopažena
+- Primerjamo ga s fingerprintom prejšnjega runa (delta/{trgovina}/{kategorija}.json)
+- Ujemanje -> izdelki iz prejšnjega runa, brez scrolla in ekstrakcije
+- Prestar zapis (max_age_hours, PRHRAN_DELTA_MAX_AGE_HOURS) se ne uporabi. Privzeto 120h:
+  daljše od razmika med runi (lokalno 24h, CI pon/čet do 96h), sicer se zapis nikoli ne uporabi
+
+Zapis kategorije:
+    {"category": ..., "fingerprint": ..., "seconds": <trajanje polnega scrapa>,
+     "updated": <unix čas>, "products": [...]}
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from .product import json_default
+
+
+FINGERPRINT_JS = """
+([selectors, limit]) => {
+    let tiles = [];
+    for (const selector of selectors) {
+        let els;
+        try { els = document.querySelectorAll(selector); } catch (e) { continue; }
+        if (els.length >= 3) {
+            tiles = Array.from(els).slice(0, limit)
+                .map(el => (el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim());
+            break;
+        }
+    }
+    const body = document.body ? document.body.innerText : '';
+    const match = body.match(/(\\d[\\d.]*)\\s+(izdelkov|izdelki|izdelka|izdelek|artiklov|rezultatov)/i);
+    return { tiles: tiles, count: match ? match[1].replace(/\\./g, '') : '' };
+}
+"""
+
+
+def delta_enabled(default: bool) -> bool:
+    """PRHRAN_DELTA=1 vklopi, PRHRAN_DELTA=0 izklopi, sicer privzeto"""
+    value = os.getenv("PRHRAN_DELTA", "").strip()
+    if value in ("0", "1"):
+        return value == "1"
+    return default
+
+
+def delta_max_age_hours(default: float) -> float:
+    """PRHRAN_DELTA_MAX_AGE_HOURS ali privzeto"""
+    try:
+        return max(0.0, float(os.getenv("PRHRAN_DELTA_MAX_AGE_HOURS") or default))
+    except ValueError:
+        return default
+
+
+def fingerprint(tiles: List[str], count: str = "", api: List[str] = None,
+                tail: List[str] = None) -> Optional[str]:
+    """Hash prve strani + vzorca konca - None če ni ničesar za primerjavo"""
+    if not tiles and not api:
+        return None
+    digest = hashlib.sha1()
+    digest.update(f"count:{count}\n".encode("utf-8"))
+    for line in api or []:
+        digest.update(f"api:{line}\n".encode("utf-8"))
+    for line in tiles:
+        digest.update(f"tile:{line}\n".encode("utf-8"))
+    for line in tail or []:
+        digest.update(f"tail:{line}\n".encode("utf-8"))
+    return digest.hexdigest()[:20]
+
+
+def category_slug(category: str) -> str:
+    """Varno ime datoteke za kategorijo (ASCII + kratek hash proti trkom)"""
+    ascii_name = "".join(c if c.isalnum() else "_" for c in category.lower())
+    ascii_name = ascii_name.encode("ascii", "ignore").decode() or "kategorija"
+    short = hashlib.sha1(category.encode("utf-8")).hexdigest()[:8]
+    return f"{ascii_name[:40]}_{short}"
+
+
+class DeltaCache:
+    """Fingerprint + izdelki prejšnjega runa, en JSON na kategorijo"""
+
+    def __init__(self, directory: Path, max_age_hours: float = 120.0):
+        self.directory = Path(directory)
+        self.max_age_hours = max_age_hours
+
+    def path(self, category: str) -> Path:
+        return self.directory / f"{category_slug(category)}.json"
+
+    def load(self, category: str) -> Optional[dict]:
+        """Zapis kategorije ali None (ga ni / prestar / pokvarjen)"""
+        path = self.path(category)
+        try:
+            if not path.exists():
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("category") != category:
+            return None
+        if time.time() - entry.get("updated", 0) > self.max_age_hours * 3600:
+            return None
+        return entry
+
+    def lookup(self, category: str, fp: str) -> Optional[dict]:
+        """Zapis samo če se fingerprint ujema in ima izdelke"""
+        if not fp:
+            return None
+        entry = self.load(category)
+        if entry and entry.get("fingerprint") == fp and entry.get("products"):
+            return entry
+        return None
+
+    def store(self, category: str, fp: str, products: List[dict], seconds: float) -> Path:
+        """Atomski zapis (tmp + replace) - workerji pišejo vsak svojo kategorijo"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(category)
+        tmp = path.with_suffix(f".{os.getpid()}.{id(products)}.tmp")
+        entry = {
+            "category": category,
+            "fingerprint": fp,
+            "seconds": round(seconds, 1),
+            "updated": time.time(),
+            "products": products,
+        }
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, separators=(",", ":"), default=json_default)
+        os.replace(tmp, path)
+        return path
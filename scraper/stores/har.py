@@ -0,0 +1,130 @@
+"""
+HAR RECORD / REPLAY
+===================
+Ponovljive meritve brez živih strežnikov trgovin.
+
+    PRHRAN_HAR=record  python scraper.py --store tus      # posnemi (ali --har-record)
+    PRHRAN_HAR=replay  python scraper.py --store tus      # predvajaj (ali --har-replay)
+    PRHRAN_HAR_LATENCY_MS=80                              # umetna zakasnitev na request ob replayu
+
+- record: vsak context trgovine (BrowserPool) piše svoj har/{trgovina}/{run}/*.har.zip
+  (Playwright record_har, vsebina odgovorov v zipu) - zapiše se ob context.close()
+- replay: route_from_har za VSE HAR-e zadnjega posnetega runa (ali PRHRAN_HAR_RUN);
+  request ki ga ni v nobenem HAR-u se prekine (nikoli v živo omrežje)
+- Service workerji so v obeh načinih blokirani - sicer requesti obidejo routing
+
+Izklopljeno (PRHRAN_HAR ni nastavljen) = nič: BrowserPool ne doda ničesar.
+"""
+import itertools
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+RECORD = "record"
+REPLAY = "replay"
+
+DEFAULT_DIR = Path(__file__).parent.parent / "har"
+
+_sequence = itertools.count(1)
+_run_stamp = time.strftime("%Y%m%d_%H%M%S")  # en posnetek na proces (orchestrator: proces na trgovino)
+_lock = threading.Lock()
+
+
+def har_mode() -> str:
+    """"record" / "replay" / "" (PRHRAN_HAR)"""
+    mode = os.getenv("PRHRAN_HAR", "").strip().lower()
+    return mode if mode in (RECORD, REPLAY) else ""
+
+
+def har_dir() -> Path:
+    return Path(os.getenv("PRHRAN_HAR_DIR") or DEFAULT_DIR)
+
+
+def replay_latency_ms() -> float:
+    try:
+        return max(0.0, float(os.getenv("PRHRAN_HAR_LATENCY_MS", "0")))
+    except ValueError:
+        return 0.0
+
+
+def store_runs(store: str, directory: Path = None) -> List[Path]:
+    """Posneti runi trgovine (najstarejši najprej)"""
+    root = Path(directory or har_dir()) / store
+    if not root.exists():
+        return []
+    return sorted(p for p in root.iterdir() if p.is_dir() and any(p.glob("*.har*")))
+
+
+def replay_files(store: str, directory: Path = None) -> List[Path]:
+    """HAR-i runa za replay: PRHRAN_HAR_RUN ali zadnji posneti run"""
+    runs = store_runs(store, directory)
+    wanted = os.getenv("PRHRAN_HAR_RUN", "")
+    if wanted:
+        runs = [run for run in runs if run.name == wanted]
+    if not runs:
+        return []
+    return sorted(runs[-1].glob("*.har*"))
+
+
+def context_options(store: str) -> dict:
+    """Dodatne new_context opcije za trenutni HAR način"""
+    mode = har_mode()
+    if not mode:
+        return {}
+    options = {"service_workers": "block"}
+    if mode == RECORD:
+        with _lock:
+            number = next(_sequence)
+        path = har_dir() / store / _run_stamp / f"{os.getpid()}_{number:03d}.har.zip"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        options.update({
+            "record_har_path": str(path),
+            "record_har_mode": "full",
+            "record_har_content": "attach",
+        })
+    return options
+
+
+def attach_replay(context, store: str, log=None) -> int:
+    """
+    Replay: vsi HAR-i runa na context (novejši HAR ima prednost), ostalo se prekine.
+    Vrne število naloženih HAR-ov (0 = ni posnetka - vsi requesti se prekinejo).
+    """
+    if har_mode() != REPLAY:
+        return 0
+    log = log or (lambda message, level="INFO": None)
+
+    # Prvi registriran route se kliče zadnji: offline "catch-all"
+    context.route("**/*", lambda route: route.abort("internetdisconnected"))
+
+    files = replay_files(store)
+    for path in files:
+        context.route_from_har(str(path), not_found="fallback")
+    if not files:
+        log(f"HAR replay: ni posnetka za {store} v {har_dir()}", "WARNING")
+
+    latency = replay_latency_ms()
+    if latency:
+        context.route("**/*", _delayed(latency))
+    return len(files)
+
+
+def _delayed(latency_ms: float):
+    """Route handler: počakaj latency_ms (kooperativno, ostali requesti tečejo) in naprej na HAR"""
+
+    def handler(route):
+        try:
+            route.request.frame.wait_for_timeout(latency_ms)
+        except Exception:
+            pass  # Service worker / odstranjen frame - brez zakasnitve
+        route.fallback()
+
+    return handler
+
+
+def recorded_size(store: str, directory: Path = None) -> Optional[int]:
+    """Velikost zadnjega posnetka v bajtih (za poročilo benchmarka)"""
+    files = replay_files(store, directory)
+    return sum(f.stat().st_size for f in files) if files else None
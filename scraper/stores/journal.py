@@ -0,0 +1,105 @@
+"""
+PRODUCT JOURNAL
+===============
+Append-only JSONL dnevnik izdelkov za PRAVI resume.
+
+Vsaka vrstica je en zapis:
+    {"t": "p", "c": "<kategorija>", "p": {...izdelek...}}   - sprejet izdelek
+    {"t": "c", "c": "<kategorija>"}                         - kategorija končana
+
+- Zapisi se zbirajo v bufferju in flushajo na N zapisov ali T sekund
+- Ob končani kategoriji se flusha takoj (izdelki + marker skupaj na disku)
+- replay() prebere dnevnik nazaj - tudi če je zadnja vrstica pol-zapisana (crash)
+"""
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from .product import json_default
+
+
+class ProductJournal:
+    """Buffered append-only JSONL journal"""
+
+    def __init__(self, path: Path, flush_every: int = 50, flush_seconds: float = 5.0):
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self.buffer: List[str] = []
+        self.last_flush = time.time()
+        self.records_written = 0
+
+    def append_product(self, product: dict, category: str = ""):
+        """Zapiši sprejet izdelek"""
+        self._append({"t": "p", "c": category, "p": product})
+
+    def mark_category(self, category: str):
+        """Zapiši da je kategorija končana (takoj na disk)"""
+        self._append({"t": "c", "c": category})
+        self.flush()
+
+    def _append(self, record: dict):
+        self.buffer.append(json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=json_default))
+        if len(self.buffer) >= self.flush_every or time.time() - self.last_flush >= self.flush_seconds:
+            self.flush()
+
+    def flush(self):
+        """Zapiši buffer na disk"""
+        if self.buffer:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(self.buffer) + "\n")
+            self.records_written += len(self.buffer)
+            self.buffer = []
+        self.last_flush = time.time()
+
+    def close(self):
+        self.flush()
+
+    # ==================== REPLAY ====================
+
+    @staticmethod
+    def iter_records(path: Path) -> Iterator[dict]:
+        """Leno preberi zapise (preskoči pokvarjene/pol-zapisane vrstice)"""
+        path = Path(path)
+        if not path.exists():
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    @classmethod
+    def replay(cls, path: Path) -> Tuple[List[dict], set, Dict[str, int]]:
+        """
+        Vrne (izdelki KONČANIH kategorij, končane kategorije, {kategorija: zavrženih}).
+        Izdelki kategorije ki je bila v teku ob crashu se zavržejo - ta se ponovi.
+        """
+        by_category: Dict[str, List[dict]] = {}
+        order: List[str] = []
+        completed = set()
+
+        for record in cls.iter_records(path):
+            category = record.get("c", "")
+            if record.get("t") == "p":
+                if category not in by_category:
+                    by_category[category] = []
+                    order.append(category)
+                by_category[category].append(record.get("p") or {})
+            elif record.get("t") == "c":
+                completed.add(category)
+
+        products = []
+        dropped = {}
+        for category in order:
+            if category in completed:
+                products.extend(by_category[category])
+            else:
+                dropped[category] = len(by_category[category])
+
+        return products, completed, dropped
@@ -0,0 +1,176 @@
+"""
+ASYNC STRUCTURED LOGGER
+=======================
+Queue + background thread - scraper nikoli ne čaka na disk ali konzolo.
+
+- log() samo sestavi zapis in ga da v vrsto (put_nowait, nikoli ne blokira)
+- Background thread izpiše vrstico na konzolo in zapis v JSONL datoteko
+  (datoteka ostane odprta, flush na interval - ne open/close za vsako vrstico)
+- Zapis: {"ts", "level", "store", "category", "phase", "elapsed", "msg"}
+- Filter po nivoju: PRHRAN_LOG_LEVEL=INFO (ali set_level("INFO"))
+
+En logger na proces (get_logger()), varen za več threadov (category workers).
+"""
+import os
+import sys
+import json
+import queue
+import atexit
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+LEVELS = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "PROGRESS": 20,
+    "SUCCESS": 20,
+    "WARNING": 30,
+    "ERROR": 40,
+}
+
+# Windows-safe symbols instead of emoji
+SYMBOLS = {
+    "ERROR": "[X]",
+    "WARNING": "[!]",
+    "SUCCESS": "[OK]",
+    "DEBUG": "[?]",
+    "PROGRESS": "[#]",
+}
+
+
+def format_line(record: dict) -> str:
+    """Zapis -> vrstica za konzolo (enak format kot prej)"""
+    timestamp = datetime.fromtimestamp(record["ts"]).strftime("%H:%M:%S.%f")[:-3]
+    prefix = f"[{timestamp}] [{record['store']}]"
+    symbol = SYMBOLS.get(record["level"], "")
+    return f"{prefix} {symbol} {record['msg']}" if symbol else f"{prefix} {record['msg']}"
+
+
+class AsyncLogger:
+    """Background writer za konzolo + JSONL datoteke"""
+
+    MAX_QUEUE = 100000
+    FILE_FLUSH_SECONDS = 1.0
+
+    def __init__(self, level: str = None, console: bool = True):
+        self.min_level = LEVELS.get((level or os.getenv("PRHRAN_LOG_LEVEL", "DEBUG")).upper(), 10)
+        self.console = console
+        self.queue: "queue.Queue" = queue.Queue(maxsize=self.MAX_QUEUE)
+        self.files: Dict[Path, object] = {}
+        self.dropped = 0
+        self.thread = threading.Thread(target=self._run, name="prhran-logger", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def set_level(self, level: str):
+        self.min_level = LEVELS.get(level.upper(), self.min_level)
+
+    def enabled(self, level: str) -> bool:
+        return LEVELS.get(level, 20) >= self.min_level
+
+    def emit(self, record: dict, log_file: Optional[Path] = None):
+        """Dodaj zapis v vrsto (nikoli ne blokira - ob polni vrsti zapis zavrže)"""
+        if not self.enabled(record.get("level", "INFO")):
+            return
+        try:
+            self.queue.put_nowait((record, log_file))
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: float = 5.0):
+        """Počakaj da writer izprazni vrsto (npr. ob koncu scrapanja)"""
+        done = threading.Event()
+        try:
+            self.queue.put(("__flush__", done), timeout=timeout)
+        except queue.Full:
+            return
+        done.wait(timeout)
+
+    def close(self):
+        """Izprazni vrsto in zapri datoteke"""
+        if self.thread.is_alive():
+            self.flush()
+            self.queue.put(("__stop__", None))
+            self.thread.join(timeout=5.0)
+
+    # ==================== WRITER THREAD ====================
+
+    def _run(self):
+        last_flush = time.time()
+        while True:
+            try:
+                item, arg = self.queue.get(timeout=self.FILE_FLUSH_SECONDS)
+            except queue.Empty:
+                self._flush_files()
+                last_flush = time.time()
+                continue
+
+            if item == "__stop__":
+                self._close_files()
+                return
+            if item == "__flush__":
+                self._flush_files()
+                arg.set()
+                continue
+
+            self._write(item, arg)
+            if time.time() - last_flush >= self.FILE_FLUSH_SECONDS:
+                self._flush_files()
+                last_flush = time.time()
+
+    def _write(self, record: dict, log_file: Optional[Path]):
+        if self.console:
+            line = format_line(record)
+            try:
+                print(line)
+            except UnicodeEncodeError:
+                # Fallback: remove problematic characters
+                print(line.encode('ascii', 'replace').decode('ascii'))
+            except Exception:
+                pass
+
+        if log_file:
+            try:
+                f = self.files.get(log_file)
+                if f is None:
+                    f = open(log_file, "a", encoding="utf-8")
+                    self.files[log_file] = f
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            except Exception:
+                pass
+
+    def _flush_files(self):
+        for f in self.files.values():
+            try:
+                f.flush()
+            except Exception:
+                pass
+        try:
+            sys.stdout.flush()
+        except Exception:
+            pass
+
+    def _close_files(self):
+        self._flush_files()
+        for f in self.files.values():
+            try:
+                f.close()
+            except Exception:
+                pass
+        self.files = {}
+
+
+_logger: Optional[AsyncLogger] = None
+_logger_lock = threading.Lock()
+
+
+def get_logger() -> AsyncLogger:
+    """En logger na proces"""
+    global _logger
+    with _logger_lock:
+        if _logger is None:
+            _logger = AsyncLogger()
+        return _logger
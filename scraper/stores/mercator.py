@@ -15,17 +15,22 @@ BULLETPROOF FEATURES:
 - Progress saving
 """
 import re
+import json
 import time
 from typing import Optional, Tuple
 from playwright.sync_api import Page, ElementHandle
 
-from .base import BulletproofScraper
+from .base import BulletproofScraper, ScraperError
+from .product import Product
+from .prices import MERCATOR_PRICE_RULES, parse_price_pair
+from .popups import COOKIE_POPUP_RULES
 
 
 class MercatorScraper(BulletproofScraper):
     """BULLETPROOF Scraper za Mercator Slovenija"""
 
     STORE_NAME = "Mercator"
+    PRICE_RULES = MERCATOR_PRICE_RULES
     BASE_URL = "https://mercatoronline.si"
     ALL_PRODUCTS_URL = "https://mercatoronline.si/brskaj"
 
@@ -100,8 +105,52 @@ class MercatorScraper(BulletproofScraper):
         'img[src]',
     ]
 
-    def __init__(self, page: Page):
-        super().__init__(page)
+    IMAGE_ATTRS = ["data-src", "data-lazy-src", "data-original", "src"]
+
+    # Category workers (scrape_all) - Mercator hitro omeji preveč hkratnih sej
+    CATEGORY_WORKERS = 2
+    MAX_CATEGORY_WORKERS = 3
+
+    # Popup guard: "Izbira načina prevzema" (X zgoraj desno) + cookie bar spodaj
+    POPUP_RULES = COOKIE_POPUP_RULES + [
+        {
+            "name": "delivery",
+            "selector": ", ".join([
+                '[class*="Modal"] [aria-label="close"]',
+                '[class*="Modal"] [aria-label="Close"]',
+                '[class*="modal"] [aria-label="close"]',
+                '[class*="modal"] [aria-label="Close"]',
+                '[role="dialog"] [aria-label="close"]',
+                '[class*="Modal"] button[class*="close"]',
+                '[class*="modal"] button[class*="close"]',
+            ]),
+        },
+        {
+            "name": "cookie_bar",
+            "selector": ", ".join([
+                '[class*="cookie"] button[class*="close"]',
+                '[class*="Cookie"] button[class*="close"]',
+                '[class*="cookie"] [aria-label="close"]',
+                '[class*="cookie"] [aria-label="Close"]',
+            ]),
+        },
+    ]
+
+    # Network capture: /brskaj nalaga izdelke prek getProducts (preveri v DevTools ob spremembah)
+    API_URL_PATTERNS = [
+        r"/products/browseProducts/getProducts",
+        r"/api/.*products",
+    ]
+    API_FIELDS = {
+        "name": ["data.name", "name", "item_name", "title"],
+        "price": ["data.current_price", "current_price", "data.price", "price"],
+        "regular_price": ["data.normal_price", "normal_price", "data.regular_price", "regular_price"],
+        "image": ["data.mainImageSrc", "mainImageSrc", "data.image", "image", "imageUrl"],
+        "category": ["data.category", "item_category", "category"],
+    }
+
+    def __init__(self, page: Page, **kwargs):
+        super().__init__(page, **kwargs)
         self.current_category = "Splošno"
 
     # ==================== POPUP HANDLING ====================
@@ -250,192 +299,117 @@ class MercatorScraper(BulletproofScraper):
 
     def wait_and_dismiss_popups(self, wait_time: float = 2.0):
         """Počakaj in zapri vse popup-e - poskusi večkrat"""
-        time.sleep(wait_time)
+        with self.timed("popup"):
+            if self.popups_handled():
+                # Popup guard zapre izbiro prevzema ko se pojavi (ali pa je seja obnovljena) - brez čakanja
+                self.close_popups()
+                return
 
-        # Poskusi 3x zapret popup (včasih se pojavi z zamikom)
-        for attempt in range(3):
-            if self.dismiss_delivery_popup():
-                time.sleep(0.5)
-            time.sleep(1.0)
+            time.sleep(wait_time)
+
+            # Poskusi 3x zapret popup (včasih se pojavi z zamikom)
+            for attempt in range(3):
+                if self.dismiss_delivery_popup():
+                    time.sleep(0.5)
+                time.sleep(1.0)
 
     # ==================== NAVIGATION ====================
 
     def scroll_and_load_all(self, max_scrolls: int = 300):
         """
-        BULLETPROOF infinite scroll za Mercator.
+        BULLETPROOF infinite scroll za Mercator - skupni scroll engine.
         Mercator ima najbolj enostavno navigacijo - samo scrollaj!
         """
         self.log("Začenjam infinite scroll...")
-
-        last_height = self.page.evaluate("document.body.scrollHeight")
-        last_product_count = 0
-        no_change = 0
-        scroll_count = 0
-
-        while no_change < 10 and scroll_count < max_scrolls:
-            # Scroll dol
-            self.safe_scroll("down")
-            scroll_count += 1
-
-            # Počakaj da se vsebina naloži (do 20 sekund)
-            try:
-                self.page.wait_for_load_state("networkidle", timeout=20000)
-            except:
-                pass
-            self.random_delay(1.0, 2.0)
-
-            # Poskusi klikniti "Naloži več" / "Load more"
-            load_more_selectors = [
-                'button[class*="load-more"]',
-                'button[class*="LoadMore"]',
-                'button[class*="loadMore"]',
-                'button[class*="show-more"]',
-                'button[class*="ShowMore"]',
-                '[class*="loadMore"] button',
-                'button:has-text("Naloži več")',
-                'button:has-text("Prikaži več")',
-                'button:has-text("Več izdelkov")',
-                'button:has-text("Več")',
-                'a:has-text("Naloži več")',
-                'a[class*="load-more"]',
-            ]
-
-            for selector in load_more_selectors:
-                try:
-                    btn = self.page.query_selector(selector)
-                    if btn and btn.is_visible():
-                        btn.click()
-                        self.random_delay(2.5, 3.5)
-                        no_change = 0  # Reset counter
-                        break
-                except:
-                    continue
-
-            # Preveri ali je nova vsebina
-            new_height = self.page.evaluate("document.body.scrollHeight")
-
-            # Preštej izdelke
-            current_products = 0
-            for selector in self.PRODUCT_SELECTORS[:3]:
-                try:
-                    els = self.page.query_selector_all(selector)
-                    if els:
-                        current_products = max(current_products, len(els))
-                        break
-                except:
-                    continue
-
-            if new_height == last_height and current_products == last_product_count:
-                no_change += 1
-            else:
-                no_change = 0
-                last_height = new_height
-                last_product_count = current_products
-
-            # Progress log
-            if scroll_count % 20 == 0:
-                self.log(f"Scroll {scroll_count}: ~{current_products} izdelkov")
-
-        self.log(f"Scroll končan po {scroll_count} scrollih (~{last_product_count} izdelkov)")
+        self.scroll_until_settled(max_scrolls=max_scrolls)
 
     # ==================== DATA EXTRACTION ====================
 
     def extract_mercator_prices(self, element: ElementHandle) -> Tuple[Optional[float], Optional[float]]:
+        """BULLETPROOF ekstrakcija cen za Mercator (glej parse_mercator_prices)"""
+        try:
+            return self.parse_mercator_prices(element.inner_text())
+        except Exception as e:
+            return None, None
+
+    def parse_mercator_prices(self, text: str) -> Tuple[Optional[float], Optional[float]]:
         """
-        BULLETPROOF ekstrakcija cen za Mercator.
+        Mercator cene iz teksta tile-a.
 
         Mercator format (iz content.js):
         - Brez akcije: "1,29 € 3,23 €/ 1kg" -> regular=1,29€, sale=None
         - Z akcijo: "2,99 € 2,49 € 2,49 €/ 1kg" -> regular=2,99€, sale=2,49€
 
-        PRAVILA:
+        PRAVILA (MERCATOR_PRICE_RULES):
+        - Samo zneski z €
         - Ignorira cene na enoto: "/ 1l", "/ 1kg", "/kg", "/kos", "/ 100g"
-        - Če sta 2 RAZLIČNI ceni: PRVA = stara/redna, DRUGA = nova/akcijska
+        - Če sta 2 RAZLIČNI ceni: PRVA = stara/redna, DRUGA = nova/akcijska (višja je redna)
         """
-        try:
-            text = element.inner_text()
-
-            # Najdi VSE cene s pozicijo
-            pattern = r"(\d+)[,.](\d{2})\s*€"
-            prices = []
-
-            for match in re.finditer(pattern, text):
-                pos = match.start()
-                full_match = match.group(0)
-                value = float(f"{match.group(1)}.{match.group(2)}")
-
-                # Preveri ali je cena na enoto (ignoriramo!)
-                # Ujame: "/ 1l", "/ 1kg", "/kg", "/kos", "/ 100g", itd
-                after_text = text[pos + len(full_match):pos + len(full_match) + 30]
-                is_per_unit = re.match(
-                    r"^\s*/\s*\d*\s*(kg|kos|kom|kpl|pak|ml|cl|dl|mm|cm|m|g|l)\b",
-                    after_text,
-                    re.I
-                )
+        return parse_price_pair(text, self.price_rules)
 
-                if is_per_unit:
-                    continue  # Preskoči ceno na enoto
-
-                if self.is_valid_price(value) and value not in [p["value"] for p in prices]:
-                    prices.append({
-                        "value": value,
-                        "pos": pos,
-                        "text": full_match
-                    })
-
-            # Preveri za popust badge
-            has_discount = False
-            discount_patterns = [r"-\s*\d+\s*%", r"akcij", r"popust", r"znižan"]
-            for pattern in discount_patterns:
-                if re.search(pattern, text, re.I):
-                    has_discount = True
-                    break
+    def parse_analytics(self, analytics_json: Optional[str]) -> Tuple[str, str, Optional[float]]:
+        """data-analytics-object -> (ime, kategorija, cena)"""
+        name = ""
+        product_category = ""
+        regular_price = None
 
-            # Preveri tudi CSS razrede
-            if not has_discount:
-                discount_selectors = [
-                    '[class*="discount"]',
-                    '[class*="Discount"]',
-                    '[class*="akcij"]',
-                    '[class*="popust"]',
-                    '[class*="sale"]',
-                    '[class*="Sale"]',
-                    'del', 's', 'strike',
-                ]
-                for sel in discount_selectors:
-                    if element.query_selector(sel):
-                        has_discount = True
-                        break
-
-            # Sortiraj po poziciji (vrstni red na strani)
-            prices.sort(key=lambda x: x["pos"])
-
-            if not prices:
-                return None, None
-
-            if len(prices) == 1:
-                # Samo ena cena = redna cena, ni akcije
-                return prices[0]["value"], None
-
-            # Več cen - preveri ali sta prvi dve RAZLIČNI
-            if len(prices) >= 2:
-                first = prices[0]["value"]
-                second = prices[1]["value"]
-
-                # Če sta ceni različni -> akcija!
-                # Mercator: PRVA = stara/redna, DRUGA = nova/akcijska
-                if first != second:
-                    # Višja je redna, nižja je akcijska
-                    if first > second:
-                        return first, second
-                    else:
-                        return second, first
-
-            # Ni akcije - vrni prvo ceno kot redno
-            return prices[0]["value"], None
-
-        except Exception as e:
-            return None, None
+        try:
+            if analytics_json:
+                data = json.loads(analytics_json)
+                name = data.get("item_name", "")
+                product_category = data.get("item_category", "") or data.get("item_category2", "")
+
+                # Cena je v price polju
+                if "price" in data:
+                    regular_price = float(data["price"])
+        except:
+            pass
+
+        return name, product_category, regular_price
+
+    def name_from_candidate(self, tag: str, alt: str, title: str, text: str) -> str:
+        """Ime iz elementa glede na tag (IMG -> alt, A -> title)"""
+        if tag == "IMG":
+            name = alt or ""
+        elif tag == "A":
+            name = title or text
+        else:
+            name = text
+
+        name = self.clean_name(name)
+        return name if self.is_valid_name(name) else ""
+
+    def name_from_text(self, all_text: str) -> str:
+        """Fallback: vzemi tekst pred ceno"""
+        all_text = re.sub(r"\s+", " ", all_text).strip()
+        if not all_text:
+            return ""
+
+        parts = re.split(r"\d+[,.]\d{2}\s*€", all_text)
+        if parts and len(parts[0].strip()) > 3:
+            name = parts[0].strip()
+            name = re.sub(r"^razvrsti\s*(po)?:?\s*", "", name, flags=re.I)
+            name = re.sub(r"^kategorij[ae]:?\s*", "", name, flags=re.I)
+            name = re.sub(r"^filter:?\s*", "", name, flags=re.I)
+
+            if self.is_valid_name(name):
+                return name
+
+        return ""
+
+    def build_product(self, name: str, regular_price: float, sale_price: float, image: str,
+                      category: str, url: str) -> Product:
+        """Sestavi Mercator izdelek"""
+        return Product(
+            ime=name,
+            redna_cena=regular_price,
+            akcijska_cena=sale_price,
+            kategorija=category,
+            enota=self.extract_unit(name),
+            trgovina=self.STORE_NAME,
+            slika=image if image else None,
+            url=url,
+        )
 
     def extract_product_data(self, element: ElementHandle, category: str = "") -> Optional[dict]:
         """
@@ -444,69 +418,38 @@ class MercatorScraper(BulletproofScraper):
         Mercator ima data-analytics-object atribut z vsemi podatki v JSON!
         Format: {"item_id":"123","item_name":"Mleko","currency":"EUR","item_brand":"..."}
         """
-        import json as json_module
-
         try:
-            name = ""
-            regular_price = None
             sale_price = None
-            product_category = ""
 
             # ===== METODA 1: Uporabi data-analytics-object (NAJBOLJŠA) =====
             try:
                 analytics_json = element.get_attribute("data-analytics-object")
-                if analytics_json:
-                    data = json_module.loads(analytics_json)
-                    name = data.get("item_name", "")
-                    product_category = data.get("item_category", "") or data.get("item_category2", "")
-
-                    # Cena je v price polju
-                    if "price" in data:
-                        regular_price = float(data["price"])
             except:
-                pass
+                analytics_json = None
+            name, product_category, regular_price = self.parse_analytics(analytics_json)
 
             # ===== METODA 2: Fallback na DOM parsing =====
             if not name:
-                for selector in self.NAME_SELECTORS:
+                for selector in self.rank_selectors("name", self.NAME_SELECTORS):
                     try:
                         el = element.query_selector(selector)
                         if el:
                             tag_name = el.evaluate("el => el.tagName")
+                            alt = el.get_attribute("alt") if tag_name == "IMG" else ""
+                            title = el.get_attribute("title") if tag_name == "A" else ""
+                            text = el.inner_text() if tag_name != "IMG" and not title else ""
 
-                            if tag_name == "IMG":
-                                name = el.get_attribute("alt") or ""
-                            elif tag_name == "A":
-                                name = el.get_attribute("title") or el.inner_text()
-                            else:
-                                name = el.inner_text()
-
-                            name = re.sub(r"\s+", " ", name).strip()
-                            name = re.sub(r"\d+[,.]\d{2}\s*€.*", "", name).strip()
-
-                            if self.is_valid_name(name):
+                            name = self.name_from_candidate(tag_name, alt, title, text)
+                            if name:
+                                self.record_selector("name", selector)
                                 break
-                            else:
-                                name = ""
                     except:
                         continue
 
             # Fallback: vzemi tekst pred ceno
             if not name:
                 try:
-                    all_text = element.inner_text()
-                    all_text = re.sub(r"\s+", " ", all_text).strip()
-
-                    if all_text:
-                        parts = re.split(r"\d+[,.]\d{2}\s*€", all_text)
-                        if parts and len(parts[0].strip()) > 3:
-                            name = parts[0].strip()
-                            name = re.sub(r"^razvrsti\s*(po)?:?\s*", "", name, flags=re.I)
-                            name = re.sub(r"^kategorij[ae]:?\s*", "", name, flags=re.I)
-                            name = re.sub(r"^filter:?\s*", "", name, flags=re.I)
-
-                            if not self.is_valid_name(name):
-                                name = ""
+                    name = self.name_from_text(element.inner_text())
                 except:
                     pass
 
@@ -522,49 +465,21 @@ class MercatorScraper(BulletproofScraper):
 
             # ===== SLIKA =====
             image = ""
-            for selector in self.IMAGE_SELECTORS:
+            for selector in self.rank_selectors("image", self.IMAGE_SELECTORS):
                 try:
                     img = element.query_selector(selector)
                     if img:
-                        src = (
-                            img.get_attribute("data-src") or
-                            img.get_attribute("data-lazy-src") or
-                            img.get_attribute("data-original") or
-                            img.get_attribute("src") or
-                            ""
-                        )
-
-                        if src and not src.startswith("data:"):
-                            if src.startswith("//"):
-                                src = f"https:{src}"
-                            elif src.startswith("/"):
-                                src = f"{self.BASE_URL}{src}"
-
-                            if self.is_valid_image_url(src):
-                                image = src
-                                break
+                        image = self.resolve_image_src({attr: img.get_attribute(attr) for attr in self.IMAGE_ATTRS})
+                        if image:
+                            self.record_selector("image", selector)
+                            break
                 except:
                     continue
 
             # ===== KATEGORIJA =====
             cat = product_category or category or self.current_category
 
-            # ===== ENOTA (iz imena) =====
-            unit_match = re.search(r"(\d+(?:[.,]\d+)?)\s*(kg|g|l|ml|cl|dl|kos|kom)\b", name, re.I)
-            unit = ""
-            if unit_match:
-                unit = f"{unit_match.group(1)}{unit_match.group(2).lower()}"
-
-            return {
-                "ime": name,
-                "redna_cena": regular_price,
-                "akcijska_cena": sale_price,
-                "kategorija": cat,
-                "enota": unit,
-                "trgovina": self.STORE_NAME,
-                "slika": image if image else None,
-                "url": self.page.url,
-            }
+            return self.build_product(name, regular_price, sale_price, image, cat, self.page.url)
 
         except Exception as e:
             self.log(f"Napaka pri ekstrakciji: {e}", "WARNING")
@@ -572,10 +487,14 @@ class MercatorScraper(BulletproofScraper):
 
     def scrape_current_page(self, category: str = "") -> list[dict]:
         """Scrapaj vse izdelke na trenutni strani"""
+        if self.EXTRACTION_MODE in ("bulk", "snapshot"):
+            return self.scrape_current_page_bulk(category)
+
         products = []
 
-        # Poskusi več selektorjev
-        for selector in self.PRODUCT_SELECTORS:
+        # Poskusi več selektorjev (naučen zmagovalec najprej)
+        ranked = self.rank_selectors("tile", self.PRODUCT_SELECTORS)
+        for selector in ranked:
             try:
                 elements = self.page.query_selector_all(selector)
                 if not elements or len(elements) < 3:
@@ -592,6 +511,7 @@ class MercatorScraper(BulletproofScraper):
                         continue
 
                 if products:
+                    self.record_selector("tile", selector, ranked)
                     break
 
             except:
@@ -599,19 +519,73 @@ class MercatorScraper(BulletproofScraper):
 
         return products
 
+    # ==================== BULK EXTRACTION ====================
+
+    def get_bulk_spec(self) -> dict:
+        """Mercator: data-analytics-object + imena + slike"""
+        spec = super().get_bulk_spec()
+        spec["attrs"] = ["data-analytics-object"]
+        return spec
+
+    def parse_tile(self, raw: dict, category: str = "", url: str = "") -> Optional[dict]:
+        """Mercator izdelek iz surovega BULK tile-a - ista logika kot extract_product_data()"""
+        sale_price = None
+        name, product_category, regular_price = self.parse_analytics(
+            raw.get("attrs", {}).get("data-analytics-object")
+        )
+
+        if not name:
+            for candidate in raw.get("names", []):
+                if not candidate:
+                    continue
+                name = self.name_from_candidate(
+                    candidate.get("tag"), candidate.get("alt"), candidate.get("title"), candidate.get("text"),
+                )
+                if name:
+                    break
+
+        text = raw.get("text") or ""
+        if not name:
+            name = self.name_from_text(text)
+
+        if not name:
+            return None
+
+        if not regular_price:
+            regular_price, sale_price = self.parse_mercator_prices(text)
+
+        if not regular_price and not sale_price:
+            return None
+
+        image = ""
+        for attrs in raw.get("images", []):
+            image = self.resolve_image_src(attrs)
+            if image:
+                break
+
+        cat = product_category or category or self.current_category
+        return self.build_product(name, regular_price, sale_price, image, cat, url or self.page.url)
+
     def scrape_category(self, category_name: str, url: str) -> list[dict]:
         """Scrapaj eno kategorijo"""
+        try:
+            return self.scrape_category_task(category_name, url)
+        except ScraperError as e:
+            self.log(str(e), "ERROR")
+            return []
+
+    def scrape_category_task(self, category_name: str, url: str) -> list[dict]:
+        """Ena kategorija (uporablja tudi category worker) - ScraperError če se ne odpre"""
         self.current_category = category_name
-        products = []
 
         self.log(f"=" * 50)
         self.log(f"KATEGORIJA: {category_name}")
         self.log(f"=" * 50)
 
         # Odpri kategorijo
+        self.begin_category()
         if not self.safe_goto(url, timeout=60000):
-            self.log(f"Ne morem odpreti: {url}", "ERROR")
-            return products
+            raise ScraperError(f"Ne morem odpreti: {url}")
 
         # Sprejmi piškotke (če še niso)
         self.accept_cookies()
@@ -619,12 +593,18 @@ class MercatorScraper(BulletproofScraper):
 
         # POMEMBNO: Zapri popup "Izbira načina prevzema"
         self.wait_and_dismiss_popups(2.0)
+        self.save_session()
+
+        # Delta: infinite scroll nima vzorca konca (category_tail_sample) -> vedno poln scrape
+        cached = self.reuse_unchanged_category(category_name)
+        if cached is not None:
+            return cached
 
         # Infinite scroll
         self.scroll_and_load_all(max_scrolls=150)
 
-        # Scrapaj izdelke
-        products = self.scrape_current_page(category_name)
+        # Scrapaj izdelke (API capture ali DOM)
+        products = self.scrape_page_products(category_name)
 
         self.log(f"{category_name}: KONČANO - {len(products)} izdelkov", "SUCCESS")
         return products
@@ -651,18 +631,10 @@ class MercatorScraper(BulletproofScraper):
 
         # POMEMBNO: Zapri popup "Izbira načina prevzema"
         self.wait_and_dismiss_popups(3.0)
+        self.save_session()
 
-        # Scrapaj vsako kategorijo
-        for i, (category_name, url) in enumerate(self.CATEGORY_URLS):
-            self.log(f"\n[{i+1}/{len(self.CATEGORY_URLS)}] {category_name}")
-
-            try:
-                products = self.scrape_category(category_name, url)
-                self.random_delay(1.5, 2.5)
-
-            except Exception as e:
-                self.log(f"Napaka pri {category_name}: {e}", "ERROR")
-                self.stats["errors"] += 1
+        # Scrapaj vsako kategorijo (serijsko ali z več workerji)
+        self.scrape_categories(self.CATEGORY_URLS)
 
         self.finish()
         return self.products
@@ -675,40 +647,48 @@ class MercatorScraper(BulletproofScraper):
         self.start()
         self.current_category = "Mercator"
 
-        # Odpri stran z vsemi izdelki
-        self.log(f"Odpiranje: {self.ALL_PRODUCTS_URL}")
-        if not self.safe_goto(self.ALL_PRODUCTS_URL, timeout=60000):
-            self.log("Ne morem odpreti strani!", "ERROR")
-            return []
-
-        # Sprejmi piškotke
-        self.accept_cookies()
-        self.close_popups()
-
-        # ============ POPUP HANDLING ============
-        self.log("Zapiram popup 'Izbira nacina prevzema'...")
-        time.sleep(2)
+        with self.profiled("Mercator"):
+            # Odpri stran z vsemi izdelki
+            self.log(f"Odpiranje: {self.ALL_PRODUCTS_URL}")
+            self.begin_category()
+            if not self.safe_goto(self.ALL_PRODUCTS_URL, timeout=60000):
+                self.log("Ne morem odpreti strani!", "ERROR")
+                return []
+
+            # Sprejmi piškotke
+            self.accept_cookies()
+            self.close_popups()
+
+            # ============ POPUP HANDLING ============
+            with self.timed("popup"):
+                if not self.popups_handled():
+                    self.log("Zapiram popup 'Izbira nacina prevzema'...")
+                    time.sleep(2)
+
+                    for attempt in range(5):
+                        if self.dismiss_delivery_popup():
+                            self.log("Popup zaprt!", "SUCCESS")
+                            break
+                        time.sleep(0.5)
 
-        for attempt in range(5):
-            if self.dismiss_delivery_popup():
-                self.log("Popup zaprt!", "SUCCESS")
-                break
-            time.sleep(0.5)
+                    self.dismiss_cookie_bar()
+                    time.sleep(1)
+            self.save_session()
 
-        self.dismiss_cookie_bar()
-        time.sleep(1)
+            # Brez delta: /brskaj je cel katalog v eni psevdo-kategoriji (prva stran ne pove nič o ostalih)
 
-        # ============ INFINITE SCROLL ============
-        # Mercator /brskaj = ~90 scrollov za vse izdelke
-        self.log("Zacem infinite scroll (~90 scrollov)...")
-        self.scroll_and_load_all(max_scrolls=100)
+            # ============ INFINITE SCROLL ============
+            # Mercator /brskaj = ~90 scrollov za vse izdelke
+            self.log("Zacem infinite scroll (~90 scrollov)...")
+            self.scroll_and_load_all(max_scrolls=100)
 
-        # Preveri popup še enkrat po scrollu
-        self.dismiss_delivery_popup()
-        self.dismiss_cookie_bar()
+            # Preveri popup še enkrat po scrollu
+            if not self.popups_handled():
+                self.dismiss_delivery_popup()
+                self.dismiss_cookie_bar()
 
-        # ============ SCRAPE IZDELKOV ============
-        self.scrape_current_page("Mercator")
+            # ============ SCRAPE IZDELKOV ============
+            self.scrape_page_products("Mercator")
 
         self.finish()
         return self.products
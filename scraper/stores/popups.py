@@ -0,0 +1,169 @@
+"""
+POPUP GUARD
+===========
+Popup-e zapira skripta V BROWSERJU namesto pollanja iz Pythona.
+
+- Skripta se namesti enkrat (page.add_init_script) in velja za vse navigacije
+- MutationObserver ob vsaki spremembi DOM-a (debounce) preveri pravila trgovine:
+  cookie bar, Mercator izbira prevzema, SPAR 18+ ... in jih klikne/odstrani
+- Vsak zaprt popup javi nazaj prek page.expose_binding -> števci v metrikah
+- Python ne čaka več na popup-e (brez sleep, brez query_selector + is_visible zank)
+
+Pravilo:
+    {"name": "cookies", "selector": "<CSS>", "text": ["sprejmi", ...], "action": "click" | "remove"}
+    - text: element mora vsebovati enega od nizov (lowercase), opcijsko
+    - action: click (default) ali remove (element odstrani iz DOM-a)
+"""
+import json
+from typing import Callable, Dict, List
+
+
+POPUP_BINDING = "__prhranPopup"
+
+POPUP_GUARD_JS = """
+(rules) => {
+    if (window.__prhranPopupGuard) return;
+    window.__prhranPopupGuard = true;
+
+    const visible = (el) => {
+        const r = el.getBoundingClientRect();
+        if (!r.width || !r.height) return false;
+        const style = getComputedStyle(el);
+        return style.visibility !== 'hidden' && style.display !== 'none';
+    };
+    const report = (name) => {
+        try { if (window.__prhranPopup) window.__prhranPopup(name); } catch (e) {}
+    };
+
+    const sweep = () => {
+        let handled = 0;
+        for (const rule of rules) {
+            let els;
+            try { els = document.querySelectorAll(rule.selector); } catch (e) { continue; }
+            for (const el of els) {
+                if (el.hasAttribute('data-prhran-popup')) continue;
+                if (rule.text) {
+                    const text = (el.textContent || '').toLowerCase();
+                    if (!rule.text.some(t => text.includes(t))) continue;
+                }
+                if (rule.action !== 'remove' && !visible(el)) continue;
+
+                el.setAttribute('data-prhran-popup', '1');
+                try {
+                    if (rule.action === 'remove') el.remove(); else el.click();
+                } catch (e) { continue; }
+                handled++;
+                report(rule.name);
+                break;  // eno na pravilo na sweep
+            }
+        }
+        // Modali pogosto zaklenejo scroll
+        if (handled && document.body) {
+            document.body.style.overflow = '';
+            document.documentElement.style.overflow = '';
+        }
+        return handled;
+    };
+    window.__prhranDismiss = sweep;
+
+    let timer = null;
+    const schedule = () => {
+        if (timer) return;
+        timer = setTimeout(() => { timer = null; sweep(); }, 50);
+    };
+    new MutationObserver(schedule).observe(document, { childList: true, subtree: true });
+    schedule();
+}
+"""
+
+# Skupna pravila za cookie consent (CookieBot, OneTrust, Didomi, generično)
+COOKIE_POPUP_RULES: List[dict] = [
+    {
+        "name": "cookies",
+        "selector": ", ".join([
+            "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
+            "#CybotCookiebotDialogBodyButtonAccept",
+            "#CybotCookiebotDialogBodyLevelButtonAccept",
+            "#onetrust-accept-btn-handler",
+            "#onetrust-accept-all-handler",
+            "#didomi-notice-agree-button",
+            "#accept-cookies",
+            "#acceptCookies",
+            "#cookie-accept",
+            "#cookieAccept",
+            "#cookies-accept",
+        ]),
+    },
+    {
+        "name": "cookies",
+        "selector": ", ".join([
+            '[id*="Cookiebot"] button',
+            '[id*="Cookiebot"] a',
+            '[class*="cookie"] button',
+            '[class*="Cookie"] button',
+            '[id*="cookie"] button',
+            '[class*="consent"] button',
+            '[class*="gdpr"] button',
+        ]),
+        "text": ["dovoli vse", "sprejmi vse", "sprejmi", "strinjam se", "soglašam", "accept all", "allow all"],
+    },
+]
+
+
+def build_guard_script(rules: List[dict]) -> str:
+    """Init skripta s pravili trgovine"""
+    return f"({POPUP_GUARD_JS})({json.dumps(rules, ensure_ascii=False)});"
+
+
+class PopupGuard:
+    """Namesti auto-dismiss skripto na page in šteje zaprte popup-e"""
+
+    def __init__(self, page, rules: List[dict], on_dismiss: Callable[[str], None] = None,
+                 log: Callable = None):
+        self.page = page
+        self.rules = rules
+        self.on_dismiss = on_dismiss
+        self.log = log or (lambda message, level="INFO": None)
+        self.counts: Dict[str, int] = {}
+        self.installed = False
+
+    def install(self) -> bool:
+        """Binding + init skripta (+ takoj na trenutni strani)"""
+        if self.installed:
+            return True
+        script = build_guard_script(self.rules)
+        try:
+            self.page.expose_binding(POPUP_BINDING, self._on_binding)
+            self.page.add_init_script(script)
+        except Exception as e:
+            self.log(f"Popup guard ni nameščen: {e}", "WARNING")
+            return False
+
+        # Init skripta velja od naslednje navigacije - trenutna stran jo dobi takoj
+        try:
+            self.page.evaluate(script)
+        except:
+            pass
+
+        self.installed = True
+        return True
+
+    def _on_binding(self, source, name: str):
+        """Klic iz browserja - samo štejemo (brez Playwright klicev v handlerju)"""
+        self.counts[name] = self.counts.get(name, 0) + 1
+        if self.on_dismiss:
+            try:
+                self.on_dismiss(name)
+            except Exception:
+                pass
+
+    def sweep(self) -> int:
+        """En takojšen pregled (en round-trip, brez čakanja) - vrne število zaprtih"""
+        try:
+            return self.page.evaluate("() => window.__prhranDismiss ? window.__prhranDismiss() : 0") or 0
+        except:
+            return 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
@@ -0,0 +1,390 @@
+"""
+PRICE PARSER (tokenizer)
+========================
+En prehod čez tekst tile-a namesto kaskade regexov v vsakem scraperju.
+
+1. tokenize(): EN master regex (finditer) -> zneski + oznake
+   (Prej, Prihranek, PC koda, "kg za", "Kupi 2" / "2 za", -20 %)
+2. Vsak znesek dobi vlogo iz oznake TIK pred njim in iz pripone (€, "/ 1kg", "0,15 kg"):
+   - regular   "Prej 2,99 €"           stara/redna cena
+   - savings   "Prihranek 0,50 €"      prihranek, NE cena
+   - unit      "4,98 €/kg", "kg za 4,98 €"
+   - bulk      "Kupi 2 ... 1,99 €", "2 za 3,00 €" (samo PriceRules.bulk)
+   - loyalty   "PC30:1,39 €"           cena s kartico - ignorirana
+   - quantity  "0,15 kg", "1,50 l"     teža/volumen brez € - ignorirana
+   - price     kandidat za redno / akcijsko
+   Tekst brez besed oznak (Prej, Prihranek, PC, za, Kupi) gre po hitri poti: samo AMOUNT_RE,
+   brez Amount objektov (večina Mercator / Tuš tile-ov in SPAR brez akcije).
+   parse_price_pair(): samo (redna, akcijska) za scraperje - brez cene na enoto, Mercator samo € zneski.
+3. PriceRules trgovine (konfiguracija) izbere redno / akcijsko iz kandidatov:
+   - pair="minmax" (SPAR, Tuš): ena cena = redna; več cen + popust = max/min, sicer min
+   - pair="order"  (Mercator): prvi dve različni ceni po vrstnem redu (višja = redna)
+   - require_currency: kandidat mora imeti € (Mercator)
+
+parse_amount(): ena celica / en element ("1,29 €", "1.234,56", "€ 2.49", "2") - Google Sheets, katalogi.
+Zlati korpus: stores/prices_golden.jsonl (python benchmark_prices.py ga preveri in izmeri hitrost).
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple, Union
+
+REGULAR = "regular"
+SALE = "sale"
+SAVINGS = "savings"
+UNIT = "unit"
+BULK = "bulk"
+LOYALTY = "loyalty"
+QUANTITY = "quantity"
+PRICE = "price"
+
+# Enote za ceno na enoto ("/ 1kg", "/kos", "/ 100g")
+PER_UNITS = "kg|kos|kom|kpl|pak|ml|cl|dl|mm|cm|m|g|l"
+
+# Znesek + pripona (€, "/ 1kg" = cena na enoto, " kg" brez € = teža) - skupno TOKEN_RE in AMOUNT_RE
+AMOUNT_PATTERN = (
+    r"(?P<amount>\d+(?:(?:\.\d{3})+,|[,.])\d{2})(?!\d)"
+    r"(?P<eur>\s*€)?"
+    r"(?:\s*/\s*(?:\d+(?:[,.]\d+)?)?\s*(?P<per_unit>" + PER_UNITS + r")\b"
+    r"|\s*(?P<bare_unit>kg|g|ml|l)\b)?"
+)
+
+# Vsaka alternativa je zunanja skupina (match.lastgroup = vrsta žetona).
+# Lookahead na začetku: večina pozicij (črke imena, presledki) odpade v enem koraku.
+# "za" brez predpone - "2 za" / "kg za" se preveri nazaj samo ko "za" res najdemo.
+TOKEN_RE = re.compile(
+    r"(?=[\dpkz-])(?:"
+    r"(?P<pc>\bPC\d+\s*:?)"
+    r"|(?P<prej>\bprej\b:?)"
+    r"|(?P<save>\bprihran[ie]k\b:?)"
+    r"|(?P<kupi>\bkupi\s*(?P<kupi_n>\d+)\b)"
+    r"|(?P<za>\bza\b)"
+    r"|(?P<pct>-\s*\d{1,2}\s*%)"
+    r"|(?P<num>" + AMOUNT_PATTERN + r")"
+    r")",
+    re.I,
+)
+ZA_PREFIX_RE = re.compile(r"(?:\b(?P<n>\d+)\s*|\b(?P<unit>kg|kos|kom|l)\s+)$", re.I)
+
+# Hitra pot (tekst brez besed oznak): vloge določi samo pripona zneska
+AMOUNT_RE = re.compile(AMOUNT_PATTERN, re.I)
+# require_currency (Mercator): € skupina samo pri znesku, ki NI cena na enoto ("2,49 €/ 1kg").
+# Zneski brez € se prav tako porabijo - zaporedje zadetkov ostane enako kot pri AMOUNT_RE
+CURRENCY_PRICE_RE = re.compile(
+    r"(\d+(?:(?:\.\d{3})+,|[,.])\d{2})(?!\d)"
+    r"(\s*€(?!\s*/\s*(?:\d+(?:[,.]\d+)?)?\s*(?:" + PER_UNITS + r")\b))?",
+    re.I,
+)
+PERCENT_RE = re.compile(r"-\s*\d{1,2}\s*%")
+
+
+@dataclass
+class PriceRules:
+    """Pravila trgovine za izbiro redne / akcijske cene"""
+    name: str = "default"
+    pair: str = "minmax"  # "minmax" ali "order"
+    require_currency: bool = False  # Kandidat mora imeti €
+    bulk: bool = False  # "Kupi 2" / "2 za" = bulk cena (katalogi)
+    min_price: float = 0.01
+    max_price: float = 9999
+
+    def valid(self, value: float) -> bool:
+        return self.min_price < value < self.max_price
+
+
+SPAR_PRICE_RULES = PriceRules("spar", pair="minmax")
+TUS_PRICE_RULES = PriceRules("tus", pair="minmax")
+MERCATOR_PRICE_RULES = PriceRules("mercator", pair="order", require_currency=True)
+
+# scripts/catalog-scraper/playwright_scraper.py (ožje meje cen kot prej)
+CATALOG_MERCATOR_PRICE_RULES = PriceRules("catalog-mercator", require_currency=True, bulk=True, max_price=10000)
+CATALOG_SPAR_PRICE_RULES = PriceRules("catalog-spar", require_currency=True, min_price=0.1, max_price=500)
+CATALOG_TUS_PRICE_RULES = PriceRules("catalog-tus", min_price=0.1, max_price=500)
+
+STORE_PRICE_RULES = {
+    "spar": SPAR_PRICE_RULES,
+    "tus": TUS_PRICE_RULES,
+    "mercator": MERCATOR_PRICE_RULES,
+    "catalog-mercator": CATALOG_MERCATOR_PRICE_RULES,
+    "catalog-spar": CATALOG_SPAR_PRICE_RULES,
+    "catalog-tus": CATALOG_TUS_PRICE_RULES,
+}
+
+
+@dataclass
+class Amount:
+    """Znesek v tekstu z vlogo"""
+    value: float
+    start: int
+    role: str
+    currency: bool = False
+    unit: str = ""  # "kg" pri ceni na enoto / teži
+    quantity: int = 0  # Kupi N / N za
+
+
+@dataclass
+class ParsedPrices:
+    """Rezultat parse_price_text"""
+    regular: Optional[float] = None
+    sale: Optional[float] = None
+    unit_price: Optional[float] = None
+    unit: str = ""
+    savings: Optional[float] = None
+    bulk_price: Optional[float] = None
+    bulk_quantity: Optional[int] = None
+    discount_hint: bool = False  # Prej / Prihranek / -N % v tekstu
+    amounts: List[Amount] = field(default_factory=list)  # Samo polna pot (tekst z oznakami)
+
+    @property
+    def pair(self) -> Tuple[Optional[float], Optional[float]]:
+        return self.regular, self.sale
+
+
+def to_amount(text: str) -> float:
+    """"1,29" / "1.29" / "1.234,56" -> float"""
+    if "," in text and "." in text:
+        text = text.replace(".", "")
+    return float(text.replace(",", "."))
+
+
+def tokenize(text: str) -> Tuple[List[Amount], bool, int]:
+    """
+    En prehod: zneski z vlogami (pred izbiro redne/akcijske), ali tekst nakazuje popust,
+    in količina prve bulk oznake ("Kupi 2" / "2 za" -> 2, sicer 0).
+    Oznaka velja samo za znesek TIK za njo (vmes le presledki).
+    """
+    amounts: List[Amount] = []
+    discount_hint = False
+    bulk_quantity = 0
+    marker = None  # (vrsta, konec, količina/enota)
+
+    for match in TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind != "num":
+            # Oznaka
+            if kind == "prej" or kind == "save":
+                marker = (kind, match.end(), None)
+                discount_hint = True
+            elif kind == "pc":
+                marker = ("pc", match.end(), None)
+            elif kind == "kupi":
+                quantity = int(match.group("kupi_n"))
+                marker = ("bulk", match.end(), quantity)
+                bulk_quantity = bulk_quantity or quantity
+            elif kind == "za":
+                # "2 za 3,00 €" = bulk, "kg za 4,98 €" / "0,15 kg za 4,98 €" = cena na enoto
+                prefix = ZA_PREFIX_RE.search(text, max(0, match.start() - 12), match.start())
+                if prefix and prefix.group("n"):
+                    quantity = int(prefix.group("n"))
+                    marker = ("bulk", match.end(), quantity)
+                    bulk_quantity = bulk_quantity or quantity
+                elif prefix:
+                    marker = ("unit", match.end(), prefix.group("unit").lower())
+                else:
+                    marker = ("za", match.end(), None)
+            else:
+                discount_hint = True  # -20 %
+            continue
+
+        number, eur, per_unit, bare_unit = match.group("amount", "eur", "per_unit", "bare_unit")
+        value = to_amount(number)
+        start = match.start()
+        currency = eur is not None
+        role, unit, quantity = PRICE, "", 0
+
+        # Oznaka tik pred zneskom
+        context = marker if marker and not text[marker[1]:start].strip() else None
+        marker = None
+
+        if per_unit:
+            role, unit = UNIT, per_unit.lower()
+        elif bare_unit and not currency:
+            role, unit = QUANTITY, bare_unit.lower()
+        elif context:
+            kind, _, extra = context
+            if kind == "prej":
+                role = REGULAR
+            elif kind == "save":
+                role = SAVINGS
+            elif kind == "pc":
+                role = LOYALTY
+            elif kind == "bulk":
+                role, quantity = BULK, extra
+            elif kind == "unit":
+                role, unit = UNIT, extra  # "kg za 4,98 €"
+            elif bare_unit:
+                role, unit = UNIT, bare_unit.lower()  # "za 4,98 € kg"
+        amounts.append(Amount(value, start, role, currency, unit, quantity))
+
+    return amounts, discount_hint, bulk_quantity
+
+
+def has_markers(text: str) -> bool:
+    """Ali tekst vsebuje besedo oznake (podniz - lažni zadetek gre samo po polni poti)"""
+    lowered = text.lower()
+    return "prej" in lowered or "prihran" in lowered or "pc" in lowered or "za" in lowered or "kupi" in lowered
+
+
+def _parse_plain(text: str, rules: PriceRules, has_discount) -> ParsedPrices:
+    """Hitra pot za tekst brez oznak: brez Amount objektov, vloga samo iz pripone zneska"""
+    valid = rules.valid
+    candidates: List[float] = []
+    unit_price, unit = None, ""
+    for number, eur, per_unit, bare_unit in AMOUNT_RE.findall(text):
+        if per_unit:
+            if unit_price is None:
+                unit_price, unit = to_amount(number), per_unit.lower()
+        elif bare_unit and not eur:
+            continue  # Teža / volumen
+        elif eur or not rules.require_currency:
+            value = to_amount(number)
+            if valid(value) and value not in candidates:
+                candidates.append(value)
+
+    regular, sale = _pick(candidates, None, rules, has_discount)
+    return ParsedPrices(regular, sale, unit_price, unit,
+                        discount_hint="%" in text and PERCENT_RE.search(text) is not None)
+
+
+def parse_price_pair(text: str, rules: PriceRules = SPAR_PRICE_RULES,
+                     has_discount: Union[bool, Callable[[], bool], None] = None) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Samo (redna, akcijska) - to rabijo scraperji trgovin. Enako kot parse_price_text(...).pair,
+    a tekst brez oznak ne računa cene na enoto; require_currency bere samo € zneske,
+    pair="order" se ustavi po dveh kandidatih.
+    """
+    text = text or ""
+    if has_markers(text):
+        return parse_price_text(text, rules, has_discount).pair
+
+    valid = rules.valid
+    candidates: List[float] = []
+    if rules.require_currency:
+        limit = 2 if rules.pair == "order" else 0
+        for number, eur in CURRENCY_PRICE_RE.findall(text):
+            if not eur:
+                continue  # Brez € / cena na enoto
+            value = to_amount(number)
+            if valid(value) and value not in candidates:
+                candidates.append(value)
+                if len(candidates) == limit:
+                    break
+    else:
+        for number, eur, per_unit, bare_unit in AMOUNT_RE.findall(text):
+            if per_unit or (bare_unit and not eur):
+                continue  # Cena na enoto / teža
+            value = to_amount(number)
+            if valid(value) and value not in candidates:
+                candidates.append(value)
+    return _pick(candidates, None, rules, has_discount)
+
+
+def parse_price_text(text: str, rules: PriceRules = SPAR_PRICE_RULES,
+                     has_discount: Union[bool, Callable[[], bool], None] = None) -> ParsedPrices:
+    """
+    Cene iz celotnega teksta tile-a.
+    has_discount: bool ali callable (kliče se samo ko je več kandidatov) - za pair="minmax".
+    """
+    text = text or ""
+    if not has_markers(text):
+        return _parse_plain(text, rules, has_discount)
+
+    amounts, discount_hint, marker_quantity = tokenize(text)
+    result = ParsedPrices(discount_hint=discount_hint, amounts=amounts)
+    valid = rules.valid
+
+    candidates: List[float] = []
+    for amount in amounts:
+        role = amount.role
+        if role == PRICE or (role == BULK and not rules.bulk):
+            # Trgovina brez bulk pravila: "2 za 3,00 €" je navaden kandidat
+            if rules.require_currency and not amount.currency:
+                continue
+            if valid(amount.value) and amount.value not in candidates:
+                candidates.append(amount.value)
+        elif role == REGULAR:
+            if result.regular is None and valid(amount.value):
+                result.regular = amount.value
+        elif role == UNIT:
+            if result.unit_price is None:
+                result.unit_price, result.unit = amount.value, amount.unit
+        elif role == SAVINGS:
+            if result.savings is None:
+                result.savings = amount.value
+        elif role == BULK:
+            if result.bulk_price is None and valid(amount.value):
+                result.bulk_price, result.bulk_quantity = amount.value, amount.quantity
+
+    # Katalog: "Kupi 2" brez zneska tik za oznako - najnižja cena je bulk, najvišja redna
+    if rules.bulk and result.bulk_price is None and marker_quantity >= 2 and len(candidates) >= 2:
+        result.bulk_price, result.bulk_quantity = min(candidates), marker_quantity
+        candidates.remove(result.bulk_price)
+
+    result.regular, result.sale = _pick(candidates, result.regular, rules, has_discount)
+    return result
+
+
+def _pick(candidates: List[float], regular: Optional[float], rules: PriceRules,
+          has_discount) -> Tuple[Optional[float], Optional[float]]:
+    """Redna / akcijska iz kandidatov po pravilih trgovine"""
+    if regular is not None:
+        # "Prej" = redna, najnižji kandidat je akcijska
+        if not candidates:
+            return regular, None
+        sale = min(candidates)
+        return regular, sale if sale < regular else None
+
+    if not candidates:
+        return None, None
+    if len(candidates) == 1:
+        return candidates[0], None
+
+    if rules.pair == "order":
+        first, second = candidates[0], candidates[1]
+        return max(first, second), min(first, second)
+
+    discount = has_discount() if callable(has_discount) else has_discount
+    if discount:
+        high, low = max(candidates), min(candidates)
+        return high, (low if low != high else None)
+    return min(candidates), None
+
+
+def first_amount(text: str) -> Optional[float]:
+    """Prvi znesek v tekstu elementa (npr. Tuš .price element)"""
+    for match in TOKEN_RE.finditer(text or ""):
+        if match.lastgroup == "num":
+            return to_amount(match.group("amount"))
+    return None
+
+
+AMOUNT_CELL_RE = re.compile(r"\d[\d.,\s]*")
+
+
+def parse_amount(text) -> Optional[float]:
+    """
+    Ena vrednost ("1,29 €", "€ 2.49", "1.234,56", "2") -> float ali None; negativna ("-1,5") -> None.
+    Ena ločilo = decimalno; obe (1.234,56 / 1,234.56) = zadnje je decimalno.
+    """
+    if text is None:
+        return None
+    if isinstance(text, (int, float)) and not isinstance(text, bool):
+        return float(text)
+    text = str(text)
+    match = AMOUNT_CELL_RE.search(text)
+    if not match:
+        return None
+    if text[:match.start()].rstrip().endswith(("-", "−")):
+        return None  # Negativna vrednost ni cena (sicer bi tiho obrnili predznak)
+    number = match.group(0).replace(" ", "").rstrip(".,")
+    if "," in number and "." in number:
+        decimal = "," if number.rfind(",") > number.rfind(".") else "."
+        thousands = "." if decimal == "," else ","
+        number = number.replace(thousands, "").replace(decimal, ".")
+    elif number.count(",") > 1 or number.count(".") > 1:
+        number = number.replace(",", "").replace(".", "")  # 1.234.567
+    else:
+        number = number.replace(",", ".")
+    try:
+        return float(number)
+    except ValueError:
+        return None
@@ -0,0 +1,169 @@
+"""
+PRODUCT RECORD
+==============
+Kompakten zapis izdelka na poti scraper -> matcher namesto prostega dicta.
+
+- __slots__: brez __dict__ na izdelek (pri 30k izdelkih nekajkrat manj spomina)
+- Obnaša se kot dict: product["ime"], product.get(...), "slika" in product, dict(product)
+  - obstoječa koda (validacija, Google Sheets, matcher) ostane nespremenjena
+- Neznani ključi (redko, npr. dodatna polja) gredo v _extra
+- Matcher cache (_normalized, _signature, _features, _tokens) je v slotih, a NE gre v to_dict()
+- to_dict() samo na meji izvoza (progress, journal, delta, Convex)
+
+fingerprint64(): stabilen 64-bit hash "trgovina|ime|cena" za seen set (int namesto dolgega stringa)
+"""
+import re
+import hashlib
+from collections.abc import MutableMapping
+from typing import Iterable, List
+
+FIELDS = (
+    "ime", "redna_cena", "akcijska_cena", "kategorija", "enota", "trgovina", "slika", "url",
+    "_quality_score", "match_id",
+)
+MATCHER_FIELDS = ("_normalized", "_signature", "_features", "_tokens")
+SLOT_FIELDS = frozenset(FIELDS + MATCHER_FIELDS)
+
+FINGERPRINT_NAME_RE = re.compile(r"[^a-zčšž0-9]")
+
+
+class Product(MutableMapping):
+    """Izdelek z __slots__ (dict vmesnik; manjkajoče polje = ključa ni)"""
+
+    __slots__ = FIELDS + MATCHER_FIELDS + ("_extra",)
+
+    def __init__(self, ime: str = "", redna_cena: float = None, akcijska_cena: float = None,
+                 kategorija: str = "", enota: str = "", trgovina: str = "", slika: str = None,
+                 url: str = ""):
+        self.ime = ime
+        self.redna_cena = redna_cena
+        self.akcijska_cena = akcijska_cena
+        self.kategorija = kategorija
+        self.enota = enota
+        self.trgovina = trgovina
+        self.slika = slika
+        self.url = url
+        self._extra = None
+
+    @classmethod
+    def from_dict(cls, data) -> "Product":
+        """Iz dicta (journal, delta, progress) - ohrani samo ključe ki obstajajo"""
+        product = cls.__new__(cls)
+        product._extra = None
+        for key, value in data.items():
+            product[key] = value
+        return product
+
+    # ==================== DICT VMESNIK ====================
+
+    def __getitem__(self, key):
+        if key in SLOT_FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in SLOT_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in SLOT_FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key in FIELDS + MATCHER_FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key) -> bool:
+        if key in SLOT_FIELDS:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def get(self, key, default=None):
+        # Hitra pot (brez KeyError) - get() je najpogostejši klic v validaciji in matcherju
+        if key in SLOT_FIELDS:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def copy(self) -> "Product":
+        return Product.from_dict(self)
+
+    def __reduce__(self):
+        # Pickle (orchestrator queue med procesi): kot dict z vsemi polji
+        return _restore, (dict(self.items()),)
+
+    def __repr__(self) -> str:
+        return f"Product({self.to_dict()!r})"
+
+    # ==================== IZVOZ ====================
+
+    def to_dict(self) -> dict:
+        """Navaden dict za JSON izvoz (brez matcher cache-a)"""
+        data = {}
+        for key in FIELDS:
+            try:
+                data[key] = getattr(self, key)
+            except AttributeError:
+                continue
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+
+def _restore(data: dict) -> Product:
+    return Product.from_dict(data)
+
+
+def to_dict(product) -> dict:
+    """Product -> dict; dict ostane kot je"""
+    return product.to_dict() if isinstance(product, Product) else product
+
+
+def to_dicts(products: Iterable) -> List[dict]:
+    return [to_dict(product) for product in products]
+
+
+def json_default(value):
+    """default= za json.dump: Product kot dict, ostalo kot str (kot prej)"""
+    if isinstance(value, Product):
+        return value.to_dict()
+    return str(value)
+
+
+def fingerprint_key(product) -> str:
+    """"trgovina|normalizirano ime|cena" - ključ deduplikacije znotraj trgovine"""
+    name = FINGERPRINT_NAME_RE.sub("", product.get("ime", "").lower().strip())
+    price = product.get("redna_cena") or product.get("akcijska_cena") or 0
+    store = product.get("trgovina", "").lower()
+    return f"{store}|{name}|{price:.2f}"
+
+
+def fingerprint64(text: str) -> int:
+    """
+    Stabilen 64-bit hash ključa (blake2b, 8 bajtov) - enak v vseh procesih orchestratorja
+    in med runi (str hash() je soljen na proces).
+    """
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
@@ -0,0 +1,202 @@
+"""
+PROFILING (opt-in)
+==================
+Ko ena kategorija nenadoma traja 20 minut - artefakti poleg loga.
+
+Vklop: PRHRAN_PROFILE (ali scraper.py --profile):
+    all            - vse kategorije
+    0.2            - naključni delež kategorij (20 %)
+    Mleko,Pijače   - samo naštete kategorije
+
+Za vsako profilirano kategorijo v profiling/{trgovina}_{ts}/:
+    {nnn}_{kategorija}.trace.zip  - Playwright trace (npx playwright show-trace ...)
+    {nnn}_{kategorija}.prof       - cProfile (pstats; flameprof / snakeviz / gprof2dot)
+    index.json                    - seznam kategorij: trajanje, status, datoteke, protokolni klici
+
+Protokolni klici = round-tripi Python -> Playwright -> CDP, po metodi
+(querySelectorAll, evaluateExpression, goto ...) - šteje se samo v threadu
+profilirane kategorije.
+
+Izklopljeno = nič: scraper nima profilerja in ne kliče ničesar od tega.
+"""
+import cProfile
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def parse_profile_spec(spec: str) -> Optional[dict]:
+    """"all" / "0.2" / "Mleko,Pijače" -> {"all": bool, "rate": float, "names": set} ali None"""
+    spec = (spec or "").strip()
+    if not spec or spec.lower() in ("0", "off", "false", "no"):
+        return None
+    if spec.lower() in ("1", "all", "true", "yes"):
+        return {"all": True, "rate": 1.0, "names": set()}
+    try:
+        rate = float(spec)
+        if 0 < rate <= 1:
+            return {"all": False, "rate": rate, "names": set()}
+    except ValueError:
+        pass
+    return {"all": False, "rate": 0.0, "names": {name.strip().lower() for name in spec.split(",") if name.strip()}}
+
+
+# ==================== PROTOCOL CALL COUNTER ====================
+
+_counters: Dict[int, Dict[str, int]] = {}  # thread id -> {metoda: klicev}
+_all_calls: Optional[Dict[str, int]] = None  # vsi threadi (benchmark_offline.py)
+_patch_lock = threading.Lock()
+_patched = {}
+
+
+def _install_call_counter() -> bool:
+    """Ovij Playwright Channel.send (enkrat na proces) - False če interni API ni na voljo"""
+    with _patch_lock:
+        if _patched:
+            return True
+        try:
+            from playwright._impl._connection import Channel
+        except Exception:
+            return False
+
+        for name in ("send", "send_return_as_dict"):
+            original = getattr(Channel, name, None)
+            if original is None:
+                continue
+
+            def wrapper(self, method, *args, __original=original, **kwargs):
+                counter = _counters.get(threading.get_ident())
+                if counter is not None:
+                    counter[method] = counter.get(method, 0) + 1
+                if _all_calls is not None:
+                    _all_calls[method] = _all_calls.get(method, 0) + 1
+                return __original(self, method, *args, **kwargs)
+
+            setattr(Channel, name, wrapper)
+            _patched[name] = original
+        return bool(_patched)
+
+
+def count_all_protocol_calls() -> Optional[Dict[str, int]]:
+    """Štej protokolne klice VSEH threadov (workerji vključeni) - None če interni API ni na voljo"""
+    global _all_calls
+    if not _install_call_counter():
+        return None
+    _all_calls = {}
+    return _all_calls
+
+
+class ProfileSession:
+    """Ena profilirana kategorija"""
+
+    def __init__(self, category: str, slug: str):
+        self.category = category
+        self.slug = slug
+        self.started = time.time()
+        self.profile: Optional[cProfile.Profile] = None
+        self.context = None
+        self.calls: Dict[str, int] = {}
+
+
+class ProfileRun:
+    """Profiling direktorij enega runa trgovine (deli se med workerji)"""
+
+    def __init__(self, directory: Path, spec: dict, trace: bool = True, cprofile: bool = True,
+                 count_calls: bool = True, log=None):
+        self.directory = Path(directory)
+        self.spec = spec
+        self.trace = trace
+        self.cprofile = cprofile
+        self.count_calls = count_calls and _install_call_counter()
+        self.log = log or (lambda message, level="INFO": None)
+        self.lock = threading.Lock()
+        self.entries: List[dict] = []
+        self.sequence = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def wants(self, category: str) -> bool:
+        """Ali profiliramo to kategorijo (vse / vzorec / naštete)"""
+        if self.spec["all"]:
+            return True
+        if self.spec["names"]:
+            return category.lower() in self.spec["names"]
+        return random.random() < self.spec["rate"]
+
+    def start(self, category: str, page) -> ProfileSession:
+        slug = "".join(c if c.isalnum() else "_" for c in category)[:60] or "kategorija"
+        with self.lock:
+            self.sequence += 1
+            slug = f"{self.sequence:03d}_{slug}"
+        session = ProfileSession(category, slug)
+
+        if self.trace and page is not None:
+            try:
+                page.context.tracing.start(screenshots=True, snapshots=True, sources=False, title=category)
+                session.context = page.context
+            except Exception as e:
+                self.log(f"Trace ni vklopljen: {e}", "DEBUG")
+
+        if self.count_calls:
+            _counters[threading.get_ident()] = session.calls
+
+        if self.cprofile:
+            try:
+                session.profile = cProfile.Profile()
+                session.profile.enable()
+            except ValueError as e:
+                # Python 3.12+: en cProfile naenkrat na proces (drug worker že profilira)
+                self.log(f"cProfile ni vklopljen: {e}", "DEBUG")
+                session.profile = None
+        return session
+
+    def stop(self, session: ProfileSession, status: str = "ok") -> dict:
+        if session.profile:
+            session.profile.disable()
+        _counters.pop(threading.get_ident(), None)
+
+        entry = {
+            "category": session.category,
+            "status": status,
+            "seconds": round(time.time() - session.started, 2),
+            "trace": None,
+            "profile": None,
+            "protocol_calls": sum(session.calls.values()),
+            "protocol_calls_by_method": dict(sorted(session.calls.items(), key=lambda kv: -kv[1])),
+        }
+
+        if session.context is not None:
+            trace_path = self.directory / f"{session.slug}.trace.zip"
+            try:
+                session.context.tracing.stop(path=str(trace_path))
+                entry["trace"] = trace_path.name
+            except Exception as e:
+                self.log(f"Trace ni shranjen: {e}", "WARNING")
+
+        if session.profile:
+            profile_path = self.directory / f"{session.slug}.prof"
+            try:
+                session.profile.dump_stats(str(profile_path))
+                entry["profile"] = profile_path.name
+            except Exception as e:
+                self.log(f"cProfile ni shranjen: {e}", "WARNING")
+
+        with self.lock:
+            self.entries.append(entry)
+            self._write_index()
+        return entry
+
+    def _write_index(self):
+        index = self.directory / "index.json"
+        tmp = index.with_suffix(f".{os.getpid()}.tmp")
+        payload = {
+            "directory": str(self.directory),
+            "spec": {**self.spec, "names": sorted(self.spec["names"])},
+            "categories": self.entries,
+        }
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, index)
@@ -0,0 +1,178 @@
+"""
+PROGRESS WRITER / READER
+========================
+En JSONL (opcijsko gzip) file na run trgovine namesto stotin progress/*.json.
+
+Format (ena vrstica = en zapis, kompaktno):
+    {"_header": {"store": "spar", "timestamp": "...", ...}}
+    {...izdelek...}
+    {...izdelek...}
+    {"_footer": {"count": 1234, "metrics": {...}}}
+
+- Zapisi se zbirajo v bufferju, na disk gredo na N zapisov ali T sekund
+- .gz: vsak flush doda nov gzip member (gzip jih bere kot en tok)
+- iter_progress_records() bere leno - tudi stare .json datoteke (dict s "products" ali seznam)
+"""
+import gzip
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from .product import json_default
+
+PROGRESS_PATTERNS = ["*.jsonl", "*.jsonl.gz", "*.json"]
+
+
+def progress_path(directory: Path, store: str, compress: bool = False, timestamp: str = None) -> Path:
+    """progress/{store}_{YYYYmmdd_HHMMSS}.jsonl[.gz]"""
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    suffix = ".jsonl.gz" if compress else ".jsonl"
+    return Path(directory) / f"{store}_{timestamp}{suffix}"
+
+
+def dumps(record: dict) -> str:
+    """Kompakten JSON (brez presledkov, UTF-8)"""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=json_default)
+
+
+class ProgressWriter:
+    """Buffered append-only writer za izdelke ene trgovine"""
+
+    def __init__(self, path: Path, header: dict = None, flush_every: int = 100,
+                 flush_seconds: float = 10.0):
+        self.path = Path(path)
+        self.compress = self.path.name.endswith(".gz")
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self.buffer: List[str] = []
+        self.last_flush = time.time()
+        self.count = 0
+        self.closed = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.buffer.append(dumps({"_header": header or {}}))
+        self.flush()
+
+    def write(self, record: dict):
+        """Dodaj zapis (na disk gre ob flushu)"""
+        self.buffer.append(dumps(record))
+        self.count += 1
+        if len(self.buffer) >= self.flush_every or time.time() - self.last_flush >= self.flush_seconds:
+            self.flush()
+
+    def write_many(self, records: Iterable[dict]):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """Zapiši buffer"""
+        if self.buffer:
+            data = "\n".join(self.buffer) + "\n"
+            if self.compress:
+                with gzip.open(self.path, "at", encoding="utf-8") as f:
+                    f.write(data)
+            else:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(data)
+            self.buffer = []
+        self.last_flush = time.time()
+
+    def close(self, footer: dict = None):
+        """Flush + zaključni zapis (število, metrike)"""
+        if self.closed:
+            return
+        summary = {"count": self.count}
+        summary.update(footer or {})
+        self.buffer.append(dumps({"_footer": summary}))
+        self.flush()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_products(path: Path, products: Iterable[dict], header: dict = None) -> Path:
+    """Zapiši vse izdelke naenkrat (streaming, brez velikega JSON stringa)"""
+    with ProgressWriter(path, header=header, flush_every=1000, flush_seconds=60.0) as writer:
+        writer.write_many(products)
+    return Path(path)
+
+
+# ==================== READER ====================
+
+def _open_text(path: Path):
+    if path.name.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_progress_records(path: Path) -> Iterator[dict]:
+    """
+    Leno preberi izdelke iz progress datoteke.
+    JSONL(.gz): vrstico za vrstico (header/footer in pokvarjene vrstice preskoči).
+    Legacy .json: {"products": [...]} ali [...].
+    """
+    path = Path(path)
+
+    if path.suffix == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        products = data.get("products", []) if isinstance(data, dict) else data
+        yield from products
+        return
+
+    try:
+        with _open_text(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Pol-zapisana vrstica (crash)
+                if isinstance(record, dict) and ("_header" in record or "_footer" in record):
+                    continue
+                yield record
+    except EOFError:
+        return  # Odrezan gzip (crash med pisanjem)
+
+
+def read_progress_meta(path: Path) -> dict:
+    """Header + footer (če obstaja) brez branja izdelkov v spomin"""
+    path = Path(path)
+    meta = {}
+    if path.suffix == ".json":
+        return meta
+    try:
+        with _open_text(path) as f:
+            for line in f:
+                if '"_header"' in line or '"_footer"' in line:
+                    try:
+                        meta.update(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+    except EOFError:
+        pass
+    return meta
+
+
+def find_progress_files(directory: Path, store: str = None) -> List[Path]:
+    """Vse progress datoteke (JSONL, JSONL.gz, legacy JSON), najnovejše zadnje"""
+    directory = Path(directory)
+    prefix = f"{store.lower()}_" if store else ""
+    files = []
+    for pattern in PROGRESS_PATTERNS:
+        files.extend(directory.glob(prefix + pattern))
+    return sorted(set(files), key=lambda p: p.stat().st_mtime)
+
+
+def progress_store(path: Path) -> Optional[str]:
+    """Trgovina iz imena datoteke (spar_20260101_120000.jsonl.gz -> spar)"""
+    parts = Path(path).name.split("_")
+    return parts[0].lower() if len(parts) >= 2 else None
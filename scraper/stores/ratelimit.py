@@ -0,0 +1,122 @@
+"""
+AIMD RATE CONTROLLER
+====================
+En token bucket na host trgovine - deli si ga vsi pagei in workerji v procesu.
+
+- acquire(): navigacija / scroll korak vzame žeton (čaka samo kolikor zahteva hitrost)
+- on_success(): hiter 2xx -> hitrost += INCREASE (aditivno, največ enkrat na COOLDOWN)
+- on_backoff(): 429 / 5xx / počasen odziv / health check -> hitrost *= DECREASE
+- Hitrost se tako sama dvigne do tega kar stran prenese in pade ko začne zavračati
+"""
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class RateController:
+    """AIMD token bucket (thread-safe)"""
+
+    COOLDOWN = 1.0  # sekund med dvema prilagoditvama v isto smer
+
+    def __init__(self, host: str, rate: float = 1.0, min_rate: float = 0.2, max_rate: float = 5.0,
+                 increase: float = 0.1, decrease: float = 0.5, burst: float = 2.0,
+                 slow_seconds: float = 3.0):
+        self.host = host
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.burst = burst
+        self.slow_seconds = slow_seconds
+
+        self.lock = threading.Lock()
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.last_increase = 0.0
+        self.last_decrease = 0.0
+
+        self.acquired = 0
+        self.waited = 0.0
+        self.increases = 0
+        self.decreases = 0
+        self.last_backoff_reason = ""
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Vzemi žeton (blokira dokler ni na voljo) - vrne čas čakanja"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    self.acquired += 1
+                    self.waited += waited
+                    return waited
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def on_success(self, seconds: Optional[float] = None):
+        """Uspešen odziv - aditivno povečaj (počasen odziv šteje kot backoff)"""
+        if seconds is not None and seconds > self.slow_seconds:
+            self.on_backoff(f"počasen odziv {seconds:.1f}s")
+            return
+        with self.lock:
+            now = time.monotonic()
+            if now - self.last_increase < self.COOLDOWN or self.rate >= self.max_rate:
+                return
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            self.last_increase = now
+            self.increases += 1
+
+    def on_backoff(self, reason: str = ""):
+        """429 / 5xx / počasno / health check - multiplikativno zmanjšaj in izprazni bucket"""
+        with self.lock:
+            now = time.monotonic()
+            self.last_backoff_reason = reason
+            if now - self.last_decrease < self.COOLDOWN:
+                return  # Ena kazen na val napak
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = min(self.tokens, 0.0)
+            self.last_decrease = now
+            self.last_increase = now  # Po kazni ne dvigujemo takoj
+            self.decreases += 1
+
+    def snapshot(self) -> dict:
+        """Stanje za metrike"""
+        with self.lock:
+            return {
+                "host": self.host,
+                "rate": round(self.rate, 2),
+                "acquired": self.acquired,
+                "waited": round(self.waited, 1),
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "last_backoff": self.last_backoff_reason,
+            }
+
+
+_controllers: Dict[str, RateController] = {}
+_controllers_lock = threading.Lock()
+
+
+def host_key(url: str) -> str:
+    """mercatoronline.si, spar.si ... (brez www. / online.)"""
+    host = urlparse(url).netloc.lower() or url.lower()
+    parts = host.split(".")
+    return ".".join(parts[-2:]) if len(parts) > 2 else host
+
+
+def get_rate_controller(url: str, **settings) -> RateController:
+    """Skupni controller za host (prvi klic določi nastavitve)"""
+    key = host_key(url)
+    with _controllers_lock:
+        controller = _controllers.get(key)
+        if controller is None:
+            controller = RateController(key, **settings)
+            _controllers[key] = controller
+        return controller
@@ -0,0 +1,133 @@
+"""
+SELECTOR STATS
+==============
+Naučeno zaporedje selektorjev na trgovino in polje (tile, name, image ...).
+
+- Vsak uspešen selektor dobi "win", zmagovalec polja se zapomni
+- rank(): zadnji zmagovalec najprej, potem po številu zmag (sicer vrstni red iz kode)
+- Zaporedje se shrani v selectors/{trgovina}.json in velja za naslednji run
+- Ko zgodovinski zmagovalec ne deluje več in zmaga drug selektor -> opozorilo
+  (stran se je spremenila - self-healing pot naj ostane redka)
+
+Zapis:
+    {"fields": {"tile": {"winner": "<CSS>", "wins": {"<CSS>": 123}, "misses": {"<CSS>": 2}}},
+     "updated": <unix čas>}
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# Prvi selektor (v podanem vrstnem redu) z vsaj min_count elementi - en round-trip za vse.
+# Neveljaven CSS (Playwright :has-text, text=...) se preskoči - vrne ga v "invalid".
+RACE_SELECTORS_JS = """
+([selectors, minCount]) => {
+    const invalid = [];
+    for (let i = 0; i < selectors.length; i++) {
+        try {
+            if (document.querySelectorAll(selectors[i]).length >= minCount) return { index: i, invalid };
+        } catch (e) {
+            invalid.push(i);
+        }
+    }
+    return { index: -1, invalid };
+}
+"""
+
+
+class SelectorStats:
+    """Zmage/zgrešitve selektorjev (thread-safe, deli se med workerji trgovine)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.fields: Dict[str, dict] = {}
+        self.dirty = False
+        self._ranked: Dict[tuple, List[str]] = {}
+        self.load()
+        # Zmagovalci prejšnjih runov - za opozorilo ko nehajo delovati
+        self.baseline: Dict[str, str] = {
+            field: data["winner"] for field, data in self.fields.items() if data.get("winner")
+        }
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            fields = data.get("fields") if isinstance(data, dict) else None
+            if isinstance(fields, dict):
+                self.fields = fields
+        except (OSError, ValueError):
+            self.fields = {}
+
+    def save(self) -> Optional[Path]:
+        """Atomski zapis (samo če se je kaj spremenilo)"""
+        with self.lock:
+            if not self.dirty:
+                return None
+            payload = {"fields": self.fields, "updated": time.time()}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        return self.path
+
+    def winner(self, field: str) -> Optional[str]:
+        return self.fields.get(field, {}).get("winner")
+
+    def rank(self, field: str, selectors: List[str]) -> List[str]:
+        """Zmagovalec najprej, potem po zmagah (stabilno - enake ostanejo v vrstnem redu iz kode)"""
+        key = (field, tuple(selectors))
+        ranked = self._ranked.get(key)
+        if ranked is not None:
+            return ranked
+
+        data = self.fields.get(field, {})
+        winner = data.get("winner")
+        wins = data.get("wins", {})
+        ranked = sorted(selectors, key=lambda s: (s != winner, -wins.get(s, 0)))
+        self._ranked[key] = ranked
+        return ranked
+
+    def record_win(self, field: str, selector: str) -> Optional[str]:
+        """Zabeleži zmago - vrne prejšnjega zmagovalca če se je zamenjal"""
+        with self.lock:
+            data = self.fields.setdefault(field, {"winner": None, "wins": {}, "misses": {}})
+            data["wins"][selector] = data["wins"].get(selector, 0) + 1
+            previous = data.get("winner")
+            self.dirty = True
+            if previous == selector:
+                return None
+            data["winner"] = selector
+            self._invalidate(field)
+            return previous
+
+    def record_miss(self, field: str, selector: str):
+        """Selektor (običajno zmagovalec) ni našel ničesar"""
+        with self.lock:
+            data = self.fields.setdefault(field, {"winner": None, "wins": {}, "misses": {}})
+            data["misses"][selector] = data["misses"].get(selector, 0) + 1
+            self.dirty = True
+
+    def _invalidate(self, field: str):
+        for key in [k for k in self._ranked if k[0] == field]:
+            del self._ranked[key]
+
+
+_stats: Dict[str, SelectorStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_selector_stats(store: str, path: Path) -> SelectorStats:
+    """Skupna statistika trgovine v procesu (koordinator + workerji)"""
+    with _stats_lock:
+        stats = _stats.get(store)
+        if stats is None:
+            stats = SelectorStats(path)
+            _stats[store] = stats
+        return stats
@@ -0,0 +1,61 @@
+"""
+STORAGE STATE (seja trgovine)
+=============================
+Piškotki + localStorage po uspešnem consent/izbiri prevzema se shranijo v
+sessions/{trgovina}.json in naložijo v new_context ob naslednjem runu.
+
+- load_storage_state(): poceni preverjanje (starost datoteke, pretečeni piškotki)
+- save_storage_state(): atomski zapis (tmp + replace, tmp na proces IN thread) - več
+  workerjev (threadi istega procesa) hkrati ne pokvari datoteke, zadnji zapis zmaga
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Set
+
+
+def load_storage_state(path: Path, max_age_hours: float = 168.0) -> Optional[dict]:
+    """Shranjena seja ali None če je ni / je prestara / so piškotki potekli"""
+    path = Path(path)
+    try:
+        if not path.exists():
+            return None
+        if time.time() - path.stat().st_mtime > max_age_hours * 3600:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(state, dict) or not state.get("cookies"):
+        return None
+
+    # Vsaj en trajni piškotek mora biti še veljaven
+    if not persistent_cookie_names(state):
+        return None
+    return state
+
+
+def save_storage_state(path: Path, state: dict) -> Path:
+    """Atomski zapis seje"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp, path)
+    return path
+
+
+def persistent_cookie_names(state: dict) -> Set[str]:
+    """Imena trajnih (ne session) piškotkov ki še niso potekli"""
+    now = time.time()
+    names = set()
+    for cookie in state.get("cookies", []):
+        expires = cookie.get("expires", -1)
+        if expires is not None and expires > now:
+            names.add(cookie.get("name"))
+    return names
+
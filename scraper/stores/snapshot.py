@@ -0,0 +1,241 @@
+"""
+SNAPSHOT EKSTRAKCIJA
+====================
+EXTRACTION_MODE = "snapshot": po scrollu EN page.content(), tile-e razčleni lxml.
+
+- Isti surovi format kot BULK_EXTRACT_JS (text, attrs, names, images, flags, groups, lists)
+  -> store parse_tile() in pravila za cene ostanejo ista za vse tri načine
+- CSS selektorji trgovine se enkrat prevedejo v XPath (cssselect) in cachirajo
+- inner_text() posnema innerText (bloki v svoje vrstice, brez script/style)
+- Velike strani (> parallel_min tile-ov) se razdelijo na ProcessPoolExecutor - proces dobi
+  samo HTML fragmente tile-ov svojega chunka (ne cele strani, brez ponovnega razčlenjevanja)
+- Snapshot se lahko arhivira (snapshots/{trgovina}/*.html.gz) in kasneje znova
+  razčleni brez browserja (reparse_snapshots.py)
+"""
+import gzip
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    from cssselect import GenericTranslator, SelectorError
+except ImportError:  # pip install lxml cssselect
+    etree = None
+    lxml_html = None
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "tr", "ul",
+}
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg"}
+ARCHIVE_MARKER = "<!-- prhran-snapshot "  # prva vrstica arhiva: {"url": ..., "category": ...}
+
+_xpaths: Dict[tuple, Optional[object]] = {}
+
+
+def available() -> bool:
+    """Ali sta lxml + cssselect nameščena"""
+    return lxml_html is not None
+
+
+def css_xpath(selector: str, scope: str = "descendant::"):
+    """CSS -> prevedena XPath (cache); None za Playwright-only sintakso (:has-text ...)"""
+    key = (selector, scope)
+    if key not in _xpaths:
+        try:
+            _xpaths[key] = etree.XPath(GenericTranslator().css_to_xpath(selector, prefix=scope))
+        except (SelectorError, etree.XPathSyntaxError, ValueError):
+            _xpaths[key] = None
+    return _xpaths[key]
+
+
+def select_all(root, selector: str, scope: str = "descendant::") -> list:
+    xpath = css_xpath(selector, scope)
+    if xpath is None:
+        return []
+    try:
+        return xpath(root)
+    except etree.XPathError:
+        return []
+
+
+def select_first(root, selector: str):
+    found = select_all(root, selector)
+    return found[0] if found else None
+
+
+def inner_text(node) -> str:
+    """Približek innerText: blok elementi v svojih vrsticah, brez script/style"""
+    parts: List[str] = []
+
+    def walk(el):
+        tag = el.tag if isinstance(el.tag, str) else ""
+        if tag in SKIP_TAGS:
+            return
+        block = tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    walk(node)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def describe(node) -> Optional[dict]:
+    if node is None:
+        return None
+    return {
+        "tag": node.tag.upper() if isinstance(node.tag, str) else "",
+        "text": inner_text(node),
+        "title": node.get("title"),
+        "alt": node.get("alt"),
+        "cls": node.get("class") or "",
+    }
+
+
+def extract_tile(el, spec: dict) -> dict:
+    """En tile -> surov dict (kot BULK_EXTRACT_JS)"""
+    image_attrs = spec.get("image_attrs") or []
+
+    def image(node):
+        return None if node is None else {a: node.get(a) for a in image_attrs}
+
+    return {
+        "text": inner_text(el),
+        "attrs": {a: el.get(a) for a in spec.get("attrs") or []},
+        "names": [describe(select_first(el, s)) for s in spec.get("names") or []],
+        "images": [image(select_first(el, s)) for s in spec.get("images") or []],
+        "flags": {s: select_first(el, s) is not None for s in spec.get("flags") or []},
+        "groups": {
+            key: [describe(select_first(el, s)) for s in sels]
+            for key, sels in (spec.get("groups") or {}).items()
+        },
+        "lists": {
+            key: [[describe(n) for n in select_all(el, s)] for s in sels]
+            for key, sels in (spec.get("lists") or {}).items()
+        },
+    }
+
+
+def parse_document(html: str):
+    return lxml_html.document_fromstring(html) if html else None
+
+
+def find_tiles(doc, selector: str) -> list:
+    return select_all(doc, selector, "descendant-or-self::") if doc is not None else []
+
+
+def tile_fragments(tiles: list) -> List[str]:
+    """HTML tile-ov (brez tail teksta) - za worker proces namesto cele strani"""
+    return [etree.tostring(el, encoding="unicode", method="html", with_tail=False) for el in tiles]
+
+
+def extract_fragments(fragments: List[str], spec: dict) -> List[dict]:
+    """Surovi tile-i iz HTML fragmentov (selektorji so relativni na tile - predniki niso potrebni)"""
+    return [extract_tile(lxml_html.fragment_fromstring(fragment), spec) for fragment in fragments]
+
+
+def _extract_chunk(args) -> List[dict]:
+    fragments, spec = args
+    return extract_fragments(fragments, spec)
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()  # Category workerji (threadi) kličejo hkrati
+
+
+def get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """Skupen process pool za razčlenjevanje (ustvari se ob prvi veliki strani)"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_parse_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+class PageSnapshot:
+    """En page.content() + lxml dokument (tile-i po selektorju se štejejo iz istega drevesa)"""
+
+    def __init__(self, html: str, url: str = "", category: str = ""):
+        self.html = html
+        self.url = url
+        self.category = category
+        self.doc = parse_document(html)
+        self._tiles: Dict[str, list] = {}
+
+    def tiles(self, selector: str) -> list:
+        if selector not in self._tiles:
+            self._tiles[selector] = find_tiles(self.doc, selector)
+        return self._tiles[selector]
+
+    def extract(self, selector: str, spec: dict, workers: int = 1, parallel_min: int = 400) -> List[dict]:
+        """Surovi dict-i vseh tile-ov (velike strani razdeljene med procese)"""
+        tiles = self.tiles(selector)
+        if workers <= 1 or len(tiles) < parallel_min:
+            return [extract_tile(el, spec) for el in tiles]
+
+        size = -(-len(tiles) // workers)
+        jobs = [(tile_fragments(tiles[start:start + size]), spec) for start in range(0, len(tiles), size)]
+        try:
+            results = list(get_parse_pool(workers).map(_extract_chunk, jobs))
+        except Exception:
+            # Pool ni na voljo (npr. omejeno okolje) - v tem procesu
+            return [extract_tile(el, spec) for el in tiles]
+        return [raw for chunk in results for raw in chunk]
+
+    def archive(self, path: Path) -> Path:
+        """Shrani HTML (gzip) za kasnejše razčlenjevanje brez browserja"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = json.dumps({"url": self.url, "category": self.category}, ensure_ascii=False)
+        meta = meta.replace("-", "\\u002d")  # "--" ne sme v HTML komentar
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(f"{ARCHIVE_MARKER}{meta} -->\n")
+            f.write(self.html)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "PageSnapshot":
+        """Arhiviran snapshot (.html ali .html.gz)"""
+        path = Path(path)
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            html = f.read()
+        meta = {}
+        if html.startswith(ARCHIVE_MARKER):
+            first, _, html = html.partition("\n")
+            try:
+                meta = json.loads(first[len(ARCHIVE_MARKER):-len(" -->")])
+            except ValueError:
+                meta = {}
+        return cls(html, meta.get("url", ""), meta.get("category", ""))
+
+
+def default_workers() -> int:
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
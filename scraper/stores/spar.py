@@ -3,11 +3,10 @@ BULLETPROOF SPAR Scraper
 https://www.spar.si/online/
 
 NAVIGACIJA:
-1. Klikni "Kategorije" gumb (levo zgoraj)
-2. Hover na glavno kategorijo (npr. "SADJE IN ZELENJAVA")
-3. Pojavi se podmeni - klikni "Poglejte vse izdelke"
-4. Scroll + paginacija (puščica desno) dokler ni vseh izdelkov
-5. Ponovi za vsako kategorijo
+1. Direkten URL kategorije (CATEGORY_URLS), meni "Kategorije" + hover samo kot fallback
+2. Zadnja stran se prebere iz paginacije (brez klikanja puščice)
+3. Strani 2..N po URL-ju (?page=N) v PARALLEL_PAGES hkratnih tabih
+4. Ponovi za vsako kategorijo (serijsko ali s category workerji)
 
 BULLETPROOF FEATURES:
 - Retry z exponential backoff
@@ -18,16 +17,44 @@ BULLETPROOF FEATURES:
 """
 import re
 import time
-from typing import Optional
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from playwright.sync_api import Page, ElementHandle
 
-from .base import BulletproofScraper
+from .base import BulletproofScraper, ScraperError
+from .product import Product
+from .prices import SPAR_PRICE_RULES, parse_price_pair
+from .capture import ResponseCapture
+from .delta import FINGERPRINT_JS
+from .popups import COOKIE_POPUP_RULES, PopupGuard
+
+
+# Zadnja stran iz paginacije (ant-design elementi + linki s ?page=N)
+PAGINATION_JS = """
+(param) => {
+    let last = 0;
+    const numbers = document.querySelectorAll(
+        '.ant-pagination-item, [class*="pagination"] li, [class*="pagination"] a, [class*="pagination"] button'
+    );
+    for (const el of numbers) {
+        const text = (el.getAttribute('title') || el.textContent || '').trim();
+        if (/^\\d+$/.test(text)) last = Math.max(last, parseInt(text, 10));
+    }
+    const re = new RegExp('[?&]' + param + '=(\\\\d+)');
+    for (const a of document.querySelectorAll('a[href*="' + param + '="]')) {
+        const m = (a.getAttribute('href') || '').match(re);
+        if (m) last = Math.max(last, parseInt(m[1], 10));
+    }
+    return last;
+}
+"""
 
 
 class SparScraper(BulletproofScraper):
     """BULLETPROOF Scraper za SPAR Slovenija"""
 
     STORE_NAME = "Spar"
+    PRICE_RULES = SPAR_PRICE_RULES
     BASE_URL = "https://www.spar.si"
     ONLINE_URL = "https://www.spar.si/online"
 
@@ -52,6 +79,12 @@ class SparScraper(BulletproofScraper):
     # Glavne kategorije
     MAIN_CATEGORIES = list(CATEGORY_URLS.keys())
 
+    # Paginacija po URL-ju: ?page=N (preveri v DevTools ob spremembah)
+    PAGE_PARAM = "page"
+    FIRST_PAGE = 1
+    PARALLEL_PAGES = 3  # hkratnih tabov na kategorijo (politeness)
+    MAX_PAGES = 50
+
     # BULLETPROOF selektorji - več možnosti za vsak element
     PRODUCT_SELECTORS = [
         '[data-testid*="product"]',
@@ -98,8 +131,49 @@ class SparScraper(BulletproofScraper):
         '[class*="Price"]',
     ]
 
-    def __init__(self, page: Page):
-        super().__init__(page)
+    # CSS elementi za popust
+    DISCOUNT_SELECTORS = [
+        '[class*="discount"]',
+        '[class*="Discount"]',
+        '[class*="sale"]',
+        '[class*="Sale"]',
+        '[class*="promo"]',
+        '[class*="action"]',
+        '[class*="badge"]',
+        'del', 's', 'strike',
+        '[class*="old-price"]',
+        '[class*="oldPrice"]',
+    ]
+
+    # Popup guard: 18+ potrditev (PRVA - ne zapri je z X!), potem drawer za prevzem
+    POPUP_RULES = COOKIE_POPUP_RULES + [
+        {
+            "name": "age_gate",
+            "selector": '.ant-modal button, [role="dialog"] button, [class*="modal"] button',
+            "text": ["da, potrjujem", "potrjujem"],
+        },
+        {
+            "name": "delivery",
+            "selector": '.ant-drawer-open .ant-drawer-close, .ant-drawer-open [class*="ant-drawer"] .anticon-close',
+        },
+    ]
+
+    # Network capture: SPAR online bere izdelke iz FactFinder search/navigation API
+    # (preveri v DevTools ob spremembah)
+    API_URL_PATTERNS = [
+        r"fact-finder/rest/v\d+/(search|navigation)",
+        r"/api/.*products",
+    ]
+    API_FIELDS = {
+        "name": ["masterValues.title", "masterValues.name", "name", "title"],
+        "price": ["masterValues.price", "price", "currentPrice"],
+        "regular_price": ["masterValues.regular-price", "masterValues.old-price", "regularPrice", "oldPrice"],
+        "image": ["masterValues.image-url", "masterValues.imageUrl", "image", "imageUrl"],
+        "category": ["masterValues.category-name", "categoryName", "category"],
+    }
+
+    def __init__(self, page: Page, **kwargs):
+        super().__init__(page, **kwargs)
         self.current_category = ""
 
     # ==================== NAVIGATION ====================
@@ -225,10 +299,15 @@ class SparScraper(BulletproofScraper):
 
     def wait_and_dismiss_popups(self, wait_time: float = 2.0):
         """Počakaj in zapri vse popup-e ki se pojavijo"""
-        # Počakaj da se popup-i naložijo
-        time.sleep(wait_time)
-        # Zapri vse popup-e
-        self.dismiss_popups()
+        with self.timed("popup"):
+            if self.popups_handled():
+                # 18+ in drawer zapre popup guard ob pojavu (ali pa je seja obnovljena) - brez čakanja
+                self.close_popups()
+                return
+            # Počakaj da se popup-i naložijo
+            time.sleep(wait_time)
+            # Zapri vse popup-e
+            self.dismiss_popups()
 
     def dismiss_age_popup(self) -> bool:
         """Zapri vse popup-e (wrapper)"""
@@ -435,43 +514,12 @@ class SparScraper(BulletproofScraper):
         self.log(f"Ne morem odpreti kategorije: {category_name}", "ERROR")
         return (False, "")
 
-    def scroll_and_load_all(self):
-        """Scroll do dna strani za lazy loading - AGRESIVNO"""
-        self.log("Scrollam do dna...")
-
-        # Počakaj da se stran stabilizira
-        time.sleep(1)
-
-        # Scrollaj v manjših korakih dokler ne pridemo do dna
-        for i in range(100):  # Max 100 scrollov
-            # Scroll navzdol za 500px
-            self.page.evaluate("window.scrollBy(0, 500)")
-            time.sleep(0.3)
-
-            # Na vsakih 10 scrollov preveri ali smo na dnu
-            if i % 10 == 9:
-                is_at_bottom = self.page.evaluate('''
-                    () => {
-                        const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
-                        const scrollHeight = document.documentElement.scrollHeight;
-                        const clientHeight = document.documentElement.clientHeight;
-                        return scrollTop + clientHeight >= scrollHeight - 100;
-                    }
-                ''')
-                if is_at_bottom:
-                    self.log(f"Prišel do dna po {i+1} scrollih")
-                    break
-
-        # Končni scroll čisto na dno
-        self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(1)
-
-        # Preštej izdelke
-        products = self.page.query_selector_all('[data-testid*="product"]')
-        self.log(f"Po scrollu: {len(products)} izdelkov na strani")
+    def scroll_and_load_all(self, max_scrolls: int = 30):
+        """Stran je paginirana - scroll samo za lazy slike/tile (skupni scroll engine)"""
+        self.scroll_until_settled(max_scrolls=max_scrolls)
 
     def go_to_next_page(self) -> bool:
-        """Klikni puščico naprej za naslednjo stran"""
+        """Klikni puščico naprej za naslednjo stran (ročno/debug - scraper gre po URL-jih)"""
         # SPAR specifični selektorji za paginacijo (ant-design)
         pagination_selectors = [
             # Ant design pagination
@@ -515,42 +563,34 @@ class SparScraper(BulletproofScraper):
 
     # ==================== DATA EXTRACTION ====================
 
-    def has_discount_badge(self, element: ElementHandle) -> bool:
-        """Preveri ali ima izdelek oznako popusta"""
-        try:
-            text = element.inner_text().lower()
+    def has_discount_text(self, text: str) -> bool:
+        """Preveri ali tekst izdelka nakazuje popust"""
+        text = text.lower()
 
-            # "Prihranek X,XX €"
-            if re.search(r"prihran[ie]k\s*\d+[,.]\d{2}", text, re.I):
-                return True
+        # "Prihranek X,XX €"
+        if re.search(r"prihran[ie]k\s*\d+[,.]\d{2}", text, re.I):
+            return True
 
-            # "Prej X,XX €"
-            if re.search(r"prej\s+\d+[,.]\d{2}", text, re.I):
-                return True
+        # "Prej X,XX €"
+        if re.search(r"prej\s+\d+[,.]\d{2}", text, re.I):
+            return True
 
-            # Procenti (-20%, -15%, itd)
-            if re.search(r"-\s*\d{1,2}\s*%", text):
-                return True
+        # Procenti (-20%, -15%, itd)
+        if re.search(r"-\s*\d{1,2}\s*%", text):
+            return True
+
+        # Besede za akcijo
+        discount_words = ["akcija", "znižano", "popust", "trajno nizka", "super cena", "ugodno"]
+        return any(w in text for w in discount_words)
 
-            # Besede za akcijo
-            discount_words = ["akcija", "znižano", "popust", "trajno nizka", "super cena", "ugodno"]
-            if any(w in text for w in discount_words):
+    def has_discount_badge(self, element: ElementHandle) -> bool:
+        """Preveri ali ima izdelek oznako popusta"""
+        try:
+            if self.has_discount_text(element.inner_text()):
                 return True
 
             # CSS elementi za popust
-            discount_selectors = [
-                '[class*="discount"]',
-                '[class*="Discount"]',
-                '[class*="sale"]',
-                '[class*="Sale"]',
-                '[class*="promo"]',
-                '[class*="action"]',
-                '[class*="badge"]',
-                'del', 's', 'strike',
-                '[class*="old-price"]',
-                '[class*="oldPrice"]',
-            ]
-            for sel in discount_selectors:
+            for sel in self.DISCOUNT_SELECTORS:
                 el = element.query_selector(sel)
                 if el:
                     return True
@@ -559,20 +599,42 @@ class SparScraper(BulletproofScraper):
         except:
             return False
 
-    def extract_product_data(self, element: ElementHandle, category: str = "") -> Optional[dict]:
+    def parse_prices(self, text: str, has_discount: bool) -> Tuple[Optional[float], Optional[float]]:
         """
-        BULLETPROOF ekstrakcija podatkov izdelka.
+        SPAR cene iz teksta tile-a - vrne (redna, akcijska).
 
-        SPAR SPECIFIČNO (iz content.js):
         - "Prej X,XX €" = stara/redna cena
         - Ignorira "Prihranek X,XX €" (to je prihranek, NE cena!)
         - Ignorira PC kode (PC30:1,39 €)
-        - Ignorira cene na enoto (/kg, /kos, /l)
+        - Ignorira cene na enoto (/kg, /kos, /l, "kg za X,XX €") in teže (0,15 kg)
+        - Več cen + popust: najvišja = redna, najnižja = akcijska (SPAR_PRICE_RULES)
+        """
+        return parse_price_pair(text, self.price_rules, has_discount)
+
+    def build_product(self, name: str, regular_price: float, sale_price: float, image: str,
+                      category: str, url: str) -> Product:
+        """Sestavi SPAR izdelek"""
+        return Product(
+            ime=name,
+            redna_cena=regular_price,
+            akcijska_cena=sale_price,
+            kategorija=category or self.current_category,
+            enota=self.extract_unit(name),
+            trgovina=self.STORE_NAME,
+            slika=image if image else None,
+            url=url,
+        )
+
+    def extract_product_data(self, element: ElementHandle, category: str = "") -> Optional[dict]:
+        """
+        BULLETPROOF ekstrakcija podatkov izdelka.
+
+        SPAR SPECIFIČNO (iz content.js) - glej parse_prices()
         """
         try:
             # ===== IME =====
             name = ""
-            for selector in self.NAME_SELECTORS:
+            for selector in self.rank_selectors("name", self.NAME_SELECTORS):
                 try:
                     el = element.query_selector(selector)
                     if el:
@@ -581,12 +643,10 @@ class SparScraper(BulletproofScraper):
                         if not name:
                             name = el.inner_text()
 
-                        name = re.sub(r"\s+", " ", name).strip()
-
-                        # Odstrani ceno iz imena če je
-                        name = re.sub(r"\d+[,.]\d{2}\s*€.*", "", name).strip()
+                        name = self.clean_name(name)
 
                         if self.is_valid_name(name):
+                            self.record_selector("name", selector)
                             break
                         else:
                             name = ""
@@ -600,122 +660,86 @@ class SparScraper(BulletproofScraper):
             text = element.inner_text()
             has_discount = self.has_discount_badge(element)
 
-            regular_price = None
-            sale_price = None
-
-            # 1. "Prej X,XX €" = stara/redna cena
-            prej_match = re.search(r"prej\s+([\d]+)[,.](\d{2})\s*€?", text, re.I)
-            if prej_match:
-                regular_price = float(f"{prej_match.group(1)}.{prej_match.group(2)}")
-
-            # 2. Očisti tekst - odstrani vse kar NI glavna cena
-            clean = text
-
-            # Odstrani "Prej X,XX €"
-            clean = re.sub(r"prej\s+\d+[,.]\d{2}\s*€?", " ", clean, flags=re.I)
-
-            # Odstrani "Prihranek X,XX €" (to je prihranek, NE cena!)
-            clean = re.sub(r"prihran[ie]k\s+\d+[,.]\d{2}\s*€?", " ", clean, flags=re.I)
-
-            # Odstrani PC kode in njihove cene (PC30:1,39 €, PC20 2,49€)
-            clean = re.sub(r"PC\d+\s*:?\s*\d+[,.]\d{2}\s*€?", " ", clean, flags=re.I)
-
-            # Odstrani cene na enoto
-            clean = re.sub(r"\d+[,.]\d{2}\s*€?\s*/\s*\d*\s*(kg|kos|kom|l|ml|g|m)\b", " ", clean, flags=re.I)
-            clean = re.sub(r"(kg|kos|kom|l)\s+za\s+\d+[,.]\d{2}\s*€?", " ", clean, flags=re.I)
-            clean = re.sub(r"za\s+\d+[,.]\d{2}\s*€?\s*/?k?g", " ", clean, flags=re.I)
-
-            # Odstrani teže (0.15KG, 500g, 1.5L, itd)
-            clean = re.sub(r"\d+[,.]\d*\s*k?g\b", " ", clean, flags=re.I)
-            clean = re.sub(r"\d+\s*g\b", " ", clean, flags=re.I)
-            clean = re.sub(r"\d+[,.]\d*\s*m?l\b", " ", clean, flags=re.I)
-
-            # 3. Najdi preostale cene
-            prices = []
-            for m in re.finditer(r"(\d+)[,.](\d{2})\s*€?", clean):
-                val = float(f"{m.group(1)}.{m.group(2)}")
-                if self.is_valid_price(val) and val not in prices:
-                    prices.append(val)
-
-            # 4. Določi katero ceno je katera
-            if regular_price and prices:
-                # Imamo "Prej" ceno (redna), najnižja preostala je akcijska
-                sale_price = min(prices)
-                # Preveri da akcijska ni višja od redne
-                if sale_price >= regular_price:
-                    sale_price = None
-            elif len(prices) == 1:
-                # Samo ena cena - to je redna cena, ni akcije
-                regular_price = prices[0]
-            elif len(prices) >= 2:
-                # Več cen - sortiraj
-                prices.sort()
-                if has_discount:
-                    # IMA AKCIJO: najvišja = redna, najnižja = akcijska
-                    regular_price = max(prices)
-                    sale_price = min(prices)
-                    if sale_price == regular_price:
-                        sale_price = None
-                else:
-                    # Ni akcije - vzemi najnižjo kot redno
-                    regular_price = min(prices)
+            regular_price, sale_price = self.parse_prices(text, has_discount)
 
             if not regular_price and not sale_price:
                 return None
 
             # ===== SLIKA =====
             image = ""
-            for selector in self.IMAGE_SELECTORS:
+            for selector in self.rank_selectors("image", self.IMAGE_SELECTORS):
                 try:
                     img = element.query_selector(selector)
                     if img:
-                        src = (
-                            img.get_attribute("data-src") or
-                            img.get_attribute("data-lazy-src") or
-                            img.get_attribute("src") or
-                            ""
-                        )
-
-                        if src and not src.startswith("data:"):
-                            if src.startswith("//"):
-                                src = f"https:{src}"
-                            elif src.startswith("/"):
-                                src = f"{self.BASE_URL}{src}"
-
-                            if self.is_valid_image_url(src):
-                                image = src
-                                break
+                        image = self.resolve_image_src({attr: img.get_attribute(attr) for attr in self.IMAGE_ATTRS})
+                        if image:
+                            self.record_selector("image", selector)
+                            break
                 except:
                     continue
 
-            # ===== ENOTA (iz imena) =====
-            unit_match = re.search(r"(\d+(?:[.,]\d+)?)\s*(kg|g|l|ml|cl|dl|kos|kom)\b", name, re.I)
-            unit = ""
-            if unit_match:
-                unit = f"{unit_match.group(1)}{unit_match.group(2).lower()}"
-
-            return {
-                "ime": name,
-                "redna_cena": regular_price,
-                "akcijska_cena": sale_price,
-                "kategorija": category or self.current_category,
-                "enota": unit,
-                "trgovina": self.STORE_NAME,
-                "slika": image if image else None,
-                "url": self.page.url,
-            }
+            return self.build_product(name, regular_price, sale_price, image, category, self.page.url)
 
         except Exception as e:
             self.log(f"Napaka pri ekstrakciji: {e}", "WARNING")
             return None
 
+    # ==================== BULK EXTRACTION ====================
+
+    def get_bulk_spec(self) -> dict:
+        """SPAR: imena, slike in CSS flagi za popust"""
+        spec = super().get_bulk_spec()
+        spec["flags"] = self.DISCOUNT_SELECTORS
+        return spec
+
+    def tile_ends_page(self, raw: dict) -> bool:
+        """Izdelki ki "niso na voljo" so na koncu - preskoči ostale"""
+        text = (raw.get("text") or "").lower()
+        if "ni na voljo" in text or "ni več na voljo" in text:
+            self.log("Najden izdelek ki ni na voljo - preskacem ostale")
+            return True
+        return False
+
+    def parse_tile(self, raw: dict, category: str = "", url: str = "") -> Optional[dict]:
+        """SPAR izdelek iz surovega BULK tile-a - ista logika kot extract_product_data()"""
+        name = ""
+        for candidate in raw.get("names", []):
+            if not candidate:
+                continue
+            name = self.clean_name(candidate.get("title") or candidate.get("text") or "")
+            if self.is_valid_name(name):
+                break
+            name = ""
+
+        if not name:
+            return None
+
+        text = raw.get("text") or ""
+        has_discount = self.has_discount_text(text) or any(raw.get("flags", {}).values())
+
+        regular_price, sale_price = self.parse_prices(text, has_discount)
+        if not regular_price and not sale_price:
+            return None
+
+        image = ""
+        for attrs in raw.get("images", []):
+            image = self.resolve_image_src(attrs)
+            if image:
+                break
+
+        return self.build_product(name, regular_price, sale_price, image, category, url or self.page.url)
+
     def scrape_current_page(self, category: str) -> list[dict]:
         """Scrapaj vse izdelke na trenutni strani"""
+        if self.EXTRACTION_MODE in ("bulk", "snapshot"):
+            return self.scrape_current_page_bulk(category)
+
         products = []
         found_unavailable = False
 
-        # Poskusi več selektorjev
-        for selector in self.PRODUCT_SELECTORS:
+        # Poskusi več selektorjev (naučen zmagovalec najprej)
+        ranked = self.rank_selectors("tile", self.PRODUCT_SELECTORS)
+        for selector in ranked:
             try:
                 elements = self.page.query_selector_all(selector)
                 if not elements or len(elements) < 3:
@@ -738,6 +762,9 @@ class SparScraper(BulletproofScraper):
                     except Exception as e:
                         continue
 
+                if products:
+                    self.record_selector("tile", selector, ranked)
+
                 if found_unavailable:
                     break
 
@@ -749,12 +776,52 @@ class SparScraper(BulletproofScraper):
 
         # Če smo našli nedostopen izdelek, označimo da je konec te kategorije
         if found_unavailable:
+            self.page_ended = True
             self.log("Konec kategorije - izdelki niso več na voljo")
 
         return products
 
     def scrape_category(self, category_name: str) -> list[dict]:
-        """Scraping ene kategorije - HOVER + KLIK, z URL fallback"""
+        """Scraping ene kategorije (direktni URL, meni samo kot fallback)"""
+        url = self.category_url(category_name)
+        try:
+            return self.scrape_category_task(category_name, url)
+        except ScraperError as e:
+            self.log(str(e), "ERROR")
+            return []
+
+    def category_url(self, category_name: str) -> str:
+        """Poln URL kategorije iz CATEGORY_URLS (prazno če je ni)"""
+        path = self.CATEGORY_URLS.get(category_name.upper(), "")
+        return f"{self.BASE_URL}{path}" if path else ""
+
+    def open_category_from_menu(self, category_name: str) -> bool:
+        """FALLBACK: meni Kategorije -> hover -> 'Poglejte vse izdelke'"""
+        self.log("Direkten URL ne dela - odpiram meni kategorij...", "WARNING")
+        if not self.safe_goto(self.ONLINE_URL):
+            return False
+        try:
+            self.page.evaluate("window.scrollTo(0, 0)")
+            self.page.click('button:has-text("Kategorije")', timeout=5000)
+            time.sleep(1.5)
+            success, url = self.hover_and_click_category(category_name)
+        except Exception as e:
+            self.log(f"Ne najdem gumba Kategorije: {e}", "WARNING")
+            return False
+        if success:
+            return True
+        if url:
+            full_url = url if url.startswith("http") else f"{self.BASE_URL}{url}"
+            return self.safe_goto(full_url)
+        return False
+
+    def scrape_category_task(self, category_name: str, url: str) -> list[dict]:
+        """
+        Ena kategorija (uporablja tudi category worker):
+        1. Stran 1 po direktnem URL-ju, zadnja stran iz paginacije
+        2. Strani 2..N po URL-ju (?page=N) v PARALLEL_PAGES hkratnih tabih
+        ScraperError če se kategorija ne odpre.
+        """
         products = []
         self.current_category = category_name.title()
 
@@ -762,154 +829,224 @@ class SparScraper(BulletproofScraper):
         self.log(f"KATEGORIJA: {category_name}")
         self.log(f"=" * 50)
 
-        category_opened = False
-        category_url_from_menu = ""
+        self.begin_category()
+        opened = bool(url) and self.safe_goto(url, timeout=30000)
+        if not opened:
+            opened = self.open_category_from_menu(category_name)
+        if not opened:
+            raise ScraperError(f"Ne morem odpreti kategorije: {category_name}")
+        url = url or self.page.url
 
-        # Scroll na vrh strani
-        self.page.evaluate("window.scrollTo(0, 0)")
-        time.sleep(0.5)
-
-        # Odpri meni Kategorije
-        self.log("Odpiram meni kategorij...")
-        try:
-            self.page.click('button:has-text("Kategorije")', timeout=5000)
-            time.sleep(1.5)
-
-            # Hover na kategorijo + klik "Pokaži vse izdelke"
-            success, url = self.hover_and_click_category(category_name)
-            if success:
-                category_opened = True
-                if url:
-                    category_url_from_menu = url
-                    self.log(f"Pridobljen URL iz menija: {url}")
-        except Exception as e:
-            self.log(f"Ne najdem gumba Kategorije - poskusam direkten URL: {e}", "WARNING")
-
-        # FALLBACK: Direkten URL za kategorijo
-        if not category_opened:
-            # Najprej poskusi URL ki smo ga dobili iz menija
-            if category_url_from_menu:
-                full_url = category_url_from_menu if category_url_from_menu.startswith("http") else f"{self.BASE_URL}{category_url_from_menu}"
-                self.log(f"Fallback - URL iz menija: {full_url}")
-                if self.safe_goto(full_url, wait_until="networkidle", timeout=30000):
-                    category_opened = True
-                    self.log(f"Odprl kategorijo z URL iz menija: {category_name}", "SUCCESS")
-
-            # Potem poskusi preddefinirani URL
-            if not category_opened and category_name in self.CATEGORY_URLS:
-                category_url = f"{self.BASE_URL}{self.CATEGORY_URLS[category_name]}"
-                self.log(f"Fallback - preddefinirani URL: {category_url}")
-                if self.safe_goto(category_url, wait_until="networkidle", timeout=30000):
-                    category_opened = True
-                    self.log(f"Odprl kategorijo z direktnim URL: {category_name}", "SUCCESS")
-
-        if not category_opened:
-            self.log(f"Ne morem odpreti kategorije: {category_name}", "ERROR")
-            return products
-
-        # POMEMBNO: Počakaj in zapri VSE popup-e (18+, dostava, itd.)
+        # POMEMBNO: Zapri VSE popup-e (18+, dostava, itd.) - guard jih zapre sam
         self.wait_and_dismiss_popups(3.0)
+        self.wait_for_products(self.PRODUCT_SELECTORS[:3], timeout=15000)
+        self.save_session()
+
+        # Delta: prva in zadnja stran enaki kot v prejšnjem runu -> izdelki prejšnjega runa, brez strani 2..N
+        cached = self.reuse_unchanged_category(category_name)
+        if cached is not None:
+            return cached
+
+        last_page = min(self.last_page_number(), self.MAX_PAGES)
+        self.log(f"Strani: {last_page}")
+
+        # Stran 1 (že odprta)
+        self.scroll_and_load_all()
+        first = self.scrape_page_products(self.current_category)
+        products.extend(first)
+        self.metrics.pages_scraped += 1
+        self.log(f"Stran {self.FIRST_PAGE}: {len(first)} izdelkov")
+
+        # Strani 2..N: po PARALLEL_PAGES tabov hkrati
+        numbers = list(range(self.FIRST_PAGE + 1, self.FIRST_PAGE + last_page))
+        failed = []
+        for start in range(0, len(numbers), self.PARALLEL_PAGES):
+            batch = numbers[start:start + self.PARALLEL_PAGES]
+            batch_products, batch_failed, ended = self.scrape_pages_parallel(url, batch)
+            products.extend(batch_products)
+            failed.extend(batch_failed)
+            self.log(f"Strani {batch[0]}-{batch[-1]}: {len(batch_products)} izdelkov (skupaj: {len(products)})")
+
+            # Nedostopni izdelki so na koncu seznama - konec samo ko se je naložena stran res končala
+            # (tile_ends_page ali 0 izdelkov); neuspele strani (tab, napaka) NISO konec kategorije
+            if ended:
+                self.log("Ni novih izdelkov - koncujem")
+                break
 
-        # 3. Počakaj da se izdelki naložijo
-        self.log("Cakam na izdelke...")
-        try:
-            self.page.wait_for_load_state("networkidle", timeout=15000)
-        except:
-            pass
-        time.sleep(2)
+        # Neuspele strani še enkrat (po PARALLEL_PAGES), potem zabeleži
+        if failed:
+            self.log(f"Ponavljam neuspele strani: {failed}", "WARNING")
+            still_failed = []
+            for start in range(0, len(failed), self.PARALLEL_PAGES):
+                retried, retry_failed, _ = self.scrape_pages_parallel(url, failed[start:start + self.PARALLEL_PAGES])
+                products.extend(retried)
+                still_failed.extend(retry_failed)
+            if still_failed:
+                self.metrics.pages_failed += len(still_failed)
+                self.category_fingerprint = None  # Nepopolna kategorija ne gre v delta zapis
+                self.log(f"{category_name}: strani {still_failed} niso prebrane", "ERROR")
 
-        # Scrapaj vse strani
-        page_num = 1
-        max_pages = 50
+        self.log(f"{category_name}: KONČANO - {len(products)} izdelkov", "SUCCESS")
+        return products
 
-        while page_num <= max_pages:
-            self.log(f"Stran {page_num}...")
+    # ==================== URL PAGINATION ====================
 
-            # Scroll za lazy loading
-            self.scroll_and_load_all()
+    def page_url(self, url: str, number: int) -> str:
+        """URL strani kategorije (?page=N, ostali parametri ostanejo)"""
+        parts = urlsplit(url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != self.PAGE_PARAM]
+        if number != self.FIRST_PAGE:
+            query.append((self.PAGE_PARAM, str(number)))
+        return urlunsplit(parts._replace(query=urlencode(query)))
 
-            # Preveri ali so izdelki "ni na voljo"
-            page_text = self.page.inner_text("body").lower()
-            if "ni na voljo" in page_text and page_num > 1:
-                # Preveri koliko izdelkov ni na voljo
-                unavailable_count = page_text.count("ni na voljo")
-                if unavailable_count > 5:
-                    self.log(f"Najdenih {unavailable_count} nedostopnih izdelkov - koncujem kategorijo")
-                    break
+    def last_page_number(self) -> int:
+        """Število strani iz paginacije (en evaluate, brez klikanja) - 1 če je ni"""
+        try:
+            pages = self.page.evaluate(PAGINATION_JS, self.PAGE_PARAM) or 0
+        except Exception as e:
+            self.log(f"Paginacija ni prebrana: {e}", "DEBUG")
+            return 1
+        return max(1, pages)
 
-            # Scrapaj izdelke
-            page_products = self.scrape_current_page(self.current_category)
-            products.extend(page_products)
+    def open_page_tab(self, url: str):
+        """
+        Nov tab v istem contextu (seja, piškotki) - goto samo do 'commit',
+        tako da se strani batcha nalagajo hkrati. Vrne (tab, capture) ali (None, None).
+        """
+        tab = None
+        try:
+            tab = self.page.context.new_page()
+            if self.AUTO_DISMISS_POPUPS:
+                PopupGuard(tab, self.POPUP_RULES, self._on_popup_dismissed, self.log).install()
+            capture = None
+            if self.CAPTURE_API_RESPONSES and self.API_URL_PATTERNS:
+                capture = ResponseCapture(tab, self.API_URL_PATTERNS, self.log)
+                capture.attach()
+            with self.timed("navigate"):
+                self.throttle()
+                tab.goto(url, wait_until="commit", timeout=30000)
+            return tab, capture
+        except Exception as e:
+            self.log(f"Tab ni odprt ({url}): {e}", "WARNING")
+            self.metrics.errors += 1
+            if tab:
+                try:
+                    tab.close()
+                except:
+                    pass
+            return None, None
 
-            self.log(f"Stran {page_num}: {len(page_products)} izdelkov (skupaj: {len(products)})")
+    def scrape_pages_parallel(self, url: str, numbers: List[int]) -> Tuple[list[dict], List[int], bool]:
+        """
+        Odpri strani v tabih (hkrati), potem jih obdelaj po vrsti in zapri.
+        Vrne (izdelki, neuspele strani, konec kategorije) - konec = naložena stran brez
+        izdelkov ali tile_ends_page; neuspela stran (tab ni odprt, napaka) ni konec.
+        """
+        tabs = [self.open_page_tab(self.page_url(url, number)) for number in numbers]
 
-            # Ce ni bilo novih izdelkov, konec
-            if len(page_products) == 0:
-                self.log("Ni novih izdelkov - koncujem")
-                break
+        products = []
+        failed = []
+        ended = False
+        main_page, main_capture = self.page, self.capture
+        for number, (tab, capture) in zip(numbers, tabs):
+            if tab is None:
+                failed.append(number)
+                continue
+            try:
+                # Scroll/ekstrakcija iz base delata na self.page - začasno tab
+                self.page, self.capture = tab, capture
+                self.api_category_products = []
+                self.api_done = False
+                try:
+                    tab.wait_for_load_state("domcontentloaded", timeout=30000)
+                except:
+                    pass
+                if not self.wait_for_products(self.PRODUCT_SELECTORS[:3], timeout=15000):
+                    # Brez tile-ov (stran se ni izrisala) - neuspela stran, ne konec kategorije
+                    self.log(f"Stran {number}: ni tile-ov", "WARNING")
+                    failed.append(number)
+                    continue
+                self.scroll_and_load_all()
+                self.page_ended = False
+                page_products = self.scrape_page_products(self.current_category)
+                products.extend(page_products)
+                self.metrics.pages_scraped += 1
+                ended = ended or self.page_ended or not page_products
+                self.log(f"Stran {number}: {len(page_products)} izdelkov", "DEBUG")
+            except Exception as e:
+                self.log(f"Stran {number} napaka: {e}", "WARNING")
+                self.metrics.errors += 1
+                failed.append(number)
+            finally:
+                self.page, self.capture = main_page, main_capture
+                if capture:
+                    capture.detach()
+                try:
+                    tab.close()
+                except:
+                    pass
 
-            # Pojdi na naslednjo stran
-            if not self.go_to_next_page():
-                self.log("Ni več strani")
-                break
+        self.api_category_products = []
+        return products, failed, ended
 
-            page_num += 1
+    def category_tail_sample(self) -> Optional[List[str]]:
+        """
+        Delta: vsi tile-i zadnje strani (en tab, en evaluate) + njena številka -
+        sprememba na koncu kategorije ali v številu strani spremeni fingerprint.
+        """
+        last_page = min(self.last_page_number(), self.MAX_PAGES)
+        if last_page <= 1:
+            return []  # Ena stran - fingerprint prve strani pokrije celo kategorijo
+        number = self.FIRST_PAGE + last_page - 1
 
+        tab, capture = self.open_page_tab(self.page_url(self.page.url, number))
+        if tab is None:
+            return None
+        main_page = self.page
+        try:
+            self.page = tab
+            tab.wait_for_load_state("domcontentloaded", timeout=30000)
+            self.wait_for_products(self.PRODUCT_SELECTORS[:3], timeout=15000)
+            last = tab.evaluate(FINGERPRINT_JS, [list(self.PRODUCT_SELECTORS), 1000]) or {}
+        except Exception as e:
+            self.log(f"Delta: zadnja stran {number} ni prebrana: {e}", "DEBUG")
+            return None
+        finally:
+            self.page = main_page
+            if capture:
+                capture.detach()
             try:
-                self.page.wait_for_load_state("networkidle", timeout=10000)
+                tab.close()
             except:
                 pass
 
-            # POMEMBNO: Počakaj in zapri VSE popup-e (18+, dostava, itd.)
-            self.wait_and_dismiss_popups(2.0)
-
-            self.random_delay(0.5, 1.0)
-
-        self.log(f"{category_name}: KONČANO - {len(products)} izdelkov", "SUCCESS")
-        return products
+        tiles = last.get("tiles") or []
+        return [f"page:{number}"] + tiles if tiles else None
 
     def scrape_all(self) -> list[dict]:
-        """Scraping vseh kategorij"""
+        """Scraping vseh kategorij (direktni URL-ji, serijsko ali z več workerji)"""
         self.start()
 
         # 1. Odpri SPAR online
         self.log(f"Odpiranje: {self.ONLINE_URL}")
-        if not self.safe_goto(self.ONLINE_URL, wait_until="networkidle", timeout=30000):
+        if not self.safe_goto(self.ONLINE_URL, timeout=30000):
             self.log("Ne morem odpreti SPAR!", "ERROR")
             return []
 
         # 2. Sprejmi piskotke
         self.log("Sprejemam piskotke...")
         self.accept_cookies()
-        time.sleep(1)
+        if not self.popups_handled():
+            time.sleep(1)
 
         # 3. Počakaj in zapri vse popup-e (18+, dostava, itd.)
         self.wait_and_dismiss_popups(3.0)
+        self.save_session()
 
         self.log(f"Kategorij: {len(self.MAIN_CATEGORIES)}")
 
-        # 3. Scrapaj vsako kategorijo
-        for i, category_name in enumerate(self.MAIN_CATEGORIES):
-            self.log(f"\n[{i+1}/{len(self.MAIN_CATEGORIES)}] {category_name}")
-
-            try:
-                products = self.scrape_category(category_name)
-                self.random_delay(1.0, 2.0)
-
-                # Vrni se na glavno stran za naslednjo kategorijo
-                self.safe_goto(self.ONLINE_URL, wait_until="networkidle")
-                time.sleep(1)
-
-            except Exception as e:
-                self.log(f"Napaka pri {category_name}: {e}", "ERROR")
-                self.take_screenshot(f"error_{category_name[:20]}", on_error=True)
-                self.metrics.errors += 1
-
-                # Vrni se na glavno stran
-                try:
-                    self.safe_goto(self.ONLINE_URL)
-                except:
-                    pass
+        # 4. Scrapaj vsako kategorijo
+        self.scrape_categories([(name, self.category_url(name)) for name in self.MAIN_CATEGORIES])
 
         self.finish()
         return self.products
@@ -0,0 +1,170 @@
+"""
+PHASE TIMINGS
+=============
+Histogrami trajanja po fazah (navigate, popup, scroll, extract, validate, dedupe, persist)
+za vsako trgovino in kategorijo.
+
+    with scraper.timed("scroll"):
+        ...
+
+- observe() je poceni (lock + nekaj seštevkov) - tudi za vsak izdelek (validate/dedupe)
+- Vedra kot Prometheus histogram (kumulativna ob izvozu)
+- Izvoz: JSON (metrics/{trgovina}_{ts}.json) in Prometheus textfile (metrics/prhran_{trgovina}.prom,
+  ali v PRHRAN_PROM_TEXTFILE_DIR za node_exporter textfile collector)
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PHASES = ("navigate", "popup", "scroll", "extract", "validate", "dedupe", "persist")
+
+# Zgornje meje veder v sekundah (+Inf implicitno)
+BUCKETS: Tuple[float, ...] = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class PhaseHistogram:
+    """Histogram ene (trgovina, kategorija, faza)"""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "PhaseHistogram"):
+        for i, value in enumerate(other.counts):
+            self.counts[i] += value
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def cumulative(self) -> List[int]:
+        result, running = [], 0
+        for value in self.counts:
+            running += value
+            result.append(running)
+        return result
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 4),
+            "max": round(self.max, 4),
+            "avg": round(self.total / self.count, 4) if self.count else 0.0,
+            "buckets": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], self.cumulative())),
+        }
+
+
+class PhaseTimings:
+    """Vsi histogrami scraperja (thread-safe, workerji se prištejejo koordinatorju)"""
+
+    def __init__(self, store: str):
+        self.store = store
+        self.lock = threading.Lock()
+        self.histograms: Dict[Tuple[str, str], PhaseHistogram] = {}
+
+    def observe(self, phase: str, seconds: float, category: str = ""):
+        key = (category or "-", phase)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = PhaseHistogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, phase: str, category: str = ""):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start, category)
+
+    def merge(self, other: "PhaseTimings"):
+        with other.lock:
+            items = list(other.histograms.items())
+        with self.lock:
+            for key, histogram in items:
+                mine = self.histograms.get(key)
+                if mine is None:
+                    mine = self.histograms[key] = PhaseHistogram()
+                mine.merge(histogram)
+
+    def phase_totals(self) -> Dict[str, dict]:
+        """Seštevek po fazi (vse kategorije) - za log_stats"""
+        totals: Dict[str, PhaseHistogram] = {}
+        with self.lock:
+            for (category, phase), histogram in self.histograms.items():
+                totals.setdefault(phase, PhaseHistogram()).merge(histogram)
+        order = {phase: i for i, phase in enumerate(PHASES)}
+        return {
+            phase: totals[phase].to_dict()
+            for phase in sorted(totals, key=lambda p: (order.get(p, len(order)), p))
+        }
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            categories: Dict[str, dict] = {}
+            for (category, phase), histogram in sorted(self.histograms.items()):
+                categories.setdefault(category, {})[phase] = histogram.to_dict()
+        return {"store": self.store, "phases": self.phase_totals(), "categories": categories}
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (histogram prhran_phase_seconds)"""
+        lines = [
+            "# HELP prhran_phase_seconds Trajanje faz scrapanja po trgovini, kategoriji in fazi",
+            "# TYPE prhran_phase_seconds histogram",
+        ]
+        with self.lock:
+            items = sorted(self.histograms.items())
+        for (category, phase), histogram in items:
+            labels = f'store="{_escape(self.store)}",category="{_escape(category)}",phase="{phase}"'
+            for bound, value in zip([str(b) for b in BUCKETS] + ["+Inf"], histogram.cumulative()):
+                lines.append(f'prhran_phase_seconds_bucket{{{labels},le="{bound}"}} {value}')
+            lines.append(f"prhran_phase_seconds_sum{{{labels}}} {histogram.total:.6f}")
+            lines.append(f"prhran_phase_seconds_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, json_path: Path, prom_path: Path, extra: dict = None) -> Tuple[Path, Path]:
+        """Atomski zapis JSON + Prometheus textfile"""
+        payload = self.to_dict()
+        payload["exported"] = time.time()
+        if extra:
+            payload.update(extra)
+        _atomic_write(Path(json_path), json.dumps(payload, ensure_ascii=False, indent=1, default=str))
+        _atomic_write(Path(prom_path), self.to_prometheus())
+        return Path(json_path), Path(prom_path)
+
+
+def prometheus_dir(default: Path) -> Path:
+    """PRHRAN_PROM_TEXTFILE_DIR (node_exporter --collector.textfile.directory) ali default"""
+    return Path(os.getenv("PRHRAN_PROM_TEXTFILE_DIR") or default)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def _atomic_write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
@@ -19,19 +19,40 @@ BULLETPROOF FEATURES:
 """
 import re
 import time
-from typing import Optional, List
+from typing import Optional, List, Tuple, Callable
 from playwright.sync_api import Page, ElementHandle
 
-from .base import BulletproofScraper
+from .base import BulletproofScraper, ScraperError
+from .product import Product
+from .prices import TUS_PRICE_RULES, first_amount, parse_price_pair
 
 
 class TusScraper(BulletproofScraper):
     """BULLETPROOF Scraper za Tuš / Hitri Nakup Slovenija"""
 
     STORE_NAME = "Tuš"
+    PRICE_RULES = TUS_PRICE_RULES
     BASE_URL = "https://hitrinakup.com"
     CATEGORIES_URL = "https://hitrinakup.com/kategorije"
 
+    # Category workers (scrape_all) - vsak worker svoj browser, večino časa čaka v scrollu
+    CATEGORY_WORKERS = 4
+    MAX_CATEGORY_WORKERS = 4
+
+    # Scroll engine - hitri nakup je počasen, daljše okno tišine
+    SCROLL_QUIET_WINDOW = 2.0
+    SCROLL_STEP_TIMEOUT = 20.0
+    SCROLL_IDLE_STEPS = 4
+    SCROLL_TILE_SELECTORS = [
+        '[class*="itemCardWrapper"]',
+        '[class*="ItemCard"]',
+        'a[href*="/izdelki/"]',
+    ]
+    LOAD_MORE_SELECTORS = BulletproofScraper.LOAD_MORE_SELECTORS + [
+        '[class*="showMore"]',
+        '[class*="ShowMore"]',
+    ]
+
     # DIREKTNI URL-ji za kategorije - iz sitemap.xml
     # Format: (ime_kategorije, URL)
     CATEGORY_URLS = [
@@ -96,6 +117,55 @@ class TusScraper(BulletproofScraper):
         '[class*="dashedPrice"]',
     ]
 
+    # Prečrtana cena (dashed-price) = REDNA cena (če je akcija)
+    DASHED_PRICE_SELECTORS = [
+        '[class*="dashed-price"]',
+        '[class*="dashedPrice"]',
+        '[class*="DashedPrice"]',
+        '[class*="old-price"]',
+        '[class*="oldPrice"]',
+        '[class*="regular-price"]',
+        '[class*="regularPrice"]',
+        'del', 's', 'strike',
+    ]
+
+    # Zelena cena (green) = AKCIJSKA cena
+    GREEN_PRICE_SELECTORS = [
+        '[class*="green"][class*="price"]',
+        '[class*="Green"][class*="Price"]',
+        '[class*="price-discount"]',
+        '[class*="priceDiscount"]',
+        '[class*="PriceDiscount"]',
+        '[class*="sale-price"]',
+        '[class*="salePrice"]',
+        '[class*="SalePrice"]',
+        '[class*="akcijska"]',
+        '[class*="nova-cena"]',
+    ]
+
+    # Cena ki NI zelena/dashed
+    PLAIN_PRICE_SELECTORS = [
+        '#price',
+        '[id="price"]',
+        '[class*="price"]:not([class*="green"]):not([class*="dashed"]):not([class*="old"])',
+        '[class*="Price"]:not([class*="Green"]):not([class*="Dashed"]):not([class*="Old"])',
+    ]
+
+    # CSS elementi za popust
+    DISCOUNT_SELECTORS = [
+        '[class*="discount"]',
+        '[class*="Discount"]',
+        '[class*="sale"]',
+        '[class*="Sale"]',
+        '[class*="akcij"]',
+        '[class*="promo"]',
+        '[class*="green"][class*="price"]',
+        '[class*="dashed"]',
+        'del', 's', 'strike',
+        '[class*="old"]',
+        '[class*="regular"]',
+    ]
+
     # TUŠ specifični selektorji za slike
     IMAGE_SELECTORS = [
         'img[class*="itemCardThumbnail"]',
@@ -104,10 +174,11 @@ class TusScraper(BulletproofScraper):
         'img[src]',
     ]
 
-    def __init__(self, page: Page):
-        super().__init__(page)
+    def __init__(self, page: Page, **kwargs):
+        super().__init__(page, **kwargs)
         self.current_category = ""
         self.current_subcategory = ""
+        self.cookies_accepted = False
 
     # ==================== NAVIGATION ====================
 
@@ -247,117 +318,36 @@ class TusScraper(BulletproofScraper):
         return False
 
     def scroll_and_load_all(self, max_scrolls: int = 200):
-        """BULLETPROOF infinite scroll za Tuš"""
+        """
+        BULLETPROOF infinite scroll za Tuš - skupni scroll engine.
+        Namesto 3s sleep na korak čakamo na nove tile / končane requeste.
+        """
         self.log("Infinite scroll...")
+        # Dvojni scroll na korak za hitrejše nalaganje
+        self.scroll_until_settled(max_scrolls=max_scrolls, scrolls_per_step=2)
 
-        last_height = self.page.evaluate("document.body.scrollHeight")
-        last_product_count = 0
-        no_change = 0
-        scroll_count = 0
-
-        # Tuš ima infinite scroll - traja da naloži
-        # no_change < 50 = počakaj še dlje (stran se včasih ZELO počasi naloži)
-        while no_change < 50 and scroll_count < max_scrolls:
-            # Scroll dol - večkrat za hitrejše nalaganje
-            self.safe_scroll("down")
-            self.safe_scroll("down")
-            scroll_count += 1
-
-            # Počakaj da se naloži - hitri nakup je počasen
-            time.sleep(3)
-
-            # Poskusi klikniti "Naloži več" / "Več izdelkov"
-            load_more_selectors = [
-                'button[class*="load-more"]',
-                'button[class*="LoadMore"]',
-                'button[class*="loadMore"]',
-                'button[class*="show-more"]',
-                '[class*="loadMore"] button',
-                'button:has-text("Naloži več")',
-                'button:has-text("Prikaži več")',
-                'button:has-text("Več izdelkov")',
-                'a:has-text("Več izdelkov")',
-                'a:has-text("Naloži več")',
-                # Tuš specifični selektorji
-                '[class*="showMore"]',
-                '[class*="ShowMore"]',
-            ]
-
-            for selector in load_more_selectors:
-                try:
-                    btn = self.page.query_selector(selector)
-                    if btn and btn.is_visible():
-                        btn.click()
-                        time.sleep(2)  # Počakaj nalaganje
-                        no_change = 0  # Reset
-                        break
-                except:
-                    continue
-
-            # Preveri ali je nova vsebina
-            new_height = self.page.evaluate("document.body.scrollHeight")
-
-            # Preštej izdelke - uporabi več selektorjev
-            current_products = 0
-            for selector in self.PRODUCT_SELECTORS:
-                try:
-                    els = self.page.query_selector_all(selector)
-                    if els:
-                        current_products = max(current_products, len(els))
-                except:
-                    continue
-            
-            # Tudi preštej a[href*="/izdelki/"] za dodatno verifikacijo
-            try:
-                product_links = self.page.query_selector_all('a[href*="/izdelki/"]')
-                current_products = max(current_products, len(product_links))
-            except:
-                pass
-
-            if new_height == last_height and current_products == last_product_count:
-                no_change += 1
-            else:
-                no_change = 0
-                last_height = new_height
-                last_product_count = current_products
+    # ==================== DATA EXTRACTION ====================
 
-            if scroll_count % 5 == 0:
-                self.log(f"Scroll {scroll_count}: ~{current_products} izdelkov, no_change={no_change}")
+    def has_discount_text(self, text: str) -> bool:
+        """Preveri ali tekst izdelka nakazuje popust"""
+        text = text.lower()
 
-        self.log(f"Scroll končan po {scroll_count} scrollih, končno {last_product_count} izdelkov")
+        # Procenti
+        if re.search(r"-\s*\d{1,2}\s*%", text):
+            return True
 
-    # ==================== DATA EXTRACTION ====================
+        # Besede za akcijo
+        discount_words = ["akcija", "znižano", "popust", "super cena", "ugodno", "prihrani"]
+        return any(w in text for w in discount_words)
 
     def has_discount_badge(self, element: ElementHandle) -> bool:
         """Preveri ali ima izdelek oznako popusta"""
         try:
-            text = element.inner_text().lower()
-
-            # Procenti
-            if re.search(r"-\s*\d{1,2}\s*%", text):
-                return True
-
-            # Besede za akcijo
-            discount_words = ["akcija", "znižano", "popust", "super cena", "ugodno", "prihrani"]
-            if any(w in text for w in discount_words):
+            if self.has_discount_text(element.inner_text()):
                 return True
 
             # CSS elementi
-            discount_selectors = [
-                '[class*="discount"]',
-                '[class*="Discount"]',
-                '[class*="sale"]',
-                '[class*="Sale"]',
-                '[class*="akcij"]',
-                '[class*="promo"]',
-                '[class*="green"][class*="price"]',
-                '[class*="dashed"]',
-                'del', 's', 'strike',
-                '[class*="old"]',
-                '[class*="regular"]',
-            ]
-
-            for sel in discount_selectors:
+            for sel in self.DISCOUNT_SELECTORS:
                 if element.query_selector(sel):
                     return True
 
@@ -365,6 +355,41 @@ class TusScraper(BulletproofScraper):
         except:
             return False
 
+    def first_price(self, text: str) -> Optional[float]:
+        """Prva cena v tekstu elementa"""
+        return first_amount(text)
+
+    def parse_text_prices(self, text: str, has_discount: Callable[[], bool]) -> Tuple[Optional[float], Optional[float]]:
+        """Fallback - generično iskanje cen v celotnem tekstu tile-a (TUS_PRICE_RULES)"""
+        return parse_price_pair(text, self.price_rules, has_discount)
+
+    def build_product(self, name: str, regular_price: Optional[float], sale_price: Optional[float],
+                      image: str, category: str, url: str) -> Optional[Product]:
+        """Sestavi Tuš izdelek (preveri da je akcijska nižja od redne)"""
+        if not regular_price and not sale_price:
+            return None
+
+        # Preveri da je akcijska nižja od redne
+        if regular_price and sale_price and sale_price >= regular_price:
+            # Zamenjaj
+            regular_price, sale_price = sale_price, regular_price
+
+        # ===== KATEGORIJA =====
+        cat = category or self.current_category
+        if self.current_subcategory:
+            cat = f"{self.current_category} > {self.current_subcategory}"
+
+        return Product(
+            ime=name,
+            redna_cena=regular_price,
+            akcijska_cena=sale_price,
+            kategorija=cat,
+            enota=self.extract_unit(name),
+            trgovina=self.STORE_NAME,
+            slika=image if image else None,
+            url=url,
+        )
+
     def extract_product_data(self, element: ElementHandle, category: str = "") -> Optional[dict]:
         """
         BULLETPROOF ekstrakcija podatkov izdelka za Tuš / Hitri Nakup.
@@ -392,7 +417,7 @@ class TusScraper(BulletproofScraper):
 
             # Fallback: itemProductTitle class
             if not name:
-                for selector in self.NAME_SELECTORS:
+                for selector in self.rank_selectors("name", self.NAME_SELECTORS):
                     try:
                         el = element.query_selector(selector)
                         if el:
@@ -402,10 +427,10 @@ class TusScraper(BulletproofScraper):
                             else:
                                 name = el.inner_text()
 
-                            name = re.sub(r"\s+", " ", name).strip()
-                            name = re.sub(r"\d+[,.]\d{2}\s*€.*", "", name).strip()
+                            name = self.clean_name(name)
 
                             if self.is_valid_name(name):
+                                self.record_selector("name", selector)
                                 break
                             else:
                                 name = ""
@@ -420,65 +445,30 @@ class TusScraper(BulletproofScraper):
             sale_price = None
 
             # 1. Prečrtana cena (dashed-price) = REDNA cena (če je akcija)
-            dashed_selectors = [
-                '[class*="dashed-price"]',
-                '[class*="dashedPrice"]',
-                '[class*="DashedPrice"]',
-                '[class*="old-price"]',
-                '[class*="oldPrice"]',
-                '[class*="regular-price"]',
-                '[class*="regularPrice"]',
-                'del', 's', 'strike',
-            ]
-
-            for sel in dashed_selectors:
+            for sel in self.DASHED_PRICE_SELECTORS:
                 try:
                     el = element.query_selector(sel)
                     if el:
-                        text = el.inner_text()
-                        match = re.search(r"(\d+)[,.](\d{2})", text)
-                        if match:
-                            regular_price = float(f"{match.group(1)}.{match.group(2)}")
+                        regular_price = self.first_price(el.inner_text())
+                        if regular_price:
                             break
                 except:
                     continue
 
             # 2. Zelena cena (green) = AKCIJSKA cena
-            green_selectors = [
-                '[class*="green"][class*="price"]',
-                '[class*="Green"][class*="Price"]',
-                '[class*="price-discount"]',
-                '[class*="priceDiscount"]',
-                '[class*="PriceDiscount"]',
-                '[class*="sale-price"]',
-                '[class*="salePrice"]',
-                '[class*="SalePrice"]',
-                '[class*="akcijska"]',
-                '[class*="nova-cena"]',
-            ]
-
-            for sel in green_selectors:
+            for sel in self.GREEN_PRICE_SELECTORS:
                 try:
                     el = element.query_selector(sel)
                     if el:
-                        text = el.inner_text()
-                        match = re.search(r"(\d+)[,.](\d{2})", text)
-                        if match:
-                            sale_price = float(f"{match.group(1)}.{match.group(2)}")
+                        sale_price = self.first_price(el.inner_text())
+                        if sale_price:
                             break
                 except:
                     continue
 
             # 3. Če ni zelene/dashed cene - vzemi #price ki NI zelena/dashed
             if not regular_price and not sale_price:
-                price_selectors = [
-                    '#price',
-                    '[id="price"]',
-                    '[class*="price"]:not([class*="green"]):not([class*="dashed"]):not([class*="old"])',
-                    '[class*="Price"]:not([class*="Green"]):not([class*="Dashed"]):not([class*="Old"])',
-                ]
-
-                for sel in price_selectors:
+                for sel in self.PLAIN_PRICE_SELECTORS:
                     try:
                         els = element.query_selector_all(sel)
                         for el in els:
@@ -487,10 +477,8 @@ class TusScraper(BulletproofScraper):
                             if "green" in class_name or "dashed" in class_name or "old" in class_name:
                                 continue
 
-                            text = el.inner_text()
-                            match = re.search(r"(\d+)[,.](\d{2})", text)
-                            if match:
-                                regular_price = float(f"{match.group(1)}.{match.group(2)}")
+                            regular_price = self.first_price(el.inner_text())
+                            if regular_price:
                                 break
 
                         if regular_price:
@@ -500,83 +488,24 @@ class TusScraper(BulletproofScraper):
 
             # 4. Fallback - generično iskanje cen
             if not regular_price and not sale_price:
-                text = element.inner_text()
-                has_discount = self.has_discount_badge(element)
-
-                # Odstrani cene na enoto
-                clean = re.sub(r"\d+[,.]\d{2}\s*€?\s*/\s*(kg|kos|kom|l|ml|g)\b", " ", text, flags=re.I)
-
-                prices = []
-                for m in re.finditer(r"(\d+)[,.](\d{2})\s*€?", clean):
-                    val = float(f"{m.group(1)}.{m.group(2)}")
-                    if self.is_valid_price(val) and val not in prices:
-                        prices.append(val)
-
-                if prices:
-                    if len(prices) == 1:
-                        regular_price = prices[0]
-                    elif has_discount:
-                        regular_price = max(prices)
-                        sale_price = min(prices)
-                        if sale_price == regular_price:
-                            sale_price = None
-                    else:
-                        regular_price = min(prices)
-
-            if not regular_price and not sale_price:
-                return None
-
-            # Preveri da je akcijska nižja od redne
-            if regular_price and sale_price and sale_price >= regular_price:
-                # Zamenjaj
-                regular_price, sale_price = sale_price, regular_price
+                regular_price, sale_price = self.parse_text_prices(
+                    element.inner_text(), lambda: self.has_discount_badge(element)
+                )
 
             # ===== SLIKA =====
             image = ""
-            for selector in self.IMAGE_SELECTORS:
+            for selector in self.rank_selectors("image", self.IMAGE_SELECTORS):
                 try:
                     img = element.query_selector(selector)
                     if img:
-                        src = (
-                            img.get_attribute("data-src") or
-                            img.get_attribute("data-lazy-src") or
-                            img.get_attribute("src") or
-                            ""
-                        )
-
-                        if src and not src.startswith("data:"):
-                            if src.startswith("//"):
-                                src = f"https:{src}"
-                            elif src.startswith("/"):
-                                src = f"{self.BASE_URL}{src}"
-
-                            if self.is_valid_image_url(src):
-                                image = src
-                                break
+                        image = self.resolve_image_src({attr: img.get_attribute(attr) for attr in self.IMAGE_ATTRS})
+                        if image:
+                            self.record_selector("image", selector)
+                            break
                 except:
                     continue
 
-            # ===== KATEGORIJA =====
-            cat = category or self.current_category
-            if self.current_subcategory:
-                cat = f"{self.current_category} > {self.current_subcategory}"
-
-            # ===== ENOTA (iz imena) =====
-            unit_match = re.search(r"(\d+(?:[.,]\d+)?)\s*(kg|g|l|ml|cl|dl|kos|kom)\b", name, re.I)
-            unit = ""
-            if unit_match:
-                unit = f"{unit_match.group(1)}{unit_match.group(2).lower()}"
-
-            return {
-                "ime": name,
-                "redna_cena": regular_price,
-                "akcijska_cena": sale_price,
-                "kategorija": cat,
-                "enota": unit,
-                "trgovina": self.STORE_NAME,
-                "slika": image if image else None,
-                "url": self.page.url,
-            }
+            return self.build_product(name, regular_price, sale_price, image, category, self.page.url)
 
         except Exception as e:
             self.log(f"Napaka pri ekstrakciji: {e}", "WARNING")
@@ -584,10 +513,14 @@ class TusScraper(BulletproofScraper):
 
     def scrape_current_page(self, category: str = "") -> list[dict]:
         """Scrapaj vse izdelke na trenutni strani"""
+        if self.EXTRACTION_MODE in ("bulk", "snapshot"):
+            return self.scrape_current_page_bulk(category)
+
         products = []
 
-        # Poskusi več selektorjev
-        for selector in self.PRODUCT_SELECTORS:
+        # Poskusi več selektorjev (naučen zmagovalec najprej)
+        ranked = self.rank_selectors("tile", self.PRODUCT_SELECTORS)
+        for selector in ranked:
             try:
                 elements = self.page.query_selector_all(selector)
                 if not elements or len(elements) < 3:
@@ -604,6 +537,7 @@ class TusScraper(BulletproofScraper):
                         continue
 
                 if products:
+                    self.record_selector("tile", selector, ranked)
                     break
 
             except:
@@ -611,6 +545,89 @@ class TusScraper(BulletproofScraper):
 
         return products
 
+    # ==================== BULK EXTRACTION ====================
+
+    def get_bulk_spec(self) -> dict:
+        """Tuš: img[alt] + imena, dashed/green cene, navadne cene s class-i, CSS flagi"""
+        spec = super().get_bulk_spec()
+        spec["names"] = ['img[alt]'] + self.NAME_SELECTORS
+        spec["flags"] = self.DISCOUNT_SELECTORS
+        spec["groups"] = {
+            "dashed": self.DASHED_PRICE_SELECTORS,
+            "green": self.GREEN_PRICE_SELECTORS,
+        }
+        spec["lists"] = {"plain": self.PLAIN_PRICE_SELECTORS}
+        return spec
+
+    def parse_tile(self, raw: dict, category: str = "", url: str = "") -> Optional[dict]:
+        """Tuš izdelek iz surovega BULK tile-a - ista logika kot extract_product_data()"""
+        candidates = raw.get("names", [])
+
+        # img[alt] najprej (prvi kandidat)
+        name = ""
+        if candidates and candidates[0]:
+            alt = (candidates[0].get("alt") or "").strip()
+            if self.is_valid_name(alt):
+                name = alt
+
+        if not name:
+            for candidate in candidates[1:]:
+                if not candidate:
+                    continue
+                if candidate.get("tag") == "IMG":
+                    name = candidate.get("alt") or ""
+                else:
+                    name = candidate.get("text") or ""
+                name = self.clean_name(name)
+                if self.is_valid_name(name):
+                    break
+                name = ""
+
+        if not name:
+            return None
+
+        groups = raw.get("groups", {})
+        regular_price = None
+        sale_price = None
+
+        for el in groups.get("dashed", []):
+            if el:
+                regular_price = self.first_price(el.get("text"))
+                if regular_price:
+                    break
+
+        for el in groups.get("green", []):
+            if el:
+                sale_price = self.first_price(el.get("text"))
+                if sale_price:
+                    break
+
+        if not regular_price and not sale_price:
+            for els in raw.get("lists", {}).get("plain", []):
+                for el in els:
+                    class_name = (el.get("cls") or "").lower()
+                    if "green" in class_name or "dashed" in class_name or "old" in class_name:
+                        continue
+                    regular_price = self.first_price(el.get("text"))
+                    if regular_price:
+                        break
+                if regular_price:
+                    break
+
+        text = raw.get("text") or ""
+        if not regular_price and not sale_price:
+            regular_price, sale_price = self.parse_text_prices(
+                text, lambda: self.has_discount_text(text) or any(raw.get("flags", {}).values())
+            )
+
+        image = ""
+        for attrs in raw.get("images", []):
+            image = self.resolve_image_src(attrs)
+            if image:
+                break
+
+        return self.build_product(name, regular_price, sale_price, image, category, url or self.page.url)
+
     def scrape_subcategory(self, subcategory: dict, main_category: str) -> list[dict]:
         """Scrapaj vse izdelke iz ene podkategorije"""
         self.current_subcategory = subcategory["name"]
@@ -619,6 +636,7 @@ class TusScraper(BulletproofScraper):
         self.log(f"  Podkategorija: {subcategory['name']}")
 
         # Klikni podkategorijo
+        self.begin_category()
         if not self.click_subcategory(subcategory):
             return products
 
@@ -633,7 +651,7 @@ class TusScraper(BulletproofScraper):
 
         # Scrapaj izdelke
         category = f"{main_category} > {subcategory['name']}"
-        products = self.scrape_current_page(category)
+        products = self.scrape_page_products(category)
 
         self.log(f"  {subcategory['name']}: {len(products)} izdelkov")
         return products
@@ -657,6 +675,7 @@ class TusScraper(BulletproofScraper):
         self.random_delay(1.0, 1.5)
 
         # Klikni na glavno kategorijo
+        self.begin_category()
         if not self.click_main_category(category_name):
             return products
 
@@ -674,7 +693,7 @@ class TusScraper(BulletproofScraper):
             # Če ni podkategorij, scrapa direktno
             self.log("Ni podkategorij, scrapam direktno")
             self.scroll_and_load_all(max_scrolls=80)
-            products = self.scrape_current_page(category_name)
+            products = self.scrape_page_products(category_name)
         else:
             # Scrapaj vsako podkategorijo
             for i, subcat in enumerate(subcategories):
@@ -682,7 +701,7 @@ class TusScraper(BulletproofScraper):
                     self.log(f"  [{i+1}/{len(subcategories)}] {subcat['name']}")
                     subcat_products = self.scrape_subcategory(subcat, category_name)
                     products.extend(subcat_products)
-                    self.random_delay(1.0, 1.5)
+                    self.throttle()
                 except Exception as e:
                     self.log(f"  Napaka pri podkategoriji {subcat['name']}: {e}", "WARNING")
                     continue
@@ -704,48 +723,50 @@ class TusScraper(BulletproofScraper):
         total = len(self.CATEGORY_URLS)
         self.log(f"Scrapajem {total} kategorij z DIREKTNIMI URL-ji...")
 
-        first_page = True
-        for i, (cat_name, cat_url) in enumerate(self.CATEGORY_URLS):
-            self.log(f"\n[{i+1}/{total}] {cat_name}")
-            self.current_category = cat_name
-            self.current_subcategory = ""
-
-            try:
-                # 1. Odpri kategorijo DIREKTNO (brez klikanja!)
-                self.log(f"Odpiranje: {cat_url}")
-                if not self.safe_goto(cat_url, timeout=60000):
-                    self.log(f"Ne morem odpreti: {cat_name}", "ERROR")
-                    continue
+        self.scrape_categories(self.CATEGORY_URLS)
 
-                # Samo na prvi strani sprejmi piškotke
-                if first_page:
-                    self.accept_cookies()
-                    self.close_popups()
-                    first_page = False
-                    time.sleep(2)
-                else:
-                    time.sleep(1)
+        self.finish()
+        return self.products
 
-                # 2. Počakaj da se stran naloži
-                time.sleep(5)  # Fiksna pavza za nalaganje
+    def scrape_category_task(self, cat_name: str, cat_url: str) -> list[dict]:
+        """Ena kategorija z DIREKTNIM URL-jem (uporablja tudi category worker)"""
+        self.current_category = cat_name
+        self.current_subcategory = ""
 
-                # 3. Infinite scroll - poberi VSE izdelke
-                self.log("Infinite scroll...")
-                self.scroll_and_load_all(max_scrolls=1000)  # Dovolj scrollov za 8000+ izdelkov
+        # 1. Odpri kategorijo DIREKTNO (brez klikanja!)
+        self.log(f"Odpiranje: {cat_url}")
+        self.begin_category()
+        if not self.safe_goto(cat_url, timeout=60000):
+            raise ScraperError(f"Ne morem odpreti: {cat_name}")
+
+        # Samo na prvi strani sprejmi piškotke
+        with self.timed("popup"):
+            if not self.cookies_accepted:
+                self.accept_cookies()
+                self.close_popups()
+                self.cookies_accepted = True
+                if not self.popups_handled():
+                    time.sleep(2)
+            elif not self.popups_handled():
+                time.sleep(1)
 
-                # 4. Scrapaj izdelke
-                products = self.scrape_current_page(cat_name)
-                self.log(f"{cat_name}: {len(products)} izdelkov", "SUCCESS")
+        # 2. Počakaj da se pojavijo prvi izdelki (namesto fiksne pavze)
+        self.wait_for_products(self.SCROLL_TILE_SELECTORS, timeout=15000)
+        self.save_session()
 
-                # Kratka pavza pred naslednjo kategorijo
-                self.random_delay(1.0, 2.0)
+        # Delta: infinite scroll nima vzorca konca (category_tail_sample) -> vedno poln scrape
+        cached = self.reuse_unchanged_category(cat_name)
+        if cached is not None:
+            return cached
 
-            except Exception as e:
-                self.log(f"Napaka pri {cat_name}: {e}", "ERROR")
-                self.metrics.errors += 1
+        # 3. Infinite scroll - poberi VSE izdelke
+        self.log("Infinite scroll...")
+        self.scroll_and_load_all(max_scrolls=1000)  # Dovolj scrollov za 8000+ izdelkov
 
-        self.finish()
-        return self.products
+        # 4. Scrapaj izdelke
+        products = self.scrape_page_products(cat_name)
+        self.log(f"{cat_name}: {len(products)} izdelkov", "SUCCESS")
+        return products
 
     def _click_subcategory_on_main_page(self, subcat_name: str) -> bool:
         """
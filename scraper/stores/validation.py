@@ -0,0 +1,284 @@
+"""
+BATCH VALIDACIJA + OCENA KVALITETE
+==================================
+Ista pravila kot validate_product() / assess_quality(), a za cel seznam izdelkov
+naenkrat (bulk, snapshot, streaming in API vrnejo stotine tile-ov hkrati).
+
+- Vzorci prevedeni enkrat: en združen regex za slaba imena, en za slabe slike
+- Stolpčno: imena, dolžine, cene, slike se preberejo enkrat na batch
+- ProductQuality.score in vrstni red razlogov zavrnitve sta ENAKA kot pri enem izdelku
+  (no_name, no_price, invalid_name, invalid_regular_price, invalid_sale_price, low_quality_N)
+- Zavrnitve: razlog na izdelek + števec po razlogu (ScrapingMetrics.rejections)
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+# (polje, točke) - ProductQuality.score in stolpčni score v validate_batch
+QUALITY_WEIGHTS = (
+    ("has_name", 20),
+    ("has_price", 25),
+    ("has_image", 20),
+    ("has_category", 10),
+    ("has_unit", 10),
+    ("name_length_ok", 5),
+    ("price_reasonable", 5),
+    ("image_url_valid", 5),
+)
+
+BAD_NAME_PATTERNS = [
+    r"^(menu|nav|header|footer|košarica|cart|prijava|login|iskanje|search)$",
+    r"^(kategorij[ea]|razvrsti|filter|išči|išci|sortir)$",
+    r"^(vstavi|dodaj|izbriši|uredi|zapri|odpri)$",
+    r"^(nalagam|čakaj|loading)\.{0,3}$",
+    r"^\d+$",
+    r"^€\s*\d",
+    r"^[A-Z]{5,}$",  # Samo uppercase kratice
+]
+BAD_NAME_RE = re.compile("|".join(f"(?:{pattern})" for pattern in BAD_NAME_PATTERNS), re.I)
+
+# Slika "ni prava" za oceno kvalitete (image_url_valid)
+QUALITY_BAD_IMAGE = ["placeholder", "no-image", "noimage", "default", "loading", "blank", "1x1"]
+QUALITY_BAD_IMAGE_RE = re.compile("|".join(re.escape(p) for p in QUALITY_BAD_IMAGE))
+
+# Strožji seznam za is_valid_image_url()
+BAD_IMAGE = [
+    "placeholder", "no-image", "noimage", "default", "loading",
+    "spinner", "blank", "empty", "1x1", "pixel", "spacer",
+    "transparent", "grey", "gray",
+]
+BAD_IMAGE_RE = re.compile("|".join(re.escape(p) for p in BAD_IMAGE))
+
+
+@dataclass
+class ProductQuality:
+    """Ocena kvalitete podatkov izdelka"""
+    has_name: bool = False
+    has_price: bool = False
+    has_image: bool = False
+    has_category: bool = False
+    has_unit: bool = False
+    name_length_ok: bool = False
+    price_reasonable: bool = False
+    image_url_valid: bool = False
+
+    @property
+    def score(self) -> int:
+        """Vrni score 0-100"""
+        return sum(getattr(self, name) * points for name, points in QUALITY_WEIGHTS)
+
+    @property
+    def is_acceptable(self) -> bool:
+        """Ali je kvaliteta sprejemljiva (min 50)"""
+        return self.score >= 50
+
+
+@dataclass
+class BatchResult:
+    """Rezultat validate_batch (accepted in scores sta poravnana)"""
+    accepted: List[dict] = field(default_factory=list)
+    scores: List[int] = field(default_factory=list)
+    rejected: List[Tuple[dict, str]] = field(default_factory=list)
+    reasons: Dict[str, int] = field(default_factory=dict)
+
+    def reject(self, product: dict, reason: str):
+        self.rejected.append((product, reason))
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+
+class ProductValidator:
+    """Pravila validacije z mejami trgovine (MIN_PRICE, MAX_PRICE, ...)"""
+
+    def __init__(self, min_price: float = 0.01, max_price: float = 9999, min_name_length: int = 2,
+                 max_name_length: int = 500, min_quality_score: int = 45):
+        self.min_price = min_price
+        self.max_price = max_price
+        self.min_name_length = min_name_length
+        self.max_name_length = max_name_length
+        self.min_quality_score = min_quality_score
+
+    @classmethod
+    def for_scraper(cls, scraper) -> "ProductValidator":
+        return cls(scraper.MIN_PRICE, scraper.MAX_PRICE, scraper.MIN_NAME_LENGTH,
+                   scraper.MAX_NAME_LENGTH, scraper.MIN_QUALITY_SCORE)
+
+    # ==================== EN IZDELEK ====================
+
+    def quality(self, product: dict) -> ProductQuality:
+        """Oceni kvaliteto podatkov izdelka"""
+        q = ProductQuality()
+
+        name = product.get("ime", "")
+        regular_price = product.get("redna_cena")
+        sale_price = product.get("akcijska_cena")
+        image = product.get("slika", "")
+        category = product.get("kategorija", "")
+        unit = product.get("enota", "")
+
+        q.has_name = bool(name and len(name) > 1)
+        q.has_price = bool(regular_price or sale_price)
+        q.has_image = bool(image and image.startswith("http"))
+        q.has_category = bool(category and len(category) > 2)
+        q.has_unit = bool(unit)
+        q.name_length_ok = self.min_name_length < len(name) < self.max_name_length if name else False
+
+        price = regular_price or sale_price or 0
+        q.price_reasonable = self.min_price < price < self.max_price if price else False
+
+        if image:
+            q.image_url_valid = not QUALITY_BAD_IMAGE_RE.search(image.lower())
+
+        return q
+
+    def is_valid_name(self, name: str) -> bool:
+        """Preveri ali je ime veljavno"""
+        if not name:
+            return False
+        if len(name) < self.min_name_length or len(name) > self.max_name_length:
+            return False
+        return not BAD_NAME_RE.match(name.lower())
+
+    def is_valid_price(self, price: float) -> bool:
+        """Preveri ali je cena veljavna"""
+        if price is None:
+            return False
+        if not isinstance(price, (int, float)):
+            return False
+        return self.min_price < price < self.max_price
+
+    def is_valid_image_url(self, url: str) -> bool:
+        """Preveri ali je URL slike veljaven"""
+        if not url or not url.startswith("http"):
+            return False
+        return not BAD_IMAGE_RE.search(url.lower())
+
+    def validate(self, product: dict) -> Tuple[bool, str, ProductQuality]:
+        """
+        Validacija enega izdelka (brez metrik).
+        Vrne (is_valid, reason, quality); akcijska >= redna se zamenjata na mestu.
+        """
+        quality = self.quality(product)
+
+        if not quality.has_name:
+            return False, "no_name", quality
+        if not quality.has_price:
+            return False, "no_price", quality
+        if not self.is_valid_name(product.get("ime", "")):
+            return False, "invalid_name", quality
+
+        regular = product.get("redna_cena")
+        sale = product.get("akcijska_cena")
+        if regular and not self.is_valid_price(regular):
+            return False, "invalid_regular_price", quality
+        if sale and not self.is_valid_price(sale):
+            return False, "invalid_sale_price", quality
+
+        # Akcijska mora biti nižja - auto-fix: zamenjaj
+        if regular and sale and sale >= regular:
+            product["redna_cena"], product["akcijska_cena"] = sale, regular
+
+        if quality.score < self.min_quality_score:
+            return False, f"low_quality_{quality.score}", quality
+
+        return True, "ok", quality
+
+    # ==================== BATCH ====================
+
+    def validate_batch(self, products: List[dict]) -> BatchResult:
+        """
+        Validacija seznama v enem prehodu (vrstni red ohranjen).
+        Izdelek s pokvarjenimi polji (npr. cena kot string) se zavrne z razlogom "error".
+        """
+        try:
+            return self._validate_columns(products)
+        except Exception:
+            # Tip ki ga stolpčna pot ne prenese - izdelek po izdelek
+            return self._validate_each(products)
+
+    def _validate_each(self, products: List[dict]) -> BatchResult:
+        result = BatchResult()
+        for product in products:
+            try:
+                ok, reason, quality = self.validate(product)
+            except Exception:
+                result.reject(product, "error")
+                continue
+            if ok:
+                result.accepted.append(product)
+                result.scores.append(quality.score)
+            else:
+                result.reject(product, reason)
+        return result
+
+    def _validate_columns(self, products: List[dict]) -> BatchResult:
+        min_price, max_price = self.min_price, self.max_price
+        min_len, max_len = self.min_name_length, self.max_name_length
+
+        # Stolpci (en get na polje na izdelek)
+        names = [p.get("ime", "") for p in products]
+        regulars = [p.get("redna_cena") for p in products]
+        sales = [p.get("akcijska_cena") for p in products]
+        images = [p.get("slika", "") for p in products]
+        categories = [p.get("kategorija", "") for p in products]
+        units = [p.get("enota", "") for p in products]
+
+        lengths = [len(name) if name else 0 for name in names]
+        prices = [r or s or 0 for r, s in zip(regulars, sales)]
+
+        # ProductQuality stolpčno (iste formule kot quality())
+        has_name = [bool(name) and length > 1 for name, length in zip(names, lengths)]
+        has_price = [bool(r or s) for r, s in zip(regulars, sales)]
+        has_image = [bool(image and image.startswith("http")) for image in images]
+        has_category = [bool(c and len(c) > 2) for c in categories]
+        has_unit = [bool(unit) for unit in units]
+        name_length_ok = [bool(name) and min_len < length < max_len for name, length in zip(names, lengths)]
+        price_reasonable = [bool(price) and min_price < price < max_price for price in prices]
+        image_url_valid = [bool(image) and not QUALITY_BAD_IMAGE_RE.search(image.lower()) for image in images]
+
+        columns = {
+            "has_name": has_name, "has_price": has_price, "has_image": has_image,
+            "has_category": has_category, "has_unit": has_unit, "name_length_ok": name_length_ok,
+            "price_reasonable": price_reasonable, "image_url_valid": image_url_valid,
+        }
+        scores = [0] * len(products)
+        for name, points in QUALITY_WEIGHTS:
+            scores = [score + points if flag else score for score, flag in zip(scores, columns[name])]
+
+        # Ime: dolžina + slabi vzorci (samo kjer je ime)
+        valid_name = [
+            bool(name) and min_len <= length <= max_len and not BAD_NAME_RE.match(name.lower())
+            for name, length in zip(names, lengths)
+        ]
+
+        result = BatchResult()
+        min_score = self.min_quality_score
+        for i, product in enumerate(products):
+            if not has_name[i]:
+                result.reject(product, "no_name")
+                continue
+            if not has_price[i]:
+                result.reject(product, "no_price")
+                continue
+            if not valid_name[i]:
+                result.reject(product, "invalid_name")
+                continue
+
+            regular, sale = regulars[i], sales[i]
+            if regular and not self.is_valid_price(regular):
+                result.reject(product, "invalid_regular_price")
+                continue
+            if sale and not self.is_valid_price(sale):
+                result.reject(product, "invalid_sale_price")
+                continue
+
+            if regular and sale and sale >= regular:
+                product["redna_cena"], product["akcijska_cena"] = sale, regular
+
+            score = scores[i]
+            if score < min_score:
+                result.reject(product, f"low_quality_{score}")
+                continue
+
+            result.accepted.append(product)
+            result.scores.append(score)
+        return result
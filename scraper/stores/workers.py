@@ -0,0 +1,153 @@
+"""
+CATEGORY WORKERS
+================
+Vzporedno scrapanje kategorij ENE trgovine z več browserji.
+
+- Vrsta kategorij (queue) - vsak worker vzame naslednjo ko konča prejšnjo
+- Vsak worker ima SVOJ BrowserPool (sync_playwright, browser), context, page in scraper
+  (Playwright sync API objektov ni dovoljeno deliti med threadi!)
+- Context se po RECYCLE_AFTER_USES kategorijah ali nad mejo spomina zamenja
+- Rezultati se po vsaki kategoriji združijo v koordinatorja:
+  products + seen (deduplikacija čez workerje), metrike, checkpoint
+- Neuspela kategorija gre še CATEGORY_RETRIES-krat v vrsto (delni izdelki workerja se zavržejo);
+  neobdelane (vsi workerji padli) poskusi koordinator serijsko. Dokončno neuspele ->
+  metrics.failed_categories (statistika, povzetek runa)
+- Število workerjev omejuje MAX_CATEGORY_WORKERS trgovine (politeness)
+"""
+import queue
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from .browser_pool import BrowserPool
+
+
+class CategoryWorkerPool:
+    """N workerjev nad skupno vrsto kategorij za eno trgovino"""
+
+    def __init__(self, coordinator, categories: List[Tuple[str, str]], workers: int):
+        self.coordinator = coordinator
+        self.categories = list(categories)
+        self.workers = workers
+        self.queue: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        self.lock = threading.Lock()
+        self.attempts: Dict[str, int] = {}
+        self.failed_categories = []
+        self.pool_stats = []
+
+    def run(self) -> list[dict]:
+        """Zaženi workerje in počakaj da izpraznijo vrsto"""
+        coord = self.coordinator
+
+        for item in self.categories:
+            self.queue.put(item)
+
+        coord.log(f"Category workers: {self.workers} (kategorij: {len(self.categories)})", "PROGRESS")
+
+        threads = []
+        for worker_id in range(1, self.workers + 1):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(worker_id,),
+                name=f"{coord.STORE_NAME}-worker-{worker_id}",
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+
+            # Ne odpri vseh browserjev hkrati (politeness)
+            if worker_id < self.workers:
+                time.sleep(coord.WORKER_START_STAGGER)
+
+        for thread in threads:
+            thread.join()
+
+        # Kategorije ki jih noben worker ni vzel (npr. vsi browserji padli) - koordinator serijsko
+        leftover = []
+        while not self.queue.empty():
+            leftover.append(self.queue.get_nowait())
+        if leftover:
+            coord.log(f"Neobdelane kategorije: {', '.join(name for name, _ in leftover)} - "
+                      f"poskušam serijsko", "ERROR")
+            self.failed_categories.extend(coord.scrape_categories_serial(leftover))
+
+        if self.failed_categories:
+            coord.metrics.failed_categories.extend(self.failed_categories)
+            coord.log(f"Neuspele kategorije: {', '.join(self.failed_categories)}", "ERROR")
+
+        if self.pool_stats:
+            created = sum(s["contexts_created"] for s in self.pool_stats)
+            recycled = sum(s["contexts_recycled"] for s in self.pool_stats)
+            launch = sum(s["launch_seconds"] for s in self.pool_stats)
+            coord.log(f"Browser pool: {created} contextov ({recycled} recikliranih), zagon {launch:.1f}s", "DEBUG")
+
+        return coord.products
+
+    def _worker(self, worker_id: int):
+        """En worker = en browser; jemlje kategorije dokler vrsta ni prazna"""
+        coord = self.coordinator
+
+        try:
+            with BrowserPool(headless=coord.headless) as pool:
+                # Shranjena seja trgovine -> worker preskoči consent/prevzem
+                lease = pool.acquire(type(coord))
+                scraper = coord.spawn_worker(lease.page, worker_id)
+                self._consume(scraper, pool, lease)
+                scraper.save_session(final=True)
+
+                with self.lock:
+                    coord.merge_worker_metrics(scraper)
+                    self.pool_stats.append(pool.stats())
+
+        except Exception as e:
+            coord.log(f"Worker {worker_id} napaka: {e}", "ERROR")
+            with self.lock:
+                coord.metrics.errors += 1
+
+    @staticmethod
+    def _discard_partial(scraper, start_index: int):
+        """Delni izdelki neuspele kategorije ven iz workerja - ponovitev jih ne sme šteti za duplikate"""
+        for product in scraper.products[start_index:]:
+            scraper.seen.discard(scraper.get_product_fingerprint(product))
+        del scraper.products[start_index:]
+
+    def _consume(self, scraper, pool: BrowserPool = None, lease=None):
+        """Obdelaj kategorije iz vrste"""
+        coord = self.coordinator
+
+        while True:
+            try:
+                name, url = self.queue.get_nowait()
+            except queue.Empty:
+                return
+
+            start_index = len(scraper.products)
+            try:
+                products = scraper.run_category_task(name, url)
+                scraper.remember_category(name, products)
+            except Exception as e:
+                scraper.log(f"Napaka pri {name}: {e}", "ERROR")
+                scraper.metrics.errors += 1
+                self._discard_partial(scraper, start_index)
+                with self.lock:
+                    self.attempts[name] = self.attempts.get(name, 0) + 1
+                    retry = self.attempts[name] <= coord.CATEGORY_RETRIES
+                    if not retry:
+                        self.failed_categories.append(name)
+                if retry:
+                    scraper.log(f"{name}: ponovno v vrsto (poskus {self.attempts[name] + 1})", "WARNING")
+                    self.queue.put((name, url))
+                continue
+
+            with self.lock:
+                added = coord.merge_products(scraper.products[start_index:], name)
+            scraper.log(f"{name}: {added} novih izdelkov (skupaj: {len(coord.products)})", "SUCCESS")
+
+            # Reciklaža contexta (N kategorij / spomin) - scraper dobi nov page
+            if pool and lease and pool.maybe_recycle(lease, type(coord)):
+                scraper.save_session(final=True)
+                scraper.attach_page(lease.page)
+                scraper.log("Context recikliran", "DEBUG")
+
+            # Politeness prek skupnega AIMD controllerja (ne fiksni sleep)
+            scraper.throttle()
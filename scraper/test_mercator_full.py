@@ -3,6 +3,7 @@ import time
 import json
 from playwright.sync_api import sync_playwright
 from stores.mercator import MercatorScraper
+from stores.product import to_dicts
 
 print("=" * 60)
 print("MERCATOR FULL SCRAPER TEST")
@@ -40,7 +41,7 @@ with sync_playwright() as p:
 
         # Shrani rezultat
         with open("mercator_full_test.json", "w", encoding="utf-8") as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
+            json.dump(to_dicts(products), f, ensure_ascii=False, indent=2)
         print(f"\n   Shranjeno v mercator_full_test.json")
 
     browser.close()
@@ -4,10 +4,11 @@ TEST UPLOAD S SLIKAMI
 Uploada 10 testnih izdelkov s slikami da preverimo če deluje.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
+from itertools import islice
 from google_sheets import GoogleSheetsManager
+from stores.progress import iter_progress_records
 
 def test_upload():
     print("=" * 70)
@@ -17,10 +18,7 @@ def test_upload():
     # Naloži SPAR podatke iz progress
     progress_file = Path(__file__).parent / "progress" / "spar_20260123_104312.json"
 
-    with open(progress_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    products = data.get('products', [])[:10]
+    products = list(islice(iter_progress_records(progress_file), 10))
     print(f"Naloženih {len(products)} izdelkov iz progress datoteke")
 
     # Prikaži izdelke
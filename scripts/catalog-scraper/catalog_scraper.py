@@ -10,7 +10,22 @@ import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
+import importlib.util
 import os
+import sys
+from pathlib import Path
+
+# Skupni parser cen (scraper/stores/prices.py - samo stdlib). Naložen iz datoteke pod svojim imenom:
+# sys.path na scraper/stores bi zasenčil module na vrhu (logger, progress, session, timing, ...)
+_PRICES_PATH = Path(__file__).resolve().parents[2] / "scraper" / "stores" / "prices.py"
+_spec = importlib.util.spec_from_file_location("prhran_prices", _PRICES_PATH)
+_prices = sys.modules.get(_spec.name)
+if _prices is None:
+    _prices = importlib.util.module_from_spec(_spec)
+    sys.modules[_spec.name] = _prices  # dataclass potrebuje modul v sys.modules
+    _spec.loader.exec_module(_prices)
+parse_amount = _prices.parse_amount
+
 
 class CatalogScraper:
     def __init__(self):
@@ -53,18 +68,7 @@ class CatalogScraper:
 
     def parse_price(self, price_str: str) -> Optional[float]:
         """Parse price string to float"""
-        if not price_str:
-            return None
-
-        # Remove currency symbols and whitespace
-        cleaned = re.sub(r'[^\d,.]', '', price_str)
-        # Replace comma with dot
-        cleaned = cleaned.replace(',', '.')
-
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+        return parse_amount(price_str)
 
     def scrape_mercator_catalog(self) -> List[Dict]:
         """Scrape Mercator weekly catalog"""
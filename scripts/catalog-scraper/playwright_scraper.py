@@ -13,7 +13,27 @@ import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Set
 from playwright.async_api import async_playwright, Page, Browser
+import importlib.util
 import os
+import sys
+from pathlib import Path
+
+# Skupni parser cen (scraper/stores/prices.py - samo stdlib). Naložen iz datoteke pod svojim imenom:
+# sys.path na scraper/stores bi zasenčil module na vrhu (logger, progress, session, timing, ...)
+_PRICES_PATH = Path(__file__).resolve().parents[2] / "scraper" / "stores" / "prices.py"
+_spec = importlib.util.spec_from_file_location("prhran_prices", _PRICES_PATH)
+_prices = sys.modules.get(_spec.name)
+if _prices is None:
+    _prices = importlib.util.module_from_spec(_spec)
+    sys.modules[_spec.name] = _prices  # dataclass potrebuje modul v sys.modules
+    _spec.loader.exec_module(_prices)
+CATALOG_MERCATOR_PRICE_RULES = _prices.CATALOG_MERCATOR_PRICE_RULES
+CATALOG_SPAR_PRICE_RULES = _prices.CATALOG_SPAR_PRICE_RULES
+CATALOG_TUS_PRICE_RULES = _prices.CATALOG_TUS_PRICE_RULES
+first_amount = _prices.first_amount
+parse_amount = _prices.parse_amount
+parse_price_text = _prices.parse_price_text
+
 
 class PlaywrightCatalogScraper:
     def __init__(self):
@@ -21,20 +41,10 @@ class PlaywrightCatalogScraper:
 
     def parse_price(self, price_str: str) -> Optional[float]:
         """Parse price string to float"""
-        if not price_str:
-            return None
-        cleaned = re.sub(r'[^\d,.]', '', price_str)
-        if ',' in cleaned and '.' in cleaned:
-            cleaned = cleaned.replace('.', '').replace(',', '.')
-        else:
-            cleaned = cleaned.replace(',', '.')
-        try:
-            value = float(cleaned)
-            if 0.01 < value < 10000:
-                return round(value, 2)
-            return None
-        except ValueError:
-            return None
+        value = parse_amount(price_str)
+        if value is not None and 0.01 < value < 10000:
+            return round(value, 2)
+        return None
 
     async def scrape_mercator(self, page: Page) -> List[Dict]:
         """
@@ -121,56 +131,16 @@ class PlaywrightCatalogScraper:
                     if len(name) < 3 or name.lower() in seen_names:
                         continue
 
-                    # Find prices - look for X,XX € pattern
-                    price_matches = re.findall(r'(\d+),(\d{2})\s*€', text)
-                    if not price_matches:
+                    # Cene iz teksta tile-a (redna/akcijska/bulk, brez cen na enoto)
+                    parsed = parse_price_text(text, CATALOG_MERCATOR_PRICE_RULES, has_discount=True)
+                    current_price = parsed.sale or parsed.regular or parsed.bulk_price
+                    if current_price is None:
                         continue
 
-                    # First price is the current/sale price
-                    current_price = float(f"{price_matches[0][0]}.{price_matches[0][1]}")
-
-                    # Check for original price (if on sale)
-                    original_price = None
-                    sale_price = None
-                    bulk_price = None  # For "Kupi 2" deals
-                    bulk_quantity = None
-
-                    # Check for "Kupi 2" or "2 za" deals
-                    bulk_match = re.search(r'(?:kupi\s*(\d+)|(\d+)\s*za|(\d+)\s*kos)', text.lower())
-                    if bulk_match:
-                        qty = bulk_match.group(1) or bulk_match.group(2) or bulk_match.group(3)
-                        if qty and int(qty) >= 2:
-                            bulk_quantity = int(qty)
-                            # The lower price might be the bulk price
-                            if len(price_matches) >= 2:
-                                prices_all = [float(f"{m[0]}.{m[1]}") for m in price_matches]
-                                prices_sorted = sorted(set(prices_all))
-                                if len(prices_sorted) >= 2:
-                                    bulk_price = prices_sorted[0]  # Lower price for bulk
-                                    original_price = prices_sorted[-1]  # Regular single price
-
-                    # Look for "prej" indicator or crossed out price
-                    if len(price_matches) >= 2 and not bulk_price:
-                        # Multiple prices - might be sale + original, or price + per-kg price
-                        # Per-kg prices have "/kg" or "/1kg" after them
-                        non_per_kg_prices = []
-                        for i, (eur, cents) in enumerate(price_matches):
-                            # Check if this price is followed by /kg
-                            price_text = f"{eur},{cents}"
-                            idx = text.find(price_text)
-                            after = text[idx:idx+20] if idx >= 0 else ""
-                            if '/kg' not in after.lower() and '/1kg' not in after.lower() and '/kos' not in after.lower():
-                                non_per_kg_prices.append(float(f"{eur}.{cents}"))
-
-                        if len(non_per_kg_prices) >= 2:
-                            # We have sale and original
-                            prices_sorted = sorted(non_per_kg_prices)
-                            sale_price = prices_sorted[0]
-                            original_price = prices_sorted[-1]
-                            if sale_price >= original_price:
-                                # Not really a sale
-                                original_price = None
-                                sale_price = None
+                    sale_price = parsed.sale
+                    bulk_price = parsed.bulk_price  # For "Kupi 2" / "2 za" deals
+                    bulk_quantity = parsed.bulk_quantity
+                    original_price = parsed.regular if (sale_price or bulk_price) else None
 
                     seen_names.add(name.lower())
 
@@ -375,22 +345,14 @@ class PlaywrightCatalogScraper:
                             if not name or name.lower() in seen_names:
                                 continue
 
-                            # Find prices - look for X,XX € pattern
-                            price_matches = re.findall(r'(\d+),(\d{2})\s*€', text)
-                            if not price_matches:
+                            # Cene iz teksta tile-a (Prej/Prihranek/PC kode/cene na enoto upoštevane)
+                            parsed = parse_price_text(text, CATALOG_SPAR_PRICE_RULES, has_discount=True)
+                            if parsed.regular is None:
                                 continue
 
-                            prices = [float(f"{m[0]}.{m[1]}") for m in price_matches]
-                            prices = [p for p in prices if 0.1 < p < 500]
-
-                            if not prices:
-                                continue
-
-                            # Determine sale vs regular price
-                            prices_sorted = sorted(set(prices))
-                            current_price = prices_sorted[0]
-                            original_price = prices_sorted[-1] if len(prices_sorted) > 1 and prices_sorted[-1] > prices_sorted[0] else None
-                            sale_price = current_price if original_price else None
+                            sale_price = parsed.sale
+                            original_price = parsed.regular if sale_price else None
+                            current_price = sale_price or parsed.regular
 
                             seen_names.add(name.lower())
 
@@ -577,15 +539,10 @@ class PlaywrightCatalogScraper:
 
                             # Get prices
                             card_text = await card.inner_text()
-                            price_matches = re.findall(r'(\d+),(\d{2})\s*€?', card_text)
-                            if not price_matches:
-                                continue
-
-                            prices = [float(f"{m[0]}.{m[1]}") for m in price_matches]
-                            prices = [p for p in prices if 0.1 < p < 500]
-
-                            if not prices:
+                            parsed = parse_price_text(card_text, CATALOG_TUS_PRICE_RULES, has_discount=True)
+                            if parsed.regular is None:
                                 continue
+                            prices = [p for p in parsed.pair if p]
 
                             # Check for BUM price (Tuš special)
                             is_bum = False
@@ -609,9 +566,8 @@ class PlaywrightCatalogScraper:
                                     original_price = round(sale_price * 1.2, 2)
                             elif dashed_elem:
                                 dashed_text = await dashed_elem.inner_text()
-                                orig_match = re.search(r'(\d+),(\d{2})', dashed_text)
-                                if orig_match:
-                                    original_price = float(f"{orig_match.group(1)}.{orig_match.group(2)}")
+                                original_price = first_amount(dashed_text)
+                                if original_price:
                                     sale_price = min(prices)
                             elif len(prices) >= 2:
                                 prices_sorted = sorted(prices)
@@ -799,6 +755,35 @@ class PlaywrightCatalogScraper:
             'skipped': total_skipped
         }
 
+    CONTEXT_OPTIONS = {
+        'viewport': {'width': 1920, 'height': 1080},
+        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+        'locale': 'sl-SI',
+    }
+
+    async def open_browser(self, p) -> Browser:
+        """
+        Connect to a long-lived browser server (PRHRAN_BROWSER_WS, e.g. started with
+        `python -m playwright run-server --port 3000`), or launch one if not set.
+        """
+        start = time.time()
+        ws_endpoint = os.getenv('PRHRAN_BROWSER_WS', '')
+        if ws_endpoint:
+            print(f"\nPovezujem se na brskalnik: {ws_endpoint}")
+            browser = await p.chromium.connect(ws_endpoint)
+        else:
+            print("\nZaganjam brskalnik...")
+            browser = await p.chromium.launch(
+                headless=True,
+                args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage']
+            )
+        print(f"Brskalnik pripravljen v {time.time() - start:.1f}s")
+        return browser
+
+    async def new_context(self, browser: Browser):
+        """Fresh context with sl-SI locale, viewport and UA"""
+        return await browser.new_context(**self.CONTEXT_OPTIONS)
+
     async def run(self):
         """Run the complete scraping pipeline"""
         print("=" * 70)
@@ -810,30 +795,23 @@ class PlaywrightCatalogScraper:
         all_products = []
 
         async with async_playwright() as p:
-            print("\nZaganjam brskalnik...")
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage']
-            )
-
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                locale='sl-SI'
-            )
-
-            page = await context.new_page()
+            browser = await self.open_browser(p)
 
-            # Scrape Mercator and Tuš (web scraping)
+            # Scrape Mercator and Tuš (web scraping) - fresh context per store,
+            # the browser stays warm
             for scraper_func, name in [
                 (self.scrape_mercator, "Mercator"),
                 (self.scrape_tus, "Tuš")
             ]:
+                context = await self.new_context(browser)
                 try:
+                    page = await context.new_page()
                     store_products = await scraper_func(page)
                     all_products.extend(store_products)
                 except Exception as e:
                     print(f"[{name}] Napaka: {e}")
+                finally:
+                    await context.close()
 
             # Scrape Spar from Google Sheets (web doesn't support infinite scroll)
             try: